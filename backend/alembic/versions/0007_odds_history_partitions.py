@@ -0,0 +1,142 @@
+"""Monthly range partitions for odds_history + odds_rollups table
+
+Revision ID: 0007_odds_history_partitions
+Revises: 0006_canonical_league_ids
+Create Date: 2026-10-18
+
+odds_history is append-only time series that was only ever read by match and
+time range, and expired with row-by-row DELETEs. On PostgreSQL it is rebuilt
+as ``PARTITION BY RANGE ("timestamp")`` with one partition per month (from the
+oldest stored row to two months ahead) plus a DEFAULT partition, so retention
+can drop whole months (src/db/odds_storage.py). Partitioned tables need the
+partition key in the primary key, so the PK becomes (id, timestamp) and
+timestamp becomes NOT NULL (existing NULLs are backfilled from created_at).
+The id sequence is kept, so ids stay unique.
+
+SQLite (tests, local fallback) has no declarative partitioning; there the
+table is left as is and retention uses a DELETE on the same month boundary.
+
+odds_rollups is new on every dialect: one row per (match, market, bookmaker)
+with opening/latest/closing prices, maintained by ingestion.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0007_odds_history_partitions"
+down_revision = "0006_canonical_league_ids"
+branch_labels = None
+depends_on = None
+
+_LEGACY = "odds_history_unpartitioned"
+_PARTITIONS_AHEAD = 2
+
+
+def _month_start(moment: datetime) -> datetime:
+    return datetime(moment.year, moment.month, 1)
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _create_rollups() -> None:
+    op.create_table(
+        "odds_rollups",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("match_id", sa.String(), sa.ForeignKey("matches.id"), nullable=False),
+        sa.Column("market_type", sa.String(), nullable=False),
+        sa.Column("bookmaker", sa.String(), nullable=False),
+        sa.Column("opening_home", sa.Float(), nullable=True),
+        sa.Column("opening_draw", sa.Float(), nullable=True),
+        sa.Column("opening_away", sa.Float(), nullable=True),
+        sa.Column("opening_at", sa.DateTime(), nullable=False),
+        sa.Column("latest_home", sa.Float(), nullable=True),
+        sa.Column("latest_draw", sa.Float(), nullable=True),
+        sa.Column("latest_away", sa.Float(), nullable=True),
+        sa.Column("latest_at", sa.DateTime(), nullable=False),
+        sa.Column("closing_home", sa.Float(), nullable=True),
+        sa.Column("closing_draw", sa.Float(), nullable=True),
+        sa.Column("closing_away", sa.Float(), nullable=True),
+        sa.Column("closing_at", sa.DateTime(), nullable=True),
+        sa.Column("snapshot_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ux_odds_rollups_match_market_bookmaker",
+        "odds_rollups",
+        ["match_id", "market_type", "bookmaker"],
+        unique=True,
+    )
+
+
+def _partition_odds_history() -> None:
+    conn = op.get_bind()
+    op.execute(f"ALTER TABLE odds_history RENAME TO {_LEGACY}")
+    op.execute(f"ALTER TABLE {_LEGACY} RENAME CONSTRAINT odds_history_pkey TO {_LEGACY}_pkey")
+    op.execute(f"ALTER INDEX ix_odds_history_match_timestamp RENAME TO ix_{_LEGACY}_match_timestamp")
+    op.execute(f"ALTER INDEX ix_odds_history_bookmaker RENAME TO ix_{_LEGACY}_bookmaker")
+    op.execute(
+        f'UPDATE {_LEGACY} SET "timestamp" = COALESCE(created_at, now()) WHERE "timestamp" IS NULL'
+    )
+
+    op.execute(
+        f'CREATE TABLE odds_history (LIKE {_LEGACY} INCLUDING DEFAULTS) PARTITION BY RANGE ("timestamp")'
+    )
+    op.execute('ALTER TABLE odds_history ADD CONSTRAINT odds_history_pkey PRIMARY KEY (id, "timestamp")')
+    op.execute(
+        "ALTER TABLE odds_history ADD CONSTRAINT odds_history_match_id_fkey "
+        "FOREIGN KEY (match_id) REFERENCES matches (id)"
+    )
+    op.execute("ALTER SEQUENCE odds_history_id_seq OWNED BY odds_history.id")
+    op.execute("CREATE TABLE odds_history_default PARTITION OF odds_history DEFAULT")
+
+    oldest = conn.execute(sa.text(f'SELECT min("timestamp") FROM {_LEGACY}')).scalar()
+    now = datetime.now(timezone.utc)
+    month = _month_start(oldest or now)
+    last = _add_months(_month_start(now), _PARTITIONS_AHEAD)
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE odds_history_{month:%Y_%m} PARTITION OF odds_history "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+        )
+        month = upper
+
+    op.execute(f"INSERT INTO odds_history SELECT * FROM {_LEGACY}")
+    op.execute(f"DROP TABLE {_LEGACY}")
+    op.create_index("ix_odds_history_match_timestamp", "odds_history", ["match_id", "timestamp"])
+    op.create_index("ix_odds_history_bookmaker", "odds_history", ["bookmaker"])
+
+
+def _unpartition_odds_history() -> None:
+    op.execute(f"CREATE TABLE {_LEGACY} (LIKE odds_history INCLUDING DEFAULTS)")
+    op.execute(f"INSERT INTO {_LEGACY} SELECT * FROM odds_history")
+    op.execute(f"ALTER SEQUENCE odds_history_id_seq OWNED BY {_LEGACY}.id")
+    op.execute("DROP TABLE odds_history CASCADE")
+    op.execute(f"ALTER TABLE {_LEGACY} RENAME TO odds_history")
+    op.execute('ALTER TABLE odds_history ALTER COLUMN "timestamp" DROP NOT NULL')
+    op.execute("ALTER TABLE odds_history ADD CONSTRAINT odds_history_pkey PRIMARY KEY (id)")
+    op.execute(
+        "ALTER TABLE odds_history ADD CONSTRAINT odds_history_match_id_fkey "
+        "FOREIGN KEY (match_id) REFERENCES matches (id)"
+    )
+    op.create_index("ix_odds_history_match_timestamp", "odds_history", ["match_id", "timestamp"])
+    op.create_index("ix_odds_history_bookmaker", "odds_history", ["bookmaker"])
+
+
+def upgrade() -> None:
+    _create_rollups()
+    if op.get_bind().dialect.name == "postgresql":
+        _partition_odds_history()
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _unpartition_odds_history()
+    op.drop_index("ux_odds_rollups_match_market_bookmaker", table_name="odds_rollups")
+    op.drop_table("odds_rollups")
@@ -0,0 +1,43 @@
+"""Feature store columns on feature_vectors
+
+Revision ID: 0008_feature_store_columns
+Revises: 0007_odds_history_partitions
+Create Date: 2026-10-18
+
+Live feature vectors are persisted in feature_vectors by
+src/services/feature_store.py under features_version = feature schema hash,
+with timestamp as the as-of time. Additive and nullable only: league and
+input_fingerprint key the lookup, data_gaps and provenance carry the
+metadata the serving path returns alongside the vector.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0008_feature_store_columns"
+down_revision = "0007_odds_history_partitions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("feature_vectors") as batch_op:
+        batch_op.add_column(sa.Column("league", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("input_fingerprint", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("data_gaps", sa.JSON(), nullable=True))
+        batch_op.add_column(sa.Column("provenance", sa.JSON(), nullable=True))
+    op.create_index(
+        "ix_feature_vectors_match_version_timestamp",
+        "feature_vectors",
+        ["match_id", "features_version", "timestamp"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_feature_vectors_match_version_timestamp", table_name="feature_vectors")
+    with op.batch_alter_table("feature_vectors") as batch_op:
+        batch_op.drop_column("provenance")
+        batch_op.drop_column("data_gaps")
+        batch_op.drop_column("input_fingerprint")
+        batch_op.drop_column("league")
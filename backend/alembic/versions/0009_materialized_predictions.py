@@ -0,0 +1,45 @@
+"""Materialized predictions for upcoming fixtures
+
+Revision ID: 0009_materialized_predictions
+Revises: 0008_feature_store_columns
+Create Date: 2026-10-18
+
+One row per upcoming fixture, written by the background precompute pass in
+src/services/prediction_materializer.py and read by primary key on the
+serving path. input_fingerprint lets a pass skip fixtures whose inputs,
+feature schema and model artifacts are unchanged.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0009_materialized_predictions"
+down_revision = "0008_feature_store_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "materialized_predictions",
+        sa.Column("match_id", sa.String(), primary_key=True),
+        sa.Column("league", sa.String(), nullable=False),
+        sa.Column("match_date", sa.DateTime(), nullable=False),
+        sa.Column("model_version", sa.String(), nullable=False),
+        sa.Column("feature_schema_hash", sa.String(), nullable=False),
+        sa.Column("input_fingerprint", sa.String(), nullable=False),
+        sa.Column("prediction", sa.JSON(), nullable=False),
+        sa.Column("features_summary", sa.JSON(), nullable=True),
+        sa.Column("computed_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_materialized_predictions_league_kickoff",
+        "materialized_predictions",
+        ["league", "match_date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_materialized_predictions_league_kickoff", table_name="materialized_predictions")
+    op.drop_table("materialized_predictions")
@@ -0,0 +1,30 @@
+"""verified_at on materialized_predictions
+
+Revision ID: 0010_materialized_verified_at
+Revises: 0009_materialized_predictions
+Create Date: 2026-10-18
+
+The precompute pass skips fixtures whose input_fingerprint is unchanged, so
+computed_at stops moving for stable fixtures. verified_at records the last
+pass that confirmed the row and is what the serving age check reads.
+Nullable: rows written before this revision fall back to computed_at.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0010_materialized_verified_at"
+down_revision = "0009_materialized_predictions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("materialized_predictions") as batch_op:
+        batch_op.add_column(sa.Column("verified_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("materialized_predictions") as batch_op:
+        batch_op.drop_column("verified_at")
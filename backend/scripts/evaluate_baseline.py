@@ -53,6 +53,10 @@ expected_calibration_error = _load_symbol(
     BACKEND_ROOT / "src" / "models" / "evaluation" / "metrics.py",
     "expected_calibration_error",
 )
+mean_ranked_probability_score = _load_symbol(
+    BACKEND_ROOT / "src" / "models" / "evaluation" / "metrics.py",
+    "mean_ranked_probability_score",
+)
 walk_forward_splits = _load_symbol(
     BACKEND_ROOT / "src" / "models" / "evaluation" / "temporal_splits.py",
     "walk_forward_splits",
@@ -163,11 +167,7 @@ def _compute_rps(y_true: np.ndarray, y_proba: np.ndarray) -> float:
 
     Class ordering must be home=0, draw=1, away=2.
     """
-    n_classes = y_proba.shape[1]
-    y_onehot = np.eye(n_classes, dtype=float)[y_true.astype(int)]
-    cdf_pred = np.cumsum(y_proba, axis=1)[:, :-1]
-    cdf_true = np.cumsum(y_onehot, axis=1)[:, :-1]
-    return float(np.mean(np.sum((cdf_pred - cdf_true) ** 2, axis=1) / (n_classes - 1)))
+    return mean_ranked_probability_score(y_true, y_proba)
 
 
 def _league_breakdown(
@@ -53,7 +53,10 @@ for _p in (str(SRC_ROOT), str(BACKEND_ROOT), str(REPO_ROOT)):
     if _p not in sys.path:
         sys.path.insert(0, _p)
 
-from models.evaluation.metrics import expected_calibration_error  # noqa: E402
+from models.evaluation.metrics import (  # noqa: E402
+    expected_calibration_error,
+    mean_ranked_probability_score,
+)
 from models.evaluation.temporal_splits import walk_forward_splits  # noqa: E402
 from models.feature_registry import (  # noqa: E402
     DEFAULT_FEATURE_VALUES_86,
@@ -79,11 +82,7 @@ logger = logging.getLogger("evaluate_baseline_v8")
 # ── metric helpers ────────────────────────────────────────────────────────────
 
 def _compute_rps(y_true: np.ndarray, y_proba: np.ndarray) -> float:
-    n_classes = y_proba.shape[1]
-    y_onehot = np.eye(n_classes, dtype=float)[y_true.astype(int)]
-    cdf_pred = np.cumsum(y_proba, axis=1)[:, :-1]
-    cdf_true = np.cumsum(y_onehot, axis=1)[:, :-1]
-    return float(round(np.mean(np.sum((cdf_pred - cdf_true) ** 2, axis=1) / (n_classes - 1)), 4))
+    return float(round(mean_ranked_probability_score(y_true, y_proba), 4))
 
 
 def _multiclass_brier(y_true: np.ndarray, y_proba: np.ndarray) -> float:
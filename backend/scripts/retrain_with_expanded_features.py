@@ -78,7 +78,10 @@ from models.feature_registry import (  # noqa: E402
     PHASE8_FEATURES_MARKET,
     PHASE8_FEATURES_PI,
 )
-from models.evaluation.metrics import expected_calibration_error  # noqa: E402
+from models.evaluation.metrics import (  # noqa: E402
+    expected_calibration_error,
+    mean_ranked_probability_score,
+)
 from models.evaluation.temporal_splits import walk_forward_splits  # noqa: E402
 
 # ── optional CatBoost ─────────────────────────────────────────────────────────
@@ -175,12 +178,7 @@ def _compute_rps(y_true: np.ndarray, y_proba: np.ndarray) -> float:
 
     Lower is better; RPS=0 is perfect. Class ordering must be home=0, draw=1, away=2.
     """
-    n_classes = y_proba.shape[1]
-    y_onehot = np.eye(n_classes, dtype=float)[y_true.astype(int)]
-    cdf_pred = np.cumsum(y_proba, axis=1)[:, :-1]
-    cdf_true = np.cumsum(y_onehot, axis=1)[:, :-1]
-    rps = float(np.mean(np.sum((cdf_pred - cdf_true) ** 2, axis=1) / (n_classes - 1)))
-    return round(rps, 4)
+    return round(mean_ranked_probability_score(y_true, y_proba), 4)
 
 
 def _multiclass_brier(y_true: np.ndarray, y_proba: np.ndarray) -> float:
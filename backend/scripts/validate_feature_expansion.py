@@ -70,6 +70,7 @@ from models.feature_registry import (  # noqa: E402
     PHASE8_FEATURES_MARKET,
     PHASE8_FEATURES_PI,
 )
+from models.evaluation.metrics import mean_ranked_probability_score  # noqa: E402
 from models.evaluation.temporal_splits import walk_forward_splits  # noqa: E402
 
 # ── optional SHAP ─────────────────────────────────────────────────────────────
@@ -142,11 +143,7 @@ class ExpansionReport:
 # ── metric helpers ────────────────────────────────────────────────────────────
 
 def _compute_rps(y_true: np.ndarray, y_proba: np.ndarray) -> float:
-    n_classes = y_proba.shape[1]
-    y_onehot = np.eye(n_classes, dtype=float)[y_true.astype(int)]
-    cdf_pred = np.cumsum(y_proba, axis=1)[:, :-1]
-    cdf_true = np.cumsum(y_onehot, axis=1)[:, :-1]
-    return float(round(np.mean(np.sum((cdf_pred - cdf_true) ** 2, axis=1) / (n_classes - 1)), 4))
+    return float(round(mean_ranked_probability_score(y_true, y_proba), 4))
 
 
 def _multiclass_brier(y_true: np.ndarray, y_proba: np.ndarray) -> float:
@@ -149,10 +149,11 @@ async def explain_prediction(
 ) -> SHAPExplainResponse:
     """Return SHAP feature contributions for a specific match prediction.
 
-    Retrieves the cached prediction for *match_id* and runs a SHAP explainer
-    against the loaded model. Returns a stub with empty feature list when the
-    model or cached prediction is not available so the frontend Why-panel
-    degrades gracefully.
+    Retrieves the cached prediction for *match_id* and returns the SHAP
+    contributions computed (and cached per feature vector) when it was
+    predicted; the loaded model is only asked when none were stored. Returns
+    a stub with empty feature list when the model or cached prediction is not
+    available so the frontend Why-panel degrades gracefully.
     """
     try:
         app_state = request.app.state
@@ -188,10 +189,27 @@ async def explain_prediction(
             predicted_outcome = max(preds, key=preds.get) if preds else "unknown"
             model_version = "3.0"
 
-        # Attempt live SHAP computation
+        # The prediction path already explained this fixture (cached per
+        # feature vector by the explanation service); reuse that payload.
+        explanations = (
+            cached.get("explanations") if isinstance(cached, dict) else getattr(cached, "explanations", None)
+        ) or {}
         top_features: List[SHAPFeatureContribution] = []
+        base_value = float(1 / 3)  # uniform prior base
+        for item in (explanations.get("feature_contributions") or [])[:10]:
+            value = float(item.get("contribution", 0.0))
+            top_features.append(
+                SHAPFeatureContribution(
+                    feature=str(item.get("feature")),
+                    shap_value=value,
+                    feature_value=item.get("feature_value"),
+                    direction="home_win" if value > 0 else "away_win",
+                )
+            )
+        if top_features:
+            base_value = float((explanations.get("waterfall_data") or {}).get("base_value", base_value))
 
-        if model_instance is not None:
+        if not top_features and model_instance is not None:
             try:
                 shap_values = getattr(model_instance, "explain_prediction", None)
                 if callable(shap_values) and cached is not None:
@@ -217,7 +235,7 @@ async def explain_prediction(
             predicted_outcome=predicted_outcome,
             confidence=confidence,
             top_features=top_features,
-            base_value=float(1 / 3),  # uniform prior base
+            base_value=base_value,
             model_version=model_version,
             generated_at=datetime.now(timezone.utc).isoformat(),
         )
@@ -21,6 +21,7 @@ from ...db.session import _alembic_head_revision
 from ...db.session import get_async_session
 from ...repositories.fixtures import get_next_upcoming_fixture
 from ...services.clv_capture_service import last_clv_capture_result
+from ...services.prediction_materializer import last_prediction_precompute_result
 from ...services.settlement_service import last_settlement_result
 from .full_analysis import get_full_analysis
 
@@ -272,6 +273,15 @@ def health_check() -> Dict[str, Any]:
     except Exception as _clv_exc:
         logger.debug("CLV capture snapshot unavailable: %s", _clv_exc)
 
+    # Prediction precompute snapshot — same informational-only convention.
+    try:
+        health_status["components"]["prediction_precompute"] = {
+            "status": "informational",
+            **last_prediction_precompute_result(),
+        }
+    except Exception as _precompute_exc:
+        logger.debug("Prediction precompute snapshot unavailable: %s", _precompute_exc)
+
     # Set overall status
     if degraded:
         health_status["status"] = "degraded"
@@ -17,6 +17,10 @@ from ...services.upcoming_match_service import UpcomingMatchService
 
 router = APIRouter(tags=["performance"])
 
+# Bootstrap resamples for the /model-performance error bars — a request-path
+# budget; offline promotion comparisons use the module default.
+_CI_RESAMPLES = 1_000
+
 
 class ValueBetScanFixture(BaseModel):
     match_id: str
@@ -195,6 +199,14 @@ async def model_performance(
             },
         )
 
+    from ...models.evaluation.bootstrap import bootstrap_metric_intervals
+
+    # Block-bootstrap intervals over the same records the folds were scored on;
+    # seeded so a page refresh does not jitter the error bars.
+    confidence_intervals = bootstrap_metric_intervals(
+        records, n_resamples=_CI_RESAMPLES, seed=0
+    )
+
     return {
         "status": "OK",
         "league": league,
@@ -207,6 +219,7 @@ async def model_performance(
         # owner instead of a hardcoded copy on the client.
         "baseline_accuracy": 1.0 / 3.0,
         "walk_forward": validation,
+        "confidence_intervals": confidence_intervals,
         "clv": clv,
         "generated_at": datetime.now(timezone.utc).isoformat(),
     }
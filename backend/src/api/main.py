@@ -12,7 +12,7 @@ from ..core.config import settings
 from ..core.cache import cache
 from ..core.model_fetcher import DEFAULT_LEAGUES, load_ensemble_per_league
 from ..db.session import init_db, close_db
-from ..providers import build_provider_registry
+from ..providers import build_provider_registry, get_provider_http_cache
 import os
 from datetime import datetime, timezone
 
@@ -173,6 +173,45 @@ async def _background_clv_capture() -> None:
             logger.exception("Background CLV capture failed")
 
 
+# Odds boards (services/odds_board.py) go stale after 600s; refreshing at half
+# that keeps request paths on a warm board. Only leagues requested in the last
+# few hours are re-fetched, so an idle deployment spends no Odds API quota.
+_ODDS_BOARD_REFRESH_INTERVAL_SECONDS = 300
+
+
+async def _background_odds_board_refresh() -> None:
+    """Same sleep-first periodic shape as CLV capture: the first board for a
+    league is fetched by whichever request asks for it."""
+    from ..services.odds_service import OddsService
+
+    service = OddsService()
+    while True:
+        await asyncio.sleep(_ODDS_BOARD_REFRESH_INTERVAL_SECONDS)
+        try:
+            await service.refresh_odds_boards()
+        except Exception:
+            logger.exception("Background odds board refresh failed")
+
+
+# Materialized predictions are served for up to
+# PREDICTION_MATERIALIZED_MAX_AGE_SECONDS (6h); a pass every 30 minutes keeps
+# them well inside that, and unchanged fixtures cost only a fingerprint query.
+_PREDICTION_PRECOMPUTE_INTERVAL_SECONDS = 1800
+
+
+async def _background_prediction_precompute() -> None:
+    """Sleep-first like settlement: fixture sync seeds the upcoming window on
+    its boot tick, and requests compute live until the first pass lands."""
+    from ..services.prediction_materializer import run_prediction_precompute_pass
+
+    while True:
+        await asyncio.sleep(_PREDICTION_PRECOMPUTE_INTERVAL_SECONDS)
+        try:
+            await run_prediction_precompute_pass()
+        except Exception:
+            logger.exception("Background prediction precompute failed")
+
+
 # Lifespan context manager for modern FastAPI startup/shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -199,7 +238,10 @@ async def lifespan(app: FastAPI):
         timeout=httpx.Timeout(8.0),
         limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
     )
-    app.state.provider_registry = build_provider_registry(http_client=app.state.http_client)
+    app.state.provider_registry = build_provider_registry(
+        http_client=app.state.http_client,
+        response_cache=get_provider_http_cache(),
+    )
 
     # Initialize async database
     try:
@@ -222,6 +264,12 @@ async def lifespan(app: FastAPI):
     # Same handle-stored/cancel-on-shutdown shape as settlement, above.
     app.state.clv_capture_task = asyncio.create_task(_background_clv_capture())
 
+    # Periodic odds board refresh: one fetch per active league per interval.
+    app.state.odds_board_task = asyncio.create_task(_background_odds_board_refresh())
+
+    # Periodic prediction precompute for every upcoming fixture.
+    app.state.prediction_precompute_task = asyncio.create_task(_background_prediction_precompute())
+
     # Strict model initialization (blocking) - startup must fail if models are unavailable.
     try:
         _startup_load_models_strict(app)
@@ -247,9 +295,15 @@ async def lifespan(app: FastAPI):
     # === SHUTDOWN ===
     logger.info("Shutting down SabiScore API...")
 
-    # All three background loops run forever — cancel them explicitly or every
+    # All background loops run forever — cancel them explicitly or every
     # redeploy logs an asyncio "task destroyed while pending" warning.
-    for task_name in ("fixture_sync_task", "settlement_task", "clv_capture_task"):
+    for task_name in (
+        "fixture_sync_task",
+        "settlement_task",
+        "clv_capture_task",
+        "odds_board_task",
+        "prediction_precompute_task",
+    ):
         task = getattr(app.state, task_name, None)
         if task is not None:
             task.cancel()
@@ -301,6 +355,15 @@ def _prime_prediction_service_cache(models: dict) -> None:
     except Exception as exc:
         logger.warning("Startup: could not prime prediction cache: %s", exc)
 
+    try:
+        from ..models.explanation_service import get_explanation_service
+
+        service = get_explanation_service()
+        for league, model in models.items():
+            service.register_ensemble(league, model)
+    except Exception as exc:
+        logger.warning("Startup: could not build SHAP explainers: %s", exc)
+
 
 def _startup_load_models_strict(app: FastAPI) -> None:
     """Load one validated ensemble per league before serving requests."""
@@ -28,7 +28,12 @@ def backfill_cli() -> None:
     help="Directory of fd_*.csv season files (defaults to backend/data/cache).",
 )
 @click.option("--dry-run", is_flag=True, help="Parse and report without writing to the database.")
-def history(cache_dir: Optional[Path], dry_run: bool) -> None:
+@click.option(
+    "--stream/--no-stream",
+    default=True,
+    help="Chunked stage-and-merge load (default) or the per-row ORM path.",
+)
+def history(cache_dir: Optional[Path], dry_run: bool, stream: bool) -> None:
     """Load completed matches from committed football-data.co.uk CSVs."""
     from ..services.historical_backfill_service import (
         default_cache_dir,
@@ -67,7 +72,7 @@ def history(cache_dir: Optional[Path], dry_run: bool) -> None:
         )
         return
 
-    report = asyncio.run(run_historical_backfill())
+    report = asyncio.run(run_historical_backfill(cache_dir=directory, streaming=stream))
     if report is None:
         raise SystemExit("historical backfill failed — see logs")
     click.echo(json.dumps(report.as_dict(), indent=2))
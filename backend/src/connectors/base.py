@@ -21,7 +21,8 @@ import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Mapping
+from typing import TYPE_CHECKING, Any, Mapping
+from urllib.parse import urlsplit
 
 import httpx
 from tenacity import (
@@ -31,6 +32,9 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
+if TYPE_CHECKING:
+    from ..providers.http_cache import ProviderHTTPCache
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -97,6 +101,9 @@ class AsyncJSONClient:
 
     Intentionally decoupled from Redis/SabiScore cache — caching stays in the
     existing ``DataAggregator`` layer, keeping this class trivially testable.
+    The one exception is HTTP-level revalidation: pass ``response_cache``
+    (``providers.http_cache.get_provider_http_cache()``) to replay ETag /
+    Last-Modified validators and honour ``Cache-Control: max-age``.
 
     Usage as context manager (preferred in long-lived tasks)::
 
@@ -126,12 +133,17 @@ class AsyncJSONClient:
         timeout_seconds: float = 12.0,
         max_retries: int = 3,
         user_agent: str = "SabiScore/4.0 (+https://github.com/Scardubu/sabiscore)",
+        response_cache: "ProviderHTTPCache | None" = None,
+        cache_namespace: str | None = None,
     ) -> None:
         merged: dict[str, str] = {"User-Agent": user_agent, "Accept": "application/json"}
         if headers:
             merged.update({k: v for k, v in headers.items() if v})
         self._base_url = base_url.rstrip("/")
         self._max_retries = max_retries
+        self._response_cache = response_cache
+        # Stats bucket in the shared cache; defaults to the upstream host.
+        self._cache_namespace = cache_namespace or urlsplit(self._base_url).netloc
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
             headers=merged,
@@ -171,7 +183,16 @@ class AsyncJSONClient:
         params: Mapping[str, Any] | None = None,
     ) -> httpx.Response:
         """Single GET call with rate-limit interception."""
-        response = await self._client.get(path, params=params)
+        if self._response_cache is not None:
+
+            async def send(request_headers: dict[str, str]) -> httpx.Response:
+                return await self._client.get(path, params=params, headers=request_headers)
+
+            response = await self._response_cache.get_response(
+                self._cache_namespace, f"{self._base_url}{path}", params, None, send
+            )
+        else:
+            response = await self._client.get(path, params=params)
         if response.status_code == 429:
             retry_after: float | None = None
             raw_header = response.headers.get("Retry-After")
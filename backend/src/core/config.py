@@ -332,6 +332,33 @@ class Settings(BaseSettings):
         alias="BERRAR_RATINGS_PARQUET_PATH",
         description="Parquet artifact for Berrar rating system (Phase 8-5a.5).",
     )
+    feature_store_max_age_seconds: int = Field(
+        default=6 * 3600,
+        ge=0,
+        alias="FEATURE_STORE_MAX_AGE_SECONDS",
+        description="Longest a stored live feature vector is served while none of its inputs "
+                    "change (freshness/staleness metadata ages with it). 0 disables the store.",
+    )
+    prediction_precompute_days_ahead: int = Field(
+        default=7,
+        ge=1,
+        alias="PREDICTION_PRECOMPUTE_DAYS_AHEAD",
+        description="Upcoming window (days) the background precompute pass materializes predictions for.",
+    )
+    prediction_materialized_max_age_seconds: int = Field(
+        default=6 * 3600,
+        ge=0,
+        alias="PREDICTION_MATERIALIZED_MAX_AGE_SECONDS",
+        description="Oldest materialized prediction the upcoming board serves before computing "
+                    "live instead. 0 disables serving materialized predictions.",
+    )
+    online_calibration_halflife_days: float = Field(
+        default=14.0,
+        gt=0,
+        alias="ONLINE_CALIBRATION_HALFLIFE_DAYS",
+        description="Half-life of settled results in the per-league online calibration state: "
+                    "older outcomes are down-weighted by 0.5 per half-life.",
+    )
     use_phase8_models: bool = Field(
         default=False,
         alias="USE_PHASE8_MODELS",
@@ -356,6 +383,13 @@ class Settings(BaseSettings):
         alias="DATA_RETENTION_DAYS",
         description="Number of days to retain scraped match records before pruning",
     )
+    odds_history_retention_days: int = Field(
+        default=180,
+        ge=31,
+        alias="ODDS_HISTORY_RETENTION_DAYS",
+        description="Days of odds_history kept by cleanup_old_data. Whole monthly partitions "
+                    "are dropped once they end before the cutoff.",
+    )
 
     # ── Sprint 4 enrichment and training configuration ────────────────────────
     odds_staleness_max_hours: int = Field(
@@ -540,6 +574,11 @@ class Settings(BaseSettings):
         alias="PROVIDER_CACHE_ENABLED",
         description="Enable response caching for provider gateway calls.",
     )
+    provider_http_cache_path: Path = Field(
+        default_factory=lambda: _PROJECT_ROOT / "data" / "cache" / "provider_http_cache.sqlite3",
+        alias="PROVIDER_HTTP_CACHE_PATH",
+        description="SQLite store behind the provider conditional-GET cache (providers/http_cache.py).",
+    )
     provider_strict_quota_mode: bool = Field(
         default=True,
         alias="PROVIDER_STRICT_QUOTA_MODE",
@@ -603,6 +642,7 @@ class Settings(BaseSettings):
         "causal_report_path",
         "pi_ratings_parquet_path",
         "berrar_ratings_parquet_path",
+        "provider_http_cache_path",
         mode="before",
     )
     @classmethod
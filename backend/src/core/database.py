@@ -376,7 +376,12 @@ class MatchEvent(Base):
 
 
 class OddsHistory(Base):
-    """Time-series odds tracking for market movement analysis"""
+    """Time-series odds tracking for market movement analysis
+
+    On PostgreSQL the table is range-partitioned by month on ``timestamp``
+    (alembic 0007, primary key ``(id, timestamp)``); see ``src.db.odds_storage``
+    for partition maintenance and retention.
+    """
     __tablename__ = "odds_history"
     __table_args__ = (
         Index("ix_odds_history_match_timestamp", "match_id", "timestamp"),
@@ -422,12 +427,49 @@ class OddsHistory(Base):
     match = relationship("Match")
 
 
+class OddsRollup(Base):
+    """Opening / latest / closing 1X2 prices per (match, market, bookmaker).
+
+    Maintained incrementally by ingestion (``src.db.odds_storage``) so drift
+    features read one row instead of scanning the odds_history time series.
+    Closing is the last price seen before kickoff.
+    """
+    __tablename__ = "odds_rollups"
+    __table_args__ = (
+        Index("ux_odds_rollups_match_market_bookmaker", "match_id", "market_type", "bookmaker", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    match_id = Column(String, ForeignKey("matches.id"), nullable=False)
+    market_type = Column(String, nullable=False)
+    bookmaker = Column(String, nullable=False)
+
+    opening_home = Column(Float, nullable=True)
+    opening_draw = Column(Float, nullable=True)
+    opening_away = Column(Float, nullable=True)
+    opening_at = Column(DateTime, nullable=False)
+
+    latest_home = Column(Float, nullable=True)
+    latest_draw = Column(Float, nullable=True)
+    latest_away = Column(Float, nullable=True)
+    latest_at = Column(DateTime, nullable=False)
+
+    closing_home = Column(Float, nullable=True)
+    closing_draw = Column(Float, nullable=True)
+    closing_away = Column(Float, nullable=True)
+    closing_at = Column(DateTime, nullable=True)
+
+    snapshot_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+
+
 class FeatureVector(Base):
     """Enriched feature vectors for ML models (220 features)"""
     __tablename__ = "feature_vectors"
     __table_args__ = (
         Index("ix_feature_vectors_match", "match_id"),
         Index("ix_feature_vectors_timestamp", "timestamp"),
+        Index("ix_feature_vectors_match_version_timestamp", "match_id", "features_version", "timestamp"),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -498,6 +540,13 @@ class FeatureVector(Base):
     timestamp = Column(DateTime)
     created_at = Column(DateTime)
 
+    # Feature store (src.services.feature_store): live vectors are stored under
+    # features_version = feature_schema_hash(...) with timestamp as the as-of time.
+    league = Column(String, nullable=True)
+    input_fingerprint = Column(String, nullable=True)
+    data_gaps = Column(JSON, nullable=True)
+    provenance = Column(JSON, nullable=True)  # staleness, freshness, sources, identity
+
     match = relationship("Match")
 
 
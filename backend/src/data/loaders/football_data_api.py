@@ -9,6 +9,7 @@ from typing import Any, Callable, Dict, List, Optional
 import httpx
 
 from ...connectors.base import AsyncJSONClient, ConnectorError, ConnectorRateLimitError
+from ...providers.http_cache import get_provider_http_cache
 from ...core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -94,6 +95,8 @@ class FootballDataAPIClient:
             base_url=self.BASE_URL,
             headers={"X-Auth-Token": self.api_key},
             timeout_seconds=float(self.timeout),
+            response_cache=get_provider_http_cache(),
+            cache_namespace="football_data_org",
         ) as client:
             for index, competition in enumerate(competitions):
                 params = {
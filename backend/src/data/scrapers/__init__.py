@@ -20,11 +20,22 @@ All scrapers implement ethical practices:
 - Local data fallback
 - Circuit breaker patterns
 
+``AsyncBaseScraper`` adds an asyncio path (shared pooled client, per-host
+token buckets, robots.txt TTL cache) for scraping several leagues at once.
+
 Note: WhoScored scraper removed due to persistent 403 blocks.
 Form features now rebuilt using Soccerway + Understat.
 """
 
 from .base_scraper import BaseScraper, USER_AGENTS, DATA_DIR, CACHE_DIR, PROCESSED_DIR
+from .local_cache import LocalDatasetCache, get_local_dataset_cache
+from .async_base_scraper import (
+    AsyncBaseScraper,
+    AsyncScraperSession,
+    HostThrottle,
+    RobotsCache,
+    get_async_scraper_session,
+)
 from .football_data_scraper import FootballDataEnhancedScraper
 from .betfair_scraper import BetfairExchangeScraper
 from .soccerway_scraper import SoccerwayScraper, get_standings, get_fixtures
@@ -36,6 +47,13 @@ from .flashscore_scraper import FlashscoreScraper, get_live_match
 __all__ = [
     # Base
     "BaseScraper",
+    "AsyncBaseScraper",
+    "AsyncScraperSession",
+    "HostThrottle",
+    "RobotsCache",
+    "get_async_scraper_session",
+    "LocalDatasetCache",
+    "get_local_dataset_cache",
     "USER_AGENTS",
     "DATA_DIR",
     "CACHE_DIR",
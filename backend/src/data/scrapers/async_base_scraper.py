@@ -0,0 +1,461 @@
+"""
+Async Scraper Core for SabiScore
+================================
+
+``BaseScraper`` fetches through a blocking ``requests.Session`` and enforces
+its delay with ``time.sleep``, so every page parks a worker thread and a
+multi-league ingestion run is strictly sequential. ``AsyncBaseScraper`` keeps
+the same contract (circuit breaker, robots.txt fail-closed, local-cache
+fallback, metrics) on an asyncio path:
+
+- One shared ``httpx.AsyncClient`` per event loop with keep-alive pooling and
+  HTTP/2 when ``h2`` is installed, so scrapers hitting the same site reuse
+  connections instead of opening a session each.
+- A per-host token bucket (``HostThrottle``) that only suspends the coroutine
+  waiting for its slot; other hosts — and other work on the loop — proceed.
+  The bucket is keyed by host, not scraper, so two scraper instances pointed
+  at one site still share its budget.
+- A per-host semaphore bounding in-flight requests to one domain.
+- robots.txt parsers cached per origin with a TTL (the sync path's
+  ``lru_cache`` never expires) and fetched single-flight through the client.
+
+Subclasses override ``_fetch_remote_async`` to fetch with ``get_page_async``;
+scrapers that only implement the sync ``_fetch_remote`` still work through
+``fetch_data_async``, which runs them on a worker thread under the host
+throttle. Several leagues can then be scraped concurrently from one worker::
+
+    scraper = FootballDataEnhancedScraper()
+    frames = await scraper.download_all_leagues_async("2526")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import httpx
+import pandas as pd
+
+from .base_scraper import BaseScraper
+
+logger = logging.getLogger(__name__)
+
+try:  # HTTP/2 needs the optional ``h2`` package (httpx[http2]).
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    HTTP2_AVAILABLE = False
+
+# Parsed robots.txt is reused this long before it is fetched again.
+ROBOTS_TTL_SECONDS = 6 * 3600
+
+# An unreachable robots.txt blocks the origin (fail closed) but is retried
+# sooner than a parsed one is refreshed.
+ROBOTS_FAILURE_TTL_SECONDS = 300
+
+# Default cap on simultaneous requests to one host.
+DEFAULT_MAX_CONCURRENCY_PER_HOST = 2
+
+# Statuses retried with backoff, same set as the sync session's urllib3 Retry.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0)
+
+
+def host_of(url: str) -> str:
+    """Lower-cased ``host[:port]`` used to key throttles and robots caches."""
+    return urlparse(url).netloc.lower()
+
+
+def _origin_of(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc.lower()}"
+
+
+class HostThrottle:
+    """
+    Token bucket plus concurrency bound for a single host.
+
+    The bucket refills one token every ``interval`` seconds and holds up to
+    ``burst`` tokens. Acquisition reserves the next slot immediately and then
+    awaits it, so callers queue in arrival order without a lock and waiting
+    never blocks the event loop. ``jitter`` adds up to that fraction of the
+    interval to each wait, like the sync scraper's natural-timing jitter.
+
+    Use as ``async with throttle: ...``; the semaphore is held for the whole
+    request, the token only gates its start.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY_PER_HOST,
+        burst: int = 1,
+        jitter: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.interval = max(0.0, float(interval))
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.burst = max(1, int(burst))
+        self.jitter = max(0.0, float(jitter))
+        self.clock = clock
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Theoretical arrival time of the next token (GCRA form of the bucket).
+        self._next_slot = 0.0
+
+    def reserve(self) -> float:
+        """Claim the next token and return how long to wait for it."""
+        now = self.clock()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self.interval
+        wait = slot - (self.burst - 1) * self.interval - now
+        if wait > 0 and self.jitter:
+            wait += random.random() * self.jitter * self.interval
+        return max(0.0, wait)
+
+    async def acquire(self) -> None:
+        await self._semaphore.acquire()
+        try:
+            wait = self.reserve()
+            if wait:
+                logger.debug("Host throttle: waiting %.2fs", wait)
+                await asyncio.sleep(wait)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def release(self) -> None:
+        self._semaphore.release()
+
+    async def __aenter__(self) -> "HostThrottle":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.release()
+
+
+@dataclass
+class _RobotsEntry:
+    parser: Optional[RobotFileParser]
+    expires_at: float
+
+
+@dataclass
+class RobotsCache:
+    """
+    Per-origin robots.txt parsers with a TTL.
+
+    Mirrors ``RobotFileParser.read()``: 401/403 disallow everything, any
+    other 4xx allows everything. Network errors and 5xx cache ``None`` for
+    ``failure_ttl_seconds`` so callers fail closed without refetching on
+    every page.
+    """
+
+    ttl_seconds: float = ROBOTS_TTL_SECONDS
+    failure_ttl_seconds: float = ROBOTS_FAILURE_TTL_SECONDS
+    clock: Callable[[], float] = time.monotonic
+    _entries: Dict[str, _RobotsEntry] = field(default_factory=dict, repr=False)
+    _inflight: Dict[str, asyncio.Future] = field(default_factory=dict, repr=False)
+
+    async def get(self, url: str, client: httpx.AsyncClient, user_agent: str) -> Optional[RobotFileParser]:
+        origin = _origin_of(url)
+        entry = self._entries.get(origin)
+        if entry is not None and self.clock() < entry.expires_at:
+            return entry.parser
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(origin)
+        if inflight is None or inflight.done() or inflight.get_loop() is not loop:
+            inflight = loop.create_task(self._load(origin, client, user_agent))
+            self._inflight[origin] = inflight
+            inflight.add_done_callback(
+                lambda task: self._inflight.pop(origin, None)
+                if self._inflight.get(origin) is task
+                else None
+            )
+        return await asyncio.shield(inflight)
+
+    async def _load(self, origin: str, client: httpx.AsyncClient, user_agent: str) -> Optional[RobotFileParser]:
+        robots_url = f"{origin}/robots.txt"
+        parser: Optional[RobotFileParser] = RobotFileParser(robots_url)
+        try:
+            response = await client.get(robots_url, headers={"User-Agent": user_agent})
+            if response.status_code in (401, 403):
+                parser.disallow_all = True
+            elif 400 <= response.status_code < 500:
+                parser.allow_all = True
+            elif response.status_code >= 500:
+                raise httpx.HTTPStatusError(
+                    f"robots.txt returned {response.status_code}",
+                    request=response.request,
+                    response=response,
+                )
+            else:
+                parser.parse(response.text.splitlines())
+            ttl = self.ttl_seconds
+        except Exception as exc:
+            logger.debug("Could not fetch robots.txt for %s: %s", origin, exc)
+            parser = None
+            ttl = self.failure_ttl_seconds
+        self._entries[origin] = _RobotsEntry(parser=parser, expires_at=self.clock() + ttl)
+        return parser
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+
+
+class AsyncScraperSession:
+    """
+    Shared client, host throttles and robots cache for async scrapers.
+
+    The pooled client and the throttles' semaphores belong to the loop that
+    created them; when used under a new loop (separate ``asyncio.run`` calls
+    from a CLI) both are rebuilt. Parsed robots.txt survives the switch.
+    """
+
+    def __init__(
+        self,
+        client_factory: Optional[Callable[[], httpx.AsyncClient]] = None,
+        robots: Optional[RobotsCache] = None,
+    ):
+        self._client_factory = client_factory or self._default_client
+        self.robots = robots or RobotsCache()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._throttles: Dict[str, HostThrottle] = {}
+
+    @staticmethod
+    def _default_client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=_POOL_LIMITS,
+            follow_redirects=True,
+        )
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._client = None
+            self._throttles.clear()
+
+    def client(self) -> httpx.AsyncClient:
+        self._bind_loop()
+        if self._client is None or self._client.is_closed:
+            self._client = self._client_factory()
+        return self._client
+
+    def throttle(
+        self,
+        host: str,
+        interval: float,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY_PER_HOST,
+        jitter: float = 0.0,
+    ) -> HostThrottle:
+        """Throttle for ``host``; the first scraper to ask sets its budget."""
+        self._bind_loop()
+        throttle = self._throttles.get(host)
+        if throttle is None:
+            throttle = HostThrottle(interval, max_concurrency=max_concurrency, jitter=jitter)
+            self._throttles[host] = throttle
+        return throttle
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+
+_shared_session: Optional[AsyncScraperSession] = None
+
+
+def get_async_scraper_session() -> AsyncScraperSession:
+    """Process-wide session shared by every ``AsyncBaseScraper``."""
+    global _shared_session
+    if _shared_session is None:
+        _shared_session = AsyncScraperSession()
+    return _shared_session
+
+
+class AsyncBaseScraper(BaseScraper):
+    """
+    ``BaseScraper`` with an asyncio fetch path.
+
+    The sync API (``get_page``/``fetch_data``) is inherited unchanged. The
+    async counterparts share one circuit breaker, metrics dict and local
+    cache paths with it, so mixing both paths on one instance is safe.
+
+    Usage:
+        class MyScraper(AsyncBaseScraper):
+            async def _fetch_remote_async(self, league):
+                return await self.get_page_async(f"{self.base_url}/{league}")
+
+        results = await asyncio.gather(
+            *(scraper.fetch_data_async(league) for league in leagues)
+        )
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        rate_limit_delay: float = 3.0,
+        max_retries: int = 3,
+        timeout: int = 30,
+        respect_robots: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY_PER_HOST,
+        session: Optional[AsyncScraperSession] = None,
+    ):
+        super().__init__(
+            base_url=base_url,
+            rate_limit_delay=rate_limit_delay,
+            max_retries=max_retries,
+            timeout=timeout,
+            respect_robots=respect_robots,
+        )
+        self.max_concurrency = max_concurrency
+        self._async_session = session
+
+    @property
+    def async_session(self) -> AsyncScraperSession:
+        if self._async_session is None:
+            self._async_session = get_async_scraper_session()
+        return self._async_session
+
+    def _host_throttle(self, url: str) -> HostThrottle:
+        return self.async_session.throttle(
+            host_of(url),
+            self.rate_limit_delay,
+            max_concurrency=self.max_concurrency,
+            jitter=0.5,
+        )
+
+    async def _is_allowed_by_robots_async(self, url: str, user_agent: str) -> bool:
+        """Async ``_is_allowed_by_robots``: same fail-closed policy, cached with TTL."""
+        if not self.respect_robots:
+            return True
+        rp = await self.async_session.robots.get(url, self.async_session.client(), user_agent)
+        if rp is None:
+            logger.warning("robots.txt unavailable for %s; blocking %s", self.base_url, url)
+            return False
+        return rp.can_fetch(user_agent, url)
+
+    @staticmethod
+    def _retry_after(response: httpx.Response, default: float) -> float:
+        try:
+            return max(default, float(response.headers.get("retry-after", "")))
+        except ValueError:
+            return default
+
+    async def get_page_async(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        method: str = "GET",
+        **kwargs,
+    ) -> Optional[str]:
+        """Async ``get_page``: circuit breaker, robots.txt, per-host throttle, retries."""
+        if not self.circuit_breaker.can_attempt():
+            logger.warning("Circuit breaker OPEN - skipping remote request")
+            return None
+
+        headers = kwargs.pop("headers", None) or self._get_headers()
+        if not await self._is_allowed_by_robots_async(url, headers.get("User-Agent", "*")):
+            logger.info(f"Blocked by robots.txt: {url}")
+            self.metrics["requests_blocked_robots"] += 1
+            return None
+
+        timeout = kwargs.pop("timeout", self.timeout)
+        client = self.async_session.client()
+        throttle = self._host_throttle(url)
+        self.metrics["requests_total"] += 1
+        try:
+            for attempt in range(self.max_retries + 1):
+                async with throttle:
+                    response = await client.request(
+                        method.upper(), url, params=params, headers=headers, timeout=timeout, **kwargs
+                    )
+                if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                    break
+                self.metrics["retries_total"] += 1
+                # Backoff sleeps outside the throttle so the host's other
+                # requests are not held behind this one.
+                await asyncio.sleep(self._retry_after(response, 2 ** attempt))
+            response.raise_for_status()
+        except Exception as exc:
+            logger.error(f"Failed to fetch page {url}: {exc}")
+            self.metrics["requests_failed"] += 1
+            self.circuit_breaker.record_failure()
+            return None
+
+        self.metrics["requests_success"] += 1
+        self.circuit_breaker.record_success()
+        return response.text
+
+    async def _fetch_remote_async(self, *args, **kwargs) -> Any:
+        """
+        Async remote fetch; override to use ``get_page_async``.
+
+        The default defers to ``_fetch_remote``: awaited directly when it is a
+        coroutine function, otherwise run on a worker thread while holding the
+        host throttle (the async equivalent of ``fetch_data``'s rate-limit
+        wait before the sync fetch).
+        """
+        if asyncio.iscoroutinefunction(self._fetch_remote):
+            return await self._fetch_remote(*args, **kwargs)
+        async with self._host_throttle(self.base_url):
+            return await asyncio.to_thread(self._fetch_remote, *args, **kwargs)
+
+    async def fetch_data_async(
+        self,
+        *args,
+        use_cache: bool = True,
+        force_refresh: bool = False,
+        **kwargs,
+    ) -> Optional[Union[pd.DataFrame, Dict, List]]:
+        """
+        Async ``fetch_data``: local cache, then remote, then stale-cache fallback.
+
+        Local reads and writes (CSV parsing, JSON dumps) run on worker threads
+        so concurrent fetches for other leagues keep moving.
+        """
+        if use_cache and not force_refresh:
+            local_data = await asyncio.to_thread(self._load_local)
+            if local_data is not None:
+                self.metrics["cache_hits"] += 1
+                logger.info(f"Using local cache from {self.local_processed_path or self.local_raw_path}")
+                return local_data
+
+        if not self.circuit_breaker.can_attempt():
+            logger.warning("Circuit breaker OPEN - using stale cache if available")
+            return await asyncio.to_thread(self._load_local)
+
+        try:
+            self.metrics["requests_total"] += 1
+            page_content = await self._fetch_remote_async(*args, **kwargs)
+            if page_content is None:
+                raise ValueError("Empty response from remote")
+
+            parsed = self._parse_data(page_content)
+
+            self.metrics["requests_success"] += 1
+            self.circuit_breaker.record_success()
+
+            if use_cache:
+                await asyncio.to_thread(self._save_local, parsed)
+            return parsed
+
+        except Exception as e:
+            logger.error(f"Fetch failed: {e}")
+            self.metrics["requests_failed"] += 1
+            self.circuit_breaker.record_failure()
+            return await asyncio.to_thread(self._load_local)
+
@@ -6,7 +6,7 @@ Streamlined abstract base class for all scrapers with:
 - Ethical rate limiting and delays
 - robots.txt compliance checking
 - User-agent rotation
-- Local data fallback (raw/processed merge)
+- Local data fallback (raw/processed merge, memoized; see local_cache.py)
 - Retry logic with exponential backoff
 - Common parsing utilities
 - Circuit breaker pattern
@@ -14,10 +14,12 @@ Streamlined abstract base class for all scrapers with:
 All scrapers inherit from this class for consistent, ethical scraping.
 """
 
+import copy
 import json
 import logging
 import os
 import random
+import threading
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
@@ -32,6 +34,8 @@ import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .local_cache import PARQUET_AVAILABLE, LocalDatasetCache, get_local_dataset_cache
+
 logger = logging.getLogger(__name__)
 
 # Expanded user agents for better rotation
@@ -58,6 +62,13 @@ CACHE_DIR = DATA_DIR / 'cache'
 for dir_path in [PROCESSED_DIR, CACHE_DIR]:
     dir_path.mkdir(parents=True, exist_ok=True)
 
+# Columnar store for DataFrames saved by scrapers (Parquet + manifest)
+DATASETS_DIR = CACHE_DIR / 'datasets'
+
+# Rows sharing these columns are the same match; used when a scraper does not
+# declare ``local_key_columns``.
+DEFAULT_KEY_COLUMNS = ['date', 'home_team', 'away_team']
+
 
 # ---------------------------------------------------------------------------
 # Robots.txt helper
@@ -172,10 +183,15 @@ class BaseScraper(ABC):
         # Local data paths (subclasses override)
         self.local_raw_path: Optional[Path] = None
         self.local_processed_path: Optional[Path] = None
+        # Dedup key for saved DataFrames (None -> DEFAULT_KEY_COLUMNS present)
+        self.local_key_columns: Optional[List[str]] = None
+        self.local_cache: LocalDatasetCache = get_local_dataset_cache(DATASETS_DIR)
+        self._merged_local: Optional[tuple] = None
         
         # Session setup
         self.session = self._create_session()
         self.last_request_time = 0.0
+        self._rate_lock = threading.Lock()
         
         # Circuit breaker
         self.circuit_breaker = CircuitBreaker(failure_threshold=5, timeout=60)
@@ -248,16 +264,25 @@ class BaseScraper(ABC):
         return allowed
 
     def _rate_limit(self) -> None:
-        """Enforce ethical rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - elapsed
-            # Add jitter for more natural timing
-            jitter = random.random() * 0.5 * self.rate_limit_delay
-            total_sleep = sleep_time + jitter
+        """Enforce ethical rate limiting between requests.
+
+        The next request slot is reserved under a lock before sleeping, so
+        threads sharing one scraper (ingestion fan-out) queue behind each
+        other instead of all waking after the same delay.
+        """
+        with self._rate_lock:
+            now = time.time()
+            elapsed = now - self.last_request_time
+            total_sleep = 0.0
+            if elapsed < self.rate_limit_delay:
+                sleep_time = self.rate_limit_delay - elapsed
+                # Add jitter for more natural timing
+                jitter = random.random() * 0.5 * self.rate_limit_delay
+                total_sleep = sleep_time + jitter
+            self.last_request_time = now + total_sleep
+        if total_sleep:
             logger.debug(f"Rate limiting: sleeping {total_sleep:.2f}s")
             time.sleep(total_sleep)
-        self.last_request_time = time.time()
 
     def _wait_rate_limit(self) -> None:
         """Public helper for enforcing the internal rate limit."""
@@ -304,50 +329,74 @@ class BaseScraper(ABC):
             self.circuit_breaker.record_failure()
             return None
     
+    @staticmethod
+    def _read_local_file(path: Path, csv_encoding: str) -> Optional[Union[pd.DataFrame, Dict, List]]:
+        if str(path).endswith('.csv'):
+            return pd.read_csv(path, encoding=csv_encoding)
+        if str(path).endswith('.json'):
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return None
+
+    def _load_local_file(self, path: Optional[Path], csv_encoding: str, label: str):
+        """Memoized read of one local file (no copy; callers must not mutate)."""
+        if not path:
+            return None
+        try:
+            data = self.local_cache.read_file(
+                path, lambda p: self._read_local_file(p, csv_encoding), copy=False
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load {label} data: {e}")
+            return None
+        if data is not None:
+            logger.debug(f"Loaded {label} data from {path}")
+        return data
+
+    def _local_dataset_name(self) -> Optional[str]:
+        if not self.local_processed_path or not PARQUET_AVAILABLE:
+            return None
+        return self.local_processed_path.stem
+
     def _load_local(self) -> Optional[Union[pd.DataFrame, Dict, List]]:
         """
         Load and merge local raw/processed data.
         
         Creative fallback: Checks both raw and processed paths,
-        merges if both exist to provide augmented data.
+        merges if both exist to provide augmented data. Processed DataFrames
+        come from the columnar dataset when one was saved, otherwise from the
+        legacy CSV/JSON file. Reads and the merge are memoized, so repeated
+        calls return a copy without touching disk.
         
         Returns:
             Merged data if available, None otherwise
         """
-        raw_data = None
+        raw_data = self._load_local_file(self.local_raw_path, 'latin1', 'raw')
+
         processed_data = None
-        
-        # Load raw data
-        if self.local_raw_path and self.local_raw_path.exists():
+        dataset = self._local_dataset_name()
+        if dataset is not None:
             try:
-                if str(self.local_raw_path).endswith('.csv'):
-                    raw_data = pd.read_csv(self.local_raw_path, encoding='latin1')
-                elif str(self.local_raw_path).endswith('.json'):
-                    with open(self.local_raw_path, 'r', encoding='utf-8') as f:
-                        raw_data = json.load(f)
-                logger.debug(f"Loaded raw data from {self.local_raw_path}")
+                processed_data = self.local_cache.load(dataset, copy=False)
             except Exception as e:
-                logger.warning(f"Failed to load raw data: {e}")
-        
-        # Load processed data
-        if self.local_processed_path and self.local_processed_path.exists():
-            try:
-                if str(self.local_processed_path).endswith('.csv'):
-                    processed_data = pd.read_csv(self.local_processed_path, encoding='utf-8')
-                elif str(self.local_processed_path).endswith('.json'):
-                    with open(self.local_processed_path, 'r', encoding='utf-8') as f:
-                        processed_data = json.load(f)
-                logger.debug(f"Loaded processed data from {self.local_processed_path}")
-            except Exception as e:
-                logger.warning(f"Failed to load processed data: {e}")
+                logger.warning(f"Failed to load dataset {dataset}: {e}")
+        if processed_data is None:
+            processed_data = self._load_local_file(self.local_processed_path, 'utf-8', 'processed')
+
         if raw_data is not None and processed_data is not None:
-            return self._merge_data(raw_data, processed_data)
+            memo = self._merged_local
+            if memo is None or memo[0] is not raw_data or memo[1] is not processed_data:
+                memo = (raw_data, processed_data, self._merge_data(raw_data, processed_data))
+                self._merged_local = memo
+            merged = memo[2]
         elif raw_data is not None:
-            return raw_data
-        elif processed_data is not None:
-            return processed_data
-        
-        return None
+            merged = raw_data
+        else:
+            merged = processed_data
+
+        if merged is None:
+            return None
+        return merged.copy() if isinstance(merged, pd.DataFrame) else copy.deepcopy(merged)
     
     def _merge_data(
         self,
@@ -380,21 +429,35 @@ class BaseScraper(ABC):
         return processed_data
     
     def _save_local(self, data: Union[pd.DataFrame, Dict, List]) -> None:
-        """Save scraped data to local cache for future use."""
+        """Save scraped data to local cache for future use.
+
+        DataFrames are appended to the scraper's Parquet dataset, deduplicated
+        on ``local_key_columns``; other payloads are written as compact JSON.
+        """
         if not self.local_processed_path:
             return
         
         try:
+            dataset = self._local_dataset_name()
+            if isinstance(data, pd.DataFrame) and dataset is not None:
+                keys = self.local_key_columns
+                if keys is None:
+                    keys = [c for c in DEFAULT_KEY_COLUMNS if c in data.columns]
+                added = self.local_cache.append(dataset, data, keys)
+                logger.info(f"Saved {added} new rows to dataset {dataset}")
+                return
+
             self.local_processed_path.parent.mkdir(parents=True, exist_ok=True)
             
             if isinstance(data, pd.DataFrame):
                 if str(self.local_processed_path).endswith('.json'):
-                    data.to_json(self.local_processed_path, orient='records', indent=2)
+                    data.to_json(self.local_processed_path, orient='records')
                 else:
                     data.to_csv(self.local_processed_path, index=False)
             else:
                 with open(self.local_processed_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, default=str)
+                    json.dump(data, f, separators=(',', ':'), default=str)
+            self.local_cache.forget(self.local_processed_path)
             
             logger.info(f"Saved data to {self.local_processed_path}")
         except Exception as e:
@@ -0,0 +1,294 @@
+"""
+Columnar Local Cache for Scrapers
+=================================
+
+``BaseScraper.fetch_data`` consults local data before every remote call, and
+``_load_local`` used to re-read the raw and processed CSV/JSON files each
+time (``pd.read_csv`` with latin1, ``json.load``), then concat + dedupe them.
+``_save_local`` rewrote the whole processed file as pretty-printed JSON/CSV.
+
+``LocalDatasetCache`` replaces both halves:
+
+- **Datasets** are directories of Parquet part files plus a small
+  ``manifest.json`` (key columns, part list, row count, columns). Writes are
+  append-only: incoming rows already present verbatim are skipped, the rest
+  land in a new part, and readers dedupe on the declared key columns with
+  last-write-wins. After ``compact_after`` parts the dataset is rewritten as
+  one part.
+- **Memoization**: loaded datasets and plain files (the legacy raw CSV/JSON)
+  are kept in-process, keyed on the file's ``(mtime_ns, size)``. The file is
+  only re-stat'ed once per ``stat_interval`` seconds, so repeated lookups in a
+  process do not touch disk; writes through the cache update the memo
+  directly.
+
+Parquet needs ``pyarrow`` (already a pipeline dependency); without it
+``PARQUET_AVAILABLE`` is False and scrapers keep their CSV/JSON files.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow  # noqa: F401
+
+    PARQUET_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    PARQUET_AVAILABLE = False
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Memoized entries are re-validated against the file's mtime at most this often.
+STAT_INTERVAL_SECONDS = 30.0
+
+# Rewrite a dataset as a single part once it has accumulated this many.
+COMPACT_AFTER_PARTS = 16
+
+Signature = Optional[Tuple[int, int]]
+
+
+def _signature(path: Path) -> Signature:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _copy(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    return copy.deepcopy(value)
+
+
+def _dedupe(frame: pd.DataFrame, key_columns: Sequence[str]) -> pd.DataFrame:
+    keys = [c for c in key_columns if c in frame.columns]
+    if not keys:
+        return frame.reset_index(drop=True)
+    return frame.drop_duplicates(subset=keys, keep="last").reset_index(drop=True)
+
+
+@dataclass
+class _Memo:
+    value: Any
+    signature: Signature
+    checked_at: float
+    manifest: Optional[Dict[str, Any]] = None
+
+
+class LocalDatasetCache:
+    """Parquet datasets with manifests, plus memoized file reads."""
+
+    def __init__(
+        self,
+        root: Path,
+        stat_interval: float = STAT_INTERVAL_SECONDS,
+        compact_after: int = COMPACT_AFTER_PARTS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.root = Path(root)
+        self.stat_interval = stat_interval
+        self.compact_after = max(1, compact_after)
+        self.clock = clock
+        self._memo: Dict[str, _Memo] = {}
+        # fetch_data_async loads local data on worker threads.
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Memo bookkeeping
+    # ------------------------------------------------------------------
+
+    def _revalidate(self, key: str, path: Path) -> Optional[_Memo]:
+        memo = self._memo.get(key)
+        if memo is None:
+            return None
+        now = self.clock()
+        if now - memo.checked_at < self.stat_interval:
+            return memo
+        if _signature(path) != memo.signature:
+            del self._memo[key]
+            return None
+        memo.checked_at = now
+        return memo
+
+    def forget(self, path: Optional[Path] = None) -> None:
+        """Drop the memo for one file (after writing it outside the cache), or all."""
+        with self._lock:
+            if path is None:
+                self._memo.clear()
+            else:
+                self._memo.pop(f"file:{path}", None)
+
+    # ------------------------------------------------------------------
+    # Plain files
+    # ------------------------------------------------------------------
+
+    def read_file(
+        self,
+        path: Path,
+        reader: Callable[[Path], Any],
+        copy: bool = True,
+    ) -> Any:
+        """``reader(path)`` memoized on the file's mtime; None if it is missing.
+
+        Pass ``copy=False`` only when the result is not mutated.
+        """
+        key = f"file:{path}"
+        with self._lock:
+            memo = self._revalidate(key, path)
+            if memo is None:
+                signature = _signature(path)
+                value = reader(path) if signature is not None else None
+                memo = _Memo(value, signature, self.clock())
+                self._memo[key] = memo
+            return _copy(memo.value) if copy else memo.value
+
+    # ------------------------------------------------------------------
+    # Datasets
+    # ------------------------------------------------------------------
+
+    def _dataset_dir(self, name: str) -> Path:
+        return self.root / name
+
+    def _manifest_path(self, name: str) -> Path:
+        return self._dataset_dir(name) / MANIFEST_NAME
+
+    def _dataset_memo(self, name: str) -> _Memo:
+        key = f"dataset:{name}"
+        manifest_path = self._manifest_path(name)
+        memo = self._revalidate(key, manifest_path)
+        if memo is not None:
+            return memo
+
+        signature = _signature(manifest_path)
+        manifest = None
+        frame = None
+        if signature is not None:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            parts = [
+                pd.read_parquet(self._dataset_dir(name) / part["file"])
+                for part in manifest.get("parts", [])
+            ]
+            if parts:
+                frame = _dedupe(pd.concat(parts, ignore_index=True), manifest.get("key_columns", []))
+        memo = _Memo(frame, signature, self.clock(), manifest)
+        self._memo[key] = memo
+        return memo
+
+    def load(self, name: str, copy: bool = True) -> Optional[pd.DataFrame]:
+        """The deduplicated dataset, or None if it was never written."""
+        with self._lock:
+            value = self._dataset_memo(name).value
+            return _copy(value) if copy else value
+
+    def manifest(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return _copy(self._dataset_memo(name).manifest)
+
+    @staticmethod
+    def _unseen_rows(existing: pd.DataFrame, incoming: pd.DataFrame) -> pd.DataFrame:
+        """Incoming rows not already stored verbatim.
+
+        Row hashes only match when dtypes line up; a mismatch just appends a
+        duplicate, which the key-column dedupe on read absorbs.
+        """
+        columns = list(incoming.columns)
+        if existing.empty or not set(columns) <= set(existing.columns):
+            return incoming
+        try:
+            seen = pd.util.hash_pandas_object(existing[columns], index=False)
+            fresh = pd.util.hash_pandas_object(incoming, index=False)
+        except TypeError:  # unhashable cells (lists/dicts)
+            return incoming
+        return incoming[~fresh.isin(set(seen)).to_numpy()]
+
+    def append(
+        self,
+        name: str,
+        frame: pd.DataFrame,
+        key_columns: Optional[Sequence[str]] = None,
+    ) -> int:
+        """Append ``frame`` to dataset ``name``; returns the number of rows written.
+
+        ``key_columns`` defaults to the ones recorded in the manifest.
+        """
+        with self._lock:
+            memo = self._dataset_memo(name)
+            manifest = memo.manifest or {
+                "version": MANIFEST_VERSION,
+                "key_columns": [],
+                "parts": [],
+                "next_part": 0,
+            }
+            if key_columns is not None:
+                manifest["key_columns"] = list(key_columns)
+            keys = manifest["key_columns"]
+
+            incoming = _dedupe(frame, keys)
+            existing = memo.value
+            if existing is not None:
+                incoming = self._unseen_rows(existing, incoming)
+            if incoming.empty and memo.manifest is not None:
+                return 0
+
+            directory = self._dataset_dir(name)
+            directory.mkdir(parents=True, exist_ok=True)
+            merged = incoming if existing is None else _dedupe(
+                pd.concat([existing, incoming], ignore_index=True), keys
+            )
+
+            stale_parts: List[str] = []
+            if len(manifest["parts"]) + 1 > self.compact_after:
+                stale_parts = [part["file"] for part in manifest["parts"]]
+                manifest["parts"] = []
+                written = merged
+            else:
+                written = incoming
+            part_file = f"part-{manifest['next_part']:05d}.parquet"
+            written.to_parquet(directory / part_file, index=False)
+            manifest["next_part"] += 1
+            manifest["parts"].append({"file": part_file, "rows": int(len(written))})
+            manifest["rows"] = int(len(merged))
+            manifest["columns"] = [str(c) for c in merged.columns]
+            manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
+
+            signature = self._write_manifest(name, manifest)
+            for stale in stale_parts:
+                (directory / stale).unlink(missing_ok=True)
+            self._memo[f"dataset:{name}"] = _Memo(merged, signature, self.clock(), manifest)
+            return int(len(incoming))
+
+    def _write_manifest(self, name: str, manifest: Dict[str, Any]) -> Signature:
+        path = self._manifest_path(name)
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(manifest, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+        return _signature(path)
+
+
+_caches: Dict[Path, LocalDatasetCache] = {}
+
+
+def get_local_dataset_cache(root: Path) -> LocalDatasetCache:
+    """Process-wide cache for ``root`` so every scraper shares one memo."""
+    root = Path(root)
+    cache = _caches.get(root)
+    if cache is None:
+        cache = _caches.setdefault(root, LocalDatasetCache(root))
+    return cache
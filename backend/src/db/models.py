@@ -23,6 +23,7 @@ from ..core.database import (  # noqa: F401
     MatchStats,
     Odds,
     OddsHistory,
+    OddsRollup,
     Player,
     PlayerValuation,
     Prediction,
@@ -278,6 +279,35 @@ class MatchPredictionLog(Base):
     )
 
 
+class MaterializedPrediction(Base):
+    """Latest precomputed prediction per upcoming fixture.
+
+    Written by services/prediction_materializer.py; serving paths read it by
+    primary key. input_fingerprint covers the feature inputs, the feature
+    schema and the model artifacts, so a pass only rewrites changed rows.
+    """
+
+    __tablename__ = "materialized_predictions"
+    __table_args__ = (
+        Index("ix_materialized_predictions_league_kickoff", "league", "match_date"),
+        {"extend_existing": True},
+    )
+
+    match_id: Mapped[str] = mapped_column(String, primary_key=True)
+    league: Mapped[str] = mapped_column(String, nullable=False)
+    match_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    model_version: Mapped[str] = mapped_column(String, nullable=False)
+    feature_schema_hash: Mapped[str] = mapped_column(String, nullable=False)
+    input_fingerprint: Mapped[str] = mapped_column(String, nullable=False)
+    prediction: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    # data_gaps, data_quality and staleness from the feature projection.
+    features_summary: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    computed_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Last pass that found input_fingerprint unchanged; the serving age check
+    # runs off this so stable fixtures stay servable without re-inference.
+    verified_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+
 class ProviderHealthLog(Base):
     __tablename__ = "provider_health_log"
     __table_args__ = (
@@ -341,6 +371,7 @@ __all__ = [
     "MatchStats",
     "Odds",
     "OddsHistory",
+    "OddsRollup",
     "Player",
     "PlayerValuation",
     "Prediction",
@@ -356,6 +387,7 @@ __all__ = [
     "ProviderEventMapping",
     "MarketSnapshot",
     "MatchPredictionLog",
+    "MaterializedPrediction",
     "ProviderHealthLog",
     "ProviderCapabilityObservation",
     "CircuitState",
@@ -0,0 +1,325 @@
+"""
+Odds History Storage
+====================
+
+Two pieces keep the odds time series cheap to read and cheap to expire:
+
+- **Rollups.** ``odds_rollups`` holds one row per (match, market, bookmaker)
+  with the opening, latest and closing (last pre-kickoff) 1X2 prices.
+  Ingestion calls ``upsert_odds_rollups`` with each poll's snapshots; the
+  batch is collapsed per key in Python and merged with a single
+  ``INSERT .. ON CONFLICT DO UPDATE`` whose CASE expressions only move the
+  opening earlier and the latest/closing later, so replays and out-of-order
+  batches leave the prices right. ``snapshot_count`` only adds snapshots
+  outside the key's stored opening..latest span, so a replayed batch adds
+  nothing; a genuinely new snapshot landing inside the span is not counted
+  either, which makes the count a lower bound. Drift features read the
+  rollup instead of ordering ``odds_history`` by timestamp.
+- **Partitions.** On PostgreSQL ``odds_history`` is range-partitioned by
+  month on ``timestamp`` (alembic 0007), with a default partition catching
+  anything outside the ones created here. ``ensure_partitions`` creates the
+  current and upcoming months; ``drop_expired_partitions`` drops whole months
+  that ended before the retention cutoff. Elsewhere (SQLite in tests and
+  local runs) the table is a plain table and retention falls back to a
+  DELETE on the same month boundary.
+
+The partition helpers take a synchronous ``Connection`` because their callers
+(Celery tasks, alembic) are synchronous.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import and_, case, delete, or_, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.database import OddsHistory, OddsRollup
+
+logger = logging.getLogger(__name__)
+
+ODDS_HISTORY_TABLE = OddsHistory.__tablename__
+DEFAULT_PARTITION = f"{ODDS_HISTORY_TABLE}_default"
+_PARTITION_RE = re.compile(rf"^{ODDS_HISTORY_TABLE}_(\d{{4}})_(\d{{2}})$")
+
+# Months created ahead of the current one by ensure_partitions.
+PARTITIONS_AHEAD = 2
+
+DEFAULT_MARKET = "match_odds"
+ROLLUP_KEY: Tuple[str, ...] = ("match_id", "market_type", "bookmaker")
+_SIDES = (("home", "home_win"), ("draw", "draw"), ("away", "away_win"))
+
+
+def _naive_utc(moment: datetime) -> datetime:
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant of ``moment``'s month, as naive UTC."""
+    return _naive_utc(moment).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{ODDS_HISTORY_TABLE}_{month:%Y_%m}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    """The month a partition covers, or None for the default/unknown tables."""
+    found = _PARTITION_RE.match(name)
+    if found is None:
+        return None
+    return datetime(int(found.group(1)), int(found.group(2)), 1)
+
+
+# ----------------------------------------------------------------------
+# Partition maintenance
+# ----------------------------------------------------------------------
+
+
+def is_partitioned(conn: Connection) -> bool:
+    if conn.dialect.name != "postgresql":
+        return False
+    found = conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :name"
+        ),
+        {"name": ODDS_HISTORY_TABLE},
+    ).scalar()
+    return bool(found)
+
+
+def list_partitions(conn: Connection) -> List[str]:
+    rows = conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits i "
+            "JOIN pg_class child ON child.oid = i.inhrelid "
+            "JOIN pg_class parent ON parent.oid = i.inhparent "
+            "WHERE parent.relname = :name ORDER BY child.relname"
+        ),
+        {"name": ODDS_HISTORY_TABLE},
+    )
+    return [row[0] for row in rows]
+
+
+def ensure_partitions(
+    conn: Connection,
+    now: Optional[datetime] = None,
+    ahead: int = PARTITIONS_AHEAD,
+) -> List[str]:
+    """Create monthly partitions for the current month and ``ahead`` more.
+
+    Returns the partitions created; a no-op on unpartitioned tables.
+    """
+    if not is_partitioned(conn):
+        return []
+    existing = set(list_partitions(conn))
+    start = month_start(now or datetime.now(timezone.utc))
+    created = []
+    for offset in range(ahead + 1):
+        month = add_months(start, offset)
+        name = partition_name(month)
+        if name in existing:
+            continue
+        conn.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{ODDS_HISTORY_TABLE}" '
+                f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{add_months(month, 1):%Y-%m-%d}')"
+            )
+        )
+        created.append(name)
+    if created:
+        logger.info("Created odds_history partitions: %s", ", ".join(created))
+    return created
+
+
+def drop_expired_partitions(
+    conn: Connection,
+    retention_days: int,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Expire odds history older than ``retention_days``, a month at a time.
+
+    The cutoff is rounded down to a month boundary so partitioned and plain
+    tables keep exactly the same rows: months ending on or before it are
+    dropped as whole partitions (plus a DELETE of stragglers in the default
+    partition); unpartitioned tables get one DELETE below the cutoff.
+    """
+    cutoff = month_start((now or datetime.now(timezone.utc)) - timedelta(days=retention_days))
+    report: Dict[str, Any] = {"cutoff": cutoff.isoformat(), "partitions_dropped": [], "rows_deleted": 0}
+
+    if not is_partitioned(conn):
+        result = conn.execute(delete(OddsHistory).where(OddsHistory.timestamp < cutoff))
+        report["rows_deleted"] = max(result.rowcount or 0, 0)
+        return report
+
+    partitions = list_partitions(conn)
+    for name in partitions:
+        month = partition_month(name)
+        if month is not None and add_months(month, 1) <= cutoff:
+            conn.execute(text(f'DROP TABLE IF EXISTS "{name}"'))
+            report["partitions_dropped"].append(name)
+    if DEFAULT_PARTITION in partitions:
+        result = conn.execute(
+            text(f'DELETE FROM "{DEFAULT_PARTITION}" WHERE "timestamp" < :cutoff'),
+            {"cutoff": cutoff},
+        )
+        report["rows_deleted"] = max(result.rowcount or 0, 0)
+    if report["partitions_dropped"]:
+        logger.info("Dropped odds_history partitions: %s", ", ".join(report["partitions_dropped"]))
+    return report
+
+
+# ----------------------------------------------------------------------
+# Rollups
+# ----------------------------------------------------------------------
+
+
+def _prices(snapshot: Mapping[str, Any]) -> Optional[Tuple[float, float, float]]:
+    values = tuple(snapshot.get(field) for _, field in _SIDES)
+    if any(value is None for value in values):
+        return None
+    return values  # type: ignore[return-value]
+
+
+def collapse_snapshots(
+    snapshots: Iterable[Mapping[str, Any]],
+    kickoffs: Optional[Mapping[str, Optional[datetime]]] = None,
+    now: Optional[datetime] = None,
+    known_spans: Optional[Mapping[Tuple[str, str, str], Tuple[datetime, datetime]]] = None,
+) -> List[Dict[str, Any]]:
+    """One rollup row per key from a batch of odds snapshots.
+
+    Snapshots are mappings with ``match_id``, ``bookmaker``, ``home_win``,
+    ``draw``, ``away_win``, ``timestamp`` and optionally ``market_type``
+    (default ``match_odds``). Snapshots missing a price are skipped. A
+    snapshot counts as the closing price when it was taken before the match's
+    kickoff in ``kickoffs``. ``known_spans`` maps a key to its stored
+    (opening_at, latest_at); ``snapshot_count`` then covers only snapshots
+    outside that span.
+    """
+    known_spans = known_spans or {}
+    kickoffs = kickoffs or {}
+    grouped: Dict[Tuple[str, str, str], List[Tuple[datetime, Tuple[float, float, float]]]] = {}
+    for snapshot in snapshots:
+        prices = _prices(snapshot)
+        if prices is None or snapshot.get("timestamp") is None:
+            continue
+        key = (snapshot["match_id"], snapshot.get("market_type") or DEFAULT_MARKET, snapshot["bookmaker"])
+        grouped.setdefault(key, []).append((_naive_utc(snapshot["timestamp"]), prices))
+
+    updated_at = _naive_utc(now or datetime.now(timezone.utc))
+    rows = []
+    for key, observed in grouped.items():
+        match_id, market_type, bookmaker = key
+        observed.sort(key=lambda item: item[0])
+        opening_at, opening = observed[0]
+        latest_at, latest = observed[-1]
+        kickoff = kickoffs.get(match_id)
+        pre_kickoff = observed if kickoff is None else [o for o in observed if o[0] < _naive_utc(kickoff)]
+        closing_at, closing = pre_kickoff[-1] if pre_kickoff else (None, (None, None, None))
+
+        row: Dict[str, Any] = {
+            "match_id": match_id,
+            "market_type": market_type,
+            "bookmaker": bookmaker,
+            "opening_at": opening_at,
+            "latest_at": latest_at,
+            "closing_at": closing_at,
+            "snapshot_count": _new_snapshots(observed, known_spans.get(key)),
+            "updated_at": updated_at,
+        }
+        for index, (side, _) in enumerate(_SIDES):
+            row[f"opening_{side}"] = opening[index]
+            row[f"latest_{side}"] = latest[index]
+            row[f"closing_{side}"] = closing[index]
+        rows.append(row)
+    return rows
+
+
+def _new_snapshots(
+    observed: List[Tuple[datetime, Tuple[float, float, float]]],
+    span: Optional[Tuple[datetime, datetime]],
+) -> int:
+    if span is None:
+        return len(observed)
+    opening_at, latest_at = span
+    return sum(1 for taken_at, _ in observed if taken_at < opening_at or taken_at > latest_at)
+
+
+async def _known_spans(
+    db: AsyncSession, match_ids: Iterable[str]
+) -> Dict[Tuple[str, str, str], Tuple[datetime, datetime]]:
+    table = OddsRollup.__table__
+    result = await db.execute(
+        select(
+            table.c.match_id, table.c.market_type, table.c.bookmaker,
+            table.c.opening_at, table.c.latest_at,
+        ).where(table.c.match_id.in_(sorted(set(match_ids))))
+    )
+    return {
+        (match_id, market_type, bookmaker): (opening_at, latest_at)
+        for match_id, market_type, bookmaker, opening_at, latest_at in result.all()
+    }
+
+
+def _dialect_insert(dialect: str, table: Any):
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return dialect_insert(table)
+
+
+def _rollup_upsert(dialect: str):
+    table = OddsRollup.__table__
+    stmt = _dialect_insert(dialect, table)
+    new = stmt.excluded
+    earlier = new.opening_at < table.c.opening_at
+    later = new.latest_at >= table.c.latest_at
+    later_close = and_(
+        new.closing_at.is_not(None),
+        or_(table.c.closing_at.is_(None), new.closing_at >= table.c.closing_at),
+    )
+
+    updates: Dict[str, Any] = {
+        "opening_at": case((earlier, new.opening_at), else_=table.c.opening_at),
+        "latest_at": case((later, new.latest_at), else_=table.c.latest_at),
+        "closing_at": case((later_close, new.closing_at), else_=table.c.closing_at),
+        "snapshot_count": table.c.snapshot_count + new.snapshot_count,
+        "updated_at": new.updated_at,
+    }
+    for side, _ in _SIDES:
+        for stage, condition in (("opening", earlier), ("latest", later), ("closing", later_close)):
+            column = f"{stage}_{side}"
+            updates[column] = case((condition, new[column]), else_=table.c[column])
+    return stmt.on_conflict_do_update(index_elements=list(ROLLUP_KEY), set_=updates)
+
+
+async def upsert_odds_rollups(
+    db: AsyncSession,
+    snapshots: Iterable[Mapping[str, Any]],
+    kickoffs: Optional[Mapping[str, Optional[datetime]]] = None,
+) -> int:
+    """Fold a batch of snapshots into ``odds_rollups``; returns rows touched.
+
+    Runs in the caller's transaction; the caller commits.
+    """
+    snapshots = list(snapshots)
+    spans = await _known_spans(db, (snapshot["match_id"] for snapshot in snapshots))
+    rows = collapse_snapshots(snapshots, kickoffs, known_spans=spans)
+    if not rows:
+        return 0
+    await db.execute(_rollup_upsert(db.get_bind().dialect.name), rows)
+    return len(rows)
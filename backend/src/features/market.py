@@ -103,7 +103,8 @@ async def compute_market_drift(
 ) -> MarketDriftResult:
     """Compute opening→current odds drift with staleness gate.
 
-    Queries OddsHistory for the earliest snapshot (opening) for the given match_id,
+    Reads the opening price from the OddsRollup row for the given match_id
+    (falling back to the earliest OddsHistory snapshot, then the Odds table),
     then computes drift against current_odds. If no opening snapshot exists or the
     snapshot is older than max_staleness_hours, returns all 5 features as DATA_GAP.
 
@@ -140,19 +141,48 @@ async def compute_market_drift(
     try:
         from sqlalchemy import asc, select
 
-        from ..db.models import OddsHistory
+        from ..db.models import OddsRollup
 
+        # Single-row lookup on the (match_id, market_type, bookmaker) key;
+        # labelled so the row reads like an OddsHistory snapshot.
         query = (
-            select(OddsHistory)
-            .where(OddsHistory.match_id == match_id)
-            .where(OddsHistory.market_type == "match_odds")
-            .order_by(asc(OddsHistory.timestamp))
+            select(
+                OddsRollup.opening_home.label("home_win"),
+                OddsRollup.opening_draw.label("draw"),
+                OddsRollup.opening_away.label("away_win"),
+                OddsRollup.opening_at.label("timestamp"),
+            )
+            .where(OddsRollup.match_id == match_id)
+            .where(OddsRollup.market_type == "match_odds")
+            .order_by(asc(OddsRollup.opening_at))
             .limit(1)
         )
         result = await db.execute(query)
-        opening_record = result.scalar_one_or_none()
+        row = result.first()
+        if row is not None and isinstance(row.timestamp, datetime):
+            opening_record = row
     except Exception as exc:
-        logger.debug("compute_market_drift: OddsHistory query failed for %s: %s", match_id, exc)
+        logger.debug("compute_market_drift: OddsRollup query failed for %s: %s", match_id, exc)
+
+    # Rollups only cover snapshots ingested since they were introduced;
+    # older matches still have their opening price in OddsHistory.
+    if opening_record is None:
+        try:
+            from sqlalchemy import asc, select
+
+            from ..db.models import OddsHistory
+
+            query = (
+                select(OddsHistory)
+                .where(OddsHistory.match_id == match_id)
+                .where(OddsHistory.market_type == "match_odds")
+                .order_by(asc(OddsHistory.timestamp))
+                .limit(1)
+            )
+            result = await db.execute(query)
+            opening_record = result.scalar_one_or_none()
+        except Exception as exc:
+            logger.debug("compute_market_drift: OddsHistory query failed for %s: %s", match_id, exc)
 
     # Fallback: try the simpler Odds table if OddsHistory had no rows
     if opening_record is None:
@@ -9,6 +9,11 @@ without the BNN feature.
 Implements Prior Networks (Malinin & Gales 2018) for Dirichlet-output
 uncertainty decomposition. Single forward-pass — no MC overhead at inference.
 MC-Dropout fallback class included for use if EDL fails ECE ≤ 0.050 gate.
+
+Credible intervals are closed-form: each Dirichlet marginal p_k is
+Beta(alpha_k, alpha_0 − alpha_k), so its quantiles come from the inverse
+regularized incomplete beta (scipy). Sampling is kept only as a fallback for
+environments without scipy.
 """
 from __future__ import annotations
 
@@ -21,6 +26,11 @@ import torch.nn as nn
 import torch.nn.functional as F
 from torch import Tensor
 
+try:
+    from scipy.special import betaincinv
+except ImportError:  # pragma: no cover - scipy ships with scikit-learn
+    betaincinv = None
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Output data class (C12: epistemic_unc, aleatoric_unc, concentration,
@@ -45,6 +55,80 @@ class UncertaintyOutput:
     low_evidence:  bool               # True when epistemic > EPISTEMIC_THRESHOLD
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Dirichlet credible intervals
+# ─────────────────────────────────────────────────────────────────────────────
+
+def dirichlet_credible_interval(
+    alpha: Tensor,
+    level: float = 0.95,
+    ci_samples: int = 200,
+) -> tuple[Tensor, Tensor]:
+    """Equal-tailed per-class credible bounds for Dir(alpha), each [B, K].
+
+    Exact via the Beta(alpha_k, alpha_0 − alpha_k) marginal quantiles when
+    scipy is available; otherwise ``ci_samples`` Dirichlet draws per row.
+    """
+    tail = (1.0 - level) / 2.0
+    alpha_cpu = alpha.detach().cpu()
+    if betaincinv is not None:
+        a = alpha_cpu.double().numpy()
+        b = a.sum(axis=1, keepdims=True) - a
+        lower = torch.from_numpy(betaincinv(a, b, tail)).to(alpha.dtype)
+        upper = torch.from_numpy(betaincinv(a, b, 1.0 - tail)).to(alpha.dtype)
+        return lower, upper
+
+    samples = torch.distributions.Dirichlet(alpha_cpu).sample((ci_samples,))  # [T, B, K]
+    return samples.quantile(tail, dim=0), samples.quantile(1.0 - tail, dim=0)
+
+
+def _mc_dropout_samples(net: nn.Module, x: Tensor, T: int) -> Tensor:
+    """[T, B, K] softmax samples from ONE forward pass over the batch tiled T times.
+
+    Dropout draws an independent mask per row and BatchNorm is in eval mode
+    (running statistics, row-independent), so the tiled pass is distributed
+    exactly like T sequential passes.
+    """
+    tiled = x.repeat(T, 1)                                      # [T*B, F]
+    probs = F.softmax(net(tiled), dim=-1)                      # [T*B, K]
+    return probs.view(T, x.shape[0], -1)
+
+
+def _to_outputs(
+    mean_p: Tensor,
+    epistemic: Tensor,
+    aleatoric: Tensor,
+    concentration: Tensor,
+    ci_lower: Tensor,
+    ci_upper: Tensor,
+    epistemic_threshold: float,
+) -> List[UncertaintyOutput]:
+    """Materialise per-row outputs with one ``tolist()`` per tensor."""
+    mean_rows = mean_p.tolist()
+    ep_rows = epistemic.tolist()
+    al_rows = aleatoric.tolist()
+    conc_rows = concentration.tolist()
+    lower_rows = ci_lower.tolist()
+    upper_rows = ci_upper.tolist()
+    return [
+        UncertaintyOutput(
+            home_prob     = probs[0],
+            draw_prob     = probs[1],
+            away_prob     = probs[2],
+            epistemic     = ep,
+            aleatoric     = al,
+            total         = ep + al,
+            concentration = conc,
+            ci_lower      = lower,
+            ci_upper      = upper,
+            low_evidence  = ep > epistemic_threshold,
+        )
+        for probs, ep, al, conc, lower, upper in zip(
+            mean_rows, ep_rows, al_rows, conc_rows, lower_rows, upper_rows
+        )
+    ]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # EDL BNN (Primary — Phase 6-A)
 # Architecture: 58 → 256 (BN+GELU) → 128 (BN+GELU+Dropout) → 3
@@ -110,7 +194,8 @@ class BNNEnsembleMember(nn.Module):
             Var[p_k] = alpha_k (alpha_0 − alpha_k) / (alpha_0² (alpha_0 + 1))
         Aleatoric (entropy of mean distribution):
             H = −Σ_k E[p_k] log(E[p_k])
-        Credible intervals: Dirichlet sample quantiles (lightweight, CPU).
+        Credible intervals: Beta marginal quantiles, closed form
+            (``ci_samples`` only matters on the no-scipy sampling fallback).
         """
         self.eval()
         alpha = self(x)                                        # [B, 3]
@@ -126,31 +211,13 @@ class BNNEnsembleMember(nn.Module):
         # Aleatoric: entropy of the mean predictive distribution
         aleatoric = -(mean_p * (mean_p + 1e-8).log()).sum(dim=1)  # [B]
 
-        total = epistemic + aleatoric
-
-        # 95% credible intervals via Dirichlet sampling (CPU, T=ci_samples)
-        alpha_cpu = alpha.cpu()
-        dirichlet = torch.distributions.Dirichlet(alpha_cpu)
-        samples = dirichlet.sample((ci_samples,))              # [T, B, 3]
-        ci_lower = samples.quantile(0.025, dim=0)              # [B, 3]
-        ci_upper = samples.quantile(0.975, dim=0)              # [B, 3]
-
-        results: List[UncertaintyOutput] = []
-        for i in range(x.shape[0]):
-            ep = float(epistemic[i])
-            results.append(UncertaintyOutput(
-                home_prob     = float(mean_p[i, 0]),
-                draw_prob     = float(mean_p[i, 1]),
-                away_prob     = float(mean_p[i, 2]),
-                epistemic     = ep,
-                aleatoric     = float(aleatoric[i]),
-                total         = float(total[i]),
-                concentration = float(alpha_0[i, 0]),
-                ci_lower      = ci_lower[i].tolist(),
-                ci_upper      = ci_upper[i].tolist(),
-                low_evidence  = ep > epistemic_threshold,
-            ))
-        return results
+        # 95% credible intervals from the Beta(alpha_k, alpha_0 − alpha_k) marginals
+        ci_lower, ci_upper = dirichlet_credible_interval(alpha, ci_samples=ci_samples)
+
+        return _to_outputs(
+            mean_p, epistemic, aleatoric, alpha_0[:, 0],
+            ci_lower, ci_upper, epistemic_threshold,
+        )
 
     @torch.no_grad()
     def get_meta_features(self, x: Tensor) -> Tensor:
@@ -223,7 +290,8 @@ class MCDropoutBNN(nn.Module):
         epistemic_threshold: float = 0.15,
         ci_samples: int = 200,
     ) -> List[UncertaintyOutput]:
-        """T stochastic forward passes with dropout active.
+        """T stochastic forward passes with dropout active, run as one pass
+        over the batch tiled T times.
 
         The model is set to train() mode so dropout runs at inference.
         BN layers use running statistics (eval-like) to avoid batch issues.
@@ -236,13 +304,7 @@ class MCDropoutBNN(nn.Module):
                 m.train()
 
         with torch.no_grad():
-            all_probs: List[Tensor] = []
-            for _ in range(T):
-                logits = self.net(x)              # [B, 3]
-                probs = F.softmax(logits, dim=-1)  # [B, 3]
-                all_probs.append(probs)
-
-        stacked = torch.stack(all_probs, dim=0)   # [T, B, 3]
+            stacked = _mc_dropout_samples(self.net, x, T)  # [T, B, 3]
         mean_p = stacked.mean(dim=0)              # [B, 3]
 
         # Epistemic proxy: predictive variance across samples
@@ -253,28 +315,15 @@ class MCDropoutBNN(nn.Module):
         per_sample_entropy = -(stacked * (stacked + 1e-8).log()).sum(dim=2)  # [T, B]
         aleatoric = per_sample_entropy.mean(dim=0)  # [B]
 
-        total = epistemic + aleatoric
-
         # Credible intervals via sample quantiles
         ci_lower = stacked.quantile(0.025, dim=0)  # [B, 3]
         ci_upper = stacked.quantile(0.975, dim=0)  # [B, 3]
 
-        results: List[UncertaintyOutput] = []
-        for i in range(x.shape[0]):
-            ep = float(epistemic[i])
-            results.append(UncertaintyOutput(
-                home_prob     = float(mean_p[i, 0]),
-                draw_prob     = float(mean_p[i, 1]),
-                away_prob     = float(mean_p[i, 2]),
-                epistemic     = ep,
-                aleatoric     = float(aleatoric[i]),
-                total         = float(total[i]),
-                concentration = 0.0,  # not applicable to MC-Dropout
-                ci_lower      = ci_lower[i].tolist(),
-                ci_upper      = ci_upper[i].tolist(),
-                low_evidence  = ep > epistemic_threshold,
-            ))
-        return results
+        return _to_outputs(
+            mean_p, epistemic, aleatoric,
+            torch.zeros(x.shape[0]),  # concentration not applicable to MC-Dropout
+            ci_lower, ci_upper, epistemic_threshold,
+        )
 
     @torch.no_grad()
     def get_meta_features(self, x: Tensor, T: int = 10) -> Tensor:
@@ -289,9 +338,7 @@ class MCDropoutBNN(nn.Module):
             elif isinstance(m, nn.Dropout):
                 m.train()
 
-        stacked = torch.stack(
-            [F.softmax(self.net(x), dim=-1) for _ in range(T)], dim=0
-        )                                                       # [T, B, 3]
+        stacked = _mc_dropout_samples(self.net, x, T)         # [T, B, 3]
         mean_p = stacked.mean(dim=0)                           # [B, 3]
         var_p = stacked.var(dim=0).sum(dim=1, keepdim=True)    # [B, 1] — epistemic proxy
         per_entropy = -(stacked * (stacked + 1e-8).log()).sum(dim=2)
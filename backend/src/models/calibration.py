@@ -12,6 +12,11 @@ Multi-method comparison (compare_calibration_methods):
        draw-F1 delta (non-degrading).
   Selection rationale + per-method comparison table persisted in calibration_report_{league}.json.
 
+Serving form (CompiledCalibrator):
+  Every FittedCalibrator carries a compiled copy of its calibrators — isotonic
+  thresholds/values for np.interp, Platt (a, b) for a vectorised sigmoid, or
+  the temperature scalar — so inference never calls into sklearn per class.
+
 Bivariate Poisson draw overlay (BivariatePoissonDrawOverlay):
   Uses the Skellam distribution (difference of two independent Poisson) to estimate
   P(draw) = e^{-(λH+λA)} · I_0(2√(λH·λA)) where λH, λA are inferred from predicted
@@ -114,6 +119,90 @@ class FittedCalibrator:
     selection_rationale: str
     # Optional: per-method comparison table from compare_calibration_methods().
     method_comparison: Optional[Dict[str, object]] = field(default=None)
+    # NumPy form of ``calibrators`` used at serving time; built on construction
+    # and pickled with the artifact. Older artifacts get it at load time via
+    # ensure_compiled().
+    compiled: Optional["CompiledCalibrator"] = field(default=None)
+
+    def __post_init__(self) -> None:
+        if self.compiled is None:
+            self.compiled = compile_calibrator(self.method, self.calibrators)
+
+
+@dataclass(frozen=True)
+class CompiledCalibrator:
+    """A fitted calibrator reduced to plain arrays.
+
+    isotonic:    per-class (thresholds, values), evaluated with ``np.interp``
+                 (identical to IsotonicRegression(out_of_bounds="clip")).
+    platt:       per-class slope ``a`` and intercept ``b``; one vectorised
+                 sigmoid over all classes.
+    temperature: the scalar T.
+    """
+    method: CalibrationMethodName
+    thresholds: Tuple[np.ndarray, ...] = ()
+    values: Tuple[np.ndarray, ...] = ()
+    a: Optional[np.ndarray] = None
+    b: Optional[np.ndarray] = None
+    temperature: float = 1.0
+
+    def apply(self, y_proba: np.ndarray) -> np.ndarray:
+        """Same output as ``apply_calibrator`` on the source sklearn objects."""
+        if self.method == "temperature":
+            return _temperature_scale(y_proba, self.temperature)
+        if self.method == "isotonic":
+            out = np.empty_like(y_proba, dtype=float)
+            for cls, (x, y) in enumerate(zip(self.thresholds, self.values)):
+                out[:, cls] = np.interp(y_proba[:, cls], x, y)
+        else:
+            out = 1.0 / (1.0 + np.exp(-(y_proba * self.a + self.b)))
+        np.clip(out, 0.0, 1.0, out=out)
+        row_sums = out.sum(axis=1, keepdims=True)
+        out /= np.where(row_sums > 0, row_sums, 1.0)
+        return out
+
+
+def compile_calibrator(method: CalibrationMethodName, calibrators: object) -> Optional[CompiledCalibrator]:
+    """Convert fitted sklearn calibrators (or a temperature) to a CompiledCalibrator.
+
+    Returns None when ``calibrators`` is missing or not in a recognised shape;
+    callers then keep applying the sklearn objects.
+    """
+    if calibrators is None:
+        return None
+    try:
+        if method == "temperature":
+            return CompiledCalibrator(method=method, temperature=float(calibrators))  # type: ignore[arg-type]
+        cal_list = list(calibrators)  # type: ignore[call-overload]
+        if method == "isotonic":
+            if any(not getattr(cal, "increasing_", True) for cal in cal_list):
+                return None
+            return CompiledCalibrator(
+                method=method,
+                thresholds=tuple(np.asarray(cal.X_thresholds_, dtype=float) for cal in cal_list),
+                values=tuple(np.asarray(cal.y_thresholds_, dtype=float) for cal in cal_list),
+            )
+        if method == "platt":
+            return CompiledCalibrator(
+                method=method,
+                a=np.array([float(cal.coef_[0, 0]) for cal in cal_list]),
+                b=np.array([float(cal.intercept_[0]) for cal in cal_list]),
+            )
+    except (AttributeError, IndexError, TypeError, ValueError) as exc:
+        logger.debug("[calibration] %s calibrator not compilable: %s", method, exc)
+    return None
+
+
+def ensure_compiled(fitted: FittedCalibrator) -> Optional[CompiledCalibrator]:
+    """Return ``fitted.compiled``, compiling (and caching) it for artifacts
+    pickled before the field existed."""
+    compiled = getattr(fitted, "compiled", None)
+    if isinstance(compiled, CompiledCalibrator):
+        return compiled
+    compiled = compile_calibrator(fitted.method, fitted.calibrators)
+    if compiled is not None:
+        fitted.compiled = compiled
+    return compiled
 
 
 # ── Core calibration helpers ─────────────────────────────────────────────────
@@ -189,17 +278,25 @@ def fit_calibrator(
             fitted.append(cal)
         return fitted
 
-    # Temperature scaling: grid search over T in [0.1, 10].
-    best_t, best_nll = 1.0, float("inf")
-    y_oh = np.eye(n_classes)[y_true.astype(int)].astype(float)
-    for t in np.linspace(0.1, 10.0, 200):
-        scaled = np.clip(y_proba ** (1.0 / t), 1e-8, None)
-        scaled /= scaled.sum(axis=1, keepdims=True)
-        nll = -float(np.mean(np.sum(y_oh * np.log(scaled), axis=1)))
-        if nll < best_nll:
-            best_nll = nll
-            best_t = float(t)
-    return best_t
+    # Temperature scaling: bounded 1-D minimisation of the NLL over T in
+    # [0.1, 10]. Only the true-class column is needed per evaluation.
+    from scipy.optimize import minimize_scalar
+
+    rows = np.arange(len(y_true))
+    labels = y_true.astype(int)
+
+    def _nll(t: float) -> float:
+        scaled = _temperature_scale(y_proba, t)
+        return -float(np.mean(np.log(scaled[rows, labels])))
+
+    result = minimize_scalar(_nll, bounds=(0.1, 10.0), method="bounded", options={"xatol": 1e-4})
+    return float(result.x)
+
+
+def _temperature_scale(y_proba: np.ndarray, t: float) -> np.ndarray:
+    scaled = np.clip(y_proba ** (1.0 / t), 1e-8, None)
+    scaled /= scaled.sum(axis=1, keepdims=True)
+    return scaled
 
 
 def apply_calibrator(
@@ -209,15 +306,15 @@ def apply_calibrator(
 ) -> np.ndarray:
     """Apply a fitted calibrator to raw probability predictions.
 
+    ``calibrators`` may also be a CompiledCalibrator, the serving-time form.
+
     Returns renormalised probabilities [n_samples, n_classes].
     """
-    y_proba.shape[1]
+    if isinstance(calibrators, CompiledCalibrator):
+        return calibrators.apply(y_proba)
 
     if method == "temperature":
-        t = float(calibrators)  # type: ignore[arg-type]
-        scaled = np.clip(y_proba ** (1.0 / t), 1e-8, None)
-        scaled /= scaled.sum(axis=1, keepdims=True)
-        return scaled
+        return _temperature_scale(y_proba, float(calibrators))  # type: ignore[arg-type]
 
     # isotonic / platt
     cal_list: List[object] = calibrators  # type: ignore[assignment]
@@ -2,10 +2,21 @@
 
 This module computes lightweight causal-style diagnostics for all canonical
 features without modifying the training feature registry.
+
+``analyze`` works on the whole feature matrix at once: per-column medians
+via ``np.nanmedian``, treated/control as boolean matrices, and group means
+and variances as masked reductions (one matrix product per outcome), so the
+cost of 200+ features is a few array passes rather than a DataFrame per
+feature. ``p_value_method="permutation"`` replaces the normal approximation
+with a permutation test of ATE(win): the outcome is shuffled B times and
+every feature's ATE is recomputed per shuffle with the same masks. Shuffles
+run in fixed-size chunks seeded from ``SeedSequence`` children (optionally
+over a process pool), so a seed gives the same p-values for any ``n_jobs``.
 """
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -14,6 +25,71 @@ import pandas as pd
 
 from .feature_registry import CANONICAL_FEATURES_58
 
+MIN_ROWS = 30
+MIN_GROUP_ROWS = 10
+
+DEFAULT_PERMUTATIONS = 1_000
+
+# Upper bound on permuted-outcome cells per chunk (~20 MB of float64). Chunk
+# layout depends only on the row count, never on n_jobs.
+_MAX_CHUNK_CELLS = 2_500_000
+
+# Fan out to worker processes only when rows x features x permutations is
+# large enough to amortise spawning them and pickling the masks.
+_PARALLEL_MIN_CELLS = 2_000_000_000
+
+
+def _permutation_chunk(
+    treated: np.ndarray,
+    control: np.ndarray,
+    outcome: np.ndarray,
+    n_permutations: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """ATE(win) of every feature under ``n_permutations`` outcome shuffles: (F, m).
+
+    ``treated``/``control`` are the boolean (rows, F) masks.
+    """
+    rng = np.random.default_rng(seed)
+    shuffled = rng.permuted(np.tile(outcome, (n_permutations, 1)), axis=1).T  # (rows, m)
+    treated, control = treated.astype(float), control.astype(float)
+    n_treated = treated.sum(axis=0)[:, None]
+    n_control = control.sum(axis=0)[:, None]
+    return treated.T @ shuffled / n_treated - control.T @ shuffled / n_control
+
+
+def permutation_null(
+    treated: np.ndarray,
+    control: np.ndarray,
+    outcome: np.ndarray,
+    *,
+    n_permutations: int = DEFAULT_PERMUTATIONS,
+    seed: Optional[int] = None,
+    n_jobs: int = 1,
+) -> np.ndarray:
+    """Null distribution of ATE(win) for each feature column: (F, n_permutations)."""
+    n_rows = outcome.shape[0]
+    chunk = max(1, min(n_permutations, _MAX_CHUNK_CELLS // max(n_rows, 1)))
+    sizes = [chunk] * (n_permutations // chunk)
+    if n_permutations % chunk:
+        sizes.append(n_permutations % chunk)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    work = n_rows * treated.shape[1] * n_permutations
+    if n_jobs > 1 and len(sizes) > 1 and work >= _PARALLEL_MIN_CELLS:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(sizes))) as pool:
+            futures = [
+                pool.submit(_permutation_chunk, treated, control, outcome, size, child)
+                for size, child in zip(sizes, seeds)
+            ]
+            parts = [future.result() for future in futures]
+    else:
+        parts = [
+            _permutation_chunk(treated, control, outcome, size, child)
+            for size, child in zip(sizes, seeds)
+        ]
+    return np.concatenate(parts, axis=1)
+
 
 @dataclass(frozen=True)
 class CausalFeatureResult:
@@ -44,6 +120,10 @@ class CausalFeatureSelector:
         frame: pd.DataFrame,
         outcome_col: str = "match_result",
         feature_cols: Optional[List[str]] = None,
+        p_value_method: str = "normal",
+        n_permutations: int = DEFAULT_PERMUTATIONS,
+        seed: Optional[int] = None,
+        n_jobs: int = 1,
     ) -> List[CausalFeatureResult]:
         """Compute causal-style ATE table for all canonical features.
 
@@ -52,73 +132,105 @@ class CausalFeatureSelector:
             outcome_col: Name of the outcome column (0=home win, 1=draw, 2=away win).
             feature_cols: Optional explicit list of features to analyse. When None,
                 falls back to CANONICAL_FEATURES_58 intersected with frame columns.
+            p_value_method: "normal" (approximation from the ATE z-score) or
+                "permutation" (two-sided permutation test of ATE(win)).
+            n_permutations: Outcome shuffles for the permutation test.
+            seed: Seed for the permutation test.
+            n_jobs: Worker processes for the permutation test.
 
         ATE proxy is the difference in outcome means between treatment/control,
         where treatment is feature >= median.
         """
         if outcome_col not in frame.columns:
             raise ValueError(f"Missing outcome column: {outcome_col}")
+        if p_value_method not in {"normal", "permutation"}:
+            raise ValueError(f"Unknown p_value_method: {p_value_method}")
 
-        prepared = frame.copy()
-        prepared = prepared.replace([np.inf, -np.inf], np.nan)
-
-        if outcome_col not in prepared.columns:
-            raise ValueError("Outcome column missing after normalization")
-
-        is_home_win = (prepared[outcome_col].astype(str) == "0").astype(float)
-        is_draw = (prepared[outcome_col].astype(str) == "1").astype(float)
+        outcome = frame[outcome_col].astype(str)
+        is_home_win = (outcome == "0").to_numpy(dtype=float)
+        is_draw = (outcome == "1").to_numpy(dtype=float)
 
         candidate_features: List[str]
         if feature_cols is not None:
-            candidate_features = [f for f in feature_cols if f in prepared.columns]
+            candidate_features = [f for f in feature_cols if f in frame.columns]
         else:
             # Fall back to canonical set; silently skip absent columns
-            candidate_features = [f for f in CANONICAL_FEATURES_58 if f in prepared.columns]
-
-        results: List[CausalFeatureResult] = []
-        for feature in candidate_features:
-            if feature not in prepared.columns:
-                continue
-
-            series = pd.to_numeric(prepared[feature], errors="coerce")
-            clean = pd.DataFrame({"x": series, "home": is_home_win, "draw": is_draw}).dropna()
-            if len(clean) < 30:
-                continue
-
-            threshold = float(clean["x"].median())
-            treated = clean[clean["x"] >= threshold]
-            control = clean[clean["x"] < threshold]
-            if len(treated) < 10 or len(control) < 10:
-                continue
-
-            ate_win = float(treated["home"].mean() - control["home"].mean())
-            ate_draw = float(treated["draw"].mean() - control["draw"].mean())
-
-            stderr = float(np.sqrt(
-                np.var(treated["home"], ddof=1) / max(len(treated), 1)
-                + np.var(control["home"], ddof=1) / max(len(control), 1)
-            ))
-            ci_low = ate_win - 1.96 * stderr
-            ci_high = ate_win + 1.96 * stderr
-
-            z = 0.0 if stderr == 0 else abs(ate_win / stderr)
-            p_value = float(np.exp(-0.717 * z - 0.416 * (z ** 2)))
-            p_value = min(1.0, max(0.0, p_value))
-
-            classification = self._classify(ate_win, p_value, feature)
-
-            results.append(
-                CausalFeatureResult(
-                    name=feature,
-                    ate_win=ate_win,
-                    ate_draw=ate_draw,
-                    ate_ci=(float(ci_low), float(ci_high)),
-                    p_value=p_value,
-                    classification=classification,
-                )
+            candidate_features = [f for f in CANONICAL_FEATURES_58 if f in frame.columns]
+        # Duplicate names would select several columns under one label.
+        candidate_features = list(dict.fromkeys(candidate_features))
+        if not candidate_features:
+            return []
+
+        block = frame[candidate_features]
+        non_numeric = [c for c in candidate_features if not pd.api.types.is_numeric_dtype(block[c])]
+        if non_numeric:
+            block = block.assign(**{c: pd.to_numeric(block[c], errors="coerce") for c in non_numeric})
+        # copy=True: a float64 frame can hand back a view of the caller's data.
+        values = block.to_numpy(dtype=float, copy=True)
+        values[~np.isfinite(values)] = np.nan
+        valid = ~np.isnan(values)
+        keep = valid.sum(axis=0) >= MIN_ROWS
+        if not keep.any():
+            return []
+        values, valid = values[:, keep], valid[:, keep]
+        names = [f for f, k in zip(candidate_features, keep) if k]
+
+        # np.median's partition path for complete columns, nanmedian for the rest.
+        complete = valid.all(axis=0)
+        threshold = np.empty(values.shape[1])
+        threshold[complete] = np.median(values[:, complete], axis=0)
+        if not complete.all():
+            threshold[~complete] = np.nanmedian(values[:, ~complete], axis=0)
+        with np.errstate(invalid="ignore"):
+            treated = valid & (values >= threshold)
+            control = valid & (values < threshold)
+        n_treated = treated.sum(axis=0)
+        n_control = control.sum(axis=0)
+        keep = (n_treated >= MIN_GROUP_ROWS) & (n_control >= MIN_GROUP_ROWS)
+        if not keep.any():
+            return []
+        treated, control = treated[:, keep], control[:, keep]
+        n_treated, n_control = n_treated[keep], n_control[keep]
+        names = [f for f, k in zip(names, keep) if k]
+
+        # Group sums by matrix product; outcomes are 0/1, so sum of squares == sum.
+        outcomes = np.column_stack([is_home_win, is_draw])
+        sums_t, sums_c = treated.T.astype(float) @ outcomes, control.T.astype(float) @ outcomes
+        home_t, home_c = sums_t[:, 0], sums_c[:, 0]
+        mean_home_t, mean_home_c = home_t / n_treated, home_c / n_control
+        ate_win = mean_home_t - mean_home_c
+        ate_draw = sums_t[:, 1] / n_treated - sums_c[:, 1] / n_control
+
+        var_t = (home_t - n_treated * mean_home_t ** 2) / (n_treated - 1)
+        var_c = (home_c - n_control * mean_home_c ** 2) / (n_control - 1)
+        stderr = np.sqrt(np.maximum(var_t, 0.0) / n_treated + np.maximum(var_c, 0.0) / n_control)
+        ci_low = ate_win - 1.96 * stderr
+        ci_high = ate_win + 1.96 * stderr
+
+        if p_value_method == "permutation":
+            null = permutation_null(
+                treated, control, is_home_win,
+                n_permutations=n_permutations, seed=seed, n_jobs=n_jobs,
             )
-
-        return results
+            # Tolerance so shuffles that reproduce the observed split count as extreme.
+            extreme = np.abs(null) >= np.abs(ate_win)[:, None] - 1e-12
+            p_values = (1.0 + extreme.sum(axis=1)) / (null.shape[1] + 1.0)
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                z = np.where(stderr == 0, 0.0, np.abs(ate_win / stderr))
+            p_values = np.clip(np.exp(-0.717 * z - 0.416 * (z ** 2)), 0.0, 1.0)
+
+        return [
+            CausalFeatureResult(
+                name=feature,
+                ate_win=float(ate_win[i]),
+                ate_draw=float(ate_draw[i]),
+                ate_ci=(float(ci_low[i]), float(ci_high[i])),
+                p_value=float(p_values[i]),
+                classification=self._classify(float(ate_win[i]), float(p_values[i]), feature),
+            )
+            for i, feature in enumerate(names)
+        ]
 
     def build_graph(
         self,
@@ -0,0 +1,411 @@
+"""Top-k similarity index over historical match embeddings.
+
+``MatchVectorEmbeddings.find_similar_matches`` used to score every historical
+embedding in a Python loop, build a dict per candidate and sort them all.
+``EmbeddingIndex`` keeps the corpus as one L2-normalised float32 matrix, so
+cosine similarity is a single matrix-vector product and the top k come from
+``argpartition``; only the k winners are turned into dicts.
+
+For large corpora two approximate modes are available:
+
+* ``"ivf"`` — a pure-NumPy inverted file: spherical k-means centroids, and a
+  query scores only the rows of its ``n_probe`` nearest lists.
+* ``"hnsw"`` — an hnswlib graph when hnswlib is installed (falls back to IVF
+  otherwise).
+
+Rows can be added incrementally and carry league/season codes used as
+filters. ``save`` writes the matrix as ``.npy`` next to a JSON sidecar and
+``load`` memory-maps it, so a restarted worker does not read the corpus into
+memory up front.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+APPROXIMATE_MODES = ("ivf", "hnsw")
+_VECTORS_FILE = "embeddings.npy"
+_META_FILE = "index.json"
+_IVF_FILE = "ivf.npz"
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLE_PER_LIST = 64
+
+
+@dataclass(frozen=True)
+class SimilarMatch:
+    match_id: str
+    similarity: float
+    outcome: Dict[str, Any]
+    league: Optional[str] = None
+    season: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "match_id": self.match_id,
+            "similarity": self.similarity,
+            "outcome": self.outcome,
+            "league": self.league,
+            "season": self.season,
+        }
+
+
+def _normalise(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k largest scores, best first."""
+
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    head = np.argpartition(-scores, k - 1)[:k]
+    return head[np.argsort(-scores[head], kind="stable")]
+
+
+class _Codes:
+    """String labels stored as int32 codes; -1 means unknown."""
+
+    def __init__(self, labels: Sequence[str] = ()) -> None:
+        self.labels: List[str] = list(labels)
+        self._lookup = {label: code for code, label in enumerate(self.labels)}
+
+    def encode(self, values: Iterable[Optional[Any]]) -> np.ndarray:
+        codes = []
+        for value in values:
+            if value is None:
+                codes.append(-1)
+                continue
+            label = str(value)
+            if label not in self._lookup:
+                self._lookup[label] = len(self.labels)
+                self.labels.append(label)
+            codes.append(self._lookup[label])
+        return np.asarray(codes, dtype=np.int32)
+
+    def code(self, value: Any) -> int:
+        return self._lookup.get(str(value), -2)  # -2 matches no row
+
+    def decode(self, code: int) -> Optional[str]:
+        return self.labels[code] if code >= 0 else None
+
+
+class EmbeddingIndex:
+    """Exact or approximate cosine top-k over a growing embedding corpus."""
+
+    def __init__(
+        self,
+        dim: int,
+        *,
+        approximate: Optional[str] = None,
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+        seed: int = 0,
+    ) -> None:
+        if approximate is not None and approximate not in APPROXIMATE_MODES:
+            raise ValueError(f"approximate must be None or one of {APPROXIMATE_MODES}")
+        self.dim = dim
+        self.approximate = approximate
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.seed = seed
+
+        self._vectors = np.empty((0, dim), dtype=np.float32)
+        self._size = 0
+        self._ids: List[str] = []
+        self._outcomes: List[Dict[str, Any]] = []
+        self._leagues = _Codes()
+        self._seasons = _Codes()
+        self._league_codes = np.empty(0, dtype=np.int32)
+        self._season_codes = np.empty(0, dtype=np.int32)
+
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.empty(0, dtype=np.int32)
+        self._list_order: Optional[np.ndarray] = None
+        self._list_offsets: Optional[np.ndarray] = None
+        self._hnsw: Any = None
+        self._hnsw_size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """The normalised corpus (a read-only view)."""
+
+        view = self._vectors[: self._size]
+        view.flags.writeable = False
+        return view
+
+    # ------------------------------------------------------------------ adds
+
+    def add(
+        self,
+        match_ids: Sequence[str],
+        embeddings: Any,
+        outcomes: Optional[Sequence[Dict[str, Any]]] = None,
+        *,
+        leagues: Optional[Sequence[Optional[str]]] = None,
+        seasons: Optional[Sequence[Optional[str]]] = None,
+    ) -> None:
+        """Append rows; the matrix grows geometrically so adds are amortised O(rows)."""
+
+        block = _normalise(np.atleast_2d(embeddings))
+        count = len(block)
+        if block.shape[1] != self.dim:
+            raise ValueError(f"expected {self.dim}-dim embeddings, got {block.shape[1]}")
+        if len(match_ids) != count:
+            raise ValueError("match_ids and embeddings differ in length")
+        outcomes = list(outcomes) if outcomes is not None else [{} for _ in range(count)]
+        leagues = list(leagues) if leagues is not None else [None] * count
+        seasons = list(seasons) if seasons is not None else [None] * count
+        if not len(outcomes) == len(leagues) == len(seasons) == count:
+            raise ValueError("outcomes/leagues/seasons must match embeddings in length")
+
+        self._reserve(self._size + count)
+        self._vectors[self._size : self._size + count] = block
+        self._league_codes[self._size : self._size + count] = self._leagues.encode(leagues)
+        self._season_codes[self._size : self._size + count] = self._seasons.encode(seasons)
+        if self._centroids is not None:
+            self._assignments[self._size : self._size + count] = np.argmax(
+                block @ self._centroids.T, axis=1
+            )
+            self._list_order = None
+        self._ids.extend(str(match_id) for match_id in match_ids)
+        self._outcomes.extend(outcomes)
+        self._size += count
+
+    def _reserve(self, rows: int) -> None:
+        capacity = len(self._vectors)
+        if rows <= capacity and not isinstance(self._vectors, np.memmap):
+            return
+        # A memory-mapped corpus is read-only; the first add copies it into
+        # an in-memory buffer.
+        capacity = max(rows, 2 * capacity, 1024)
+        self._vectors = self._grow(self._vectors, (capacity, self.dim), np.float32)
+        self._league_codes = self._grow(self._league_codes, (capacity,), np.int32)
+        self._season_codes = self._grow(self._season_codes, (capacity,), np.int32)
+        self._assignments = self._grow(self._assignments, (capacity,), np.int32)
+
+    def _grow(self, array: np.ndarray, shape: tuple, dtype: Any) -> np.ndarray:
+        grown = np.empty(shape, dtype=dtype)
+        kept = min(len(array), self._size)
+        grown[:kept] = array[:kept]
+        return grown
+
+    # --------------------------------------------------------------- search
+
+    def search(
+        self,
+        query: Any,
+        top_k: int = 10,
+        *,
+        league: Optional[str] = None,
+        season: Optional[str] = None,
+        approximate: Optional[str] = None,
+    ) -> List[SimilarMatch]:
+        """The ``top_k`` most cosine-similar rows, optionally filtered.
+
+        ``approximate`` overrides the index's configured mode for this call
+        (``"exact"`` forces a full scan).
+        """
+
+        if top_k <= 0 or not self._size:
+            return []
+        q = _normalise(np.asarray(query, dtype=np.float32).reshape(-1))
+        if q.shape[0] != self.dim:
+            raise ValueError(f"expected a {self.dim}-dim query, got {q.shape[0]}")
+        mask = self._filter_mask(league, season)
+        mode = approximate or self.approximate
+        if mode == "exact":
+            mode = None
+
+        rows: Optional[np.ndarray] = None
+        if mode == "hnsw" and self._ensure_hnsw():
+            rows = self._search_hnsw(q, top_k, mask)
+        elif mode is not None:
+            rows = self._search_ivf(q, top_k, mask)
+        if rows is None:
+            rows = self._search_exact(q, top_k, mask)
+        scores = self._vectors[rows] @ q
+        return [self._hit(int(row), float(score)) for row, score in zip(rows, scores)]
+
+    def _filter_mask(self, league: Optional[str], season: Optional[str]) -> Optional[np.ndarray]:
+        mask = None
+        if league is not None:
+            mask = self._league_codes[: self._size] == self._leagues.code(league)
+        if season is not None:
+            season_mask = self._season_codes[: self._size] == self._seasons.code(season)
+            mask = season_mask if mask is None else mask & season_mask
+        return mask
+
+    def _search_exact(self, q: np.ndarray, top_k: int, mask: Optional[np.ndarray]) -> np.ndarray:
+        scores = self._vectors[: self._size] @ q
+        if mask is None:
+            return _top_k(scores, top_k)
+        # Masking the full product is cheaper than gathering the filtered rows.
+        scores[~mask] = -np.inf
+        return _top_k(scores, min(top_k, int(mask.sum())))
+
+    def _hit(self, row: int, similarity: float) -> SimilarMatch:
+        return SimilarMatch(
+            match_id=self._ids[row],
+            similarity=similarity,
+            outcome=self._outcomes[row],
+            league=self._leagues.decode(int(self._league_codes[row])),
+            season=self._seasons.decode(int(self._season_codes[row])),
+        )
+
+    # ------------------------------------------------------------------ IVF
+
+    def build_ivf(self, n_lists: Optional[int] = None) -> None:
+        """Train spherical k-means centroids and assign every row to a list."""
+
+        if not self._size:
+            raise ValueError("cannot build an IVF index over an empty corpus")
+        n_lists = min(n_lists or self.n_lists or int(np.sqrt(self._size)) or 1, self._size)
+        rng = np.random.default_rng(self.seed)
+        corpus = self._vectors[: self._size]
+        sample_size = min(self._size, n_lists * _KMEANS_SAMPLE_PER_LIST)
+        sample = corpus[np.sort(rng.choice(self._size, size=sample_size, replace=False))]
+        centroids = sample[rng.choice(sample_size, size=n_lists, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            filled = np.bincount(labels, minlength=n_lists) > 0
+            centroids[filled] = _normalise(sums[filled])
+
+        self._centroids = centroids
+        assignments = np.empty(self._size, dtype=np.int32)
+        for start in range(0, self._size, 65_536):
+            block = corpus[start : start + 65_536]
+            assignments[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+        if len(self._assignments) < self._size:
+            self._assignments = np.empty(len(self._vectors), dtype=np.int32)
+        self._assignments[: self._size] = assignments
+        self._list_order = None
+
+    def _lists(self) -> tuple:
+        if self._list_order is None:
+            assignments = self._assignments[: self._size]
+            self._list_order = np.argsort(assignments, kind="stable")
+            counts = np.bincount(assignments, minlength=len(self._centroids))
+            self._list_offsets = np.concatenate([[0], np.cumsum(counts)])
+        return self._list_order, self._list_offsets
+
+    def _search_ivf(
+        self, q: np.ndarray, top_k: int, mask: Optional[np.ndarray]
+    ) -> Optional[np.ndarray]:
+        if self._centroids is None:
+            self.build_ivf()
+        order, offsets = self._lists()
+        probes = _top_k(self._centroids @ q, min(self.n_probe, len(self._centroids)))
+        candidates = np.concatenate([order[offsets[p] : offsets[p + 1]] for p in probes])
+        if mask is not None:
+            candidates = candidates[mask[candidates]]
+        if len(candidates) < top_k:
+            return None  # too few rows in the probed lists — scan exactly
+        return candidates[_top_k(self._vectors[candidates] @ q, top_k)]
+
+    # ----------------------------------------------------------------- HNSW
+
+    def _ensure_hnsw(self) -> bool:
+        try:
+            import hnswlib
+        except ImportError:
+            if self._hnsw is None:
+                logger.info("hnswlib not installed; using the NumPy IVF index instead")
+                self._hnsw = False
+            return False
+        if not self._hnsw:
+            self._hnsw = hnswlib.Index(space="ip", dim=self.dim)
+            self._hnsw.init_index(max_elements=max(self._size, 1024), ef_construction=200, M=16)
+            self._hnsw_size = 0
+        if self._hnsw_size < self._size:
+            if self._size > self._hnsw.get_max_elements():
+                self._hnsw.resize_index(max(self._size, 2 * self._hnsw.get_max_elements()))
+            self._hnsw.add_items(
+                self._vectors[self._hnsw_size : self._size],
+                np.arange(self._hnsw_size, self._size),
+            )
+            self._hnsw_size = self._size
+        return True
+
+    def _search_hnsw(
+        self, q: np.ndarray, top_k: int, mask: Optional[np.ndarray]
+    ) -> Optional[np.ndarray]:
+        k = min(top_k, self._size if mask is None else int(mask.sum()))
+        if k < top_k:
+            return None
+        self._hnsw.set_ef(max(4 * top_k, 64))
+        allowed = None if mask is None else (lambda label: bool(mask[label]))
+        labels, _ = self._hnsw.knn_query(q, k=k, filter=allowed)
+        return labels[0].astype(np.int64)
+
+    # ------------------------------------------------------------ persistence
+
+    def save(self, directory: str | Path) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / _VECTORS_FILE, np.ascontiguousarray(self._vectors[: self._size]))
+        meta = {
+            "dim": self.dim,
+            "ids": self._ids,
+            "outcomes": self._outcomes,
+            "leagues": self._leagues.labels,
+            "seasons": self._seasons.labels,
+            "league_codes": self._league_codes[: self._size].tolist(),
+            "season_codes": self._season_codes[: self._size].tolist(),
+            "approximate": self.approximate,
+            "n_lists": self.n_lists,
+            "n_probe": self.n_probe,
+            "seed": self.seed,
+        }
+        (directory / _META_FILE).write_text(json.dumps(meta, default=str), encoding="utf-8")
+        if self._centroids is not None:
+            np.savez(
+                directory / _IVF_FILE,
+                centroids=self._centroids,
+                assignments=self._assignments[: self._size],
+            )
+
+    @classmethod
+    def load(cls, directory: str | Path, *, mmap: bool = True) -> "EmbeddingIndex":
+        directory = Path(directory)
+        meta = json.loads((directory / _META_FILE).read_text(encoding="utf-8"))
+        index = cls(
+            meta["dim"],
+            approximate=meta.get("approximate"),
+            n_lists=meta.get("n_lists"),
+            n_probe=meta.get("n_probe", 8),
+            seed=meta.get("seed", 0),
+        )
+        index._vectors = np.load(directory / _VECTORS_FILE, mmap_mode="r" if mmap else None)
+        index._size = len(index._vectors)
+        index._ids = list(meta["ids"])
+        index._outcomes = list(meta["outcomes"])
+        index._leagues = _Codes(meta["leagues"])
+        index._seasons = _Codes(meta["seasons"])
+        index._league_codes = np.asarray(meta["league_codes"], dtype=np.int32)
+        index._season_codes = np.asarray(meta["season_codes"], dtype=np.int32)
+        ivf_path = directory / _IVF_FILE
+        if ivf_path.exists():
+            with np.load(ivf_path) as ivf:
+                index._centroids = ivf["centroids"]
+                index._assignments = ivf["assignments"].astype(np.int32)
+        return index
+
+
+__all__ = ["APPROXIMATE_MODES", "EmbeddingIndex", "SimilarMatch"]
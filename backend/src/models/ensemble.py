@@ -33,6 +33,8 @@ class EnsembleModel:
         self.meta_model = None
         self.feature_columns = []
         self.model_metadata = {}
+        # Mean |SHAP| per feature, computed offline in build_ensemble
+        self.shap_global_importance: Dict[str, float] = {}
         self.is_trained = False
         self.is_v2 = False
         self.v2_model_data: Dict[str, Any] = {}
@@ -63,6 +65,7 @@ class EnsembleModel:
 
             # Evaluate ensemble
             self._evaluate_ensemble(X_test, y_test)
+            self._compute_shap_importance(X_test)
 
             logger.info("Ensemble model built successfully")
 
@@ -360,39 +363,36 @@ class EnsembleModel:
             logger.error(f"V2 prediction failed: {e}")
             raise
 
-    def explain_predictions(self, X: pd.DataFrame) -> Dict[str, Any]:
-        """Generate SHAP explanations via ModelExplainer on the first available base model.
+    def _compute_shap_importance(self, X: pd.DataFrame) -> None:
+        """Store global SHAP importance in the artifact so serving never recomputes it."""
+        try:
+            from .explanation_service import TREE_MODEL_KEYS, global_shap_importance
+
+            model = next((self.models[k] for k in TREE_MODEL_KEYS if self.models.get(k) is not None), None)
+            if model is not None:
+                self.shap_global_importance = global_shap_importance(
+                    model, X, list(self.feature_columns) or list(X.columns)
+                )
+        except Exception as e:
+            logger.warning(f"Global SHAP importance not computed: {e}")
+
+    def explain_predictions(self, X: pd.DataFrame, league: Optional[str] = None) -> Dict[str, Any]:
+        """SHAP explanation of the first row via the shared per-league TreeExplainer.
 
-        Uses a tree-based base model so SHAP TreeExplainer can attribute each of the 58
-        canonical features.  Returns {} when SHAP is unavailable or the base model is
-        not tree-compatible (fail-closed — callers fall back to deterministic ranking).
+        The explainer is built once per league artifact (see explanation_service)
+        and explanations are cached per feature vector. Returns {} when SHAP is
+        unavailable or the base model is not tree-compatible (fail-closed —
+        callers fall back to deterministic ranking).
         """
         try:
-            from .explainer import ModelExplainer
-
-            # Prefer tree models in priority order; accept any available model
-            base_model = None
-            for name in ('rf', 'random_forest', 'xgb', 'xgboost', 'lgbm', 'lightgbm'):
-                candidate = self.models.get(name)
-                if candidate is not None:
-                    base_model = candidate
-                    break
-            if base_model is None and self.models:
-                base_model = next(iter(self.models.values()))
-
-            if base_model is None:
-                logger.warning("No base model available for SHAP explanation")
-                return {}
-
-            feature_names = (
-                list(self.feature_columns)
-                if self.feature_columns
-                else [f"feature_{i}" for i in range(X.shape[1])]
-            )
+            from .explanation_service import get_explanation_service
 
-            explainer = ModelExplainer(model=base_model)
-            explainer.setup_explainer(X, feature_names)
-            return explainer.explain_prediction(X.iloc[[0]] if len(X) > 0 else X)
+            service = get_explanation_service()
+            key = league or self.model_metadata.get("league") or f"ensemble-{id(self):x}"
+            if not service.register_ensemble(key, self):
+                logger.warning("No SHAP-compatible base model available for explanation")
+                return {}
+            return service.explain(key, X)
 
         except Exception as e:
             logger.error(f"SHAP explanation failed: {e}")
@@ -408,6 +408,7 @@ class EnsembleModel:
                 'meta_model': self.meta_model,
                 'feature_columns': self.feature_columns,
                 'model_metadata': self.model_metadata,
+                'shap_global_importance': self.shap_global_importance,
                 'is_trained': self.is_trained
             }
 
@@ -451,6 +452,7 @@ class EnsembleModel:
             instance.meta_model = model_data['meta_model']
             instance.feature_columns = model_data.get('feature_columns', [])
             instance.model_metadata = model_data.get('model_metadata', {})
+            instance.shap_global_importance = model_data.get('shap_global_importance', {})
             instance.is_trained = model_data.get('is_trained', False)
             cls._repair_sklearn_compatibility(instance.models)
             cls._repair_sklearn_compatibility(instance.meta_model)
@@ -1,10 +1,41 @@
 """Evaluation helpers for temporal validation and calibration metrics."""
 
 from .temporal_splits import TemporalSplit, walk_forward_splits
-from .metrics import expected_calibration_error
+from .backtest import BacktestResult, StrategyGrid, backtest, evaluate_stakes
+from .bootstrap import (
+    bootstrap_mean_intervals,
+    bootstrap_metric_intervals,
+    moving_block_indices,
+    paired_bootstrap_difference,
+)
+from .metrics import (
+    brier_score_decomposition,
+    expected_calibration_error,
+    mean_ranked_probability_score,
+    multiclass_brier_scores,
+    multiclass_log_loss,
+    ranked_probability_score,
+    ranked_probability_scores,
+    reliability_curve,
+)
 
 __all__ = [
     "TemporalSplit",
     "walk_forward_splits",
+    "BacktestResult",
+    "StrategyGrid",
+    "backtest",
+    "evaluate_stakes",
+    "bootstrap_mean_intervals",
+    "bootstrap_metric_intervals",
+    "moving_block_indices",
+    "paired_bootstrap_difference",
+    "brier_score_decomposition",
     "expected_calibration_error",
+    "mean_ranked_probability_score",
+    "multiclass_brier_scores",
+    "multiclass_log_loss",
+    "ranked_probability_score",
+    "ranked_probability_scores",
+    "reliability_curve",
 ]
@@ -0,0 +1,353 @@
+"""Vectorised betting backtest over aligned probability and odds matrices.
+
+Inputs are (n, k) model probabilities and decimal odds with the same column
+order, an (n,) outcome index and optionally closing odds and a per-match
+abstention mask. Matches must be in chronological order.
+
+Strategies are *stacked*: every field of a :class:`StrategyGrid` broadcasts to
+one shape (s,), and a single :func:`backtest` call evaluates all s variants at
+once as (s, n) stake / P&L matrices — no per-match Python loop, so a
+threshold sweep over thousands of variants costs about as much as one run.
+
+Per strategy the result carries bets, abstentions, staked amount, P&L, ROI,
+max drawdown (bankroll starting at 1.0), rolling Sharpe of per-unit returns
+and mean CLV against closing odds, plus the (s, n) cumulative P&L curves.
+:func:`evaluate_stakes` computes the same metrics for externally decided
+stakes (e.g. an RL agent's recommendations).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+SELECTIONS = ("model_pick", "max_edge")
+
+
+@dataclass(frozen=True)
+class StrategyGrid:
+    """Stacked staking strategies.
+
+    ``kelly_fraction == 0`` means flat staking at ``flat_stake``; otherwise
+    the stake is ``kelly_fraction`` times the full-Kelly fraction, capped at
+    ``kelly_cap`` (and at any per-match cap passed to :func:`backtest`).
+    A bet is placed only when the selected outcome's edge
+    (model probability minus implied probability) exceeds ``min_edge``.
+    """
+
+    min_edge: np.ndarray
+    kelly_fraction: np.ndarray
+    kelly_cap: np.ndarray
+    flat_stake: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        min_edge: Any = -np.inf,
+        kelly_fraction: Any = 0.0,
+        kelly_cap: Any = 1.0,
+        flat_stake: Any = 1.0,
+    ) -> "StrategyGrid":
+        """Broadcast scalars/arrays to a common (s,) shape."""
+        arrays = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(v, dtype=float)) for v in (min_edge, kelly_fraction, kelly_cap, flat_stake))
+        )
+        if arrays[0].ndim != 1:
+            raise ValueError("strategy parameters must broadcast to one dimension")
+        return cls(*(np.ascontiguousarray(a) for a in arrays))
+
+    @classmethod
+    def product(cls, **axes: Sequence[float]) -> "StrategyGrid":
+        """Cartesian product of the given parameter axes (unspecified ones
+        take their :meth:`build` defaults)."""
+        names = list(axes)
+        mesh = np.meshgrid(*(np.asarray(axes[n], dtype=float) for n in names), indexing="ij")
+        return cls.build(**{n: m.ravel() for n, m in zip(names, mesh)})
+
+    @classmethod
+    def stack(cls, *grids: "StrategyGrid") -> "StrategyGrid":
+        """Concatenate grids into one (results follow the argument order)."""
+        return cls(*(
+            np.concatenate([getattr(g, name) for g in grids])
+            for name in ("min_edge", "kelly_fraction", "kelly_cap", "flat_stake")
+        ))
+
+    def __len__(self) -> int:
+        return int(self.min_edge.shape[0])
+
+    def params(self, i: int) -> Dict[str, float]:
+        return {
+            "min_edge": float(self.min_edge[i]),
+            "kelly_fraction": float(self.kelly_fraction[i]),
+            "kelly_cap": float(self.kelly_cap[i]),
+            "flat_stake": float(self.flat_stake[i]),
+        }
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+    """Per-strategy metrics, each shaped (s,), plus (s, n) curves."""
+
+    n_matches: int
+    n_bets: np.ndarray
+    n_abstained: np.ndarray
+    staked: np.ndarray
+    pnl: np.ndarray
+    roi: np.ndarray
+    max_drawdown: np.ndarray
+    rolling_sharpe: np.ndarray
+    clv: np.ndarray
+    pnl_curve: np.ndarray
+    stakes: np.ndarray
+    group_labels: Optional[List[Any]] = None
+    group_roi: Optional[np.ndarray] = None
+
+    @property
+    def abstention_rate(self) -> np.ndarray:
+        return self.n_abstained / self.n_matches if self.n_matches else np.zeros_like(self.roi)
+
+    def summary(self, i: int = 0) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "n_matches": self.n_matches,
+            "n_bets": int(self.n_bets[i]),
+            "n_abstained": int(self.n_abstained[i]),
+            "staked": float(self.staked[i]),
+            "pnl": float(self.pnl[i]),
+            "roi": float(self.roi[i]),
+            "max_drawdown": float(self.max_drawdown[i]),
+            "rolling_sharpe": float(self.rolling_sharpe[i]),
+            "clv": None if np.isnan(self.clv[i]) else float(self.clv[i]),
+            "abstention_rate": float(self.abstention_rate[i]),
+        }
+        if self.group_labels is not None and self.group_roi is not None:
+            out["group_roi"] = {
+                label: float(self.group_roi[i, g]) for g, label in enumerate(self.group_labels)
+            }
+        return out
+
+
+# ── Metric kernels (row-wise over strategies) ─────────────────────────────────
+
+def max_drawdown(pnl_curve: np.ndarray) -> np.ndarray:
+    """Peak-to-trough fall of a bankroll starting at 1.0, per row."""
+    curve = np.atleast_2d(np.asarray(pnl_curve, dtype=float))
+    if curve.shape[1] == 0:
+        return np.zeros(curve.shape[0])
+    bankroll = curve + 1.0
+    peak = np.maximum.accumulate(np.maximum(bankroll, 1.0), axis=1)
+    return np.max((peak - bankroll) / np.maximum(peak, 1e-9), axis=1)
+
+
+def rolling_sharpe(returns: np.ndarray, counts: np.ndarray, window: int = 30) -> np.ndarray:
+    """Mean of window-``window`` Sharpe ratios (ddof=1, x sqrt(window)) over the
+    first ``counts[i]`` entries of each row; rows shorter than the window use
+    one whole-row Sharpe (x sqrt(count)), rows under two entries score 0."""
+    returns = np.atleast_2d(np.asarray(returns, dtype=float))
+    counts = np.asarray(counts, dtype=int)
+    s, n = returns.shape
+    out = np.zeros(s)
+
+    pos = np.arange(n)
+    live = pos[None, :] < counts[:, None]
+    x = np.where(live, returns, 0.0)
+    csum = np.concatenate([np.zeros((s, 1)), np.cumsum(x, axis=1)], axis=1)
+    csq = np.concatenate([np.zeros((s, 1)), np.cumsum(x * x, axis=1)], axis=1)
+
+    def _sharpe(total: np.ndarray, total_sq: np.ndarray, m: np.ndarray) -> np.ndarray:
+        m = np.asarray(m, dtype=float)
+        mean = total / np.maximum(m, 1.0)
+        var = (total_sq - total * mean) / np.maximum(m - 1.0, 1.0)
+        # Differenced cumulative sums leave rounding noise on constant windows.
+        tol = 1e-12 * np.maximum(1.0, mean * mean)
+        ok = var > tol
+        return np.where(ok, mean / np.sqrt(np.where(ok, var, 1.0)) * np.sqrt(m), 0.0)
+
+    short = (counts >= 2) & (counts < window)
+    if short.any():
+        rows = np.nonzero(short)[0]
+        m = counts[rows]
+        out[rows] = _sharpe(csum[rows, m], csq[rows, m], m)
+
+    full = counts >= window
+    if full.any() and n >= window:
+        rows = np.nonzero(full)[0]
+        sums = csum[rows, window:] - csum[rows, :-window]
+        sq = csq[rows, window:] - csq[rows, :-window]
+        sharpe = _sharpe(sums, sq, np.full(sums.shape, window))
+        n_windows = counts[rows] - window + 1
+        in_row = np.arange(sums.shape[1])[None, :] < n_windows[:, None]
+        out[rows] = np.sum(np.where(in_row, sharpe, 0.0), axis=1) / n_windows
+    return out
+
+
+def _compact(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Per row, the masked entries moved to the front in original order."""
+    order = np.argsort(~mask, axis=1, kind="stable")
+    return np.take_along_axis(values, order, axis=1)
+
+
+def evaluate_stakes(
+    stakes: np.ndarray,
+    picks: np.ndarray,
+    odds: np.ndarray,
+    outcomes: np.ndarray,
+    *,
+    closing_odds: Optional[np.ndarray] = None,
+    abstained: Optional[np.ndarray] = None,
+    groups: Optional[Sequence[Any]] = None,
+    sharpe_window: int = 30,
+) -> BacktestResult:
+    """Metrics for given stakes on given picks.
+
+    ``stakes`` and ``picks`` are (n,) or (s, n); a stake of 0 is no bet.
+    ``abstained`` marks matches counted as abstentions (default: no bet).
+    """
+    odds = np.asarray(odds, dtype=float)
+    outcomes = np.asarray(outcomes, dtype=int)
+    n = odds.shape[0]
+    stakes = np.atleast_2d(np.asarray(stakes, dtype=float))
+    picks = np.broadcast_to(np.atleast_2d(np.asarray(picks, dtype=int)), stakes.shape)
+    s = stakes.shape[0]
+
+    rows = np.arange(n)[None, :]
+    price = odds[rows, picks]
+    bet = (stakes > 0) & np.isfinite(price) & (price > 1.0)
+    stakes = np.where(bet, stakes, 0.0)
+    won = picks == outcomes[None, :]
+    pnl = np.where(bet, np.where(won, stakes * (price - 1.0), -stakes), 0.0)
+
+    n_bets = bet.sum(axis=1)
+    staked = stakes.sum(axis=1)
+    total = pnl.sum(axis=1)
+    roi = np.divide(total, staked, out=np.zeros(s), where=staked > 0)
+    curve = np.cumsum(pnl, axis=1)
+
+    unit_returns = _compact(np.divide(pnl, stakes, out=np.zeros_like(pnl), where=bet), bet)
+    sharpe = rolling_sharpe(unit_returns, n_bets, window=sharpe_window)
+
+    clv = np.full(s, np.nan)
+    if closing_odds is not None:
+        closing = np.asarray(closing_odds, dtype=float)[rows, picks]
+        has_close = bet & np.isfinite(closing) & (closing > 1.0)
+        beat = np.where(has_close, price / np.where(has_close, closing, 1.0) - 1.0, 0.0)
+        n_close = has_close.sum(axis=1)
+        clv = np.divide(beat.sum(axis=1), n_close, out=clv, where=n_close > 0)
+
+    if abstained is None:
+        n_abstained = n - n_bets
+    else:
+        n_abstained = np.broadcast_to(np.atleast_2d(np.asarray(abstained, dtype=bool)), (s, n)).sum(axis=1)
+
+    group_labels = group_roi = None
+    if groups is not None:
+        group_labels, codes = np.unique(np.asarray(groups, dtype=object).astype(str), return_inverse=True)
+        g = len(group_labels)
+        flat = (np.arange(s)[:, None] * g + codes[None, :]).ravel()
+        g_pnl = np.bincount(flat, weights=pnl.ravel(), minlength=s * g).reshape(s, g)
+        g_staked = np.bincount(flat, weights=stakes.ravel(), minlength=s * g).reshape(s, g)
+        group_roi = np.divide(g_pnl, g_staked, out=np.zeros((s, g)), where=g_staked > 0)
+        group_labels = list(group_labels)
+
+    return BacktestResult(
+        n_matches=n,
+        n_bets=n_bets,
+        n_abstained=n_abstained,
+        staked=staked,
+        pnl=total,
+        roi=roi,
+        max_drawdown=max_drawdown(curve),
+        rolling_sharpe=sharpe,
+        clv=clv,
+        pnl_curve=curve,
+        stakes=stakes,
+        group_labels=group_labels,
+        group_roi=group_roi,
+    )
+
+
+def backtest(
+    probs: np.ndarray,
+    odds: np.ndarray,
+    outcomes: np.ndarray,
+    strategies: Optional[StrategyGrid] = None,
+    *,
+    selection: str = "model_pick",
+    picks: Optional[np.ndarray] = None,
+    abstain: Optional[np.ndarray] = None,
+    match_kelly_cap: Optional[np.ndarray] = None,
+    closing_odds: Optional[np.ndarray] = None,
+    groups: Optional[Sequence[Any]] = None,
+    sharpe_window: int = 30,
+) -> BacktestResult:
+    """Evaluate every strategy in ``strategies`` over the same matches.
+
+    ``selection``: ``"model_pick"`` bets the model's most likely outcome,
+    ``"max_edge"`` the outcome with the largest edge; explicit (n,) ``picks``
+    override it. ``abstain`` is an (n,)
+    or (s, n) mask of matches never bet. ``match_kelly_cap`` is an (n,)
+    per-match stake cap (see :func:`policy_kelly_caps`).
+    """
+    if selection not in SELECTIONS:
+        raise ValueError(f"selection must be one of {SELECTIONS}")
+    probs = np.asarray(probs, dtype=float)
+    odds = np.asarray(odds, dtype=float)
+    if probs.shape != odds.shape or probs.ndim != 2:
+        raise ValueError("probs and odds must be aligned (n, k) arrays")
+    strategies = strategies or StrategyGrid.build()
+
+    valid_odds = np.isfinite(odds) & (odds > 1.0)
+    implied = np.divide(1.0, odds, out=np.full_like(odds, np.nan), where=valid_odds)
+    edges = np.where(valid_odds, probs - implied, -np.inf)
+    if picks is None:
+        picks = np.argmax(probs if selection == "model_pick" else edges, axis=1)
+    picks = np.asarray(picks, dtype=int)
+
+    rows = np.arange(len(picks))
+    p = probs[rows, picks]
+    price = odds[rows, picks]
+    edge = edges[rows, picks]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        full_kelly = np.where(valid_odds[rows, picks], (p * price - 1.0) / (price - 1.0), 0.0)
+    cap = strategies.kelly_cap[:, None]
+    if match_kelly_cap is not None:
+        cap = np.minimum(cap, np.asarray(match_kelly_cap, dtype=float)[None, :])
+    kelly = strategies.kelly_fraction[:, None]
+    stakes = np.where(
+        kelly > 0,
+        np.clip(kelly * full_kelly[None, :], 0.0, cap),
+        np.broadcast_to(strategies.flat_stake[:, None], (len(strategies), len(picks))),
+    )
+    place = edge[None, :] > strategies.min_edge[:, None]
+    if abstain is not None:
+        place &= ~np.asarray(abstain, dtype=bool)
+    stakes = np.where(place, stakes, 0.0)
+
+    return evaluate_stakes(
+        stakes,
+        picks,
+        odds,
+        outcomes,
+        closing_odds=closing_odds,
+        groups=groups,
+        sharpe_window=sharpe_window,
+    )
+
+
+def policy_kelly_caps(leagues: Iterable[str]) -> np.ndarray:
+    """Per-match Kelly caps from each league's LeaguePolicy; leagues without a
+    validated policy get 0 (NO_BET, per the league-policy contract)."""
+    from ...core.league_policy import LeaguePolicyUnavailableError, get_league_policy
+
+    caps: Dict[str, float] = {}
+    out = []
+    for league in leagues:
+        key = str(league)
+        if key not in caps:
+            try:
+                caps[key] = float(get_league_policy(key).kelly_cap)
+            except LeaguePolicyUnavailableError:
+                caps[key] = 0.0
+        out.append(caps[key])
+    return np.asarray(out, dtype=float)
@@ -0,0 +1,293 @@
+"""Moving-block bootstrap confidence intervals for settled-prediction metrics.
+
+``walk_forward_validate()`` reports point estimates plus ``rps_std`` across at
+most five folds, and ``compute_clv_summary()`` reports a bare mean — neither
+says whether a 0.004 RPS gap between two models is signal. This module puts
+percentile intervals on the per-record means (RPS, Brier, accuracy, CLV, ROI).
+
+Consecutive fixtures are not independent (same matchweek, same form streaks,
+same market regime), so resamples draw contiguous blocks of the date-ordered
+series (Künsch 1989) instead of single records. Every resample is one row of a
+``(B, n)`` index matrix; a metric for all B resamples is then one gather plus
+one row-mean. B is processed in fixed-size chunks, each seeded from its own
+``SeedSequence`` child, so the result for a given seed is identical whether the
+chunks run inline or across a process pool.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .walk_forward import score_walk_forward_records
+
+DEFAULT_RESAMPLES = 2_000
+DEFAULT_ALPHA = 0.05
+
+# Below this many records an interval is noise about noise — same floor the
+# pooled Brier decomposition and the CLV summary use.
+MIN_BOOTSTRAP_RECORDS = 10
+
+# Upper bound on index-matrix cells per chunk (~20 MB of int64). Chunk layout
+# depends only on n, never on n_jobs, which keeps results reproducible.
+_MAX_CHUNK_CELLS = 2_500_000
+
+# Fan out to worker processes only when there is enough work to amortise
+# spawning them and pickling the value matrix.
+_PARALLEL_MIN_CELLS = 20_000_000
+
+# Metrics where a lower value is better; used for the paired comparison.
+LOWER_IS_BETTER = frozenset({"rps", "brier"})
+
+
+def default_block_length(n: int) -> int:
+    """n^(1/3), the usual rate for block-bootstrap variance estimation."""
+    return max(1, int(round(n ** (1.0 / 3.0))))
+
+
+def moving_block_indices(
+    n: int,
+    n_resamples: int,
+    block_length: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Return a ``(n_resamples, n)`` matrix of moving-block resample indices.
+
+    Each row concatenates ``ceil(n / block_length)`` blocks of consecutive
+    indices whose start is uniform over ``[0, n - block_length]`` and is then
+    truncated to n. ``block_length=1`` is the ordinary i.i.d. bootstrap.
+    """
+    if n < 1:
+        raise ValueError("n must be >= 1")
+    block_length = int(min(max(block_length, 1), n))
+    n_blocks = -(-n // block_length)
+    starts = rng.integers(0, n - block_length + 1, size=(n_resamples, n_blocks))
+    offsets = np.arange(block_length)
+    indices = (starts[:, :, None] + offsets).reshape(n_resamples, n_blocks * block_length)
+    return indices[:, :n]
+
+
+def _bootstrap_chunk(
+    values: np.ndarray,
+    n_resamples: int,
+    block_length: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    """Resampled means for one chunk: ``(m, n_resamples)`` for ``values`` (m, n)."""
+    rng = np.random.default_rng(seed)
+    indices = moving_block_indices(values.shape[1], n_resamples, block_length, rng)
+    out = np.empty((values.shape[0], n_resamples))
+    for row in range(values.shape[0]):
+        out[row] = values[row][indices].mean(axis=1)
+    return out
+
+
+def bootstrap_mean_distribution(
+    values: np.ndarray,
+    *,
+    n_resamples: int = DEFAULT_RESAMPLES,
+    block_length: Optional[int] = None,
+    seed: Optional[int] = None,
+    n_jobs: int = 1,
+) -> np.ndarray:
+    """Bootstrap distribution of the row means of ``values`` (m, n) -> (m, B).
+
+    All rows share the same index matrices, so metrics computed over the same
+    records (or two models scored on the same fixtures) stay paired.
+    """
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    n = values.shape[1]
+    if n < 1:
+        raise ValueError("values must contain at least one record")
+    if n_resamples < 1:
+        raise ValueError("n_resamples must be >= 1")
+    block_length = default_block_length(n) if block_length is None else int(block_length)
+
+    chunk = max(1, min(n_resamples, _MAX_CHUNK_CELLS // n))
+    sizes = [chunk] * (n_resamples // chunk)
+    if n_resamples % chunk:
+        sizes.append(n_resamples % chunk)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if n_jobs > 1 and len(sizes) > 1 and n_resamples * n >= _PARALLEL_MIN_CELLS:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(sizes))) as pool:
+            futures = [
+                pool.submit(_bootstrap_chunk, values, size, block_length, child)
+                for size, child in zip(sizes, seeds)
+            ]
+            parts = [future.result() for future in futures]
+    else:
+        parts = [
+            _bootstrap_chunk(values, size, block_length, child)
+            for size, child in zip(sizes, seeds)
+        ]
+    return np.concatenate(parts, axis=1)
+
+
+def _interval(estimate: float, distribution: np.ndarray, alpha: float) -> Dict[str, float]:
+    lower, upper = np.quantile(distribution, [alpha / 2.0, 1.0 - alpha / 2.0])
+    return {
+        "estimate": float(estimate),
+        "lower": float(lower),
+        "upper": float(upper),
+        "std_error": float(distribution.std(ddof=1)) if distribution.size > 1 else 0.0,
+    }
+
+
+def bootstrap_mean_intervals(
+    metrics: Mapping[str, Sequence[float]],
+    *,
+    n_resamples: int = DEFAULT_RESAMPLES,
+    alpha: float = DEFAULT_ALPHA,
+    block_length: Optional[int] = None,
+    seed: Optional[int] = None,
+    n_jobs: int = 1,
+) -> Dict[str, Dict[str, float]]:
+    """Percentile intervals for the mean of each equally long per-record series.
+
+    Series must be in date order; all of them are resampled with the same
+    index matrices.
+    """
+    names = list(metrics)
+    values = np.vstack([np.asarray(metrics[name], dtype=float) for name in names])
+    distribution = bootstrap_mean_distribution(
+        values,
+        n_resamples=n_resamples,
+        block_length=block_length,
+        seed=seed,
+        n_jobs=n_jobs,
+    )
+    estimates = values.mean(axis=1)
+    return {
+        name: _interval(estimates[i], distribution[i], alpha)
+        for i, name in enumerate(names)
+    }
+
+
+def settled_prediction_metrics(
+    records: Sequence[Mapping[str, Any]],
+) -> Dict[str, np.ndarray]:
+    """Per-record RPS, Brier, accuracy and (when odds are present) ROI.
+
+    ``records`` are ``get_settled_predictions()`` rows; invalid rows are
+    dropped under ``score_walk_forward_records()``'s rules and the rest are
+    ordered by ``date``. ROI is a one-unit flat stake on the argmax outcome at
+    the record's decimal ``odds`` ([h, d, a]); it is only returned when every
+    valid record carries usable odds, since a partial ROI is not comparable
+    across models.
+    """
+    ordered = sorted(records, key=lambda rec: rec.get("date", ""))
+    scored = score_walk_forward_records(ordered)
+    valid = scored["valid"]
+    out = {
+        "rps": scored["rps"][valid],
+        "brier": scored["brier"][valid],
+        "accuracy": scored["correct"][valid].astype(float),
+    }
+
+    kept = [rec for rec, ok in zip(ordered, valid) if ok]
+    odds = np.full((len(kept), 3), np.nan)
+    for i, rec in enumerate(kept):
+        raw = rec.get("odds")
+        if raw is not None and len(raw) == 3:
+            try:
+                odds[i] = [float(price) for price in raw]
+            except (TypeError, ValueError):
+                pass
+    if kept and np.isfinite(odds).all() and (odds > 1.0).all():
+        picks = np.argmax(scored["probs"][valid], axis=1)
+        hit = picks == scored["outcome"][valid]
+        out["roi"] = np.where(hit, odds[np.arange(len(kept)), picks] - 1.0, -1.0)
+    return out
+
+
+def bootstrap_metric_intervals(
+    records: Sequence[Mapping[str, Any]],
+    clv: Optional[Sequence[float]] = None,
+    *,
+    n_resamples: int = DEFAULT_RESAMPLES,
+    alpha: float = DEFAULT_ALPHA,
+    block_length: Optional[int] = None,
+    seed: Optional[int] = None,
+    n_jobs: int = 1,
+) -> Dict[str, Any]:
+    """Bootstrap intervals for RPS, Brier, accuracy, ROI and mean CLV.
+
+    Returns ``{"skipped": True, "reason": ...}`` below the
+    ``MIN_BOOTSTRAP_RECORDS`` floor; otherwise ``{"skipped": False, "n": ...,
+    "metrics": {name: {"estimate", "lower", "upper", "std_error"}}, ...}``.
+    ``clv`` is the per-record CLV series from ``clv_service.clv_values()``
+    (match-date order); it is bootstrapped over its own closing-line-joined
+    population, so it carries its own ``n``.
+    """
+    series = settled_prediction_metrics(records)
+    n = len(series["rps"])
+    if n < MIN_BOOTSTRAP_RECORDS:
+        return {
+            "skipped": True,
+            "reason": f"need >= {MIN_BOOTSTRAP_RECORDS} valid settled predictions, got {n}",
+            "n": n,
+        }
+
+    options = dict(
+        n_resamples=n_resamples,
+        alpha=alpha,
+        block_length=block_length,
+        seed=seed,
+        n_jobs=n_jobs,
+    )
+    metrics: Dict[str, Any] = bootstrap_mean_intervals(series, **options)
+    result: Dict[str, Any] = {
+        "skipped": False,
+        "n": n,
+        "n_resamples": n_resamples,
+        "alpha": alpha,
+        "block_length": block_length or default_block_length(n),
+        "metrics": metrics,
+    }
+
+    if clv is not None:
+        clv = np.asarray(clv, dtype=float)
+        if len(clv) >= MIN_BOOTSTRAP_RECORDS:
+            interval = bootstrap_mean_intervals({"clv": clv}, **options)["clv"]
+            metrics["mean_clv"] = {**interval, "n": int(len(clv))}
+    return result
+
+
+def paired_bootstrap_difference(
+    candidate: Sequence[float],
+    incumbent: Sequence[float],
+    *,
+    lower_is_better: bool = True,
+    n_resamples: int = DEFAULT_RESAMPLES,
+    alpha: float = DEFAULT_ALPHA,
+    block_length: Optional[int] = None,
+    seed: Optional[int] = None,
+    n_jobs: int = 1,
+) -> Dict[str, float]:
+    """Interval on ``mean(candidate) - mean(incumbent)`` over the same fixtures.
+
+    Both series must be aligned record-for-record (same fixtures, date order);
+    resampling the per-record difference keeps the pairing, which is far
+    tighter than comparing two independent intervals. ``prob_candidate_better``
+    is the share of resamples in which the candidate wins.
+    """
+    a = np.asarray(candidate, dtype=float)
+    b = np.asarray(incumbent, dtype=float)
+    if a.shape != b.shape:
+        raise ValueError(f"candidate and incumbent must be aligned, got {a.shape} vs {b.shape}")
+    diff = a - b
+    distribution = bootstrap_mean_distribution(
+        diff,
+        n_resamples=n_resamples,
+        block_length=block_length,
+        seed=seed,
+        n_jobs=n_jobs,
+    )[0]
+    wins = distribution < 0.0 if lower_is_better else distribution > 0.0
+    return {
+        **_interval(diff.mean(), distribution, alpha),
+        "prob_candidate_better": float(wins.mean()),
+        "n": int(diff.size),
+    }
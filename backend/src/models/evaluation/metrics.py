@@ -5,34 +5,66 @@ from typing import Any, Dict
 import numpy as np
 
 
-def expected_calibration_error(
-    y_true: np.ndarray,
-    y_proba: np.ndarray,
-    n_bins: int = 10,
-) -> Dict[str, float]:
-    """Compute multiclass ECE and return per-class plus mean values."""
+def _validate_proba(y_true: np.ndarray, y_proba: np.ndarray) -> None:
     if y_proba.ndim != 2:
         raise ValueError("y_proba must be a 2D array shaped (n_samples, n_classes)")
     if len(y_true) != y_proba.shape[0]:
         raise ValueError("y_true length must match y_proba rows")
 
+
+def _one_hot(y_true: np.ndarray, n_classes: int) -> np.ndarray:
+    return (np.asarray(y_true).reshape(-1, 1) == np.arange(n_classes)).astype(float)
+
+
+def _bin_statistics(
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
+    n_bins: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-class, per-bin (count, sum of predicted prob, sum of outcomes).
+
+    Bins are right-closed, ``(lo, hi]`` over ``linspace(0, 1, n_bins + 1)`` —
+    a probability of exactly 0 falls in no bin. One ``np.digitize`` over the
+    whole (n, k) matrix plus one ``np.bincount`` per statistic; each array is
+    shaped (n_classes, n_bins).
+    """
     n_classes = y_proba.shape[1]
-    n = max(len(y_true), 1)
     bins = np.linspace(0.0, 1.0, n_bins + 1)
+    bin_idx = np.digitize(y_proba, bins, right=True) - 1
+    in_range = (bin_idx >= 0) & (bin_idx < n_bins)
+    flat = (np.arange(n_classes) * n_bins + np.where(in_range, bin_idx, 0))[in_range]
+    size = n_classes * n_bins
+
+    counts = np.bincount(flat, minlength=size).reshape(n_classes, n_bins)
+    prob_sums = np.bincount(flat, weights=y_proba[in_range], minlength=size)
+    outcome_sums = np.bincount(
+        flat, weights=_one_hot(y_true, n_classes)[in_range], minlength=size
+    )
+    return (
+        counts,
+        prob_sums.reshape(n_classes, n_bins),
+        outcome_sums.reshape(n_classes, n_bins),
+    )
 
-    ece_per_class: Dict[str, float] = {}
-    for cls in range(n_classes):
-        binary = (y_true == cls).astype(float)
-        probs = y_proba[:, cls]
-        ece = 0.0
 
-        for lo, hi in zip(bins[:-1], bins[1:]):
-            mask = (probs > lo) & (probs <= hi)
-            if np.any(mask):
-                ece += mask.sum() * abs(binary[mask].mean() - probs[mask].mean())
+def expected_calibration_error(
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
+    n_bins: int = 10,
+) -> Dict[str, float]:
+    """Compute multiclass ECE and return per-class plus mean values."""
+    _validate_proba(y_true, y_proba)
 
-        ece_per_class[f"class_{cls}"] = round(float(ece / n), 4)
+    n_classes = y_proba.shape[1]
+    n = max(len(y_true), 1)
+    counts, prob_sums, outcome_sums = _bin_statistics(y_true, y_proba, n_bins)
+    safe = np.maximum(counts, 1)
+    gaps = counts * np.abs(outcome_sums / safe - prob_sums / safe)
+    ece = gaps.sum(axis=1) / n
 
+    ece_per_class: Dict[str, float] = {
+        f"class_{cls}": round(float(ece[cls]), 4) for cls in range(n_classes)
+    }
     ece_per_class["mean"] = round(
         float(np.mean([ece_per_class[f"class_{i}"] for i in range(n_classes)])), 4
     )
@@ -49,6 +81,83 @@ def ranked_probability_score(y_true_outcome: int, probs: list[float]) -> float:
     return sum((p - t) ** 2 for p, t in zip(cumprobs, cumtrue)) / 2.0
 
 
+def ranked_probability_scores(y_true: np.ndarray, y_proba: np.ndarray) -> np.ndarray:
+    """Per-record RPS for an (n, k) matrix of ordered-outcome probabilities.
+
+    Array-native counterpart of ``ranked_probability_score``: cumulative sums
+    over the class axis, normalised by ``k - 1``. Returns shape (n,).
+    """
+    y_proba = np.asarray(y_proba, dtype=float)
+    _validate_proba(y_true, y_proba)
+    n_classes = y_proba.shape[1]
+    cdf_pred = np.cumsum(y_proba, axis=1)[:, :-1]
+    cdf_true = np.cumsum(_one_hot(y_true, n_classes), axis=1)[:, :-1]
+    return np.sum((cdf_pred - cdf_true) ** 2, axis=1) / (n_classes - 1)
+
+
+def mean_ranked_probability_score(y_true: np.ndarray, y_proba: np.ndarray) -> float:
+    """Mean RPS over all records. Lower is better."""
+    return float(np.mean(ranked_probability_scores(y_true, y_proba)))
+
+
+def multiclass_brier_scores(y_true: np.ndarray, y_proba: np.ndarray) -> np.ndarray:
+    """Per-record multi-category Brier score (Brier 1950): sum of squared
+    errors against the one-hot outcome, range [0, 2]. Returns shape (n,).
+    """
+    y_proba = np.asarray(y_proba, dtype=float)
+    _validate_proba(y_true, y_proba)
+    return np.sum((y_proba - _one_hot(y_true, y_proba.shape[1])) ** 2, axis=1)
+
+
+def multiclass_log_loss(
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
+    eps: float = 1e-15,
+) -> float:
+    """Mean negative log-likelihood of the observed outcome, with probabilities
+    clipped to ``[eps, 1 - eps]`` and rows renormalised (sklearn's convention).
+    """
+    y_proba = np.asarray(y_proba, dtype=float)
+    _validate_proba(y_true, y_proba)
+    clipped = np.clip(y_proba, eps, 1.0 - eps)
+    clipped = clipped / clipped.sum(axis=1, keepdims=True)
+    picked = clipped[np.arange(len(y_true)), np.asarray(y_true, dtype=int)]
+    return float(-np.mean(np.log(picked)))
+
+
+def reliability_curve(
+    y_true: np.ndarray,
+    y_proba: np.ndarray,
+    n_bins: int = 10,
+) -> Dict[str, Any]:
+    """Per-class reliability diagram data on ``expected_calibration_error``'s
+    bins: mean predicted probability, observed frequency and sample count per
+    bin. Empty bins report ``None`` for both rates and are kept so every
+    class's curve has ``n_bins`` points aligned with ``bin_edges``.
+    """
+    _validate_proba(y_true, y_proba)
+    counts, prob_sums, outcome_sums = _bin_statistics(y_true, y_proba, n_bins)
+
+    per_class: Dict[str, Dict[str, list]] = {}
+    for cls in range(y_proba.shape[1]):
+        occupied = counts[cls] > 0
+        safe = np.maximum(counts[cls], 1)
+        mean_predicted = np.where(occupied, prob_sums[cls] / safe, np.nan)
+        observed = np.where(occupied, outcome_sums[cls] / safe, np.nan)
+        per_class[f"class_{cls}"] = {
+            "mean_predicted": [None if np.isnan(v) else round(float(v), 4) for v in mean_predicted],
+            "observed_frequency": [None if np.isnan(v) else round(float(v), 4) for v in observed],
+            "counts": counts[cls].astype(int).tolist(),
+        }
+
+    return {
+        "per_class": per_class,
+        "bin_edges": np.linspace(0.0, 1.0, n_bins + 1).round(4).tolist(),
+        "n_bins": n_bins,
+        "n_samples": int(len(y_true)),
+    }
+
+
 def brier_score_decomposition(
     y_true: np.ndarray,
     y_proba: np.ndarray,
@@ -73,43 +182,31 @@ def brier_score_decomposition(
     Every bin's sample count is returned in ``bin_counts`` — this is never
     meant to back a reliability curve without also showing its counts.
     """
-    if y_proba.ndim != 2:
-        raise ValueError("y_proba must be a 2D array shaped (n_samples, n_classes)")
-    if len(y_true) != y_proba.shape[0]:
-        raise ValueError("y_true length must match y_proba rows")
+    _validate_proba(y_true, y_proba)
 
     n_classes = y_proba.shape[1]
     n = max(len(y_true), 1)
-    bins = np.linspace(0.0, 1.0, n_bins + 1)
+    counts, prob_sums, outcome_sums = _bin_statistics(y_true, y_proba, n_bins)
+    safe = np.maximum(counts, 1)
+    p_bar = prob_sums / safe
+    o_bar = outcome_sums / safe
+
+    binary = _one_hot(y_true, n_classes)
+    base_rates = binary.mean(axis=0) if len(y_true) else np.zeros(n_classes)
+    reliability = (counts * (p_bar - o_bar) ** 2).sum(axis=1) / n
+    resolution = (counts * (o_bar - base_rates[:, None]) ** 2).sum(axis=1) / n
+    brier = np.mean((y_proba - binary) ** 2, axis=0)
 
     per_class: Dict[str, Dict[str, float]] = {}
     bin_counts: Dict[str, list] = {}
-
     for cls in range(n_classes):
-        binary = (y_true == cls).astype(float)
-        probs = y_proba[:, cls]
-        base_rate = float(binary.mean()) if n else 0.0
-
-        reliability = 0.0
-        resolution = 0.0
-        counts_for_class: list = []
-        for lo, hi in zip(bins[:-1], bins[1:]):
-            mask = (probs > lo) & (probs <= hi)
-            count = int(mask.sum())
-            counts_for_class.append(count)
-            if count == 0:
-                continue
-            p_j = float(probs[mask].mean())
-            o_j = float(binary[mask].mean())
-            reliability += count * (p_j - o_j) ** 2
-            resolution += count * (o_j - base_rate) ** 2
-
         key = f"class_{cls}"
-        bin_counts[key] = counts_for_class
+        base_rate = float(base_rates[cls])
+        bin_counts[key] = counts[cls].astype(int).tolist()
         per_class[key] = {
-            "brier_score": round(float(np.mean((probs - binary) ** 2)), 4),
-            "reliability": round(reliability / n, 4),
-            "resolution": round(resolution / n, 4),
+            "brier_score": round(float(brier[cls]), 4),
+            "reliability": round(float(reliability[cls]), 4),
+            "resolution": round(float(resolution[cls]), 4),
             "uncertainty": round(base_rate * (1.0 - base_rate), 4),
         }
 
@@ -0,0 +1,545 @@
+"""Incremental walk-forward validation over settled predictions.
+
+``ModelRegistry.walk_forward_validate()`` scores every settled record on every
+call. The settlement loop calls it on a timer, so its cost grew with total
+history even when only a handful of fixtures settled since the last tick.
+
+``IncrementalWalkForwardEvaluator`` keeps each record's scores keyed by
+prediction-log id, so a settlement pass only scores what is new (fetched past
+a settlement-time high-water mark). Fold boundaries still follow
+``walk_forward_validate()``'s count-based layout; they are re-derived from
+prefix sums over the date-ordered score arrays, never by re-scoring records.
+
+Alongside the records it keeps running totals over every validated record:
+RPS / Brier / hit sums and, per class and calibration bin, the count,
+predicted-probability sum and outcome sum (``expected_calibration_error``'s
+bins). Each ingest adds the new records and subtracts replaced ones, so the
+``history`` block of ``evaluate()`` is O(bins).
+
+Persistence is a small JSON header (high-water marks plus those totals),
+rewritten atomically, and an append-only JSONL journal of record additions
+and removals beside it. ``save()`` appends only what changed since the last
+save; the header stores the committed journal length, so a tail left by an
+interrupted save is ignored and overwritten. The journal is compacted once
+removals make it much longer than the live record set.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .metrics import (
+    _bin_statistics,
+    brier_score_decomposition,
+    multiclass_brier_scores,
+    ranked_probability_scores,
+)
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 2
+JOURNAL_SUFFIX = ".records.jsonl"
+CALIBRATION_BINS = 10
+N_CLASSES = 3
+# Rewrite the journal once it holds this many more lines than live records.
+_COMPACTION_SLACK = 1_000
+
+# Diagnostic floor for the pooled Brier decomposition — same value
+# walk_forward_validate() applies.
+MIN_RECORDS_FOR_DECOMPOSITION = 10
+
+
+def normalise_settled_high_water_mark(mark: Optional[str]) -> Optional[str]:
+    """A persisted ``settled_at`` mark as a naive-UTC ISO string.
+
+    Records carry naive-UTC ``settled_at`` strings and the mark is compared
+    against them lexicographically; marks saved while some writers still
+    stamped ``Match.updated_at`` with an offset are converted on load.
+    """
+    if not mark:
+        return None
+    moment = datetime.fromisoformat(mark)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment.isoformat()
+
+
+def score_walk_forward_records(
+    records: Sequence[Mapping[str, Any]],
+) -> Dict[str, np.ndarray]:
+    """Validate and score a batch of settled records in one array pass.
+
+    Returns ``valid`` (bool), ``outcome`` (int, -1 where invalid), ``probs``
+    (n, 3), ``rps``, ``brier`` (multi-category, Brier 1950) and ``correct``
+    (top-class hit, ties to the first max). A record is invalid — and scores 0
+    everywhere — on an unknown outcome, a non-finite or out-of-range
+    probability, or a vector that does not sum to 1 within 1e-6; these are the
+    rules walk_forward_validate() has always applied.
+    """
+    n = len(records)
+    outcomes = np.full(n, -1, dtype=np.int64)
+    probs = np.full((n, 3), np.nan)
+    for i, rec in enumerate(records):
+        outcome = rec.get("outcome")
+        raw = rec.get("probs")
+        if outcome is None or raw is None or len(raw) != 3:
+            continue
+        try:
+            outcomes[i] = int(outcome)
+            probs[i] = [float(probability) for probability in raw]
+        except (TypeError, ValueError, OverflowError):
+            outcomes[i] = -1
+
+    with np.errstate(invalid="ignore"):
+        valid = (
+            (outcomes >= 0)
+            & (outcomes <= 2)
+            & np.isfinite(probs).all(axis=1)
+            & ((probs >= 0.0) & (probs <= 1.0)).all(axis=1)
+            & (np.abs(probs.sum(axis=1) - 1.0) <= 1e-6)
+        )
+    safe_probs = np.where(valid[:, None], probs, 0.0)
+    safe_outcomes = np.where(valid, outcomes, 0)
+
+    rps = np.where(valid, ranked_probability_scores(safe_outcomes, safe_probs), 0.0)
+    brier = np.where(valid, multiclass_brier_scores(safe_outcomes, safe_probs), 0.0)
+    correct = valid & (np.argmax(safe_probs, axis=1) == safe_outcomes)
+    return {
+        "valid": valid,
+        "outcome": np.where(valid, outcomes, -1),
+        "probs": safe_probs,
+        "rps": rps,
+        "brier": brier,
+        "correct": correct,
+    }
+
+
+def score_walk_forward_record(outcome: Any, probs: Any) -> Optional[tuple[float, float, bool]]:
+    """(rps, multi-category brier, top-class hit) for one settled record, or
+    None when it fails validation — single-record form of
+    ``score_walk_forward_records``.
+    """
+    scored = score_walk_forward_records([{"outcome": outcome, "probs": probs}])
+    if not scored["valid"][0]:
+        return None
+    return float(scored["rps"][0]), float(scored["brier"][0]), bool(scored["correct"][0])
+
+
+class IncrementalWalkForwardEvaluator:
+    """Walk-forward RPS/Brier/accuracy state that grows with new settlements.
+
+    Records are dicts shaped like ``get_settled_predictions_since()`` rows:
+    ``prediction_id``, ``match_id``, ``date``, ``outcome``, ``probs`` and
+    ``settled_at``. Re-ingesting a prediction id is a no-op; a newer prediction
+    log for an already-scored match replaces the older one, mirroring the
+    latest-log-per-match rule of ``build_settled_predictions_query``.
+
+    ``evaluate()`` returns the same payload as ``walk_forward_validate()``.
+    """
+
+    def __init__(self, state_path: Optional[Path] = None, n_splits: int = 5) -> None:
+        self.state_path = Path(state_path) if state_path is not None else None
+        self.n_splits = n_splits
+        # Date-ordered sort keys: (date, prediction_id).
+        self._order: List[tuple[str, int]] = []
+        # prediction_id -> [match_id, date, outcome, rps, brier, correct, valid]
+        self._rows: Dict[int, list] = {}
+        self._by_match: Dict[str, int] = {}
+        self.settled_high_water_mark: Optional[str] = None
+        self.prediction_high_water_mark: int = 0
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+        self._pooled_probs: Dict[int, List[float]] = {}
+        self._clear_totals()
+        # Journal lines not yet written, and the committed journal length.
+        self._pending: List[list] = []
+        self._journal_bytes = 0
+        self._journal_lines = 0
+        self._rewrite_journal = False
+        if self.state_path is not None:
+            self.load()
+
+    @property
+    def journal_path(self) -> Optional[Path]:
+        if self.state_path is None:
+            return None
+        return self.state_path.with_name(self.state_path.stem + JOURNAL_SUFFIX)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    # ── ingestion ────────────────────────────────────────────────────────────
+
+    def ingest(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Score and insert new records; returns how many changed the state."""
+        candidates: Dict[str, Dict[str, Any]] = {}
+        for rec in records:
+            prediction_id = int(rec["prediction_id"])
+            settled_at = rec.get("settled_at")
+            if settled_at and (
+                self.settled_high_water_mark is None or settled_at > self.settled_high_water_mark
+            ):
+                self.settled_high_water_mark = settled_at
+            self.prediction_high_water_mark = max(self.prediction_high_water_mark, prediction_id)
+
+            if prediction_id in self._rows:
+                continue
+            match_id = str(rec.get("match_id") or prediction_id)
+            current = candidates.get(match_id)
+            if current is None or int(current["prediction_id"]) < prediction_id:
+                candidates[match_id] = rec
+
+        fresh: List[Dict[str, Any]] = []
+        for match_id, rec in candidates.items():
+            previous = self._by_match.get(match_id)
+            if previous is not None:
+                if previous > int(rec["prediction_id"]):
+                    continue
+                self._remove(previous)
+            fresh.append(rec)
+        if not fresh:
+            return 0
+
+        scored = score_walk_forward_records(fresh)
+        valid_mask = scored["valid"]
+        self._accumulate(
+            scored["outcome"][valid_mask],
+            scored["probs"][valid_mask],
+            scored["rps"][valid_mask],
+            scored["brier"][valid_mask],
+            scored["correct"][valid_mask],
+            sign=1.0,
+        )
+        for i, rec in enumerate(fresh):
+            prediction_id = int(rec["prediction_id"])
+            match_id = str(rec.get("match_id") or prediction_id)
+            date = str(rec.get("date") or "")
+            valid = bool(scored["valid"][i])
+            self._rows[prediction_id] = [
+                match_id,
+                date,
+                int(scored["outcome"][i]) if valid else None,
+                float(scored["rps"][i]),
+                float(scored["brier"][i]),
+                bool(scored["correct"][i]),
+                valid,
+            ]
+            if valid:
+                self._pooled_probs[prediction_id] = scored["probs"][i].tolist()
+            self._by_match[match_id] = prediction_id
+            bisect.insort(self._order, (date, prediction_id))
+            self._pending.append(
+                [prediction_id, *self._rows[prediction_id], self._pooled_probs.get(prediction_id)]
+            )
+
+        self._arrays = None
+        return len(fresh)
+
+    def _remove(self, prediction_id: int) -> None:
+        row = self._rows.pop(prediction_id)
+        probs = self._pooled_probs.pop(prediction_id, None)
+        if row[6] and probs is not None:
+            self._accumulate(
+                np.array([row[2]]), np.array([probs]), np.array([row[3]]),
+                np.array([row[4]]), np.array([row[5]], dtype=float), sign=-1.0,
+            )
+        self._pending.append([prediction_id])
+        key = (row[1], prediction_id)
+        idx = bisect.bisect_left(self._order, key)
+        if idx < len(self._order) and self._order[idx] == key:
+            del self._order[idx]
+        self._arrays = None
+
+    # ── running totals ───────────────────────────────────────────────────────
+
+    def _clear_totals(self) -> None:
+        shape = (N_CLASSES, CALIBRATION_BINS)
+        self._bin_counts = np.zeros(shape)
+        self._bin_prob_sums = np.zeros(shape)
+        self._bin_outcome_sums = np.zeros(shape)
+        self._totals = {"valid": 0.0, "rps": 0.0, "brier": 0.0, "correct": 0.0}
+
+    def _accumulate(
+        self,
+        outcomes: np.ndarray,
+        probs: np.ndarray,
+        rps: np.ndarray,
+        brier: np.ndarray,
+        correct: np.ndarray,
+        sign: float,
+    ) -> None:
+        """Add (sign=1) or subtract (sign=-1) validated records from the totals."""
+        if len(outcomes) == 0:
+            return
+        counts, prob_sums, outcome_sums = _bin_statistics(
+            np.asarray(outcomes, dtype=np.int64), np.asarray(probs, dtype=float), CALIBRATION_BINS
+        )
+        self._bin_counts += sign * counts
+        self._bin_prob_sums += sign * prob_sums
+        self._bin_outcome_sums += sign * outcome_sums
+        self._totals["valid"] += sign * len(outcomes)
+        self._totals["rps"] += sign * float(np.sum(rps))
+        self._totals["brier"] += sign * float(np.sum(brier))
+        self._totals["correct"] += sign * float(np.sum(correct))
+
+    def _rebuild_totals(self) -> None:
+        self._clear_totals()
+        rows = [(pid, row) for pid, row in self._rows.items() if row[6] and pid in self._pooled_probs]
+        if rows:
+            self._accumulate(
+                np.array([row[2] for _, row in rows]),
+                np.array([self._pooled_probs[pid] for pid, _ in rows]),
+                np.array([row[3] for _, row in rows]),
+                np.array([row[4] for _, row in rows]),
+                np.array([row[5] for _, row in rows], dtype=float),
+                sign=1.0,
+            )
+
+    def history(self) -> Dict[str, Any]:
+        """Every validated record so far: mean scores and per-bin calibration."""
+        n = int(round(self._totals["valid"]))
+        counts = np.rint(self._bin_counts).astype(int)
+        occupied = counts > 0
+        safe = np.maximum(counts, 1)
+        mean_predicted = self._bin_prob_sums / safe
+        observed = self._bin_outcome_sums / safe
+        ece = (counts * np.abs(observed - mean_predicted)).sum(axis=1) / max(n, 1)
+        per_class: Dict[str, Dict[str, list]] = {}
+        for cls in range(N_CLASSES):
+            per_class[f"class_{cls}"] = {
+                "mean_predicted": [
+                    round(float(v), 4) if hit else None
+                    for v, hit in zip(mean_predicted[cls], occupied[cls])
+                ],
+                "observed_frequency": [
+                    round(float(v), 4) if hit else None
+                    for v, hit in zip(observed[cls], occupied[cls])
+                ],
+                "counts": counts[cls].tolist(),
+            }
+        return {
+            "n_samples": n,
+            "rps_mean": self._totals["rps"] / n if n else None,
+            "brier_mean": self._totals["brier"] / n if n else None,
+            "accuracy": self._totals["correct"] / n if n else None,
+            "ece_mean": round(float(ece.mean()), 4),
+            "n_bins": CALIBRATION_BINS,
+            "per_class": per_class,
+        }
+
+    # ── evaluation ───────────────────────────────────────────────────────────
+
+    def _materialize(self) -> Dict[str, np.ndarray]:
+        if self._arrays is None:
+            ids = [pid for _, pid in self._order]
+            rows = [self._rows[pid] for pid in ids]
+            valid = np.fromiter((r[6] for r in rows), dtype=bool, count=len(rows))
+            rps = np.fromiter((r[3] for r in rows), dtype=float, count=len(rows))
+            brier = np.fromiter((r[4] for r in rows), dtype=float, count=len(rows))
+            correct = np.fromiter((r[5] for r in rows), dtype=float, count=len(rows))
+            zero = np.zeros(1)
+            self._arrays = {
+                "ids": np.asarray(ids, dtype=np.int64),
+                "valid": valid,
+                "rps": rps,
+                "cum_valid": np.concatenate([zero, np.cumsum(valid)]),
+                "cum_rps": np.concatenate([zero, np.cumsum(np.where(valid, rps, 0.0))]),
+                "cum_brier": np.concatenate([zero, np.cumsum(np.where(valid, brier, 0.0))]),
+                "cum_correct": np.concatenate([zero, np.cumsum(np.where(valid, correct, 0.0))]),
+            }
+        return self._arrays
+
+    def evaluate(self) -> Dict[str, Any]:
+        """Walk-forward payload for the current state (walk_forward_validate() contract)."""
+        n = len(self._order)
+        if n == 0:
+            return {"skipped": True, "reason": "no_records"}
+        min_records = self.n_splits * 2
+        if n < min_records:
+            return {"skipped": True, "reason": f"need >= {min_records} records, got {n}"}
+
+        arrays = self._materialize()
+        fold_size = n // (self.n_splits + 1)
+        fold_results: List[Dict[str, Any]] = []
+
+        for fold in range(self.n_splits):
+            start = (fold + 1) * fold_size
+            end = min(start + fold_size, n)
+            if start >= end:
+                continue
+            count = int(arrays["cum_valid"][end] - arrays["cum_valid"][start])
+            if count == 0:
+                continue
+            window = arrays["rps"][start:end][arrays["valid"][start:end]]
+            fold_results.append({
+                "fold": fold,
+                "train_end_idx": start,
+                "test_size": count,
+                "rps_mean": float(arrays["cum_rps"][end] - arrays["cum_rps"][start]) / count,
+                "rps_min": float(window.min()),
+                "rps_max": float(window.max()),
+                "brier_mean": float(arrays["cum_brier"][end] - arrays["cum_brier"][start]) / count,
+                "accuracy": float(arrays["cum_correct"][end] - arrays["cum_correct"][start]) / count,
+                "date_range": {
+                    "from": self._order[start][0],
+                    "to": self._order[end - 1][0],
+                },
+            })
+
+        if not fold_results:
+            return {"skipped": True, "reason": "no_valid_folds"}
+
+        all_rps = [f["rps_mean"] for f in fold_results]
+        all_brier = [f["brier_mean"] for f in fold_results]
+        all_accuracy = [f["accuracy"] for f in fold_results]
+
+        pooled_end = min((self.n_splits + 1) * fold_size, n)
+        pooled_ids = arrays["ids"][fold_size:pooled_end][arrays["valid"][fold_size:pooled_end]]
+        if len(pooled_ids) >= MIN_RECORDS_FOR_DECOMPOSITION:
+            brier_decomposition = brier_score_decomposition(
+                np.array([self._rows[int(pid)][2] for pid in pooled_ids]),
+                np.array([self._pooled_probs[int(pid)] for pid in pooled_ids]),
+            )
+        else:
+            brier_decomposition = {
+                "skipped": True,
+                "reason": (
+                    f"need >= {MIN_RECORDS_FOR_DECOMPOSITION} pooled validated records, "
+                    f"got {len(pooled_ids)}"
+                ),
+            }
+
+        return {
+            "skipped": False,
+            "n_splits": len(fold_results),
+            "total_records": n,
+            "rps_overall": sum(all_rps) / len(all_rps),
+            "rps_std": float(np.std(all_rps, ddof=1)) if len(all_rps) > 1 else 0.0,
+            "accuracy_overall": sum(all_accuracy) / len(all_accuracy),
+            "brier_overall": sum(all_brier) / len(all_brier),
+            "brier_decomposition": brier_decomposition,
+            "folds": fold_results,
+            "history": self.history(),
+            "validated_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    # ── persistence ──────────────────────────────────────────────────────────
+
+    def save(self) -> None:
+        """Append new journal lines, then atomically rewrite the header."""
+        if self.state_path is None:
+            self._pending.clear()
+            return
+        journal_path = self.journal_path
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        compact = self._journal_lines + len(self._pending) > 2 * len(self._rows) + _COMPACTION_SLACK
+        if self._rewrite_journal or compact:
+            lines = [
+                [pid, *self._rows[pid], self._pooled_probs.get(pid)]
+                for _, pid in self._order
+            ]
+            data = self._encode(lines)
+            tmp_path = journal_path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, journal_path)
+            self._journal_bytes, self._journal_lines = len(data), len(lines)
+        elif self._pending:
+            data = self._encode(self._pending)
+            with open(journal_path, "ab") as journal:
+                # Drop any tail an interrupted save wrote past the committed length.
+                journal.truncate(self._journal_bytes)
+                journal.write(data)
+                journal.flush()
+                os.fsync(journal.fileno())
+            self._journal_bytes += len(data)
+            self._journal_lines += len(self._pending)
+        self._pending.clear()
+        self._rewrite_journal = False
+
+        payload = {
+            "version": STATE_VERSION,
+            "n_splits": self.n_splits,
+            "settled_high_water_mark": self.settled_high_water_mark,
+            "prediction_high_water_mark": self.prediction_high_water_mark,
+            "journal_bytes": self._journal_bytes,
+            "journal_lines": self._journal_lines,
+            "totals": {
+                **self._totals,
+                "bin_counts": self._bin_counts.tolist(),
+                "bin_prob_sums": self._bin_prob_sums.tolist(),
+                "bin_outcome_sums": self._bin_outcome_sums.tolist(),
+            },
+        }
+        tmp_path = self.state_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")))
+        os.replace(tmp_path, self.state_path)
+
+    @staticmethod
+    def _encode(lines: List[list]) -> bytes:
+        return "".join(json.dumps(line, separators=(",", ":")) + "\n" for line in lines).encode("utf-8")
+
+    def load(self) -> None:
+        """Restore state written by save(); a missing or stale file starts empty."""
+        if self.state_path is None or not self.state_path.exists():
+            return
+        try:
+            payload = json.loads(self.state_path.read_text())
+            if payload.get("version") != STATE_VERSION or payload.get("n_splits") != self.n_splits:
+                return
+            journal_bytes = int(payload.get("journal_bytes") or 0)
+            data = self.journal_path.read_bytes()[:journal_bytes] if journal_bytes else b""
+            if len(data) != journal_bytes:
+                raise ValueError("journal shorter than its header")
+            lines = [json.loads(line) for line in data.splitlines()]
+        except (OSError, ValueError) as exc:
+            logger.warning("walk_forward state unreadable (%s) — rebuilding from scratch", exc)
+            self.reset()
+            return
+
+        for line in lines:
+            if len(line) == 1:
+                self._rows.pop(line[0], None)
+                self._pooled_probs.pop(line[0], None)
+                continue
+            pid, match_id, date, outcome, rps, brier, correct, valid, probs = line
+            self._rows[pid] = [match_id, date, outcome, rps, brier, correct, valid]
+            self._pooled_probs.pop(pid, None)
+            if probs is not None:
+                self._pooled_probs[pid] = probs
+        self._order = sorted((row[1], pid) for pid, row in self._rows.items())
+        self._by_match = {row[0]: pid for pid, row in self._rows.items()}
+        self._journal_bytes, self._journal_lines = journal_bytes, len(lines)
+
+        totals = payload.get("totals") or {}
+        shape = (N_CLASSES, CALIBRATION_BINS)
+        try:
+            self._bin_counts = np.asarray(totals["bin_counts"], dtype=float).reshape(shape)
+            self._bin_prob_sums = np.asarray(totals["bin_prob_sums"], dtype=float).reshape(shape)
+            self._bin_outcome_sums = np.asarray(totals["bin_outcome_sums"], dtype=float).reshape(shape)
+            self._totals = {key: float(totals[key]) for key in ("valid", "rps", "brier", "correct")}
+        except (KeyError, TypeError, ValueError):
+            self._rebuild_totals()
+
+        self.settled_high_water_mark = normalise_settled_high_water_mark(
+            payload.get("settled_high_water_mark")
+        )
+        self.prediction_high_water_mark = int(payload.get("prediction_high_water_mark") or 0)
+        self._arrays = None
+
+    def reset(self) -> None:
+        self._order.clear()
+        self._rows.clear()
+        self._by_match.clear()
+        self._pooled_probs.clear()
+        self._clear_totals()
+        self._pending.clear()
+        self._rewrite_journal = True
+        self.settled_high_water_mark = None
+        self.prediction_high_water_mark = 0
+        self._arrays = None
@@ -0,0 +1,280 @@
+"""Per-league TreeSHAP explanations with a per-match cache.
+
+``EnsembleModel.explain_predictions`` used to build a fresh ``ModelExplainer``
+(and SHAP explainer, with the request row as its background) on every call,
+then rank a global importance dict from that single row. This service instead
+holds one ``shap.TreeExplainer`` per league artifact, built once when the
+artifact is registered (at load), using the tree-path-dependent algorithm so
+no background sample is needed.
+
+``explain_batch`` explains many fixtures in one SHAP call, after looking up each
+row in an LRU cache keyed on (league, model version, feature-vector hash);
+only the misses reach SHAP. Global importance is read from the artifact
+(``shap_global_importance``, computed offline by ``global_shap_importance``
+at training time) rather than recomputed per request.
+
+The explanation payload keeps ``ModelExplainer.explain_prediction``'s shape,
+so callers that read ``feature_contributions`` / ``waterfall_data`` are
+unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OUTCOME_CLASSES = ("home_win", "draw", "away_win")
+# Same preference order explain_predictions has always used.
+TREE_MODEL_KEYS = ("rf", "random_forest", "xgb", "xgboost", "lgbm", "lightgbm")
+DEFAULT_CACHE_SIZE = 4096
+TOP_CONTRIBUTIONS = 5
+GLOBAL_IMPORTANCE_ROWS = 1_000
+
+
+def _tree_explainer(model: Any) -> Any:
+    try:
+        import shap
+    except ImportError:
+        return None
+    try:
+        return shap.TreeExplainer(model)
+    except Exception as exc:
+        logger.warning("TreeExplainer unavailable for %s: %s", type(model).__name__, exc)
+        return None
+
+
+def _shap_array(explainer: Any, X: np.ndarray) -> np.ndarray:
+    """SHAP values as (rows, features, outputs) whatever the SHAP version returns."""
+
+    values = explainer.shap_values(X, check_additivity=False)
+    if isinstance(values, list):
+        return np.stack([np.asarray(v, dtype=float) for v in values], axis=-1)
+    values = np.asarray(values, dtype=float)
+    return values[..., None] if values.ndim == 2 else values
+
+
+def _expected_values(explainer: Any) -> np.ndarray:
+    return np.atleast_1d(np.asarray(explainer.expected_value, dtype=float))
+
+
+def _sorted_importance(feature_names: Sequence[str], importance: np.ndarray) -> Dict[str, float]:
+    order = np.argsort(-importance, kind="stable")
+    return {feature_names[i]: float(importance[i]) for i in order}
+
+
+def global_shap_importance(
+    model: Any,
+    X: pd.DataFrame,
+    feature_names: Sequence[str],
+    max_rows: int = GLOBAL_IMPORTANCE_ROWS,
+    seed: int = 42,
+) -> Dict[str, float]:
+    """Mean |SHAP| per feature over (a sample of) ``X``, averaged across outputs.
+
+    Run offline at training time; the result is stored in the artifact.
+    Returns {} when SHAP or a tree explainer is unavailable.
+    """
+
+    explainer = _tree_explainer(model)
+    if explainer is None or X.empty:
+        return {}
+    sample = X.sample(min(max_rows, len(X)), random_state=seed) if len(X) > max_rows else X
+    values = _shap_array(explainer, sample.to_numpy(dtype=float))
+    return _sorted_importance(list(feature_names), np.abs(values).mean(axis=(0, 2)))
+
+
+@dataclass
+class _LeagueExplainer:
+    model: Any
+    explainer: Any
+    feature_names: List[str]
+    model_version: str
+    expected_values: np.ndarray
+    global_importance: Dict[str, float]
+
+
+class ExplanationService:
+    """One TreeExplainer per league plus an LRU cache of per-match explanations."""
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self.cache_size = cache_size
+        self._leagues: Dict[str, _LeagueExplainer] = {}
+        # Models SHAP rejected, held so their ids stay unique; never retried.
+        self._unsupported: Dict[int, Any] = {}
+        self._cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def register(
+        self,
+        league: str,
+        model: Any,
+        feature_names: Sequence[str],
+        *,
+        model_version: str,
+        global_importance: Optional[Dict[str, float]] = None,
+    ) -> bool:
+        """Build the league's TreeExplainer; False when SHAP cannot explain ``model``."""
+
+        current = self._leagues.get(league)
+        if current is not None and current.model is model and current.model_version == model_version:
+            return True
+        if id(model) in self._unsupported:
+            return False
+        explainer = _tree_explainer(model)
+        if explainer is None:
+            self._unsupported[id(model)] = model
+            return False
+        self._leagues[league] = _LeagueExplainer(
+            model=model,
+            explainer=explainer,
+            feature_names=list(feature_names),
+            model_version=str(model_version),
+            expected_values=_expected_values(explainer),
+            global_importance=dict(global_importance or {}),
+        )
+        logger.info("TreeExplainer ready for %s (model %s)", league, model_version)
+        return True
+
+    def register_ensemble(self, league: str, ensemble: Any) -> bool:
+        """Register the ensemble's preferred tree base model for ``league``."""
+
+        models = getattr(ensemble, "models", None) or {}
+        model = next((models[key] for key in TREE_MODEL_KEYS if models.get(key) is not None), None)
+        if model is None and models:
+            model = next(iter(models.values()))
+        if model is None:
+            return False
+        metadata = getattr(ensemble, "model_metadata", None) or {}
+        version = (
+            metadata.get("model_version")
+            or metadata.get("dataset_signature")
+            or metadata.get("trained_at")
+            or f"ensemble-{id(ensemble):x}"
+        )
+        return self.register(
+            league,
+            model,
+            getattr(ensemble, "feature_columns", None) or [],
+            model_version=str(version),
+            global_importance=getattr(ensemble, "shap_global_importance", None),
+        )
+
+    def is_registered(self, league: str) -> bool:
+        return league in self._leagues
+
+    def explain(self, league: str, features: pd.DataFrame) -> Dict[str, Any]:
+        """Explanation of the first row of ``features`` ({} when unavailable)."""
+
+        explanations = self.explain_batch(league, features.iloc[:1])
+        return explanations[0] if explanations else {}
+
+    def explain_batch(self, league: str, features: pd.DataFrame) -> List[Dict[str, Any]]:
+        """One explanation per row; cached rows skip SHAP entirely."""
+
+        bundle = self._leagues.get(league)
+        if bundle is None or features.empty:
+            return []
+        names = bundle.feature_names or [str(column) for column in features.columns]
+        frame = features.reindex(columns=names) if bundle.feature_names else features
+        X = np.ascontiguousarray(frame.to_numpy(dtype=float))
+
+        keys = [
+            (league, bundle.model_version, hashlib.blake2b(row.tobytes(), digest_size=16).hexdigest())
+            for row in X
+        ]
+        results: List[Optional[Dict[str, Any]]] = []
+        with self._lock:
+            for key in keys:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                results.append(cached)
+        missing = [i for i, result in enumerate(results) if result is None]
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            values = _shap_array(bundle.explainer, X[missing])
+            computed = [self._payload(bundle, names, X[i], values[j]) for j, i in enumerate(missing)]
+            with self._lock:
+                for i, payload in zip(missing, computed):
+                    results[i] = payload
+                    self._cache[keys[i]] = payload
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return results  # type: ignore[return-value]
+
+    @staticmethod
+    def _payload(
+        bundle: _LeagueExplainer,
+        names: List[str],
+        row: np.ndarray,
+        values: np.ndarray,
+    ) -> Dict[str, Any]:
+        """ModelExplainer.explain_prediction's layout for one row of (features, outputs)."""
+
+        outputs = values.shape[1]
+        labels = OUTCOME_CLASSES if outputs == len(OUTCOME_CLASSES) else ("prediction",)
+        primary = values[:, 0]
+        top = np.argsort(-np.abs(primary), kind="stable")[:TOP_CONTRIBUTIONS]
+        importance = bundle.global_importance or _sorted_importance(names, np.abs(values).mean(axis=1))
+        return {
+            "shap_values": {label: values[:, k].tolist() for k, label in enumerate(labels)},
+            "feature_importance": importance,
+            "waterfall_data": {
+                "base_value": float(bundle.expected_values[0]),
+                "contributions": [
+                    {"feature": name, "value": float(value), "shap_value": float(shap_value)}
+                    for name, value, shap_value in zip(names, row, primary)
+                ],
+            },
+            "feature_contributions": [
+                {
+                    "feature": names[i],
+                    "contribution": float(primary[i]),
+                    "feature_value": float(row[i]),
+                }
+                for i in top
+            ],
+            "model_version": bundle.model_version,
+        }
+
+    def cache_info(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._cache), "leagues": len(self._leagues)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+        self._leagues.clear()
+        self._unsupported.clear()
+        self.hits = self.misses = 0
+
+
+_service: Optional[ExplanationService] = None
+
+
+def get_explanation_service() -> ExplanationService:
+    """Process-wide service shared by the prediction path and the API."""
+
+    global _service
+    if _service is None:
+        _service = ExplanationService()
+    return _service
+
+
+__all__ = [
+    "ExplanationService",
+    "get_explanation_service",
+    "global_shap_importance",
+]
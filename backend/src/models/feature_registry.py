@@ -1,7 +1,8 @@
 """Canonical feature registry for inference-safe SabiScore models."""
 
+import hashlib
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 # Canonical production feature schema (58) from sabiscore_production_v2 metadata.
 CANONICAL_FEATURES_58: List[str] = [
@@ -369,6 +370,17 @@ def active_default_feature_values(
     return dict(DEFAULT_FEATURE_VALUES_68 if use_phase7 else DEFAULT_FEATURE_VALUES_58)
 
 
+# Bump when a feature's derivation changes without its name changing, so
+# vectors persisted by the feature store under the old schema are not served.
+FEATURE_SCHEMA_REVISION = 1
+
+
+def feature_schema_hash(feature_names: Sequence[str]) -> str:
+    """Short stable hash of an ordered feature schema (plus FEATURE_SCHEMA_REVISION)."""
+    text = f"{FEATURE_SCHEMA_REVISION}|" + ",".join(feature_names)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
 def canonical_feature_count() -> int:
     return len(CANONICAL_FEATURES_58)
 
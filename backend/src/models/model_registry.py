@@ -6,7 +6,6 @@ Manages model versioning, tracking, and deployment lifecycle
 import joblib
 import json
 import logging
-import math
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
@@ -227,7 +226,9 @@ class ModelRegistry:
             metric: Primary metric for ranking
             
         Returns:
-            DataFrame with comparison results
+            DataFrame with comparison results. Models with stored bootstrap
+            intervals (see ``record_confidence_intervals``) also carry
+            ``<metric>_ci_lower`` / ``<metric>_ci_upper`` columns.
         """
         comparison = []
         
@@ -237,12 +238,17 @@ class ModelRegistry:
                 continue
             
             model_info = self.metadata['models'][model_id]
+            intervals = {}
+            for name, ci in model_info.get('confidence_intervals', {}).items():
+                intervals[f'{name}_ci_lower'] = ci['lower']
+                intervals[f'{name}_ci_upper'] = ci['upper']
             comparison.append({
                 'model_id': model_id,
                 'model_name': model_info['model_name'],
                 'version': model_info['model_version'],
                 'status': model_info['status'],
                 **model_info['metrics'],
+                **intervals,
                 'registered_at': model_info['registered_at']
             })
         
@@ -254,6 +260,41 @@ class ModelRegistry:
         
         return df
     
+    def record_confidence_intervals(
+        self,
+        model_id: str,
+        records: List[Dict[str, Any]],
+        clv: Optional[List[float]] = None,
+        **bootstrap_kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Bootstrap metric intervals for a model and store them in its metadata
+
+        Args:
+            model_id: Registered model to annotate
+            records: Settled predictions from this model, shaped for
+                ``walk_forward_validate()`` (optionally with decimal ``odds``)
+            clv: Optional per-record CLV series (``clv_service.clv_values``)
+            **bootstrap_kwargs: Forwarded to ``bootstrap_metric_intervals``
+                (n_resamples, alpha, block_length, seed, n_jobs)
+
+        Returns:
+            The bootstrap result; only a non-skipped result is stored
+        """
+        from .evaluation.bootstrap import bootstrap_metric_intervals
+
+        if model_id not in self.metadata['models']:
+            raise ValueError(f"Model {model_id} not found")
+
+        result = bootstrap_metric_intervals(records, clv=clv, **bootstrap_kwargs)
+        if result.get('skipped'):
+            logger.warning(f"Bootstrap skipped for {model_id}: {result['reason']}")
+            return result
+
+        self.metadata['models'][model_id]['confidence_intervals'] = result['metrics']
+        self._save_metadata()
+        return result
+
     def list_models(
         self, 
         status: Optional[str] = None
@@ -329,9 +370,10 @@ class ModelRegistry:
             ``n_splits * 2`` records are available.
         """
         try:
-            from .evaluation.metrics import brier_score_decomposition, ranked_probability_score
+            from .evaluation.metrics import brier_score_decomposition
+            from .evaluation.walk_forward import score_walk_forward_records
         except ImportError:
-            logger.warning("ranked_probability_score not available; walk-forward skipped")
+            logger.warning("evaluation metrics not available; walk-forward skipped")
             return {"skipped": True, "reason": "metrics module unavailable"}
 
         if not records:
@@ -352,6 +394,9 @@ class ModelRegistry:
         pooled_outcomes: List[int] = []
         pooled_probs: List[List[float]] = []
 
+        # One validation + scoring pass over every record; folds below are slices.
+        scored = score_walk_forward_records(sorted_records)
+
         for fold in range(n_splits):
             train_end = (fold + 1) * fold_size
             test_start = train_end
@@ -361,61 +406,34 @@ class ModelRegistry:
             if not test_records:
                 continue
 
-            rps_scores = []
-            brier_scores = []
-            correct = 0
-            for rec in test_records:
-                outcome = rec.get("outcome")
-                probs = rec.get("probs", [])
-                if outcome is None or len(probs) != 3:
-                    continue
-                try:
-                    outcome_index = int(outcome)
-                    probabilities = [float(probability) for probability in probs]
-                except (TypeError, ValueError):
-                    continue
-
-                if outcome_index not in (0, 1, 2):
-                    continue
-                if any(not math.isfinite(probability) for probability in probabilities):
-                    continue
-                if any(probability < 0.0 or probability > 1.0 for probability in probabilities):
-                    continue
-                if not math.isclose(sum(probabilities), 1.0, rel_tol=0.0, abs_tol=1e-6):
-                    continue
-
-                rps_scores.append(ranked_probability_score(outcome_index, probabilities))
-                # Multi-category Brier score (Brier 1950): sum of squared errors
-                # against the one-hot outcome vector. Distinct from RPS (which
-                # credits distance along the ordered outcome axis) — this is the
-                # metric brier_score_decomposition() below breaks into
-                # reliability/resolution/uncertainty.
-                one_hot = [1.0 if outcome_index == i else 0.0 for i in range(3)]
-                brier_scores.append(
-                    sum((p - t) ** 2 for p, t in zip(probabilities, one_hot))
-                )
-                pooled_outcomes.append(outcome_index)
-                pooled_probs.append(probabilities)
-                # Top-class hit rate, scored over the same validated records as RPS so the
-                # two metrics can never describe different populations. RPS stays the
-                # primary scoring rule (it credits distance, not just the argmax); accuracy
-                # is carried because it is the number a reader understands without a
-                # glossary. Ties resolve to the first max — deterministic, and only
-                # reachable on an exactly-uniform vector, which a real model does not emit.
-                if probabilities.index(max(probabilities)) == outcome_index:
-                    correct += 1
-
-            if not rps_scores:
+            valid = scored["valid"][test_start:test_end]
+            if not valid.any():
                 continue
+            rps_scores = scored["rps"][test_start:test_end][valid]
+            # Multi-category Brier score (Brier 1950): sum of squared errors
+            # against the one-hot outcome vector. Distinct from RPS (which
+            # credits distance along the ordered outcome axis) — this is the
+            # metric brier_score_decomposition() below breaks into
+            # reliability/resolution/uncertainty.
+            brier_scores = scored["brier"][test_start:test_end][valid]
+            # Top-class hit rate, scored over the same validated records as RPS so the
+            # two metrics can never describe different populations. RPS stays the
+            # primary scoring rule (it credits distance, not just the argmax); accuracy
+            # is carried because it is the number a reader understands without a
+            # glossary. Ties resolve to the first max — deterministic, and only
+            # reachable on an exactly-uniform vector, which a real model does not emit.
+            correct = int(scored["correct"][test_start:test_end].sum())
+            pooled_outcomes.extend(scored["outcome"][test_start:test_end][valid].tolist())
+            pooled_probs.extend(scored["probs"][test_start:test_end][valid].tolist())
 
             fold_results.append({
                 "fold": fold,
                 "train_end_idx": train_end,
                 "test_size": len(rps_scores),
-                "rps_mean": sum(rps_scores) / len(rps_scores),
-                "rps_min": min(rps_scores),
-                "rps_max": max(rps_scores),
-                "brier_mean": sum(brier_scores) / len(brier_scores),
+                "rps_mean": float(rps_scores.mean()),
+                "rps_min": float(rps_scores.min()),
+                "rps_max": float(rps_scores.max()),
+                "brier_mean": float(brier_scores.mean()),
                 "accuracy": correct / len(rps_scores),
                 "date_range": {
                     "from": test_records[0].get("date"),
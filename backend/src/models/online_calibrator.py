@@ -0,0 +1,382 @@
+"""Per-league online calibration from running sufficient statistics.
+
+The legacy calibration jobs (Celery ``calibrate_models`` and
+``PlattCalibrator.calibrate_loop``) re-read every settled prediction of the
+last 24 h every 3 minutes and refit sklearn from scratch. This module keeps,
+per league, only what those refits need and folds in each newly settled
+result once:
+
+- a logistic (Platt) state on the log-odds of the top pick's probability,
+  ``P(correct) = sigmoid(a * logit(p) + b)``, updated by Newton/IRLS steps
+  against the accumulated curvature (precision matrix) of everything seen so
+  far — one batch costs a few 2x2 solves, not a refit;
+- binned reliability counts (predicted-probability sum, hit count, weight
+  per bin) and a prequential Brier sum, for ECE / Brier reporting.
+
+Older evidence decays with ``online_calibration_halflife_days`` instead of a
+hard 24 h window. The whole engine (all leagues plus the settlement
+high-water marks) is a few hundred bytes of JSON, persisted in the cache
+tiers (Redis first) under ``calibration:online``; each league is also
+mirrored to the legacy ``calibration:{league}`` payload.
+
+Fed from services/settlement_service.py on every settlement pass, so
+parameters move within one pass of a result landing; the Celery task is a
+catch-up from the same high-water marks. Both read, update and rewrite the
+same blob, so each load-ingest-save runs under ``online_state_lock``: a
+process-local lock plus, when tier-1 Redis is up, a Redis lock shared by the
+API and worker processes.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from redis.exceptions import RedisError
+
+from ..core.config import settings
+from .evaluation.walk_forward import normalise_settled_high_water_mark
+
+logger = logging.getLogger(__name__)
+
+ONLINE_STATE_KEY = "calibration:online"
+ONLINE_STATE_LOCK_KEY = f"lock:{ONLINE_STATE_KEY}"
+_STATE_TTL_SECONDS = 90 * 86400
+_LEGACY_TTL_SECONDS = 86400
+# A holder that dies keeps the Redis lock at most this long.
+_LOCK_TIMEOUT_SECONDS = 120
+_LOCK_WAIT_SECONDS = 30
+_process_lock = threading.Lock()
+
+_EPS = 1e-6
+# Prior precision around the identity map (a=1, b=0): worth a handful of
+# results, so the first few settlements cannot swing the parameters.
+_PRIOR_PRECISION = 10.0
+_NEWTON_STEPS = 8
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@contextmanager
+def online_state_lock(cache: Any = None) -> Iterator[None]:
+    """Serialize read-modify-write of ``calibration:online``.
+
+    The process-local lock covers concurrent passes in one process; the Redis
+    lock (tier-1 client only) covers the API's settlement pass against the
+    Celery task. Without Redis the blob lives in per-process tiers, so the
+    local lock is all there is to hold. Raises TimeoutError when another
+    holder keeps the Redis lock past ``_LOCK_WAIT_SECONDS``.
+    """
+    if cache is None:
+        from ..core.cache import cache_manager as cache
+
+    if not _process_lock.acquire(timeout=_LOCK_WAIT_SECONDS):
+        raise TimeoutError("online calibration state is locked in this process")
+    try:
+        client = getattr(cache, "redis_client", None)
+        lock = None
+        if client is not None:
+            lock = client.lock(
+                ONLINE_STATE_LOCK_KEY,
+                timeout=_LOCK_TIMEOUT_SECONDS,
+                blocking_timeout=_LOCK_WAIT_SECONDS,
+            )
+            try:
+                acquired = lock.acquire()
+            except RedisError as exc:
+                logger.warning("Online calibration lock unavailable, holding the local lock only: %s", exc)
+                lock = None
+            else:
+                if not acquired:
+                    raise TimeoutError(f"{ONLINE_STATE_LOCK_KEY} is held by another pass")
+        try:
+            yield
+        finally:
+            if lock is not None:
+                try:
+                    lock.release()
+                except RedisError as exc:
+                    logger.warning("Online calibration lock expired before release: %s", exc)
+    finally:
+        _process_lock.release()
+
+
+def _logit(p: np.ndarray) -> np.ndarray:
+    p = np.clip(np.asarray(p, dtype=float), _EPS, 1.0 - _EPS)
+    return np.log(p / (1.0 - p))
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-z))
+
+
+@dataclass
+class OnlineLeagueCalibration:
+    """Sufficient statistics for one league; JSON-round-trippable."""
+
+    n_bins: int = 10
+    theta: List[float] = field(default_factory=lambda: [1.0, 0.0])
+    precision: List[List[float]] = field(
+        default_factory=lambda: [[_PRIOR_PRECISION, 0.0], [0.0, _PRIOR_PRECISION]]
+    )
+    bin_weight: List[float] = field(default_factory=list)
+    bin_pred_sum: List[float] = field(default_factory=list)
+    bin_hit_sum: List[float] = field(default_factory=list)
+    brier_sum: float = 0.0
+    samples_seen: int = 0
+    updated_at: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        for name in ("bin_weight", "bin_pred_sum", "bin_hit_sum"):
+            if len(getattr(self, name)) != self.n_bins:
+                setattr(self, name, [0.0] * self.n_bins)
+
+    @property
+    def a(self) -> float:
+        return self.theta[0]
+
+    @property
+    def b(self) -> float:
+        return self.theta[1]
+
+    @property
+    def effective_samples(self) -> float:
+        return float(sum(self.bin_weight))
+
+    def calibrate(self, p: Any) -> np.ndarray:
+        """Calibrated probability that the top pick with confidence ``p`` wins."""
+        return _sigmoid(self.a * _logit(p) + self.b)
+
+    def decay(self, factor: float) -> None:
+        """Down-weight everything seen so far; the prior is never forgotten."""
+        if factor >= 1.0:
+            return
+        prior = np.eye(2) * _PRIOR_PRECISION
+        self.precision = (prior + factor * (np.asarray(self.precision) - prior)).tolist()
+        self.bin_weight = [w * factor for w in self.bin_weight]
+        self.bin_pred_sum = [s * factor for s in self.bin_pred_sum]
+        self.bin_hit_sum = [s * factor for s in self.bin_hit_sum]
+        self.brier_sum *= factor
+
+    def update(self, confidence: np.ndarray, correct: np.ndarray) -> None:
+        """Fold one batch of settled (top-pick confidence, hit) pairs in."""
+        confidence = np.clip(np.asarray(confidence, dtype=float), 0.0, 1.0)
+        correct = np.asarray(correct, dtype=float)
+        if confidence.size == 0:
+            return
+
+        # Prequential Brier: score each result with the parameters it was
+        # predicted under, before it moves them.
+        self.brier_sum += float(np.sum((self.calibrate(confidence) - correct) ** 2))
+
+        bins = np.minimum((confidence * self.n_bins).astype(int), self.n_bins - 1)
+        self.bin_weight = (np.asarray(self.bin_weight) + np.bincount(bins, minlength=self.n_bins)).tolist()
+        self.bin_pred_sum = (
+            np.asarray(self.bin_pred_sum) + np.bincount(bins, weights=confidence, minlength=self.n_bins)
+        ).tolist()
+        self.bin_hit_sum = (
+            np.asarray(self.bin_hit_sum) + np.bincount(bins, weights=correct, minlength=self.n_bins)
+        ).tolist()
+
+        # Newton/IRLS on: 1/2 (t - t0)' P (t - t0) + batch NLL(t), where the
+        # quadratic term is the curvature of all earlier evidence.
+        X = np.column_stack([_logit(confidence), np.ones_like(confidence)])
+        theta0 = np.asarray(self.theta, dtype=float)
+        P = np.asarray(self.precision, dtype=float)
+        theta = theta0.copy()
+        for _ in range(_NEWTON_STEPS):
+            mu = _sigmoid(X @ theta)
+            grad = P @ (theta - theta0) - X.T @ (correct - mu)
+            hessian = P + (X * (mu * (1.0 - mu))[:, None]).T @ X
+            step = np.linalg.solve(hessian, grad)
+            theta -= step
+            if np.max(np.abs(step)) < 1e-8:
+                break
+        mu = _sigmoid(X @ theta)
+        self.theta = theta.tolist()
+        self.precision = (P + (X * (mu * (1.0 - mu))[:, None]).T @ X).tolist()
+        self.samples_seen += int(confidence.size)
+
+    def reliability(self) -> Dict[str, Any]:
+        weight = np.asarray(self.bin_weight)
+        total = float(weight.sum())
+        occupied = weight > 0
+        pred = np.divide(self.bin_pred_sum, weight, out=np.zeros_like(weight), where=occupied)
+        hit = np.divide(self.bin_hit_sum, weight, out=np.zeros_like(weight), where=occupied)
+        ece = float(np.sum(weight * np.abs(hit - pred)) / total) if total > 0 else None
+        return {
+            "ece": ece,
+            "bins": [
+                {"mean_predicted": float(pred[i]), "observed": float(hit[i]), "weight": float(weight[i])}
+                for i in range(self.n_bins)
+                if occupied[i]
+            ],
+        }
+
+    def legacy_payload(self) -> Dict[str, Any]:
+        """The ``calibration:{league}`` shape the refit task used to write."""
+        total = self.effective_samples
+        return {
+            "platt_a": self.a,
+            "platt_b": self.b,
+            "brier_score": self.brier_sum / total if total > 0 else None,
+            "samples_used": self.samples_seen,
+            "calibrated_at": self.updated_at,
+            "accuracy": sum(self.bin_hit_sum) / total if total > 0 else None,
+            "avg_confidence": sum(self.bin_pred_sum) / total if total > 0 else None,
+            "scale": "log_odds",
+        }
+
+
+class OnlineCalibrationEngine:
+    """All leagues' online calibration state plus the settlement high-water marks."""
+
+    def __init__(
+        self,
+        leagues: Optional[Dict[str, OnlineLeagueCalibration]] = None,
+        *,
+        settled_high_water_mark: Optional[str] = None,
+        prediction_high_water_mark: int = 0,
+        halflife_days: Optional[float] = None,
+        cache: Any = None,
+        clock: Callable[[], datetime] = _now,
+    ):
+        self.leagues: Dict[str, OnlineLeagueCalibration] = dict(leagues or {})
+        self.settled_high_water_mark = settled_high_water_mark
+        self.prediction_high_water_mark = prediction_high_water_mark
+        self.halflife_days = (
+            settings.online_calibration_halflife_days if halflife_days is None else halflife_days
+        )
+        self._cache = cache
+        self.clock = clock
+
+    @property
+    def cache(self) -> Any:
+        if self._cache is None:
+            from ..core.cache import cache_manager
+
+            self._cache = cache_manager
+        return self._cache
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def load(cls, cache: Any = None, **kwargs: Any) -> "OnlineCalibrationEngine":
+        engine = cls(cache=cache, **kwargs)
+        try:
+            state = engine.cache.get(ONLINE_STATE_KEY)
+        except Exception as exc:
+            logger.warning("Online calibration state unreadable, starting fresh: %s", exc)
+            state = None
+        if isinstance(state, dict):
+            engine.leagues = {
+                league: OnlineLeagueCalibration(**payload)
+                for league, payload in (state.get("leagues") or {}).items()
+            }
+            engine.settled_high_water_mark = normalise_settled_high_water_mark(
+                state.get("settled_high_water_mark")
+            )
+            engine.prediction_high_water_mark = int(state.get("prediction_high_water_mark") or 0)
+        return engine
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "leagues": {league: asdict(state) for league, state in self.leagues.items()},
+            "settled_high_water_mark": self.settled_high_water_mark,
+            "prediction_high_water_mark": self.prediction_high_water_mark,
+        }
+
+    def save(self, leagues: Optional[Iterable[str]] = None) -> None:
+        """Persist the engine, and the legacy per-league payload for ``leagues``."""
+        self.cache.set(ONLINE_STATE_KEY, self.to_dict(), ttl=_STATE_TTL_SECONDS)
+        for league in leagues if leagues is not None else self.leagues:
+            state = self.leagues.get(league)
+            if state is not None:
+                self.cache.set(f"calibration:{league}", state.legacy_payload(), ttl=_LEGACY_TTL_SECONDS)
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def _is_new(self, record: Dict[str, Any]) -> bool:
+        settled_at = record.get("settled_at")
+        newer_settlement = bool(settled_at) and (
+            self.settled_high_water_mark is None or settled_at > self.settled_high_water_mark
+        )
+        return newer_settlement or int(record["prediction_id"]) > self.prediction_high_water_mark
+
+    def ingest(self, records: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """Fold settled-prediction records (``get_settled_predictions_since``
+        shape) into their leagues; returns new results per league."""
+        batches: Dict[str, Tuple[List[float], List[float]]] = {}
+        for record in records:
+            if not self._is_new(record):
+                continue
+            settled_at = record.get("settled_at")
+            if settled_at and (self.settled_high_water_mark is None or settled_at > self.settled_high_water_mark):
+                self.settled_high_water_mark = settled_at
+            self.prediction_high_water_mark = max(self.prediction_high_water_mark, int(record["prediction_id"]))
+
+            probs = record.get("probs") or []
+            league = str(record.get("league") or "").lower()
+            if not league or len(probs) != 3 or any(p is None for p in probs):
+                continue
+            top = int(np.argmax(probs))
+            confidence, correct = batches.setdefault(league, ([], []))
+            confidence.append(float(probs[top]))
+            correct.append(1.0 if top == int(record["outcome"]) else 0.0)
+
+        now = self.clock()
+        for league, (confidence, correct) in batches.items():
+            state = self.leagues.setdefault(league, OnlineLeagueCalibration())
+            if state.updated_at is not None:
+                elapsed_days = (now - datetime.fromisoformat(state.updated_at)).total_seconds() / 86400
+                state.decay(0.5 ** (max(elapsed_days, 0.0) / self.halflife_days))
+            state.update(np.asarray(confidence), np.asarray(correct))
+            state.updated_at = now.isoformat()
+        return {league: len(confidence) for league, (confidence, _) in batches.items()}
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def calibrate(self, league: str, confidence: Any) -> np.ndarray:
+        """Calibrated top-pick probability; identity for leagues with no state."""
+        state = self.leagues.get(league.lower())
+        if state is None:
+            return np.asarray(confidence, dtype=float)
+        return state.calibrate(confidence)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "settled_high_water_mark": self.settled_high_water_mark,
+            "leagues": {
+                league: {
+                    "platt_a": round(state.a, 4),
+                    "platt_b": round(state.b, 4),
+                    "samples_seen": state.samples_seen,
+                    "effective_samples": round(state.effective_samples, 2),
+                    "ece": state.reliability()["ece"],
+                    "updated_at": state.updated_at,
+                }
+                for league, state in self.leagues.items()
+            },
+        }
+
+
+def ingest_settled_predictions(records: List[Dict[str, Any]], cache: Any = None) -> Dict[str, Any]:
+    """Load the persisted engine, fold ``records`` in and save it back."""
+    with online_state_lock(cache):
+        engine = OnlineCalibrationEngine.load(cache=cache)
+        updated = engine.ingest(records)
+        if updated:
+            engine.save(leagues=updated)
+    return {"leagues_updated": updated, "settled_high_water_mark": engine.settled_high_water_mark}
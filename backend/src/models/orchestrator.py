@@ -7,8 +7,9 @@ Handles training, caching, live calibration, and edge detection
 import redis
 import json
 import os
+from pathlib import Path
 from typing import Dict, Optional
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 import pandas as pd
 import numpy as np
@@ -67,13 +68,35 @@ class ModelOrchestrator:
         """Normalize league name to internal key"""
         return self.LEAGUE_MAP.get(league.lower().replace(' ', '_'), 'epl')
     
-    def train_all_models(self, db: Session):
+    # League key -> name of the model's feature extractor
+    EXTRACTORS = {
+        'epl': 'extract_epl_features',
+        'laliga': 'extract_laliga_features',
+        'bundesliga': 'extract_bundesliga_features',
+        'seriea': 'extract_serie_a_features',
+        'ligue1': 'extract_ligue1_features',
+        'championship': 'extract_championship_features',
+        'eredivisie': 'extract_eredivisie_features',
+    }
+
+    TRAIN_START = datetime(2018, 1, 1)
+    TRAIN_END = datetime(2025, 11, 3)
+
+    def train_all_models(self, db: Session, feature_cache_dir: Optional[Path] = None):
         """
         Train all league models from historical data (2018-2025)
-        Expected runtime: 12-18 minutes per league
+
+        Features come from one history read per league
+        (training_features.build_league_training_frame), so runtime is
+        bounded by model fitting. Frames are cached as Parquet under
+        feature_cache_dir (default: <data_path>/training_features).
         """
-        from ..core.database import Match
-        
+        from ..core.config import settings
+        from .training_features import build_league_training_frame, training_records
+
+        if feature_cache_dir is None:
+            feature_cache_dir = Path(settings.data_path) / "training_features"
+
         print("🚀 Starting model training pipeline...")
         
         for league_key, model in self.models.items():
@@ -81,55 +104,30 @@ class ModelOrchestrator:
             print(f"Training {league_key.upper()} model")
             print(f"{'='*60}")
             
-            # Query historical matches
-            matches = db.query(Match).filter(
-                Match.league.ilike(f"%{league_key}%"),
-                Match.match_date >= datetime(2018, 1, 1),
-                Match.match_date <= datetime(2025, 11, 3),
-                Match.home_score.isnot(None),
-                Match.away_score.isnot(None)
-            ).all()
+            # Historical matches with their as-of features
+            frame = build_league_training_frame(
+                db, league_key, self.TRAIN_START, self.TRAIN_END, cache_dir=feature_cache_dir
+            )
             
-            print(f"Loaded {len(matches)} matches for training")
+            print(f"Loaded {len(frame)} matches for training")
             
-            if len(matches) < 500:
-                print(f"⚠️  Insufficient data ({len(matches)} matches). Need 500+ for training.")
+            if len(frame) < 500:
+                print(f"⚠️  Insufficient data ({len(frame)} matches). Need 500+ for training.")
                 continue
             
-            # Extract features and labels
+            # Extract features and labels (label: 0=home win, 1=draw, 2=away win)
+            extract = getattr(model, self.EXTRACTORS[league_key])
             X_train = []
             y_train = []
             
-            for match in matches:
+            for match_id, label, match_data in zip(frame['match_id'], frame['label'], training_records(frame)):
                 try:
-                    # Build feature dict from database
-                    match_data = self._build_match_features(match, db)
-                    
-                    # Get features using league-specific extractor
-                    if league_key == 'epl':
-                        features = model.extract_epl_features(match_data)
-                    elif league_key == 'laliga':
-                        features = model.extract_laliga_features(match_data)
-                    elif league_key == 'bundesliga':
-                        features = model.extract_bundesliga_features(match_data)
-                    elif league_key == 'seriea':
-                        features = model.extract_serie_a_features(match_data)
-                    elif league_key == 'ligue1':
-                        features = model.extract_ligue1_features(match_data)
-                    
-                    X_train.append(features.flatten())
-                    
-                    # Label: 0=home win, 1=draw, 2=away win
-                    if match.home_score > match.away_score:
-                        y_train.append(0)
-                    elif match.home_score == match.away_score:
-                        y_train.append(1)
-                    else:
-                        y_train.append(2)
-                        
+                    features = extract(match_data)
                 except Exception as e:
-                    print(f"Error processing match {match.id}: {e}")
+                    print(f"Error processing match {match_id}: {e}")
                     continue
+                X_train.append(features.flatten())
+                y_train.append(int(label))
             
             # Train model
             X_train_df = pd.DataFrame(X_train)
@@ -142,83 +140,13 @@ class ModelOrchestrator:
             metadata = {
                 'trained_at': datetime.now(timezone.utc).isoformat(),
                 'sample_count': len(X_train_df),
-                'date_range': f"2018-{datetime(2025, 11, 3).strftime('%Y-%m-%d')}",
+                'date_range': f"2018-{self.TRAIN_END.strftime('%Y-%m-%d')}",
                 'accuracy_target': self._get_accuracy_target(league_key)
             }
             self.redis.setex(f"model:{league_key}:metadata", 86400, json.dumps(metadata))
             
         print("\n✅ All models trained successfully!")
-        self._run_validation_suite(db)
-    
-    def _build_match_features(self, match, db: Session) -> Dict:
-        """
-        Build feature dictionary from database match record
-        Aggregates team stats from last 5 matches
-        """
-        from ..core.database import Match
-        from sqlalchemy import and_
-        
-        features = {}
-        
-        # Recent form (last 5 matches)
-        home_recent = db.query(Match).filter(
-            and_(
-                Match.home_team == match.home_team,
-                Match.match_date < match.match_date,
-                Match.match_date >= match.match_date - timedelta(days=60)
-            )
-        ).order_by(Match.match_date.desc()).limit(5).all()
-        
-        away_recent = db.query(Match).filter(
-            and_(
-                Match.away_team == match.away_team,
-                Match.match_date < match.match_date,
-                Match.match_date >= match.match_date - timedelta(days=60)
-            )
-        ).order_by(Match.match_date.desc()).limit(5).all()
-        
-        # Home team stats
-        features['home_goals_scored_l5'] = sum(m.home_score for m in home_recent if m.home_score)
-        features['home_goals_conceded_l5'] = sum(m.away_score for m in home_recent if m.away_score)
-        features['home_xg_l5'] = sum(m.home_xg for m in home_recent if m.home_xg) / max(len(home_recent), 1)
-        features['home_xga_l5'] = sum(m.away_xg for m in home_recent if m.away_xg) / max(len(home_recent), 1)
-        
-        # Away team stats
-        features['away_goals_scored_l5'] = sum(m.away_score for m in away_recent if m.away_score)
-        features['away_goals_conceded_l5'] = sum(m.home_score for m in away_recent if m.home_score)
-        features['away_xg_l5'] = sum(m.away_xg for m in away_recent if m.away_xg) / max(len(away_recent), 1)
-        features['away_xga_l5'] = sum(m.home_xg for m in away_recent if m.home_xg) / max(len(away_recent), 1)
-        
-        # Form indicators
-        home_form = [1 if m.home_score > m.away_score else 0.5 if m.home_score == m.away_score else 0 
-                     for m in home_recent if m.home_score is not None]
-        away_form = [1 if m.away_score > m.home_score else 0.5 if m.away_score == m.home_score else 0 
-                     for m in away_recent if m.away_score is not None]
-        
-        features['home_form_last_5'] = home_form
-        features['away_form_last_5'] = away_form
-        features['home_points_l5'] = sum([3 if x == 1 else 1 if x == 0.5 else 0 for x in home_form])
-        features['away_points_l5'] = sum([3 if x == 1 else 1 if x == 0.5 else 0 for x in away_form])
-        
-        # Clean sheets
-        features['home_clean_sheets_l5'] = sum(1 for m in home_recent if m.away_score == 0)
-        features['away_clean_sheets_l5'] = sum(1 for m in away_recent if m.home_score == 0)
-        
-        # H2H
-        h2h_matches = db.query(Match).filter(
-            and_(
-                Match.home_team.in_([match.home_team, match.away_team]),
-                Match.away_team.in_([match.home_team, match.away_team]),
-                Match.match_date < match.match_date,
-                Match.match_date >= match.match_date - timedelta(days=730)  # 2 years
-            )
-        ).order_by(Match.match_date.desc()).limit(5).all()
-        
-        h2h_home_wins = sum(1 for m in h2h_matches if m.home_team == match.home_team and m.home_score > m.away_score)
-        features['h2h_home_wins_l5'] = h2h_home_wins
-        features['h2h_goals_per_game'] = sum(m.home_score + m.away_score for m in h2h_matches if m.home_score) / max(len(h2h_matches), 1)
-        
-        return features
+        self._run_validation_suite(db, feature_cache_dir)
     
     def predict(self, league: str, match_data: Dict, odds: Optional[Dict] = None) -> Dict:
         """
@@ -350,12 +278,12 @@ class ModelOrchestrator:
         # ponytail: hardcoded strings removed (zero-fab); real accuracy from model_registry walk_forward_validate()
         return ""
     
-    def _run_validation_suite(self, db: Session):
+    def _run_validation_suite(self, db: Session, feature_cache_dir: Optional[Path] = None):
         """
         Validate trained models on holdout set (last 60 days)
         Calculates Brier score, accuracy, CLV
         """
-        from ..core.database import Match
+        from .training_features import build_league_training_frame, training_records
         from sklearn.metrics import accuracy_score, brier_score_loss
         
         print("\n" + "="*60)
@@ -363,36 +291,26 @@ class ModelOrchestrator:
         print("="*60)
         
         for league_key, model in self.models.items():
-            # Get recent matches (not in training set)
-            recent_matches = db.query(Match).filter(
-                Match.league.ilike(f"%{league_key}%"),
-                Match.match_date >= datetime(2025, 9, 1),
-                Match.match_date <= datetime(2025, 11, 3),
-                Match.home_score.isnot(None)
-            ).all()
+            # Recent matches (not in training set), as-of their kickoffs
+            recent = build_league_training_frame(
+                db, league_key, datetime(2025, 9, 1), self.TRAIN_END, cache_dir=feature_cache_dir
+            )
             
-            if len(recent_matches) < 20:
+            if len(recent) < 20:
                 continue
             
             y_true = []
             y_pred = []
             y_proba = []
             
-            for match in recent_matches:
+            for label, match_data in zip(recent['label'], training_records(recent)):
                 try:
-                    match_data = self._build_match_features(match, db)
                     pred = model.predict_proba(match_data)
                     
                     probs = [pred['home_win'], pred['draw'], pred['away_win']]
                     y_proba.append(probs)
                     y_pred.append(np.argmax(probs))
-                    
-                    if match.home_score > match.away_score:
-                        y_true.append(0)
-                    elif match.home_score == match.away_score:
-                        y_true.append(1)
-                    else:
-                        y_true.append(2)
+                    y_true.append(int(label))
                         
                 except Exception:
                     continue
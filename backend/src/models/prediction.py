@@ -42,9 +42,11 @@ from ..core.league_policy import LeaguePolicyUnavailableError, get_league_policy
 
 # ── Soft import: calibration module (requires scipy / sklearn) ─────────────────
 _apply_calibrator = None
+_ensure_compiled = None
 _CAL_AVAILABLE = False
 try:
     from .calibration import apply_calibrator as _apply_calibrator  # type: ignore
+    from .calibration import ensure_compiled as _ensure_compiled  # type: ignore
     _CAL_AVAILABLE = True
 except ImportError:
     pass
@@ -200,6 +202,21 @@ class PredictionEngine:
 
         return result
 
+    async def predict_batch(
+        self,
+        features_batch: List[np.ndarray],
+        league: str,
+    ) -> List[PredictionResult]:
+        """Score many fixtures of one league with a single model pass.
+
+        Results line up with ``features_batch`` and equal what ``predict``
+        returns per vector; the per-match prediction cache is not consulted.
+        """
+        if not features_batch:
+            return []
+        bundle = await self._load_model(league)
+        return await asyncio.to_thread(self._run_inference_batch, bundle, list(features_batch), league)
+
     # ── Model loading ──────────────────────────────────────────────────────────
 
     async def _load_model(self, league: str) -> Optional["_ArtifactBundle"]:
@@ -268,10 +285,18 @@ class PredictionEngine:
             if not any(callable(getattr(m, "predict_proba", None)) for m in models_dict.values()):
                 logger.warning("PredictionEngine: no callable predict_proba in 'models' dict at %s", path)
                 return None
+            calibrator = raw.get("calibrator")
+            if calibrator is not None and _ensure_compiled is not None:
+                # Artifacts pickled before CompiledCalibrator existed are
+                # compiled once here rather than on every prediction.
+                try:
+                    _ensure_compiled(calibrator)
+                except Exception as exc:
+                    logger.debug("PredictionEngine: calibrator at %s not compiled: %s", path, exc)
             return _ArtifactBundle(
                 direct_model=None,
                 models_dict=models_dict,
-                calibrator=raw.get("calibrator"),
+                calibrator=calibrator,
                 overlay=raw.get("bivariate_poisson_overlay"),
                 feature_columns=raw.get("feature_columns"),
             )
@@ -293,69 +318,108 @@ class PredictionEngine:
         features: np.ndarray,
         league: str,
     ) -> PredictionResult:
+        return self._run_inference_batch(bundle, [features], league)[0]
+
+    def _declared_dim(self, bundle: "_ArtifactBundle") -> Optional[int]:
+        """Feature width the artifact declares, or None to take the caller's."""
+        if bundle.models_dict is not None:
+            return self._expected_dim_from_bundle(bundle, None)
+        model = bundle.direct_model
+        expected_dim = getattr(model, "n_features_in_", None)
+        if expected_dim is None and hasattr(model, "estimators_"):
+            try:
+                expected_dim = model.estimators_[0].n_features_in_
+            except Exception:
+                pass
+        return expected_dim
+
+    def _run_inference_batch(
+        self,
+        bundle: Optional["_ArtifactBundle"],
+        features_batch: List[np.ndarray],
+        league: str,
+    ) -> List[PredictionResult]:
+        """Score many vectors for one league with one predict_proba per learner.
+
+        Each vector is aligned to the artifact's width exactly as a single
+        prediction would be; vectors sharing a width are stacked into one
+        matrix, and calibration and the draw overlay run on the whole matrix.
+        """
         _infer_t0 = time.perf_counter()
-        features = np.asarray(features, dtype=np.float32).ravel()
+        rows = [np.asarray(f, dtype=np.float32).ravel() for f in features_batch]
 
         if bundle is None:
-            return self._fallback_result(input_dim=len(features))
-
-        is_dict_artifact = bundle.models_dict is not None
+            return [self._fallback_result(input_dim=len(row)) for row in rows]
+
+        declared_dim = self._declared_dim(bundle)
+        results: List[Optional[PredictionResult]] = [None] * len(rows)
+        groups: Dict[int, List[int]] = {}
+
+        # ── Align feature vectors ──────────────────────────────────────────
+        for index, row in enumerate(rows):
+            expected_dim = declared_dim if declared_dim is not None else len(row)
+            actual_dim = len(row)
+            if actual_dim < expected_dim:
+                # A narrower vector than the model expects means real feature slots
+                # would be zero-filled — fabricating signal the model was trained to
+                # receive, not just carrying forward an older-but-valid subset (that's
+                # the truncation branch below, which stays as-is). Fail closed via the
+                # same _fallback_result() this function already uses for "no bundle" /
+                # "inference raised" — model_version="fallback" is the established,
+                # already-checked signal (full_analysis.py, upcoming_match_service.py)
+                # that a result is diagnostic-only, not a real prediction.
+                logger.error(
+                    "PredictionEngine: SCHEMA_MISMATCH — %d features supplied, %s model expects %d; "
+                    "refusing to zero-pad the missing %d values into a live prediction",
+                    actual_dim, league, expected_dim, expected_dim - actual_dim,
+                )
+                results[index] = self._fallback_result(input_dim=actual_dim)
+                continue
+            if actual_dim > expected_dim:
+                rows[index] = row[:expected_dim]
+                logger.warning(
+                    "PredictionEngine: truncated %d → %d for %s (retrain recommended)",
+                    actual_dim, expected_dim, league,
+                )
+            groups.setdefault(expected_dim, []).append(index)
+
+        for expected_dim, indices in groups.items():
+            X = np.stack([rows[i] for i in indices])
+            for i, result in zip(indices, self._score_matrix(bundle, X, expected_dim, league)):
+                results[i] = result
 
-        # ── Determine expected feature width ───────────────────────────────
-        if is_dict_artifact:
-            expected_dim = self._expected_dim_from_bundle(bundle, len(features))
-        else:
-            model = bundle.direct_model
-            expected_dim = getattr(model, "n_features_in_", None)
-            if expected_dim is None and hasattr(model, "estimators_"):
-                try:
-                    expected_dim = model.estimators_[0].n_features_in_
-                except Exception:
-                    pass
-            if expected_dim is None:
-                expected_dim = len(features)
-
-        # ── Align feature vector ───────────────────────────────────────────
-        actual_dim = len(features)
-        if actual_dim < expected_dim:
-            # A narrower vector than the model expects means real feature slots
-            # would be zero-filled — fabricating signal the model was trained to
-            # receive, not just carrying forward an older-but-valid subset (that's
-            # the truncation branch below, which stays as-is). Fail closed via the
-            # same _fallback_result() this function already uses for "no bundle" /
-            # "inference raised" — model_version="fallback" is the established,
-            # already-checked signal (full_analysis.py, upcoming_match_service.py)
-            # that a result is diagnostic-only, not a real prediction.
-            logger.error(
-                "PredictionEngine: SCHEMA_MISMATCH — %d features supplied, %s model expects %d; "
-                "refusing to zero-pad the missing %d values into a live prediction",
-                actual_dim, league, expected_dim, expected_dim - actual_dim,
-            )
-            return self._fallback_result(input_dim=actual_dim)
-        elif actual_dim > expected_dim:
-            features = features[:expected_dim]
-            logger.warning(
-                "PredictionEngine: truncated %d → %d for %s (retrain recommended)",
-                actual_dim, expected_dim, league,
-            )
+        logger.debug(
+            "PredictionEngine: batch of %d for %s total_ms=%.2f",
+            len(rows), league, (time.perf_counter() - _infer_t0) * 1000,
+        )
+        return results  # type: ignore[return-value]
 
-        X = features.reshape(1, -1)
+    def _score_matrix(
+        self,
+        bundle: "_ArtifactBundle",
+        X: np.ndarray,
+        expected_dim: int,
+        league: str,
+    ) -> List[PredictionResult]:
+        _infer_t0 = time.perf_counter()
+        is_dict_artifact = bundle.models_dict is not None
+        n_rows = X.shape[0]
 
         # ── Raw ensemble prediction ────────────────────────────────────────
         try:
             if is_dict_artifact:
                 proba = self._ensemble_predict_dict(bundle.models_dict, X)
             else:
-                raw = bundle.direct_model.predict_proba(X)[0]
-                if len(raw) == 2:
-                    proba = np.array([[float(raw[1]), 0.0, float(raw[0])]], dtype=np.float64)
-                elif len(raw) >= 3:
-                    proba = np.array([[float(raw[0]), float(raw[1]), float(raw[2])]], dtype=np.float64)
+                raw = np.asarray(bundle.direct_model.predict_proba(X), dtype=np.float64)
+                if raw.shape[1] == 2:
+                    proba = np.column_stack([raw[:, 1], np.zeros(n_rows), raw[:, 0]])
+                elif raw.shape[1] >= 3:
+                    proba = raw[:, :3].copy()
                 else:
-                    return self._fallback_result(input_dim=expected_dim)
+                    return [self._fallback_result(input_dim=expected_dim)] * n_rows
         except Exception as exc:
             logger.error("PredictionEngine: inference error for %s: %s", league, exc)
-            return self._fallback_result(input_dim=expected_dim)
+            return [self._fallback_result(input_dim=expected_dim)] * n_rows
 
         # Normalise
         row_sum = proba.sum(axis=1, keepdims=True)
@@ -378,7 +442,7 @@ class PredictionEngine:
                     fitted_cal = bundle.calibrator
                     calibrated = _apply_calibrator(
                         fitted_cal.method,
-                        fitted_cal.calibrators,
+                        getattr(fitted_cal, "compiled", None) or fitted_cal.calibrators,
                         proba,
                     )
                     row_sum = calibrated.sum(axis=1, keepdims=True)
@@ -430,29 +494,33 @@ class PredictionEngine:
                 except Exception as exc:
                     logger.warning("PredictionEngine: Bivariate Poisson overlay failed for %s: %s", league, exc)
 
-        h, d, a = float(proba[0, 0]), float(proba[0, 1]), float(proba[0, 2])
-        confidence = max(0.0, min(1.0, max(h, d, a) - 0.333))
         _total_ms = (time.perf_counter() - _infer_t0) * 1000
         logger.debug(
-            "PredictionEngine: inference complete league=%s version=%s "
+            "PredictionEngine: inference complete league=%s version=%s rows=%d "
             "calibration=%s overlay=%s total_ms=%.2f",
-            league, model_version, calibration_applied, overlay_applied, _total_ms,
+            league, model_version, n_rows, calibration_applied, overlay_applied, _total_ms,
         )
 
-        return PredictionResult(
-            home_win=round(h, 4),
-            draw=round(d, 4),
-            away_win=round(a, 4),
-            confidence=round(confidence, 4),
-            model_dim=expected_dim,
-            model_version=model_version,
-            calibration_method=calibration_method if calibration_applied else "raw",
-            calibration_applied=calibration_applied,
-            overlay_applied=overlay_applied,
-        )
+        results = []
+        for h, d, a in proba[:, :3].astype(float):
+            confidence = max(0.0, min(1.0, max(h, d, a) - 0.333))
+            results.append(
+                PredictionResult(
+                    home_win=round(h, 4),
+                    draw=round(d, 4),
+                    away_win=round(a, 4),
+                    confidence=round(confidence, 4),
+                    model_dim=expected_dim,
+                    model_version=model_version,
+                    calibration_method=calibration_method if calibration_applied else "raw",
+                    calibration_applied=calibration_applied,
+                    overlay_applied=overlay_applied,
+                )
+            )
+        return results
 
     @staticmethod
-    def _expected_dim_from_bundle(bundle: "_ArtifactBundle", fallback: int) -> int:
+    def _expected_dim_from_bundle(bundle: "_ArtifactBundle", fallback: Optional[int]) -> Optional[int]:
         """Infer expected feature count from a dict-artifact bundle."""
         if bundle.feature_columns:
             return len(bundle.feature_columns)
@@ -464,7 +532,7 @@ class PredictionEngine:
 
     @staticmethod
     def _ensemble_predict_dict(models_dict: Dict[str, Any], X: np.ndarray) -> np.ndarray:
-        """Equal-weight average of all base learner class probabilities. Returns (1, 3)."""
+        """Equal-weight average of all base learner class probabilities. Returns (n, 3)."""
         all_probs: List[np.ndarray] = []
         for m in models_dict.values():
             try:
@@ -474,7 +542,7 @@ class PredictionEngine:
             except Exception:
                 pass
         if not all_probs:
-            return np.array([[0.333, 0.333, 0.334]], dtype=np.float64)
+            return np.tile(np.array([0.333, 0.333, 0.334], dtype=np.float64), (X.shape[0], 1))
         return np.mean(all_probs, axis=0)
 
     @staticmethod
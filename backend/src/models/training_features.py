@@ -0,0 +1,298 @@
+"""As-of training features for ``ModelOrchestrator.train_all_models``.
+
+The league models were trained by calling ``_build_match_features`` once per
+historical match, and each call ran its own "last 5 home matches", "last 5
+away matches" and head-to-head queries; 3,000 matches meant 9,000+ round
+trips before any fitting started. Here a league's history is read once (one
+matches query, one match_stats query) and every match's pre-kickoff
+aggregates come from grouped shifts over that frame:
+
+- home form: the home side's previous ``FORM_WINDOW`` *home* matches within
+  ``FORM_LOOKBACK`` before kickoff;
+- away form: the away side's previous ``FORM_WINDOW`` *away* matches within
+  the same lookback;
+- head-to-head: the previous ``FORM_WINDOW`` meetings of the pair (either
+  venue) within ``H2H_LOOKBACK``.
+
+Only matches strictly before kickoff count, so every row is as-of its own
+kickoff. The resulting frame has one row per match with the feature keys the
+league extractors (``extract_epl_features`` etc.) read, plus the label.
+
+``build_league_training_frame`` optionally caches the frame as Parquet under
+``cache_dir``, keyed by a watermark of the league's match and stats rows
+(counts and latest timestamps): unchanged data is a cache hit, and a new
+result or late stats correction changes the key.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from ..core.database import League, Match, MatchStats
+
+logger = logging.getLogger(__name__)
+
+FORM_WINDOW = 5
+FORM_LOOKBACK = pd.Timedelta(days=60)
+H2H_LOOKBACK = pd.Timedelta(days=730)
+
+# Bump when the feature definitions below change so cached frames are rebuilt.
+_FEATURES_VERSION = 1
+
+_HISTORY_COLUMNS = [
+    "match_id", "match_date", "league_id", "home_team_id", "away_team_id",
+    "home_score", "away_score", "home_xg", "away_xg",
+]
+
+FEATURE_COLUMNS = [
+    "home_goals_scored_l5", "home_goals_conceded_l5", "home_xg_l5", "home_xga_l5",
+    "away_goals_scored_l5", "away_goals_conceded_l5", "away_xg_l5", "away_xga_l5",
+    "home_form_last_5", "away_form_last_5", "home_points_l5", "away_points_l5",
+    "home_clean_sheets_l5", "away_clean_sheets_l5",
+    "h2h_home_wins_l5", "h2h_goals_per_game",
+]
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+def _league_filter(league_key: str):
+    pattern = f"%{league_key}%"
+    return or_(Match.league_id.ilike(pattern), League.name.ilike(pattern))
+
+
+def load_league_history(
+    db: Session,
+    league_key: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """Every scored match of the league in [start, end] with per-side xG."""
+    query = (
+        select(
+            Match.id, Match.match_date, Match.league_id, Match.home_team_id,
+            Match.away_team_id, Match.home_score, Match.away_score,
+        )
+        .outerjoin(League, League.id == Match.league_id)
+        .where(
+            _league_filter(league_key),
+            Match.home_score.isnot(None),
+            Match.away_score.isnot(None),
+        )
+    )
+    if start is not None:
+        query = query.where(Match.match_date >= start)
+    if end is not None:
+        query = query.where(Match.match_date <= end)
+    history = pd.DataFrame(db.execute(query).all(), columns=_HISTORY_COLUMNS[:7])
+    if history.empty:
+        return pd.DataFrame(columns=_HISTORY_COLUMNS)
+
+    stats = pd.DataFrame(
+        db.execute(
+            select(MatchStats.match_id, MatchStats.team_id, MatchStats.expected_goals)
+            .where(MatchStats.match_id.in_(query.with_only_columns(Match.id).scalar_subquery()))
+        ).all(),
+        columns=["match_id", "team_id", "expected_goals"],
+    ).drop_duplicates(["match_id", "team_id"], keep="last")
+    for side in ("home", "away"):
+        history = history.merge(
+            stats.rename(columns={"team_id": f"{side}_team_id", "expected_goals": f"{side}_xg"}),
+            on=["match_id", f"{side}_team_id"],
+            how="left",
+        )
+    history["match_date"] = pd.to_datetime(history["match_date"])
+    return history[_HISTORY_COLUMNS]
+
+
+def history_watermark(db: Session, league_key: str) -> str:
+    """Cheap fingerprint of the league's match and stats rows."""
+    league_matches = (
+        select(Match.id)
+        .outerjoin(League, League.id == Match.league_id)
+        .where(_league_filter(league_key))
+    )
+    match_part = db.execute(
+        select(
+            func.count(Match.id),
+            func.max(Match.match_date),
+            func.max(Match.updated_at),
+            func.sum(Match.home_score),
+            func.sum(Match.away_score),
+        )
+        .outerjoin(League, League.id == Match.league_id)
+        .where(_league_filter(league_key))
+    ).one()
+    stats_part = db.execute(
+        select(func.count(MatchStats.id), func.max(MatchStats.created_at), func.sum(MatchStats.expected_goals))
+        .where(MatchStats.match_id.in_(league_matches.scalar_subquery()))
+    ).one()
+    parts = [_FEATURES_VERSION, league_key, *match_part, *stats_part]
+    return hashlib.sha256(json.dumps(parts, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+# ---------------------------------------------------------------------------
+# As-of aggregates
+# ---------------------------------------------------------------------------
+
+def _lags(frame: pd.DataFrame, key, columns: List[str], lookback: pd.Timedelta):
+    """(n, FORM_WINDOW) arrays of each column's previous values within ``key``
+    groups, newest first, plus the mask of lags inside [kickoff - lookback, kickoff).
+
+    ``*_team_id`` columns stay objects; everything else is float (NaN = missing).
+    """
+    ordered = frame.sort_values(["match_date", "match_id"], kind="mergesort")
+    groups = ordered.groupby(key, sort=False)
+    dates = ordered["match_date"]
+    valid = np.zeros((len(frame), FORM_WINDOW), dtype=bool)
+    lagged = {
+        column: np.empty((len(frame), FORM_WINDOW), dtype=object if column.endswith("_team_id") else float)
+        for column in columns
+    }
+    for k in range(1, FORM_WINDOW + 1):
+        previous = groups["match_date"].shift(k)
+        valid[:, k - 1] = (
+            previous.notna() & (previous < dates) & (previous >= dates - lookback)
+        ).to_numpy()
+        for column in columns:
+            shifted = groups[column].shift(k)
+            if lagged[column].dtype != object:
+                shifted = pd.to_numeric(shifted, errors="coerce")
+            lagged[column][:, k - 1] = shifted.to_numpy()
+    # Back to the caller's row order.
+    position = np.empty(len(frame), dtype=np.int64)
+    position[frame.index.get_indexer(ordered.index)] = np.arange(len(frame))
+    return {column: values[position] for column, values in lagged.items()}, valid[position]
+
+
+def _side_features(frame: pd.DataFrame, side: str) -> Dict[str, Any]:
+    other = "away" if side == "home" else "home"
+    lagged, valid = _lags(
+        frame, f"{side}_team_id", [f"{side}_score", f"{other}_score", f"{side}_xg", f"{other}_xg"], FORM_LOOKBACK,
+    )
+    scored = np.where(valid, lagged[f"{side}_score"], 0.0)
+    conceded = np.where(valid, lagged[f"{other}_score"], 0.0)
+    xg_for = np.nan_to_num(np.where(valid, lagged[f"{side}_xg"], 0.0))
+    xg_against = np.nan_to_num(np.where(valid, lagged[f"{other}_xg"], 0.0))
+    count = np.maximum(valid.sum(axis=1), 1)
+
+    result = np.where(scored > conceded, 1.0, np.where(scored == conceded, 0.5, 0.0))
+    points = np.where(result == 1.0, 3, np.where(result == 0.5, 1, 0)) * valid
+    return {
+        f"{side}_goals_scored_l5": scored.sum(axis=1),
+        f"{side}_goals_conceded_l5": conceded.sum(axis=1),
+        f"{side}_xg_l5": xg_for.sum(axis=1) / count,
+        f"{side}_xga_l5": xg_against.sum(axis=1) / count,
+        f"{side}_form_last_5": [row[mask].tolist() for row, mask in zip(result, valid)],
+        f"{side}_points_l5": points.sum(axis=1),
+        f"{side}_clean_sheets_l5": (valid & (conceded == 0)).sum(axis=1),
+    }
+
+
+def _h2h_features(frame: pd.DataFrame) -> Dict[str, Any]:
+    teams = frame[["home_team_id", "away_team_id"]].astype(str)
+    pair = np.where(
+        teams["home_team_id"] < teams["away_team_id"],
+        teams["home_team_id"] + "|" + teams["away_team_id"],
+        teams["away_team_id"] + "|" + teams["home_team_id"],
+    )
+    keyed = frame.assign(_pair=pair)
+    lagged, valid = _lags(keyed, "_pair", ["home_team_id", "home_score", "away_score"], H2H_LOOKBACK)
+    home_score = np.where(valid, lagged["home_score"], 0.0)
+    away_score = np.where(valid, lagged["away_score"], 0.0)
+    same_home = lagged["home_team_id"] == frame["home_team_id"].to_numpy()[:, None]
+    home_wins = (valid & same_home & (home_score > away_score)).sum(axis=1)
+    # Meetings with a goalless home side add nothing to the goal total but
+    # still count towards the denominator.
+    goals = np.where(valid & (home_score != 0), home_score + away_score, 0.0).sum(axis=1)
+    return {
+        "h2h_home_wins_l5": home_wins,
+        "h2h_goals_per_game": goals / np.maximum(valid.sum(axis=1), 1),
+    }
+
+
+def compute_asof_features(history: pd.DataFrame) -> pd.DataFrame:
+    """One row per match of ``history`` with its pre-kickoff aggregates and label."""
+    frame = history.reset_index(drop=True)
+    if frame.empty:
+        return pd.DataFrame(columns=[*_HISTORY_COLUMNS, *FEATURE_COLUMNS, "label"])
+    frame = frame.assign(match_date=pd.to_datetime(frame["match_date"]))
+    features = {**_side_features(frame, "home"), **_side_features(frame, "away"), **_h2h_features(frame)}
+    out = frame.assign(**{column: features[column] for column in FEATURE_COLUMNS})
+    home, away = out["home_score"].astype(float), out["away_score"].astype(float)
+    # 0=home win, 1=draw, 2=away win
+    out["label"] = np.where(home > away, 0, np.where(home == away, 1, 2))
+    return out
+
+
+def training_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """The extractor input dict of every row of a training frame."""
+    records = frame[FEATURE_COLUMNS].to_dict("records")
+    for record in records:
+        for column in ("home_form_last_5", "away_form_last_5"):
+            record[column] = list(record[column])
+    return records
+
+
+# ---------------------------------------------------------------------------
+# Cached build
+# ---------------------------------------------------------------------------
+
+def _write_parquet(path: Path, frame: pd.DataFrame) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("wb", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as handle:
+        temp_path = Path(handle.name)
+    try:
+        frame.to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def build_league_training_frame(
+    db: Session,
+    league_key: str,
+    start: datetime,
+    end: datetime,
+    cache_dir: Optional[Path] = None,
+) -> pd.DataFrame:
+    """Training frame for matches in [start, end], as-of each kickoff.
+
+    History is loaded from ``start - H2H_LOOKBACK`` so the first training
+    matches still see their prior meetings.
+    """
+    cache_path = None
+    if cache_dir is not None:
+        try:
+            watermark = history_watermark(db, league_key)
+            cache_path = Path(cache_dir) / (
+                f"{league_key}_{start:%Y%m%d}_{end:%Y%m%d}_{watermark}.parquet"
+            )
+            if cache_path.exists():
+                return pd.read_parquet(cache_path)
+        except Exception as exc:
+            logger.warning("Training feature cache unavailable for %s: %s", league_key, exc)
+            cache_path = None
+
+    history = load_league_history(db, league_key, start=start - H2H_LOOKBACK, end=end)
+    frame = compute_asof_features(history)
+    frame = frame[frame["match_date"] >= pd.Timestamp(start)].reset_index(drop=True)
+
+    if cache_path is not None:
+        try:
+            _write_parquet(cache_path, frame)
+        except Exception as exc:
+            logger.warning("Could not cache training features at %s: %s", cache_path, exc)
+    return frame
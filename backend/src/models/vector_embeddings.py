@@ -8,6 +8,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import numpy as np
 import pickle
 
+from .embedding_index import EmbeddingIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,12 +31,15 @@ class MatchVectorEmbeddings:
         self,
         redis_client: Optional[Any] = None,
         embedding_model: str = "all-MiniLM-L6-v2",
+        index: Optional[EmbeddingIndex] = None,
     ):
         self.redis = redis_client
         self.model_name = embedding_model
         self.model = None
         self.embedding_dim = 384
         self.cache_ttl = 86400  # 24 hours
+        # Historical analog corpus; see add_historical_matches()
+        self.index = index or EmbeddingIndex(self.embedding_dim)
         
         # Initialize model lazily
         self._init_model()
@@ -180,47 +185,59 @@ class MatchVectorEmbeddings:
             logger.error(f"Failed to embed match: {e}")
             return np.zeros(self.embedding_dim)
 
+    def add_historical_matches(
+        self,
+        match_ids: List[str],
+        embeddings: np.ndarray,
+        outcomes: Optional[List[Dict]] = None,
+        leagues: Optional[List[Optional[str]]] = None,
+        seasons: Optional[List[Optional[str]]] = None,
+    ) -> None:
+        """Append settled matches to the analog index (incremental)."""
+        self.index.add(match_ids, embeddings, outcomes, leagues=leagues, seasons=seasons)
+
     async def find_similar_matches(
         self,
         match_embedding: np.ndarray,
-        historical_embeddings: List[Tuple[str, np.ndarray, Dict]],
+        historical_embeddings: Optional[List[Tuple[str, np.ndarray, Dict]]] = None,
         top_k: int = 10,
+        league: Optional[str] = None,
+        season: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Find K most similar historical matches using cosine similarity.
         
         Args:
             match_embedding: Query match embedding
-            historical_embeddings: List of (match_id, embedding, outcome)
+            historical_embeddings: Optional list of (match_id, embedding, outcome);
+                when omitted the persistent analog index is searched
             top_k: Number of similar matches to return
+            league: Only return analogs from this league
+            season: Only return analogs from this season
             
         Returns:
-            List of similar matches with outcomes:
+            List of similar matches with outcomes, best first:
             [
                 {
                     'match_id': str,
                     'similarity': float,
                     'outcome': Dict,  # Result, xG, etc.
-                    'descriptor': str,
+                    'league': Optional[str],
+                    'season': Optional[str],
                 },
                 ...
             ]
         """
-        similarities = []
-        
-        for match_id, hist_embedding, outcome in historical_embeddings:
-            # Cosine similarity
-            similarity = self._cosine_similarity(match_embedding, hist_embedding)
-            similarities.append({
-                'match_id': match_id,
-                'similarity': float(similarity),
-                'outcome': outcome,
-            })
-        
-        # Sort by similarity
-        similarities.sort(key=lambda x: x['similarity'], reverse=True)
-        
-        return similarities[:top_k]
+        index = self.index
+        if historical_embeddings is not None:
+            if not historical_embeddings:
+                return []
+            match_ids, embeddings, outcomes = zip(*historical_embeddings)
+            index = EmbeddingIndex(len(match_embedding))
+            index.add(list(match_ids), np.stack(embeddings), list(outcomes))
+
+        hits = index.search(match_embedding, top_k, league=league, season=season)
+        return [hit.as_dict() for hit in hits]
 
     def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
         """Calculate cosine similarity between two vectors"""
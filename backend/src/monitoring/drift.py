@@ -2,6 +2,22 @@
 
 This module is Phase-2 infrastructure. It must run in a worker/cron after the
 first real prediction has been settled—not in the synchronous serving path.
+
+The reference parquet is compressed once into a ``ReferenceSketch``: per
+feature, the sorted non-NaN values, ±inf included (or, above ``sketch_size``
+rows, that many evenly spaced order statistics), plus decile bins. A KS
+statistic against a new batch is then two ``searchsorted`` calls over sorted
+arrays, computed feature by feature; only the p-values are evaluated in one
+vectorised call. PSI / Jensen–Shannon are a histogram over the same bins.
+The sketch is cached next to the artifact keyed by its SHA-256, so later
+monitors never read the parquet unless Evidently needs the raw frame.
+
+Served feature rows can be fed to ``DriftMonitor.observe``, which appends
+them to a fixed-size ring buffer; ``evaluate_window`` scores that window
+against the sketch without touching the reference, so it is cheap enough to
+run every few minutes. Nothing in the serving path builds a monitor or calls
+``observe`` yet: that is left to the Phase-2 worker that owns the reference
+artifact, so prediction latency never depends on it.
 """
 
 from __future__ import annotations
@@ -10,16 +26,18 @@ import asyncio
 import hashlib
 import json
 import logging
+import threading
 import uuid
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Mapping, Sequence
+from typing import Any, Callable, Mapping, Sequence
 
 import numpy as np
 import pandas as pd
 from httpx import AsyncClient
 from opentelemetry import metrics
-from scipy.stats import ks_2samp
+from scipy.spatial.distance import jensenshannon
+from scipy.stats import kstwo
 
 from src.services.alerting import trigger_slack_drift_alert
 
@@ -45,6 +63,16 @@ drift_feature_share = meter.create_histogram(
     unit="1",
 )
 
+DRIFT_METHODS = ("ks", "psi", "js")
+# Conventional "significant shift" cut-offs for the distance methods, which
+# have no p-value to run through FDR.
+DEFAULT_DRIFT_THRESHOLDS = {"psi": 0.2, "js": 0.1}
+DEFAULT_SKETCH_SIZE = 10_000
+DEFAULT_SKETCH_BINS = 10
+DEFAULT_WINDOW_SIZE = 2_000
+_PSI_FLOOR = 1e-6
+_SKETCH_VERSION = 1
+
 
 class DriftConfigurationError(RuntimeError):
     """Raised when the reference artifact or monitor configuration is invalid."""
@@ -54,9 +82,10 @@ class DriftConfigurationError(RuntimeError):
 class FeatureDrift:
     feature: str
     statistic: float
-    p_value: float
-    adjusted_p_value: float
+    p_value: float | None
+    adjusted_p_value: float | None
     drift_detected: bool
+    method: str = "ks"
 
 
 @dataclass(frozen=True)
@@ -75,6 +104,7 @@ class DriftEvaluation:
     feature_results: tuple[FeatureDrift, ...]
     evidently_report: Mapping[str, Any] | None
     reason: str | None = None
+    method: str = "ks"
 
     def as_dict(self) -> dict[str, Any]:
         payload = asdict(self)
@@ -149,32 +179,288 @@ def _evidently_report(reference_df: pd.DataFrame, current_df: pd.DataFrame) -> M
     raise DriftConfigurationError("Unsupported Evidently snapshot output API")
 
 
-def _fdr_feature_drift(
-    reference_df: pd.DataFrame,
-    current_df: pd.DataFrame,
-    *,
-    alpha: float,
-) -> tuple[FeatureDrift, ...]:
-    raw: list[tuple[str, float, float]] = []
-    for column in reference_df.columns:
-        reference = pd.to_numeric(reference_df[column], errors="coerce").dropna()
-        current = pd.to_numeric(current_df[column], errors="coerce").dropna()
-        if reference.empty or current.empty:
-            continue
-        result = ks_2samp(reference, current, alternative="two-sided", method="auto")
-        raw.append((column, float(result.statistic), float(result.pvalue)))
-
-    adjusted = benjamini_hochberg([item[2] for item in raw])
-    return tuple(
-        FeatureDrift(
-            feature=feature,
-            statistic=statistic,
-            p_value=p_value,
-            adjusted_p_value=adjusted_p,
-            drift_detected=adjusted_p < alpha,
+def _numeric(values: Any) -> np.ndarray:
+    """Float values of one column with NaN and non-numeric entries dropped; ±inf kept."""
+
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    if not pd.api.types.is_numeric_dtype(series):
+        series = pd.to_numeric(series, errors="coerce")
+    array = series.to_numpy(dtype=float, na_value=np.nan)
+    return array[~np.isnan(array)]
+
+
+def _ecdf(sorted_values: np.ndarray, points: np.ndarray) -> np.ndarray:
+    return np.searchsorted(sorted_values, points, side="right") / len(sorted_values)
+
+
+def ks_statistic(reference_sorted: np.ndarray, current_sorted: np.ndarray) -> float:
+    """Two-sample KS statistic of two already-sorted samples."""
+
+    grid = np.concatenate([reference_sorted, current_sorted])
+    return float(np.abs(_ecdf(reference_sorted, grid) - _ecdf(current_sorted, grid)).max())
+
+
+def _ks_p_values(statistics: np.ndarray, reference_n: np.ndarray, current_n: np.ndarray) -> np.ndarray:
+    """Asymptotic two-sided KS p-values (ks_2samp's ``method="asymp"``)."""
+
+    effective_n = np.round(reference_n * current_n / (reference_n + current_n))
+    return np.clip(kstwo.sf(statistics, np.maximum(effective_n, 1)), 0.0, 1.0)
+
+
+@dataclass(frozen=True)
+class _FeatureSketch:
+    sorted_values: np.ndarray
+    count: int
+    edges: np.ndarray
+    probabilities: np.ndarray
+
+    @classmethod
+    def build(cls, sorted_values: np.ndarray, count: int, bins: int) -> "_FeatureSketch":
+        quantiles = np.quantile(sorted_values, np.linspace(0, 1, bins + 1)[1:-1])
+        edges = np.unique(quantiles)
+        probabilities = _histogram(sorted_values, edges)
+        return cls(sorted_values, count, edges, probabilities)
+
+
+def _histogram(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    counts = np.bincount(np.searchsorted(edges, values, side="right"), minlength=len(edges) + 1)
+    return counts / max(len(values), 1)
+
+
+def _psi(current: np.ndarray, reference: np.ndarray) -> float:
+    current = np.maximum(current, _PSI_FLOOR)
+    reference = np.maximum(reference, _PSI_FLOOR)
+    return float(np.sum((current - reference) * np.log(current / reference)))
+
+
+@dataclass(frozen=True)
+class ReferenceSketch:
+    """Per-feature sorted samples (or quantile sketches) of the reference."""
+
+    features: tuple[str, ...]
+    rows: int
+    sketches: Mapping[str, _FeatureSketch]
+    artifact_sha256: str | None = None
+    sketch_size: int | None = DEFAULT_SKETCH_SIZE
+    bins: int = DEFAULT_SKETCH_BINS
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame: pd.DataFrame,
+        *,
+        sketch_size: int | None = DEFAULT_SKETCH_SIZE,
+        bins: int = DEFAULT_SKETCH_BINS,
+        artifact_sha256: str | None = None,
+    ) -> "ReferenceSketch":
+        """Sort each column once; above ``sketch_size`` values keep that many
+        evenly spaced order statistics (ECDF error at most 1/sketch_size)."""
+
+        columns: dict[str, tuple[np.ndarray, int]] = {}
+        for column in frame.columns:
+            values = np.sort(_numeric(frame[column]))
+            count = len(values)
+            if sketch_size and count > sketch_size:
+                positions = ((np.arange(sketch_size) + 0.5) * count / sketch_size).astype(np.int64)
+                values = values[positions]
+            columns[str(column)] = (values, count)
+        return cls._assemble(
+            tuple(str(column) for column in frame.columns),
+            len(frame),
+            columns,
+            artifact_sha256=artifact_sha256,
+            sketch_size=sketch_size,
+            bins=bins,
         )
-        for (feature, statistic, p_value), adjusted_p in zip(raw, adjusted, strict=True)
-    )
+
+    @classmethod
+    def _assemble(
+        cls,
+        features: tuple[str, ...],
+        rows: int,
+        columns: Mapping[str, tuple[np.ndarray, int]],
+        **options: Any,
+    ) -> "ReferenceSketch":
+        bins = options["bins"]
+        sketches = {
+            name: _FeatureSketch.build(values, count, bins)
+            for name, (values, count) in columns.items()
+            if count
+        }
+        return cls(features=features, rows=rows, sketches=sketches, **options)
+
+    def save(self, path: str | Path) -> None:
+        names = [name for name in self.features if name in self.sketches]
+        lengths = [len(self.sketches[name].sorted_values) for name in names]
+        payload = {
+            "version": _SKETCH_VERSION,
+            "features": list(self.features),
+            "rows": self.rows,
+            "sketched": names,
+            "counts": [self.sketches[name].count for name in names],
+            "artifact_sha256": self.artifact_sha256,
+            "sketch_size": self.sketch_size,
+            "bins": self.bins,
+        }
+        values = (
+            np.concatenate([self.sketches[name].sorted_values for name in names])
+            if names
+            else np.empty(0)
+        )
+        with Path(path).open("wb") as handle:
+            np.savez(
+                handle,
+                meta=np.array(json.dumps(payload)),
+                offsets=np.cumsum([0, *lengths]),
+                values=values,
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ReferenceSketch":
+        with np.load(Path(path), allow_pickle=False) as archive:
+            payload = json.loads(str(archive["meta"]))
+            offsets = archive["offsets"]
+            values = archive["values"]
+        if payload.get("version") != _SKETCH_VERSION:
+            raise DriftConfigurationError("Unsupported reference sketch version")
+        columns = {
+            name: (values[offsets[index] : offsets[index + 1]], count)
+            for index, (name, count) in enumerate(zip(payload["sketched"], payload["counts"]))
+        }
+        return cls._assemble(
+            tuple(payload["features"]),
+            int(payload["rows"]),
+            columns,
+            artifact_sha256=payload["artifact_sha256"],
+            sketch_size=payload["sketch_size"],
+            bins=int(payload["bins"]),
+        )
+
+    def compare(
+        self,
+        current: Mapping[str, np.ndarray],
+        *,
+        method: str = "ks",
+        alpha: float = 0.05,
+        threshold: float | None = None,
+    ) -> tuple[FeatureDrift, ...]:
+        """Score current column values (NaN already dropped) against the sketch.
+
+        ``ks`` flags features by Benjamini–Hochberg adjusted p-value < alpha;
+        ``psi`` and ``js`` flag features whose distance reaches ``threshold``.
+        """
+
+        if method not in DRIFT_METHODS:
+            raise ValueError(f"method must be one of {DRIFT_METHODS}")
+        scored = [
+            (name, sketch, np.asarray(current[name], dtype=float))
+            for name, sketch in self.sketches.items()
+            if name in current and len(current[name])
+        ]
+        if not scored:
+            return ()
+
+        if method == "ks":
+            statistics = np.array(
+                [ks_statistic(sketch.sorted_values, np.sort(values)) for _, sketch, values in scored]
+            )
+            p_values = _ks_p_values(
+                statistics,
+                np.array([sketch.count for _, sketch, _ in scored], dtype=float),
+                np.array([len(values) for _, _, values in scored], dtype=float),
+            )
+            adjusted = benjamini_hochberg(p_values.tolist())
+            return tuple(
+                FeatureDrift(
+                    feature=name,
+                    statistic=float(statistic),
+                    p_value=float(p_value),
+                    adjusted_p_value=adjusted_p,
+                    drift_detected=adjusted_p < alpha,
+                )
+                for (name, _, _), statistic, p_value, adjusted_p in zip(
+                    scored, statistics, p_values, adjusted, strict=True
+                )
+            )
+
+        cutoff = DEFAULT_DRIFT_THRESHOLDS[method] if threshold is None else threshold
+        results = []
+        for name, sketch, values in scored:
+            observed = _histogram(values, sketch.edges)
+            if method == "psi":
+                statistic = _psi(observed, sketch.probabilities)
+            else:
+                statistic = float(jensenshannon(observed, sketch.probabilities, base=2))
+            results.append(
+                FeatureDrift(
+                    feature=name,
+                    statistic=statistic,
+                    p_value=None,
+                    adjusted_p_value=None,
+                    drift_detected=statistic >= cutoff,
+                    method=method,
+                )
+            )
+        return tuple(results)
+
+
+class RollingFeatureWindow:
+    """Fixed-capacity ring buffer of the most recent served feature rows."""
+
+    def __init__(self, features: Sequence[str], capacity: int = DEFAULT_WINDOW_SIZE) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.features = tuple(features)
+        self.capacity = capacity
+        self._buffer = np.full((capacity, len(self.features)), np.nan)
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, rows: pd.DataFrame | Mapping[str, Any] | Sequence[Mapping[str, Any]]) -> None:
+        """Add rows; columns are matched by name and missing features are NaN."""
+
+        if isinstance(rows, Mapping):
+            rows = [rows]
+        frame = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+        if frame.empty:
+            return
+        block = np.column_stack(
+            [
+                pd.to_numeric(frame[name], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+                if name in frame
+                else np.full(len(frame), np.nan)
+                for name in self.features
+            ]
+        )[-self.capacity :]
+        with self._lock:
+            positions = (self._next + np.arange(len(block))) % self.capacity
+            self._buffer[positions] = block
+            self._next = int((self._next + len(block)) % self.capacity)
+            self._size = min(self.capacity, self._size + len(block))
+
+    def values(self) -> np.ndarray:
+        """Copy of the window, oldest row first."""
+
+        with self._lock:
+            if self._size < self.capacity:
+                return self._buffer[: self._size].copy()
+            return np.roll(self._buffer, -self._next, axis=0)
+
+    def columns(self) -> dict[str, np.ndarray]:
+        block = self.values()
+        return {
+            name: column[~np.isnan(column)]
+            for name, column in zip(self.features, block.T, strict=True)
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._next = 0
+            self._size = 0
 
 
 class DriftMonitor:
@@ -188,6 +474,12 @@ class DriftMonitor:
         minimum_current_rows: int,
         dataset_drift_share: float,
         fdr_alpha: float = 0.05,
+        method: str = "ks",
+        drift_threshold: float | None = None,
+        sketch_size: int | None = DEFAULT_SKETCH_SIZE,
+        sketch_path: str | Path | None = None,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        evidently: bool = True,
     ) -> None:
         self.reference_path = Path(reference_path).resolve()
         self.manifest_path = (
@@ -195,89 +487,185 @@ class DriftMonitor:
             if manifest_path
             else self.reference_path.with_name("baseline_v1.manifest.json")
         )
+        self.sketch_path = (
+            Path(sketch_path).resolve()
+            if sketch_path
+            else self.reference_path.with_suffix(".sketch.npz")
+        )
         if minimum_current_rows < 2:
             raise ValueError("minimum_current_rows must be at least 2")
         if not 0 < dataset_drift_share <= 1:
             raise ValueError("dataset_drift_share must be in (0, 1]")
         if not 0 < fdr_alpha < 1:
             raise ValueError("fdr_alpha must be in (0, 1)")
+        if method not in DRIFT_METHODS:
+            raise ValueError(f"method must be one of {DRIFT_METHODS}")
         if not self.reference_path.exists():
             raise DriftConfigurationError(f"Reference artifact not found: {self.reference_path}")
 
         self.manifest = _load_manifest(self.reference_path, self.manifest_path)
-        self.reference_df = pd.read_parquet(self.reference_path)
-        if self.reference_df.empty:
+        artifact_sha256 = self.manifest["artifact"]["sha256"]
+
+        # Evidently needs the raw reference; the statistical checks only the sketch.
+        self.reference_df: pd.DataFrame | None = None
+        self.reference = self._cached_sketch(artifact_sha256, sketch_size)
+        if self.reference is None or evidently:
+            self.reference_df = pd.read_parquet(self.reference_path)
+            if self.reference_df.empty:
+                raise DriftConfigurationError("Reference artifact contains no rows")
+        if self.reference is None:
+            self.reference = ReferenceSketch.from_frame(
+                self.reference_df, sketch_size=sketch_size, artifact_sha256=artifact_sha256
+            )
+            self._store_sketch()
+        if not self.reference.rows:
             raise DriftConfigurationError("Reference artifact contains no rows")
         manifest_features = self.manifest.get("feature_schema", {}).get("ordered_features") or []
-        if manifest_features and list(self.reference_df.columns) != list(manifest_features):
+        if manifest_features and list(self.reference.features) != list(manifest_features):
             raise DriftConfigurationError("Reference columns do not match manifest feature order")
 
         self.minimum_current_rows = minimum_current_rows
         self.dataset_drift_share = dataset_drift_share
         self.fdr_alpha = fdr_alpha
+        self.method = method
+        self.drift_threshold = drift_threshold
+        self.window = RollingFeatureWindow(self.reference.features, window_size)
+
+    @property
+    def features(self) -> tuple[str, ...]:
+        return self.reference.features
+
+    def _cached_sketch(self, artifact_sha256: str, sketch_size: int | None) -> ReferenceSketch | None:
+        if not self.sketch_path.exists():
+            return None
+        try:
+            sketch = ReferenceSketch.load(self.sketch_path)
+        except Exception as exc:
+            logger.warning("Ignoring unreadable drift sketch %s: %s", self.sketch_path, exc)
+            return None
+        if sketch.artifact_sha256 != artifact_sha256 or sketch.sketch_size != sketch_size:
+            return None
+        return sketch
+
+    def _store_sketch(self) -> None:
+        try:
+            self.reference.save(self.sketch_path)
+        except OSError as exc:
+            logger.warning("Could not cache drift sketch at %s: %s", self.sketch_path, exc)
+
+    def observe(self, rows: pd.DataFrame | Mapping[str, Any] | Sequence[Mapping[str, Any]]) -> None:
+        """Append served feature rows to the rolling window (cheap, no scoring)."""
+
+        self.window.append(rows)
+
+    async def evaluate_window(
+        self,
+        *,
+        http_client: AsyncClient,
+        method: str | None = None,
+    ) -> DriftEvaluation:
+        """Score the rolling window against the sketch; Evidently is skipped."""
+
+        current = self.window.columns()
+        return await self._evaluate(
+            http_client=http_client,
+            current_rows=len(self.window),
+            current_columns=lambda: current,
+            method=method or self.method,
+        )
 
     async def evaluate_batch(
         self,
         *,
         http_client: AsyncClient,
         current_batch_df: pd.DataFrame,
+        method: str | None = None,
     ) -> DriftEvaluation:
         """Evaluate drift off-thread and emit advisory telemetry/Slack output."""
 
+        schema_matches = list(current_batch_df.columns) == list(self.features)
+        return await self._evaluate(
+            http_client=http_client,
+            current_rows=len(current_batch_df),
+            current_columns=lambda: {
+                column: _numeric(current_batch_df[column]) for column in self.reference.sketches
+            },
+            method=method or self.method,
+            current_df=current_batch_df,
+            schema_matches=schema_matches,
+        )
+
+    def _skipped(
+        self, evaluation_id: str, status: str, current_rows: int, method: str, reason: str
+    ) -> DriftEvaluation:
+        return DriftEvaluation(
+            evaluation_id=evaluation_id,
+            status=status,
+            reference_rows=self.reference.rows,
+            current_rows=current_rows,
+            evaluated_features=0,
+            drifting_features=(),
+            drift_share=0.0,
+            fdr_alpha=self.fdr_alpha,
+            minimum_current_rows=self.minimum_current_rows,
+            dataset_drift=False,
+            alert_delivered=False,
+            feature_results=(),
+            evidently_report=None,
+            reason=reason,
+            method=method,
+        )
+
+    async def _evaluate(
+        self,
+        *,
+        http_client: AsyncClient,
+        current_rows: int,
+        current_columns: Callable[[], Mapping[str, np.ndarray]],
+        method: str,
+        current_df: pd.DataFrame | None = None,
+        schema_matches: bool = True,
+    ) -> DriftEvaluation:
+        if method not in DRIFT_METHODS:
+            raise ValueError(f"method must be one of {DRIFT_METHODS}")
         evaluation_id = uuid.uuid4().hex
-        current_rows = len(current_batch_df)
         attributes = {"status": "evaluated"}
         drift_evaluation_counter.add(1, attributes)
         drift_batch_size.record(current_rows)
 
         if current_rows < self.minimum_current_rows:
-            return DriftEvaluation(
-                evaluation_id=evaluation_id,
-                status="INSUFFICIENT_SAMPLE",
-                reference_rows=len(self.reference_df),
-                current_rows=current_rows,
-                evaluated_features=0,
-                drifting_features=(),
-                drift_share=0.0,
-                fdr_alpha=self.fdr_alpha,
-                minimum_current_rows=self.minimum_current_rows,
-                dataset_drift=False,
-                alert_delivered=False,
-                feature_results=(),
-                evidently_report=None,
-                reason=(
-                    f"Current batch has {current_rows} rows; "
-                    f"requires {self.minimum_current_rows}."
-                ),
+            return self._skipped(
+                evaluation_id,
+                "INSUFFICIENT_SAMPLE",
+                current_rows,
+                method,
+                f"Current batch has {current_rows} rows; requires {self.minimum_current_rows}.",
             )
 
-        if list(current_batch_df.columns) != list(self.reference_df.columns):
-            return DriftEvaluation(
-                evaluation_id=evaluation_id,
-                status="SCHEMA_MISMATCH",
-                reference_rows=len(self.reference_df),
-                current_rows=current_rows,
-                evaluated_features=0,
-                drifting_features=(),
-                drift_share=0.0,
-                fdr_alpha=self.fdr_alpha,
-                minimum_current_rows=self.minimum_current_rows,
-                dataset_drift=False,
-                alert_delivered=False,
-                feature_results=(),
-                evidently_report=None,
-                reason="Current feature columns/order do not match the reference manifest.",
+        if not schema_matches:
+            return self._skipped(
+                evaluation_id,
+                "SCHEMA_MISMATCH",
+                current_rows,
+                method,
+                "Current feature columns/order do not match the reference manifest.",
             )
 
-        evidently_report, feature_results = await asyncio.gather(
-            asyncio.to_thread(_evidently_report, self.reference_df, current_batch_df),
-            asyncio.to_thread(
-                _fdr_feature_drift,
-                self.reference_df,
-                current_batch_df,
+        def score() -> tuple[FeatureDrift, ...]:
+            return self.reference.compare(
+                current_columns(),
+                method=method,
                 alpha=self.fdr_alpha,
-            ),
-        )
+                threshold=self.drift_threshold,
+            )
+
+        if current_df is not None and self.reference_df is not None:
+            evidently_report, feature_results = await asyncio.gather(
+                asyncio.to_thread(_evidently_report, self.reference_df, current_df),
+                asyncio.to_thread(score),
+            )
+        else:
+            evidently_report, feature_results = None, await asyncio.to_thread(score)
 
         drifting = tuple(item.feature for item in feature_results if item.drift_detected)
         evaluated_features = len(feature_results)
@@ -299,7 +687,7 @@ class DriftMonitor:
         return DriftEvaluation(
             evaluation_id=evaluation_id,
             status="DRIFT_DETECTED" if dataset_drift else "NO_DATASET_DRIFT",
-            reference_rows=len(self.reference_df),
+            reference_rows=self.reference.rows,
             current_rows=current_rows,
             evaluated_features=evaluated_features,
             drifting_features=drifting,
@@ -310,13 +698,18 @@ class DriftMonitor:
             alert_delivered=alert_delivered,
             feature_results=feature_results,
             evidently_report=evidently_report,
+            method=method,
         )
 
 
 __all__: Sequence[str] = (
+    "DRIFT_METHODS",
     "DriftConfigurationError",
     "DriftEvaluation",
     "DriftMonitor",
     "FeatureDrift",
+    "ReferenceSketch",
+    "RollingFeatureWindow",
     "benjamini_hochberg",
+    "ks_statistic",
 )
@@ -8,15 +8,18 @@ from .base import (
     ProviderStatus,
     TrustTier,
 )
+from .http_cache import ProviderHTTPCache, get_provider_http_cache
 from .registry import ProviderRegistry, build_provider_registry
 
 __all__ = [
     "ProviderCapability",
     "ProviderHealth",
+    "ProviderHTTPCache",
     "ProviderQuota",
     "ProviderRegistry",
     "ProviderResult",
     "ProviderStatus",
     "TrustTier",
     "build_provider_registry",
+    "get_provider_http_cache",
 ]
@@ -6,6 +6,7 @@ quota state, freshness, and provenance are handled in one backend-only layer.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
@@ -13,12 +14,15 @@ import random
 import re
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Mapping
+from typing import TYPE_CHECKING, Any, Mapping
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import httpx
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from .http_cache import ProviderHTTPCache
+
 logger = logging.getLogger(__name__)
 
 SENSITIVE_QUERY_KEYS = {"api_key", "apikey", "api_token", "key", "token", "auth", "authorization"}
@@ -181,14 +185,19 @@ class BaseProvider:
         enabled: bool = False,
         live_tests: bool = False,
         http_client: httpx.AsyncClient | None = None,
+        response_cache: "ProviderHTTPCache | None" = None,
     ) -> None:
         self.api_key = api_key
         self.enabled = enabled
         self.live_tests = live_tests
         self.breaker = CircuitBreaker()
-        # Lifespan-owned client when injected by the registry; falls back to a
-        # per-call client only when constructed directly (e.g. unit tests).
+        # Lifespan-owned client when injected by the registry; otherwise one
+        # client owned by this provider, opened lazily and reused across calls.
         self._http_client = http_client
+        self._owned_client: httpx.AsyncClient | None = None
+        self._owned_client_loop: asyncio.AbstractEventLoop | None = None
+        # Conditional-GET cache (providers/http_cache.py); None = always fetch.
+        self.response_cache = response_cache
 
     @property
     def configured(self) -> bool:
@@ -239,6 +248,11 @@ class BaseProvider:
             "health": health.model_dump(mode="json"),
             "capability_count": len(capabilities),
             "quota": quota.model_dump(mode="json"),
+            "http_cache": (
+                self.response_cache.stats(self.provider_id)
+                if self.response_cache is not None
+                else None
+            ),
             "configuration": redact_mapping(
                 {
                     "enabled": self.enabled,
@@ -259,18 +273,24 @@ class BaseProvider:
         if self.breaker.open:
             raise RuntimeError(f"{self.provider_id} circuit breaker is open")
         last_exc: Exception | None = None
+        client = self._client()
+
+        async def send(request_headers: dict[str, str]) -> httpx.Response:
+            return await client.get(
+                url,
+                headers=request_headers,
+                params=params,
+                timeout=httpx.Timeout(self.timeout_seconds),
+            )
+
         for attempt in range(self.max_retries + 1):
             try:
-                if self._http_client is not None:
-                    response = await self._http_client.get(
-                        url,
-                        headers=dict(headers or {}),
-                        params=params,
-                        timeout=httpx.Timeout(self.timeout_seconds),
+                if self.response_cache is not None:
+                    response = await self.response_cache.get_response(
+                        self.provider_id, url, params, headers, send
                     )
                 else:
-                    async with httpx.AsyncClient(timeout=httpx.Timeout(self.timeout_seconds)) as client:
-                        response = await client.get(url, headers=dict(headers or {}), params=params)
+                    response = await send(dict(headers or {}))
                 if response.status_code == 429:
                     self.breaker.record_failure()
                     raise RuntimeError("rate_limited")
@@ -289,7 +309,26 @@ class BaseProvider:
         logger.warning("provider_request_failed provider=%s url=%s error=%s", self.provider_id, safe_url, safe_error)
         raise last_exc or RuntimeError("provider_request_failed")
 
-    async def _sleep_with_jitter(self, attempt: int) -> None:
-        import asyncio
+    def _client(self) -> httpx.AsyncClient:
+        if self._http_client is not None:
+            return self._http_client
+        # Pooled connections belong to the loop that opened them; a provider
+        # reused under a new loop (CLI asyncio.run calls) gets a fresh client.
+        loop = asyncio.get_running_loop()
+        if (
+            self._owned_client is None
+            or self._owned_client.is_closed
+            or self._owned_client_loop is not loop
+        ):
+            self._owned_client = httpx.AsyncClient(timeout=httpx.Timeout(self.timeout_seconds))
+            self._owned_client_loop = loop
+        return self._owned_client
+
+    async def aclose(self) -> None:
+        """Close the provider-owned client; an injected client belongs to its owner."""
+        if self._owned_client is not None:
+            await self._owned_client.aclose()
+            self._owned_client = None
 
+    async def _sleep_with_jitter(self, attempt: int) -> None:
         await asyncio.sleep(min(2.0, 0.25 * (2**attempt)) + random.random() * 0.1)
@@ -0,0 +1,350 @@
+"""Conditional-GET response cache shared by provider and connector HTTP calls.
+
+Fixtures and standings rarely change between polls, yet every poll downloaded
+and parsed the full payload and spent a request of the provider's quota. This
+layer stores each successful response (body + headers) keyed on URL + params
+and:
+
+- serves it without any request while ``Cache-Control: max-age`` (less
+  ``Age``) says it is fresh;
+- otherwise replays its ``ETag`` / ``Last-Modified`` as ``If-None-Match`` /
+  ``If-Modified-Since`` and treats a ``304 Not Modified`` as a hit, merging the
+  304's headers over the stored ones.
+
+Quota and rate-limit headers describe one exchange, not the body, so they are
+never stored: a fresh hit carries none (it spent no quota, and providers read
+a missing counter as unknown) and a 304 carries only its own live counters.
+
+Entries live in an in-process dict backed by a SQLite file (stdlib, no extra
+dependency) so a restart revalidates instead of refetching. ``no-store``
+responses and responses with neither a validator nor a max-age are never
+stored. Per-provider counters report how many requests and downloads the cache
+saved.
+
+Cache keys are SHA-256 digests of the request, so credentials passed as query
+params (The Odds API's ``apiKey``) are never written to disk; the stored URL is
+redacted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Mapping
+
+import httpx
+
+from .base import redact_url
+
+logger = logging.getLogger(__name__)
+
+# Entries not refreshed for this long are pruned when the store is opened.
+DEFAULT_RETENTION_SECONDS = 7 * 24 * 3600
+
+# Headers that describe the stored body rather than a single exchange; kept
+# from the original 200 when merging a 304.
+_ENTITY_HEADERS = {"content-type", "content-length", "content-encoding", "transfer-encoding"}
+
+# Per-exchange quota / rate-limit counters (The Odds API x-requests-*,
+# API-Football x-ratelimit-*, football-data.org X-Requests-Available-* and
+# X-RequestCounter-Reset); never stored or replayed from the cache.
+_QUOTA_HEADER_PREFIXES = (
+    "x-requests", "x-requestcounter", "x-ratelimit", "x-rate-limit", "ratelimit", "retry-after",
+)
+
+
+def _is_quota_header(name: str) -> bool:
+    return name.lower().startswith(_QUOTA_HEADER_PREFIXES)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    url TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+def _cache_directives(headers: Mapping[str, str]) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in (headers.get("cache-control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _freshness_lifetime(headers: Mapping[str, str]) -> float:
+    """Seconds the response may be served without revalidation (0 if none)."""
+    directives = _cache_directives(headers)
+    if "no-cache" in directives or "max-age" not in directives:
+        return 0.0
+    try:
+        max_age = float(directives["max-age"] or 0)
+        age = float(headers.get("age") or 0)
+    except ValueError:
+        return 0.0
+    return max(0.0, max_age - age)
+
+
+@dataclass
+class CacheEntry:
+    provider: str
+    url: str
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+    expires_at: float
+
+    @property
+    def validators(self) -> dict[str, str]:
+        conditional: dict[str, str] = {}
+        if self.headers.get("etag"):
+            conditional["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            conditional["If-Modified-Since"] = self.headers["last-modified"]
+        return conditional
+
+    def is_fresh(self, now: float) -> bool:
+        return now < self.expires_at
+
+    def to_response(
+        self, request: httpx.Request, live_headers: Mapping[str, str] | None = None
+    ) -> httpx.Response:
+        # The stored body is already decoded, so encoding/length headers from
+        # the original exchange must not be replayed. Quota counters only come
+        # from ``live_headers`` (the exchange that just happened, if any);
+        # entries written before they were filtered out may still hold some.
+        headers = {
+            k: v
+            for k, v in self.headers.items()
+            if k not in _ENTITY_HEADERS and not _is_quota_header(k)
+        }
+        if "content-type" in self.headers:
+            headers["content-type"] = self.headers["content-type"]
+        headers.update(live_headers or {})
+        return httpx.Response(200, headers=headers, content=self.body, request=request)
+
+
+@dataclass
+class CacheStats:
+    fresh_hits: int = 0          # served from max-age, no request sent
+    not_modified: int = 0        # 304 revalidations
+    misses: int = 0              # full downloads
+    bytes_saved: int = 0         # body bytes not re-downloaded
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "fresh_hits": self.fresh_hits,
+            "not_modified": self.not_modified,
+            "misses": self.misses,
+            # Every fresh hit is a request that never reached the provider.
+            "requests_saved": self.fresh_hits,
+            "downloads_saved": self.fresh_hits + self.not_modified,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+@dataclass
+class ProviderHTTPCache:
+    """SQLite-backed conditional-GET cache; ``path=None`` keeps it in memory."""
+
+    path: Path | None = None
+    retention_seconds: float = DEFAULT_RETENTION_SECONDS
+    clock: Callable[[], float] = time.time
+    _entries: dict[str, CacheEntry] = field(default_factory=dict, init=False, repr=False)
+    _stats: dict[str, CacheStats] = field(default_factory=dict, init=False, repr=False)
+    _db: sqlite3.Connection | None = field(default=None, init=False, repr=False)
+    _db_opened: bool = field(default=False, init=False, repr=False)
+
+    def _connection(self) -> sqlite3.Connection | None:
+        """Open the SQLite store on first use, pruning expired history."""
+        if self._db_opened or self.path is None:
+            return self._db
+        self._db_opened = True
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._db.execute(_SCHEMA)
+            self._db.execute(
+                "DELETE FROM http_cache WHERE stored_at < ?",
+                (self.clock() - self.retention_seconds,),
+            )
+            self._db.commit()
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Provider HTTP cache store unavailable at %s: %s", self.path, exc)
+            self._db = None
+        return self._db
+
+    # -- keys and storage ---------------------------------------------------
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, Any] | None = None) -> str:
+        canonical = json.dumps(
+            [url, sorted((str(k), str(v)) for k, v in (params or {}).items())],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        db = self._connection()
+        if entry is not None or db is None:
+            return entry
+        row = db.execute(
+            "SELECT provider, url, headers, body, stored_at, expires_at FROM http_cache WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        entry = CacheEntry(row[0], row[1], json.loads(row[2]), bytes(row[3]), row[4], row[5])
+        self._entries[key] = entry
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        db = self._connection()
+        if db is None:
+            return
+        try:
+            db.execute(
+                "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.provider,
+                    entry.url,
+                    json.dumps(entry.headers),
+                    entry.body,
+                    entry.stored_at,
+                    entry.expires_at,
+                ),
+            )
+            db.commit()
+        except sqlite3.Error as exc:
+            logger.warning("Provider HTTP cache write failed: %s", exc)
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    # -- accounting ---------------------------------------------------------
+
+    def _stat(self, provider: str) -> CacheStats:
+        return self._stats.setdefault(provider, CacheStats())
+
+    def stats(self, provider: str | None = None) -> dict[str, Any]:
+        if provider is not None:
+            return self._stat(provider).as_dict()
+        return {name: stat.as_dict() for name, stat in sorted(self._stats.items())}
+
+    # -- request path -------------------------------------------------------
+
+    async def get_response(
+        self,
+        provider: str,
+        url: str,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, str] | None,
+        send: Callable[[dict[str, str]], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Answer a GET from cache, by revalidation, or by ``send(headers)``.
+
+        ``send`` performs the real request with the given headers. Non-200,
+        non-304 responses (429s, errors) pass through untouched so callers keep
+        their own status handling.
+        """
+        key = self.key(url, params)
+        entry = self.get(key)
+        now = self.clock()
+        stat = self._stat(provider)
+        if entry is not None and entry.is_fresh(now):
+            stat.fresh_hits += 1
+            stat.bytes_saved += len(entry.body)
+            return entry.to_response(httpx.Request("GET", url, params=params))
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.validators)
+        response = await send(request_headers)
+
+        if response.status_code == 304 and entry is not None:
+            merged = {k: v for k, v in entry.headers.items() if not _is_quota_header(k)}
+            quota = {}
+            for name, value in response.headers.items():
+                name = name.lower()
+                if _is_quota_header(name):
+                    quota[name] = value
+                elif name not in _ENTITY_HEADERS:
+                    merged[name] = value
+            entry = CacheEntry(
+                provider=provider,
+                url=entry.url,
+                headers=merged,
+                body=entry.body,
+                stored_at=now,
+                expires_at=now + _freshness_lifetime(merged),
+            )
+            self.put(key, entry)
+            stat.not_modified += 1
+            stat.bytes_saved += len(entry.body)
+            return entry.to_response(httpx.Request("GET", url, params=params), live_headers=quota)
+
+        if response.status_code == 200:
+            stat.misses += 1
+            self._store(key, provider, url, params, response, now)
+        return response
+
+    def _store(
+        self,
+        key: str,
+        provider: str,
+        url: str,
+        params: Mapping[str, Any] | None,
+        response: httpx.Response,
+        now: float,
+    ) -> None:
+        response_headers = {
+            k.lower(): v for k, v in response.headers.items() if not _is_quota_header(k)
+        }
+        if "no-store" in _cache_directives(response_headers):
+            return
+        lifetime = _freshness_lifetime(response_headers)
+        if not lifetime and not ({"etag", "last-modified"} & response_headers.keys()):
+            return
+        query = "&".join(f"{k}={v}" for k, v in (params or {}).items())
+        self.put(
+            key,
+            CacheEntry(
+                provider=provider,
+                url=redact_url(f"{url}?{query}" if query else url),
+                headers=response_headers,
+                body=response.content,
+                stored_at=now,
+                expires_at=now + lifetime,
+            ),
+        )
+
+
+_shared_cache: ProviderHTTPCache | None = None
+
+
+def get_provider_http_cache() -> ProviderHTTPCache | None:
+    """Process-wide cache, or None when PROVIDER_CACHE_ENABLED is off."""
+    global _shared_cache
+    from ..core.config import settings
+
+    if not settings.provider_cache_enabled:
+        return None
+    if _shared_cache is None:
+        _shared_cache = ProviderHTTPCache(path=settings.provider_http_cache_path)
+    return _shared_cache
@@ -13,6 +13,7 @@ from .api_football import APIFootballProvider
 from .base import ProviderCapability, ProviderHealth, ProviderQuota
 from .espn import ESPNProvider
 from .football_data_org import FootballDataOrgProvider
+from .http_cache import ProviderHTTPCache
 from .sportmonks import SportmonksProvider
 from .the_odds_api import TheOddsAPIProvider
 
@@ -47,13 +48,18 @@ class ProviderRegistry:
         return {"providers": reports}
 
 
-def build_provider_registry(http_client: httpx.AsyncClient | None = None) -> ProviderRegistry:
+def build_provider_registry(
+    http_client: httpx.AsyncClient | None = None,
+    response_cache: ProviderHTTPCache | None = None,
+) -> ProviderRegistry:
     """Build the canonical provider set.
 
     `http_client` should be the single application-lifespan client (see
     `app.state.http_client` in `api/main.py`) so providers share one pooled
     connection instead of opening a new client per request. Left optional so
     tests and CLI tools can construct a registry without a running app.
+    `response_cache` is the shared conditional-GET cache
+    (`http_cache.get_provider_http_cache()`); None disables caching.
     """
     return ProviderRegistry(
         [
@@ -61,30 +67,35 @@ def build_provider_registry(http_client: httpx.AsyncClient | None = None) -> Pro
                 enabled=settings.enable_espn_provider,
                 live_tests=settings.provider_live_tests,
                 http_client=http_client,
+                response_cache=response_cache,
             ),
             FootballDataOrgProvider(
                 api_key=settings.football_data_api_key,
                 enabled=settings.enable_football_data_provider,
                 live_tests=settings.provider_live_tests,
                 http_client=http_client,
+                response_cache=response_cache,
             ),
             APIFootballProvider(
                 api_key=settings.api_football_key,
                 enabled=settings.enable_api_football_provider,
                 live_tests=settings.provider_live_tests,
                 http_client=http_client,
+                response_cache=response_cache,
             ),
             SportmonksProvider(
                 api_key=settings.sportmonks_api_key,
                 enabled=settings.enable_sportmonks_provider,
                 live_tests=settings.provider_live_tests,
                 http_client=http_client,
+                response_cache=response_cache,
             ),
             TheOddsAPIProvider(
                 api_key=settings.the_odds_api_key,
                 enabled=settings.enable_the_odds_api_provider,
                 live_tests=settings.provider_live_tests,
                 http_client=http_client,
+                response_cache=response_cache,
             ),
         ]
     )
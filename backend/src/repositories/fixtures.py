@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Final, List, Sequence
 
-from sqlalchemy import Select, and_, func, select
+from sqlalchemy import Select, and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.database import Match
@@ -206,6 +206,146 @@ async def get_settled_predictions(
     return records
 
 
+# Incremental variant for the settlement loop. "Settled at" is
+# COALESCE(Match.updated_at, Match.match_date): sync_settled_results() stamps
+# updated_at when it writes the final score, and rows settled by historical
+# loaders (no updated_at) fall back to kickoff time. The predicate is >= so a
+# row committed in the same instant as the previous high-water mark is fetched
+# again rather than lost — IncrementalWalkForwardEvaluator.ingest() is keyed by
+# prediction id, so a re-fetched row is a no-op. A prediction log written after
+# its match settled is caught by the prediction-id high-water mark instead.
+
+
+def settled_at_expression():
+    return func.coalesce(Match.updated_at, Match.match_date)
+
+
+def _naive_utc(moment: datetime) -> datetime:
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def parse_settled_high_water_mark(mark: str | None) -> datetime | None:
+    """A stored ``settled_at`` high-water mark as naive UTC.
+
+    ``Match.updated_at`` is TIMESTAMP WITHOUT TIME ZONE; marks persisted before
+    every writer used naive UTC can carry an offset, so they are converted
+    rather than compared as-is against the column.
+    """
+
+    if not mark:
+        return None
+    return _naive_utc(datetime.fromisoformat(mark))
+
+
+def build_settled_predictions_since_query(
+    *,
+    settled_after: datetime | None = None,
+    after_prediction_id: int = 0,
+    limit: int = MAX_SETTLED_FIXTURE_LIMIT,
+) -> Select[Any]:
+    """Latest-log-per-match settled predictions newer than either high-water mark,
+    with the ids and settlement time the incremental evaluator keys on.
+    """
+
+    validated_limit = _validated_limit(limit)
+    settled_at = settled_at_expression()
+
+    latest_per_match = (
+        select(
+            MatchPredictionLog.match_id,
+            func.max(MatchPredictionLog.created_at).label("latest_created_at"),
+        )
+        .group_by(MatchPredictionLog.match_id)
+        .subquery()
+    )
+
+    statement = (
+        select(
+            MatchPredictionLog.id,
+            Match.id,
+            Match.match_date,
+            Match.home_score,
+            Match.away_score,
+            MatchPredictionLog.home_probability,
+            MatchPredictionLog.draw_probability,
+            MatchPredictionLog.away_probability,
+            settled_at.label("settled_at"),
+            Match.league_id,
+        )
+        .select_from(MatchPredictionLog)
+        .join(Match, MatchPredictionLog.match_id == Match.id)
+        .join(
+            latest_per_match,
+            and_(
+                MatchPredictionLog.match_id == latest_per_match.c.match_id,
+                MatchPredictionLog.created_at == latest_per_match.c.latest_created_at,
+            ),
+        )
+        .where(
+            func.lower(Match.status).in_(SETTLED_MATCH_STATUSES),
+            Match.home_score.is_not(None),
+            Match.away_score.is_not(None),
+        )
+    )
+
+    if settled_after is not None:
+        settled_after = _naive_utc(settled_after)
+        statement = statement.where(
+            or_(settled_at >= settled_after, MatchPredictionLog.id > after_prediction_id)
+        )
+
+    return statement.order_by(settled_at.asc(), MatchPredictionLog.id.asc()).limit(validated_limit)
+
+
+async def get_settled_predictions_since(
+    session: AsyncSession,
+    *,
+    settled_after: datetime | None = None,
+    after_prediction_id: int = 0,
+    limit: int = MAX_SETTLED_FIXTURE_LIMIT,
+) -> List[Dict[str, Any]]:
+    """get_settled_predictions() records plus ``prediction_id``, ``match_id``,
+    ``league`` and ``settled_at`` (ISO str), restricted to rows past the given
+    high-water marks. ``settled_after=None`` fetches the full history (first pass / rebuild).
+    """
+
+    result = await session.execute(
+        build_settled_predictions_since_query(
+            settled_after=settled_after,
+            after_prediction_id=after_prediction_id,
+            limit=limit,
+        )
+    )
+
+    return [settled_prediction_record(row) for row in result.all()]
+
+
+def settled_prediction_record(row: Sequence[Any]) -> Dict[str, Any]:
+    """One ``build_settled_predictions_since_query`` row as the record dict the
+    incremental consumers (walk-forward evaluator, online calibration) ingest."""
+    (
+        prediction_id, match_id, match_date, home_score, away_score,
+        home_prob, draw_prob, away_prob, settled_at, league,
+    ) = row
+    if home_score > away_score:
+        outcome = 0
+    elif home_score == away_score:
+        outcome = 1
+    else:
+        outcome = 2
+    return {
+        "prediction_id": prediction_id,
+        "match_id": match_id,
+        "league": league,
+        "date": match_date.isoformat(),
+        "outcome": outcome,
+        "probs": [home_prob, draw_prob, away_prob],
+        "settled_at": _naive_utc(settled_at).isoformat() if settled_at is not None else None,
+    }
+
+
 # ---------------------------------------------------------------------------
 # CLV computation: join logged predictions to captured closing lines
 # ---------------------------------------------------------------------------
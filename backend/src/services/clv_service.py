@@ -12,18 +12,14 @@ from typing import Any
 # inventing a second magic number in the same /model-performance response.
 _MIN_CLV_SAMPLE_SIZE = 10
 
+# Block-bootstrap resamples behind mean_clv_ci; plenty for a 95% percentile
+# interval and cheap enough for a request path.
+_CLV_BOOTSTRAP_RESAMPLES = 1_000
 
-def compute_clv_summary(records: list[dict[str, Any]]) -> dict[str, Any]:
-    """records: [{"model_probs": [h,d,a], "closing_probs": [h,d,a]}, ...] from
-    repositories.fixtures.get_clv_records(). No outcome field — CLV compares
-    model belief to market close, independent of the result.
 
-    CLV per record = model_probs[picked] - closing_probs[picked], where
-    picked = argmax(model_probs) (mirrors walk_forward_validate()'s own
-    argmax convention for `accuracy`). Sign is reported as-is — this is a
-    read-only diagnostic surface, not a verdict.
-    """
-    valid: list[tuple[list[float], list[float]]] = []
+def clv_values(records: list[dict[str, Any]]) -> list[float]:
+    """Per-record CLV for every valid record, in input (match-date) order."""
+    values: list[float] = []
     for rec in records:
         mp, cp = rec.get("model_probs"), rec.get("closing_probs")
         if not mp or not cp or len(mp) != 3 or len(cp) != 3:
@@ -32,9 +28,23 @@ def compute_clv_summary(records: list[dict[str, Any]]) -> dict[str, Any]:
             continue
         if not math.isclose(sum(mp), 1.0, abs_tol=1e-6):
             continue
-        valid.append((mp, cp))
+        picked = mp.index(max(mp))
+        values.append(mp[picked] - cp[picked])
+    return values
 
-    n = len(valid)
+
+def compute_clv_summary(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """records: [{"model_probs": [h,d,a], "closing_probs": [h,d,a]}, ...] from
+    repositories.fixtures.get_clv_records(). No outcome field — CLV compares
+    model belief to market close, independent of the result.
+
+    CLV per record = model_probs[picked] - closing_probs[picked], where
+    picked = argmax(model_probs) (mirrors walk_forward_validate()'s own
+    argmax convention for `accuracy`). Sign is reported as-is — this is a
+    read-only diagnostic surface, not a verdict.
+    """
+    values = clv_values(records)
+    n = len(values)
     if n < _MIN_CLV_SAMPLE_SIZE:
         return {
             "skipped": True,
@@ -42,11 +52,22 @@ def compute_clv_summary(records: list[dict[str, Any]]) -> dict[str, Any]:
             "n": n,
         }
 
-    clv_values = [mp[mp.index(max(mp))] - cp[mp.index(max(mp))] for mp, cp in valid]
+    # Lazy: keeps this module importable without the ML stack.
+    from ..models.evaluation.bootstrap import bootstrap_mean_intervals
+
+    # Fixed seed so the same closing lines always render the same interval.
+    interval = bootstrap_mean_intervals(
+        {"clv": values}, n_resamples=_CLV_BOOTSTRAP_RESAMPLES, seed=0
+    )["clv"]
     return {
         "skipped": False,
         "n": n,
-        "mean_clv": sum(clv_values) / n,
-        "positive_rate": sum(1 for v in clv_values if v > 0) / n,
+        "mean_clv": sum(values) / n,
+        "mean_clv_ci": {
+            "lower": interval["lower"],
+            "upper": interval["upper"],
+            "std_error": interval["std_error"],
+        },
+        "positive_rate": sum(1 for v in values if v > 0) / n,
         "computed_at": datetime.now(timezone.utc).isoformat(),
     }
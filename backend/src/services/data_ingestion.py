@@ -13,19 +13,30 @@ Integrates 7 ethical scrapers:
 
 Note: WhoScored scraper removed due to persistent 403 blocks.
 Form features now reconstructed from Soccerway results + Understat xG trends.
+
+Live polling (scores, exchange odds) fans out per poll: every due match is
+fetched concurrently, bounded by a semaphore per source, with the blocking
+scraper calls on a dedicated thread pool. Results are written back in one
+bulk statement per poll. Each match is polled on its own cadence — every tick
+while in play, progressively less often the further away kickoff is — and
+per-source lag (how late the most overdue match was served) is published to
+the metrics collector.
 """
 
 import asyncio
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import selectinload
 
 from ..core.cache import cache_manager
 from ..db.session import get_db_session
 from ..db.models import Match, Odds, MatchStats
+from ..db.odds_storage import upsert_odds_rollups
 from ..monitoring.metrics import metrics_collector
 
 # Import all 7 ethical scrapers (WhoScored removed due to 403 blocks)
@@ -41,6 +52,45 @@ from ..data.scrapers import (
 
 logger = logging.getLogger(__name__)
 
+# Per-match poll cadence by source. The first entry is the in-play interval,
+# which is also the loop tick; the rest are (seconds to kickoff, interval)
+# tiers checked in order, ``None`` meaning "any further out".
+POLL_TIERS: Dict[str, Tuple[float, Tuple[Tuple[Optional[float], float], ...]]] = {
+    "flashscore": (5.0, ((15 * 60, 30.0), (None, 60.0))),
+    "betfair_exchange": (10.0, ((2 * 3600, 30.0), (24 * 3600, 120.0), (None, 600.0))),
+}
+
+# Simultaneous in-flight fetches per source.
+SOURCE_CONCURRENCY: Dict[str, int] = {
+    "flashscore": 8,
+    "betfair_exchange": 8,
+}
+DEFAULT_SOURCE_CONCURRENCY = 4
+
+# Exchange markets refreshed per poll (most overdue first).
+MAX_ODDS_MARKETS_PER_POLL = 20
+
+
+def poll_interval(source: str, status: Optional[str], kickoff: Optional[datetime], now: datetime) -> float:
+    """Seconds until ``source`` should poll this match again."""
+    in_play, tiers = POLL_TIERS[source]
+    if status == "live" or kickoff is None:
+        return in_play
+    if kickoff.tzinfo is None:
+        kickoff = kickoff.replace(tzinfo=timezone.utc)
+    until_kickoff = (kickoff - now).total_seconds()
+    if until_kickoff <= 0:
+        return in_play
+    for bound, interval in tiers:
+        if bound is None or until_kickoff <= bound:
+            return interval
+    return tiers[-1][1]
+
+
+def _team_name(match, side: str) -> str:
+    team = getattr(match, f"{side}_team", None)
+    return team.name if team is not None else str(getattr(match, f"{side}_team_id"))
+
 
 class DataIngestionService:
     """
@@ -70,6 +120,14 @@ class DataIngestionService:
         
         self._running = False
         self._tasks: List[asyncio.Task] = []
+
+        # Fan-out state: per-source semaphores (bound to the running loop),
+        # the thread pool for blocking scraper calls, and per-match due times.
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._next_due: Dict[str, Dict[str, float]] = {}
+        self.lag_stats: Dict[str, Dict[str, Any]] = {}
         
         logger.info("DataIngestionService initialized with 7 ethical scrapers")
 
@@ -112,77 +170,190 @@ class DataIngestionService:
         await asyncio.gather(*self._tasks, return_exceptions=True)
         self._tasks.clear()
 
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
         logger.info("Data ingestion service stopped")
 
     async def _ingest_live_scores(self):
-        """Poll Flashscore for live scores every 5 seconds"""
+        """Poll Flashscore for live scores (5s tick, adaptive per match)"""
         logger.info("Starting live scores ingestion (Flashscore)")
 
         while self._running:
             try:
                 async with get_db_session() as db:
-                    # Fetch live matches
-                    now = datetime.now(timezone.utc)
-                    query = select(Match).where(
-                        Match.status.in_(["scheduled", "live"]),
-                        Match.match_date <= now + timedelta(hours=2),
-                        Match.match_date >= now - timedelta(hours=3),
-                    )
-                    result = await db.execute(query)
-                    matches = result.scalars().all()
-
-                    logger.debug(f"Checking {len(matches)} live/upcoming matches")
-
-                    # For each match, fetch latest score from Flashscore
-                    for match in matches:
-                        try:
-                            score_data = await self._fetch_flashscore_live(match)
-                            if score_data:
-                                await self._update_match_score(db, match.id, score_data)
-                        except Exception as e:
-                            logger.warning(f"Failed to fetch score for match {match.id}: {e}")
-
-                    await db.commit()
-
+                    await self._poll_live_scores(db)
             except Exception as e:
                 logger.error(f"Error in live scores ingestion: {e}", exc_info=True)
 
-            # Poll every 5 seconds
-            await asyncio.sleep(5)
+            await asyncio.sleep(POLL_TIERS["flashscore"][0])
+
+    async def _poll_live_scores(self, db: AsyncSession) -> int:
+        """One live-score poll: fan out over due matches, bulk-update scores."""
+        now = datetime.now(timezone.utc)
+        query = (
+            select(Match)
+            .options(selectinload(Match.home_team), selectinload(Match.away_team))
+            .where(
+                Match.status.in_(["scheduled", "live"]),
+                Match.match_date <= now + timedelta(hours=2),
+                Match.match_date >= now - timedelta(hours=3),
+            )
+        )
+        matches = (await db.execute(query)).scalars().all()
+        due = self._due_matches("flashscore", matches)
+        logger.debug(f"Checking {len(due)}/{len(matches)} live/upcoming matches")
+
+        results = await self._fan_out("flashscore", due, self._fetch_flashscore_live)
+        await self._bulk_update_match_scores(db, [(m.id, data) for m, data in results])
+        await db.commit()
+        return len(results)
 
     async def _ingest_live_odds(self):
-        """Poll Betfair Exchange for live odds every 10 seconds"""
+        """Poll Betfair Exchange for live odds (10s tick, adaptive per match)"""
         logger.info("Starting live odds ingestion (Betfair Exchange)")
 
         while self._running:
             try:
                 async with get_db_session() as db:
-                    # Get active markets
-                    now = datetime.now(timezone.utc)
-                    query = select(Match).where(
-                        Match.status.in_(["scheduled", "live"]),
-                        Match.match_date >= now - timedelta(hours=1),
-                        Match.match_date <= now + timedelta(days=7),
-                    )
-                    result = await db.execute(query)
-                    matches = result.scalars().all()
+                    await self._poll_live_odds(db)
+            except Exception as e:
+                logger.error(f"Error in odds ingestion: {e}", exc_info=True)
 
-                    # Fetch odds for each match from Betfair Exchange
-                    for match in matches[:20]:  # Limit to 20 concurrent markets
-                        try:
-                            odds_data = await self._fetch_betfair_exchange_odds(match)
-                            if odds_data:
-                                await self._persist_odds_snapshot(db, match.id, odds_data)
-                        except Exception as e:
-                            logger.warning(f"Failed to fetch Betfair odds for {match.id}: {e}")
+            await asyncio.sleep(POLL_TIERS["betfair_exchange"][0])
+
+    async def _poll_live_odds(self, db: AsyncSession) -> int:
+        """One exchange-odds poll: fan out over due markets, bulk-insert snapshots."""
+        now = datetime.now(timezone.utc)
+        query = (
+            select(Match)
+            .options(selectinload(Match.home_team), selectinload(Match.away_team))
+            .where(
+                Match.status.in_(["scheduled", "live"]),
+                Match.match_date >= now - timedelta(hours=1),
+                Match.match_date <= now + timedelta(days=7),
+            )
+        )
+        matches = (await db.execute(query)).scalars().all()
+        due = self._due_matches("betfair_exchange", matches, limit=MAX_ODDS_MARKETS_PER_POLL)
+
+        results = await self._fan_out("betfair_exchange", due, self._fetch_betfair_exchange_odds)
+        await self._bulk_insert_odds_snapshots(
+            db,
+            [(m.id, data) for m, data in results],
+            kickoffs={m.id: m.match_date for m, _ in results},
+        )
+        await db.commit()
+        return len(results)
 
-                    await db.commit()
+    # ==========================================================================
+    # Fan-out, scheduling and lag accounting
+    # ==========================================================================
 
-            except Exception as e:
-                logger.error(f"Error in odds ingestion: {e}", exc_info=True)
+    def _source_semaphore(self, source: str) -> asyncio.Semaphore:
+        # Semaphores belong to the loop that first waits on them; rebuild if
+        # the service is restarted under a new loop.
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphores.clear()
+            self._semaphore_loop = loop
+        semaphore = self._semaphores.get(source)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(SOURCE_CONCURRENCY.get(source, DEFAULT_SOURCE_CONCURRENCY))
+            self._semaphores[source] = semaphore
+        return semaphore
+
+    async def _run_blocking(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a synchronous scraper call on the ingestion thread pool."""
+        if self._executor is None:
+            workers = sum(SOURCE_CONCURRENCY.values()) or DEFAULT_SOURCE_CONCURRENCY
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingestion")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
+
+    def _due_matches(self, source: str, matches: Sequence, limit: Optional[int] = None) -> List:
+        """Matches whose per-source poll is due, most overdue first.
+
+        Each returned match is rescheduled by its ``poll_interval`` tier, and
+        matches no longer in the window are forgotten.
+        """
+        schedule = self._next_due.setdefault(source, {})
+        clock = time.monotonic()
+        now = datetime.now(timezone.utc)
+        live_ids = {m.id for m in matches}
+        for match_id in list(schedule):
+            if match_id not in live_ids:
+                del schedule[match_id]
+
+        due = sorted(
+            (m for m in matches if schedule.get(m.id, 0.0) <= clock),
+            key=lambda m: schedule.get(m.id, 0.0),
+        )
+        if limit is not None:
+            due = due[:limit]
+        lag = max((clock - schedule[m.id] for m in due if m.id in schedule), default=0.0)
+        for match in due:
+            schedule[match.id] = clock + poll_interval(source, match.status, match.match_date, now)
+        self._record_lag(source, lag=lag, due=len(due), tracked=len(matches))
+        return due
+
+    async def _fan_out(
+        self,
+        source: str,
+        items: Sequence,
+        fetch: Callable[[Any], Awaitable[Optional[Dict]]],
+    ) -> List[Tuple[Any, Dict]]:
+        """Fetch every item concurrently (bounded per source).
+
+        Returns ``(item, result)`` pairs for non-empty results, in input order.
+        A failing item is logged and skipped; it never cancels its siblings.
+        """
+        if not items:
+            return []
+        semaphore = self._source_semaphore(source)
+        results: List[Optional[Dict]] = [None] * len(items)
+        failures = 0
+
+        async def run(index: int, item) -> None:
+            nonlocal failures
+            async with semaphore:
+                try:
+                    results[index] = await fetch(item)
+                except Exception as e:
+                    failures += 1
+                    logger.warning(f"{source} fetch failed for {getattr(item, 'id', item)}: {e}")
+
+        started = time.monotonic()
+        async with asyncio.TaskGroup() as group:
+            for index, item in enumerate(items):
+                group.create_task(run(index, item))
+        duration = time.monotonic() - started
+
+        metrics_collector.record_timer(f"ingestion.{source}.poll_ms", duration * 1000)
+        if duration > POLL_TIERS.get(source, (float("inf"),))[0]:
+            metrics_collector.increment(f"ingestion.{source}.overruns")
+        stats = self.lag_stats.setdefault(source, {})
+        stats.update(
+            last_poll_seconds=round(duration, 3),
+            last_results=sum(r is not None for r in results),
+            last_failures=failures,
+        )
+        return [(item, result) for item, result in zip(items, results) if result]
+
+    def _record_lag(self, source: str, lag: float, due: int, tracked: int) -> None:
+        metrics_collector.set_gauge(f"ingestion.{source}.lag_seconds", round(lag, 3))
+        stats = self.lag_stats.setdefault(source, {})
+        stats.update(
+            lag_seconds=round(lag, 3),
+            due=due,
+            tracked=tracked,
+            polled_at=datetime.now(timezone.utc).isoformat(),
+        )
 
-            # Poll every 10 seconds
-            await asyncio.sleep(10)
+    def get_lag_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-source poll lag and throughput from the most recent polls."""
+        return {source: dict(stats) for source, stats in self.lag_stats.items()}
 
     async def _ingest_closing_lines(self):
         """Track Pinnacle closing lines for CLV calculation via OddsPortal"""
@@ -308,9 +479,10 @@ class DataIngestionService:
         success = False
         try:
             # Use Flashscore scraper to fetch live data
-            result = self.flashscore.fetch_data(
-                home_team=match.home_team.name if hasattr(match, 'home_team') else str(match.home_team_id),
-                away_team=match.away_team.name if hasattr(match, 'away_team') else str(match.away_team_id),
+            result = await self._run_blocking(
+                self.flashscore.fetch_data,
+                home_team=_team_name(match, "home"),
+                away_team=_team_name(match, "away"),
                 use_cache=False  # Always get fresh data for live scores
             )
             
@@ -341,9 +513,10 @@ class DataIngestionService:
         success = False
         try:
             # Use Betfair scraper to fetch exchange odds
-            odds_data = self.betfair.fetch_data(
-                home_team=match.home_team.name if hasattr(match, 'home_team') else str(match.home_team_id),
-                away_team=match.away_team.name if hasattr(match, 'away_team') else str(match.away_team_id),
+            odds_data = await self._run_blocking(
+                self.betfair.fetch_data,
+                home_team=_team_name(match, "home"),
+                away_team=_team_name(match, "away"),
                 use_cache=True
             )
 
@@ -491,35 +664,59 @@ class DataIngestionService:
         """Deprecated: Use _fetch_betfair_exchange_odds instead"""
         return None
 
-    async def _update_match_score(self, db: AsyncSession, match_id: str, score_data: Dict):
-        """Update match with live score"""
-        stmt = (
-            update(Match)
-            .where(Match.id == match_id)
-            .values(
-                home_score=score_data.get("home_score"),
-                away_score=score_data.get("away_score"),
-                status=score_data.get("status", "live"),
-            )
-        )
-        await db.execute(stmt)
-
-    async def _persist_odds_snapshot(self, db: AsyncSession, match_id: str, odds_data: Dict):
-        """Save odds snapshot to database"""
-        runners = odds_data.get("runners", [])
-        if len(runners) < 3:
+    async def _bulk_update_match_scores(
+        self,
+        db: AsyncSession,
+        updates: List[Tuple[str, Dict]],
+    ) -> None:
+        """Write a poll's live scores in one executemany UPDATE by primary key"""
+        if not updates:
             return
-
-        odds = Odds(
-            match_id=match_id,
-            bookmaker="Betfair",
-            home_win=runners[0].get("last_price_traded"),
-            draw=runners[1].get("last_price_traded") if len(runners) > 1 else None,
-            away_win=runners[2].get("last_price_traded") if len(runners) > 2 else None,
-            timestamp=datetime.now(timezone.utc),
-            market_type="MATCH_ODDS",
+        now = datetime.now(timezone.utc).replace(tzinfo=None)  # Match.updated_at is naive UTC
+        await db.execute(
+            update(Match),
+            [
+                {
+                    "id": match_id,
+                    "home_score": score_data.get("home_score"),
+                    "away_score": score_data.get("away_score"),
+                    "status": score_data.get("status", "live"),
+                    "updated_at": now,
+                }
+                for match_id, score_data in updates
+            ],
         )
-        db.add(odds)
+
+    async def _bulk_insert_odds_snapshots(
+        self,
+        db: AsyncSession,
+        snapshots: List[Tuple[str, Dict]],
+        kickoffs: Optional[Dict[str, datetime]] = None,
+    ) -> None:
+        """Save a poll's exchange odds snapshots in one multi-row INSERT
+
+        The same snapshots are folded into the opening/latest/closing rollups
+        in one upsert.
+        """
+        now = datetime.now(timezone.utc)
+        rows = []
+        for match_id, odds_data in snapshots:
+            runners = odds_data.get("runners", [])
+            if len(runners) < 3:
+                continue
+            rows.append(
+                {
+                    "match_id": match_id,
+                    "bookmaker": "Betfair",
+                    "home_win": runners[0].get("last_price_traded"),
+                    "draw": runners[1].get("last_price_traded"),
+                    "away_win": runners[2].get("last_price_traded"),
+                    "timestamp": now,
+                }
+            )
+        if rows:
+            await db.execute(insert(Odds), rows)
+            await upsert_odds_rollups(db, rows, kickoffs)
 
     async def _persist_closing_line(self, db: AsyncSession, match_id: str, closing_data: Dict):
         """Save Pinnacle closing line for CLV analysis"""
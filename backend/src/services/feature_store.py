@@ -0,0 +1,309 @@
+"""
+Live Feature Vector Store
+=========================
+
+``UpcomingMatchFeatureProjector.build_live_feature_vector`` is the most
+expensive read in the serving path: team history queries plus Elo, pi,
+Berrar, StatsBomb and Phase 8 enrichment, repeated by the board, full
+analysis, phase8 features and the monitoring baseline for the same fixture.
+
+``FeatureStore`` persists each computed vector in ``feature_vectors`` with
+its data gaps, staleness and provenance, keyed by (match, league, schema hash
+from ``feature_registry.feature_schema_hash``, as-of time). A stored vector is
+served while its *input fingerprint* still matches and it is younger than
+``settings.feature_store_max_age_seconds``. The fingerprint is one aggregate
+query over everything the projection reads that can change under it:
+
+- the fixture row itself (kickoff, status, stage, teams),
+- finished matches before kickoff for either team,
+- odds snapshots, odds_history rows and the odds rollup for the match,
+- league standings rows for either team,
+
+plus the mtimes of the rating/StatsBomb artifacts on disk. A new finished
+match, odds snapshot or standings update therefore changes the fingerprint
+and the next read recomputes; nothing else does. Time-relative metadata
+(staleness / freshness seconds) is aged by the row's age on read, and each
+(match, league, schema) keeps only its latest row.
+
+Store failures never fail the request: reads fall back to computing and
+writes happen in a savepoint of the caller's session, so they commit with it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import and_, delete, desc, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import FeatureVector, LeagueStanding, Match, Odds, OddsHistory, OddsRollup
+from ..models.feature_registry import CANONICAL_FEATURES_58
+
+logger = logging.getLogger(__name__)
+
+# Result keys rebuilt from feature_vector_full / data_gaps rather than stored
+# in provenance.
+_VECTOR_KEYS = ("features", "features_58", "data_gaps", "feature_store")
+# Provenance measured in seconds-before-compute; a stored row is older by its age.
+_AGE_RELATIVE_KEYS = ("staleness_seconds", "enrichment_staleness_seconds", "model_input_staleness_seconds")
+_AGE_RELATIVE_MAPS = ("feature_freshness_seconds",)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"not JSON serialisable: {type(value).__name__}")
+
+
+def _artifact_signature(paths: Iterable[Path]) -> List[Optional[int]]:
+    signature = []
+    for path in paths:
+        try:
+            signature.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return signature
+
+
+class FeatureStore:
+    """Persisted live feature vectors, invalidated by input fingerprint."""
+
+    def __init__(
+        self,
+        schema_hash: str,
+        artifact_paths: Iterable[Path] = (),
+        max_age_seconds: Optional[int] = None,
+        clock: Callable[[], datetime] = _now,
+    ):
+        self.schema_hash = schema_hash
+        self.artifact_paths = [Path(p) for p in artifact_paths]
+        self.max_age_seconds = (
+            settings.feature_store_max_age_seconds if max_age_seconds is None else max_age_seconds
+        )
+        self.clock = clock
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age_seconds > 0
+
+    # ------------------------------------------------------------------
+    # Fingerprint
+    # ------------------------------------------------------------------
+
+    async def input_fingerprint(self, match: Match, db: AsyncSession) -> str:
+        """Hash of every DB/disk input the projection of ``match`` depends on."""
+        teams = [match.home_team_id, match.away_team_id]
+        history = and_(
+            or_(Match.home_team_id.in_(teams), Match.away_team_id.in_(teams)),
+            Match.match_date < match.match_date,
+            Match.status == "finished",
+        )
+        aggregates = [
+            (history, (func.count(Match.id), func.max(Match.match_date), func.max(Match.updated_at))),
+            (Odds.match_id == match.id, (func.count(Odds.id), func.max(Odds.timestamp))),
+            (
+                OddsHistory.match_id == match.id,
+                (func.count(OddsHistory.id), func.max(OddsHistory.timestamp)),
+            ),
+            (OddsRollup.match_id == match.id, (func.max(OddsRollup.updated_at),)),
+            (
+                LeagueStanding.team_id.in_(teams),
+                (
+                    func.count(LeagueStanding.id),
+                    func.max(LeagueStanding.updated_at),
+                    func.sum(LeagueStanding.played),
+                    func.sum(LeagueStanding.points),
+                ),
+            ),
+        ]
+        # One round trip: every aggregate is a scalar subquery of one SELECT.
+        row = (
+            await db.execute(
+                select(
+                    *(
+                        select(column).where(condition).scalar_subquery()
+                        for condition, columns in aggregates
+                        for column in columns
+                    )
+                )
+            )
+        ).one()
+        parts = [
+            match.match_date,
+            match.status,
+            getattr(match, "competition_stage", None),
+            match.updated_at,
+            *teams,
+            *tuple(row),
+            *_artifact_signature(self.artifact_paths),
+        ]
+        text = json.dumps(parts, default=_json_default)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Read / write
+    # ------------------------------------------------------------------
+
+    async def get(
+        self,
+        match_id: str,
+        league: str,
+        fingerprint: str,
+        db: AsyncSession,
+    ) -> Optional[Dict[str, Any]]:
+        """The latest stored vector if its inputs are unchanged and it is young enough."""
+        query = (
+            select(FeatureVector)
+            .where(
+                FeatureVector.match_id == match_id,
+                FeatureVector.features_version == self.schema_hash,
+                FeatureVector.league == league,
+            )
+            .order_by(desc(FeatureVector.timestamp))
+            .limit(1)
+        )
+        row = (await db.execute(query)).scalar_one_or_none()
+        if row is None or row.input_fingerprint != fingerprint or row.timestamp is None:
+            return None
+        age = (self.clock() - row.timestamp).total_seconds()
+        if age > self.max_age_seconds:
+            return None
+        return self._decode(row, age)
+
+    async def put(
+        self,
+        match_id: str,
+        league: str,
+        fingerprint: str,
+        result: Dict[str, Any],
+        db: AsyncSession,
+    ) -> bool:
+        """Persist ``result`` in a savepoint, replacing the key's older rows.
+
+        False if it cannot be stored.
+        """
+        encoded = self._encode(result)
+        if encoded is None:
+            return False
+        vector, data_gaps, provenance = encoded
+        as_of = self.clock()
+        async with db.begin_nested():
+            await db.execute(
+                delete(FeatureVector).where(
+                    FeatureVector.match_id == match_id,
+                    FeatureVector.features_version == self.schema_hash,
+                    FeatureVector.league == league,
+                )
+            )
+            db.add(
+                FeatureVector(
+                    match_id=match_id,
+                    league=league,
+                    features_version=self.schema_hash,
+                    input_fingerprint=fingerprint,
+                    feature_vector_full=vector,
+                    data_gaps=data_gaps,
+                    provenance=provenance,
+                    timestamp=as_of,
+                    created_at=as_of,
+                )
+            )
+        return True
+
+    async def get_or_compute(
+        self,
+        match: Match,
+        league: str,
+        db: AsyncSession,
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """Serve the stored vector for ``match`` or compute, store and return it."""
+        if not self.enabled:
+            return await compute()
+        match_id = str(match.id)
+        try:
+            fingerprint = await self.input_fingerprint(match, db)
+            stored = await self.get(match_id, league, fingerprint, db)
+        except Exception as exc:
+            logger.warning("Feature store read failed for %s: %s", match_id, exc)
+            return await compute()
+        if stored is not None:
+            return stored
+
+        result = await compute()
+        try:
+            stored_ok = await self.put(match_id, league, fingerprint, result, db)
+        except Exception as exc:
+            logger.warning("Feature store write failed for %s: %s", match_id, exc)
+            stored_ok = False
+        result["feature_store"] = {
+            "hit": False,
+            "stored": stored_ok,
+            "schema_hash": self.schema_hash,
+            "as_of": self.clock().isoformat(),
+            "age_seconds": 0,
+        }
+        return result
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _encode(result: Dict[str, Any]) -> Optional[Tuple[List[float], List[str], Dict[str, Any]]]:
+        provenance = {k: v for k, v in result.items() if k not in _VECTOR_KEYS}
+        try:
+            vector = json.loads(
+                json.dumps(np.asarray(result["features"], dtype=np.float64).tolist(), allow_nan=False)
+            )
+            provenance = json.loads(json.dumps(provenance, default=_json_default, allow_nan=False))
+        except (KeyError, TypeError, ValueError) as exc:
+            # NaN/inf or an unexpected type: serve it, but don't persist it.
+            logger.debug("Feature vector not storable: %s", exc)
+            return None
+        return vector, list(result.get("data_gaps", [])), provenance
+
+    @staticmethod
+    def _aged(value: Any, age_seconds: float) -> Any:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return value  # None means "unknown", not "fresh"
+        return type(value)(value + (int(age_seconds) if isinstance(value, int) else age_seconds))
+
+    def _decode(self, row: FeatureVector, age_seconds: float) -> Dict[str, Any]:
+        features = np.asarray(row.feature_vector_full, dtype=np.float32)
+        result = dict(row.provenance or {})
+        for key in _AGE_RELATIVE_KEYS:
+            if key in result:
+                result[key] = self._aged(result[key], age_seconds)
+        for key in _AGE_RELATIVE_MAPS:
+            if isinstance(result.get(key), dict):
+                result[key] = {name: self._aged(value, age_seconds) for name, value in result[key].items()}
+        result["features"] = features
+        result["features_58"] = features[: len(CANONICAL_FEATURES_58)]
+        result["data_gaps"] = list(row.data_gaps or [])
+        result["feature_store"] = {
+            "hit": True,
+            "stored": True,
+            "schema_hash": self.schema_hash,
+            "as_of": row.timestamp.isoformat(),
+            "age_seconds": int(age_seconds),
+        }
+        return result
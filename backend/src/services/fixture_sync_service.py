@@ -7,7 +7,7 @@ swallowed so they never prevent the API from serving requests.
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -157,6 +157,9 @@ async def sync_settled_results(session: AsyncSession, *, days_back: int = 3) ->
         match.status = "finished"
         match.home_score = home_score
         match.away_score = away_score
+        # Settlement timestamp — the incremental walk-forward evaluator's
+        # high-water mark (repositories.fixtures.get_settled_predictions_since).
+        match.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
         updated += 1
 
     await session.commit()
@@ -28,6 +28,18 @@ unique token-prefix → curated alias) and **always fails closed on ambiguity**:
 "Milan" matches both "AC Milan" and "Internazionale Milano" by prefix, so it is
 refused rather than guessed. An unresolved team simply gets no history — which
 surfaces honestly as reduced evidence — never a wrong join.
+
+Streaming mode
+--------------
+The original path materialises every parsed row, then adds one ORM ``Match`` per
+row to the unit of work — fine for a season, minutes for the full multi-season
+cache on boot. ``backfill_historical_matches(..., streaming=True)`` (what boot and
+the CLI use) instead parses files lazily and works in chunks of
+``STREAM_CHUNK_SIZE`` rows: leagues and teams are created with one multi-row
+INSERT per chunk from sets loaded once up front, matches are staged into a
+temporary table (``COPY`` on asyncpg, ``executemany`` elsewhere) and merged with
+a single ``INSERT … SELECT … ON CONFLICT (id) DO NOTHING``. Memory is bounded by
+the chunk, and each chunk logs progress and throughput.
 """
 
 from __future__ import annotations
@@ -36,14 +48,15 @@ import csv
 import hashlib
 import logging
 import re
+import time
 import unicodedata
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, delete, func, insert, select, true
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 from ..utils.season import canonical_season
 
@@ -293,18 +306,21 @@ class HistoricalMatch:
         )
 
 
-def parse_fd_csv(path: Path) -> List[HistoricalMatch]:
-    """Parse one football-data.co.uk season file. Malformed rows are skipped, not fatal."""
-    stem = path.stem  # fd_E0_2425
-    parts = stem.split("_")
+def _league_meta(path: Path) -> Optional[Tuple[str, str]]:
+    """``fd_E0_2425.csv`` → (league_id, country), or None for other divisions."""
+    parts = path.stem.split("_")
     if len(parts) < 2:
-        return []
-    meta = _FD_CODE_TO_LEAGUE.get(parts[1])
+        return None
+    return _FD_CODE_TO_LEAGUE.get(parts[1])
+
+
+def iter_fd_csv(path: Path) -> Iterator[HistoricalMatch]:
+    """Lazily parse one football-data.co.uk season file. Malformed rows are skipped."""
+    meta = _league_meta(path)
     if meta is None:
-        return []
+        return
     league_id = meta[0]
 
-    out: List[HistoricalMatch] = []
     # utf-8-sig: the provider ships a BOM on the Div column.
     with path.open(encoding="utf-8-sig", newline="") as handle:
         for row in csv.DictReader(handle):
@@ -320,17 +336,19 @@ def parse_fd_csv(path: Path) -> List[HistoricalMatch]:
                 away_score = int(float(raw_away_goals))
             except (TypeError, ValueError):
                 continue
-            out.append(
-                HistoricalMatch(
-                    league_id=league_id,
-                    match_date=match_date,
-                    home_team=home,
-                    away_team=away,
-                    home_score=home_score,
-                    away_score=away_score,
-                )
+            yield HistoricalMatch(
+                league_id=league_id,
+                match_date=match_date,
+                home_team=home,
+                away_team=away,
+                home_score=home_score,
+                away_score=away_score,
             )
-    return out
+
+
+def parse_fd_csv(path: Path) -> List[HistoricalMatch]:
+    """Parse one football-data.co.uk season file. Malformed rows are skipped, not fatal."""
+    return list(iter_fd_csv(path))
 
 
 def default_cache_dir() -> Path:
@@ -349,6 +367,13 @@ class BackfillReport:
     teams_resolved: int = 0
     skipped_unparseable: int = 0
     leagues: Dict[str, int] = field(default_factory=dict)
+    mode: str = "orm"
+    chunks: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_parsed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
 
     def as_dict(self) -> Dict[str, object]:
         return {
@@ -360,6 +385,10 @@ class BackfillReport:
             "teams_resolved": self.teams_resolved,
             "skipped_unparseable": self.skipped_unparseable,
             "leagues": dict(self.leagues),
+            "mode": self.mode,
+            "chunks": self.chunks,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
         }
 
 
@@ -368,25 +397,230 @@ def _historical_team_id(team_name: str, league_id: str) -> str:
     return f"fdco-team-{league_id.lower()}-{slug or 'unknown'}"
 
 
+# Rows staged and merged per round-trip in streaming mode.
+STREAM_CHUNK_SIZE = 5_000
+
+# Dialects with INSERT … ON CONFLICT DO NOTHING … RETURNING, required by streaming.
+_STREAMING_DIALECTS = frozenset({"postgresql", "sqlite"})
+
+_STAGE_COLUMNS = (
+    "id", "league_id", "home_team_id", "away_team_id", "match_date",
+    "season", "status", "home_score", "away_score",
+)
+
+
+def _stage_table() -> Table:
+    """Session-private staging table mirroring the Match columns the backfill sets."""
+    return Table(
+        "_fdco_match_stage",
+        MetaData(),
+        Column("id", String, primary_key=True),
+        Column("league_id", String),
+        Column("home_team_id", String),
+        Column("away_team_id", String),
+        Column("match_date", DateTime),
+        Column("season", String),
+        Column("status", String),
+        Column("home_score", Integer),
+        Column("away_score", Integer),
+        prefixes=["TEMPORARY"],
+    )
+
+
+def _dialect_insert(dialect: str, table: Any):
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    return dialect_insert(table)
+
+
+async def _stage_rows(conn: AsyncConnection, stage: Table, rows: List[Dict[str, Any]]) -> None:
+    if conn.dialect.driver == "asyncpg":
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            stage.name,
+            records=[tuple(row[c] for c in _STAGE_COLUMNS) for row in rows],
+            columns=list(_STAGE_COLUMNS),
+        )
+    else:
+        await conn.execute(insert(stage), rows)
+
+
+async def _stream_backfill(
+    session: AsyncSession,
+    directory: Path,
+    chunk_size: int,
+    progress: Optional[Callable[[BackfillReport], None]],
+) -> BackfillReport:
+    from ..core.database import League, Match, Team
+
+    report = BackfillReport(mode="streaming")
+    started = time.perf_counter()
+    conn = await session.connection()
+    dialect = conn.dialect.name
+
+    paths = sorted(directory.glob("fd_*.csv"))
+    candidate_leagues = sorted({meta[0] for meta in map(_league_meta, paths) if meta})
+    known_leagues = set(
+        (await conn.execute(select(League.id).where(League.id.in_(candidate_leagues)))).scalars()
+    )
+    team_rows = (await conn.execute(select(Team.id, Team.name))).all()
+    known_teams = {team_id for team_id, _ in team_rows}
+    index = TeamIndex(team_rows)
+    team_ids: Dict[Tuple[str, str], str] = {}
+    pending_teams: Dict[str, Dict[str, Any]] = {}
+    seen_matches: set[str] = set()
+
+    stage = _stage_table()
+    await conn.run_sync(lambda sync_conn: stage.create(sync_conn, checkfirst=True))
+    await conn.execute(delete(stage))
+    merge = (
+        _dialect_insert(dialect, Match.__table__)
+        .from_select(list(_STAGE_COLUMNS), select(*stage.c).where(true()))
+        .on_conflict_do_nothing(index_elements=["id"])
+        .returning(Match.__table__.c.league_id)
+    )
+
+    def team_id_for(league_id: str, name: str) -> str:
+        key = (league_id, name)
+        resolved = team_ids.get(key)
+        if resolved is not None:
+            return resolved
+        resolved = index.resolve(name)
+        if resolved is not None:
+            report.teams_resolved += 1
+        else:
+            resolved = _historical_team_id(name, league_id)
+            if resolved not in known_teams and resolved not in pending_teams:
+                pending_teams[resolved] = {"id": resolved, "name": name, "league_id": league_id}
+            index.add(resolved, name)
+        team_ids[key] = resolved
+        return resolved
+
+    async def flush(rows: List[Dict[str, Any]]) -> None:
+        missing_leagues = {row["league_id"] for row in rows} - known_leagues
+        if missing_leagues:
+            await conn.execute(
+                insert(League),
+                [
+                    {
+                        "id": league_id,
+                        "name": league_id.replace("_", " ").title(),
+                        "country": next(
+                            (c for lid, c in _FD_CODE_TO_LEAGUE.values() if lid == league_id), None
+                        ),
+                    }
+                    for league_id in sorted(missing_leagues)
+                ],
+            )
+            known_leagues.update(missing_leagues)
+        if pending_teams:
+            await conn.execute(insert(Team), list(pending_teams.values()))
+            report.teams_created += len(pending_teams)
+            known_teams.update(pending_teams)
+            pending_teams.clear()
+
+        await _stage_rows(conn, stage, rows)
+        inserted = (await conn.execute(merge)).scalars().all()
+        await conn.execute(delete(stage))
+
+        report.matches_inserted += len(inserted)
+        report.matches_existing += len(rows) - len(inserted)
+        for league_id in inserted:
+            report.leagues[league_id] = report.leagues.get(league_id, 0) + 1
+        report.chunks += 1
+        report.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            "historical_backfill: chunk %d — %d rows parsed, %d inserted, %.0f rows/s",
+            report.chunks,
+            report.rows_parsed,
+            report.matches_inserted,
+            report.rows_per_second,
+        )
+        if progress is not None:
+            progress(report)
+
+    chunk: List[Dict[str, Any]] = []
+    try:
+        for path in paths:
+            # Only reading the CSV counts as a bad file; database errors from
+            # flush() must abort the run, not be reported as unparseable.
+            try:
+                items = list(iter_fd_csv(path))
+            except Exception:
+                logger.exception("historical_backfill: failed to parse %s", path.name)
+                report.skipped_unparseable += 1
+                continue
+            report.files_read += 1
+            for item in items:
+                report.rows_parsed += 1
+                match_id = item.match_id
+                if match_id in seen_matches:
+                    report.matches_existing += 1  # duplicate row within the CSVs
+                    continue
+                seen_matches.add(match_id)
+                chunk.append(
+                    {
+                        "id": match_id,
+                        "league_id": item.league_id,
+                        "home_team_id": team_id_for(item.league_id, item.home_team),
+                        "away_team_id": team_id_for(item.league_id, item.away_team),
+                        "match_date": item.match_date,
+                        "season": canonical_season(item.match_date),
+                        "status": "finished",
+                        "home_score": item.home_score,
+                        "away_score": item.away_score,
+                    }
+                )
+                if len(chunk) >= chunk_size:
+                    await flush(chunk)
+                    chunk = []
+        if chunk:
+            await flush(chunk)
+    except Exception:
+        await session.rollback()
+        raise
+
+    await conn.run_sync(lambda sync_conn: stage.drop(sync_conn, checkfirst=True))
+    await session.commit()
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
 async def backfill_historical_matches(
     session: AsyncSession,
     *,
     cache_dir: Optional[Path] = None,
+    streaming: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    progress: Optional[Callable[[BackfillReport], None]] = None,
 ) -> BackfillReport:
     """Upsert finished matches from every ``fd_*.csv`` in ``cache_dir``.
 
     Idempotent by construction: match ids are deterministic and existing ids are
     loaded once up front, so a partial previous run completes rather than
     duplicating. Safe to call on every boot.
+
+    ``streaming=True`` uses the chunked stage-and-merge path (see module
+    docstring), calling ``progress(report)`` after each chunk. It needs
+    PostgreSQL or SQLite; other dialects fall back to the ORM path.
     """
     from ..core.database import League, Match, Team
 
     directory = cache_dir or default_cache_dir()
     report = BackfillReport()
+    started = time.perf_counter()
     if not directory.is_dir():
         logger.warning("historical_backfill: cache dir %s not found — nothing to do", directory)
         return report
 
+    if streaming:
+        dialect = session.get_bind().dialect.name
+        if dialect in _STREAMING_DIALECTS:
+            return await _stream_backfill(session, directory, max(1, chunk_size), progress)
+        logger.warning("historical_backfill: streaming unsupported on %s — using ORM path", dialect)
+
     parsed: List[HistoricalMatch] = []
     for path in sorted(directory.glob("fd_*.csv")):
         try:
@@ -463,6 +697,7 @@ async def backfill_historical_matches(
         report.leagues[item.league_id] = report.leagues.get(item.league_id, 0) + 1
 
     await session.commit()
+    report.elapsed_seconds = time.perf_counter() - started
     return report
 
 
@@ -475,13 +710,16 @@ async def count_finished_matches(session: AsyncSession) -> int:
     return int(result.scalar() or 0)
 
 
-async def run_historical_backfill() -> Optional[BackfillReport]:
+async def run_historical_backfill(
+    cache_dir: Optional[Path] = None,
+    streaming: bool = True,
+) -> Optional[BackfillReport]:
     """Entry point for the startup background task and the CLI.
 
     Owns its own session, and swallows its own failures — history is an
     enrichment: the API must still serve (fail-closed, reduced-evidence) if this
     cannot run. Failures are recorded in metrics so they are not silent, matching
-    ``run_fixture_sync``'s convention.
+    ``run_fixture_sync``'s convention. Uses the streaming path by default.
     """
     from ..db.session import AsyncSessionLocal
     from ..monitoring.metrics import metrics_collector
@@ -492,7 +730,9 @@ async def run_historical_backfill() -> Optional[BackfillReport]:
 
     try:
         async with AsyncSessionLocal() as session:
-            report = await backfill_historical_matches(session)
+            report = await backfill_historical_matches(
+                session, cache_dir=cache_dir, streaming=streaming
+            )
     except Exception as exc:  # pragma: no cover - defensive, mirrors run_fixture_sync
         logger.exception("historical_backfill: unhandled error — continuing without history")
         metrics_collector.increment("historical_backfill.failures")
@@ -506,13 +746,15 @@ async def run_historical_backfill() -> Optional[BackfillReport]:
     if report.matches_inserted:
         logger.info(
             "historical_backfill: inserted %d matches (%d already present) from %d files; "
-            "teams resolved=%d created=%d; per-league=%s",
+            "teams resolved=%d created=%d; per-league=%s; %.1fs (%.0f rows/s)",
             report.matches_inserted,
             report.matches_existing,
             report.files_read,
             report.teams_resolved,
             report.teams_created,
             report.leagues,
+            report.elapsed_seconds,
+            report.rows_per_second,
         )
     else:
         logger.info(
@@ -0,0 +1,215 @@
+"""Per-league odds board snapshots indexed by normalized team pair.
+
+``OddsService.get_match_odds()`` used to fetch the whole league's odds on a
+per-fixture cache miss and then scan every event with bidirectional substring
+matching — a cold 20-fixture board meant up to 20 full-league fetches against
+The Odds API's paid quota. A ``LeagueOddsBoard`` is one fetch of a league,
+with each event's h2h prices extracted once and keyed by
+``(team_key(home), team_key(away))``, so every fixture on it answers in O(1).
+
+``OddsBoardRegistry`` holds one board per competition and is shared by every
+``OddsService`` instance (services are constructed per request). A board is
+fetched on demand only when none is fresh; concurrent callers share that one
+fetch (single-flight). Keeping boards fresh is the job of the scheduled
+``refresh_active()`` pass, which only re-fetches leagues somebody asked for
+recently so idle leagues stop spending quota.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+import unicodedata
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .team_identity import strip_club_affixes
+
+logger = logging.getLogger(__name__)
+
+# A board older than this is re-fetched on demand. Twice the scheduled refresh
+# cadence (api/main.py), so a live refresh loop keeps requests off this path.
+BOARD_MAX_AGE_SECONDS = 600
+
+# An empty board (provider unavailable, or an off-week) is retried sooner —
+# same 60s the old per-fixture "unavailable" cache entry used.
+EMPTY_BOARD_MAX_AGE_SECONDS = 60
+
+# Leagues not requested within this window drop out of the scheduled refresh.
+ACTIVE_WINDOW_SECONDS = 6 * 3600
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]")
+
+TeamPair = Tuple[str, str]
+FetchEvents = Callable[..., Awaitable[List[Dict[str, Any]]]]
+ExtractOdds = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+def team_key(name: str) -> str:
+    """Normalized team identity key: accents folded, club affixes stripped
+    with team_identity's rules ("Arsenal FC" -> "arsenal", "AFC Bournemouth"
+    -> "bournemouth"), then everything but [a-z0-9] removed."""
+    folded = unicodedata.normalize("NFKD", name or "").encode("ascii", "ignore").decode()
+    return _NON_ALNUM.sub("", strip_club_affixes(folded).lower())
+
+
+def _contains_either_way(a: str, b: str) -> bool:
+    return bool(a) and bool(b) and (a in b or b in a)
+
+
+@dataclass
+class LeagueOddsBoard:
+    """One fetched snapshot of a competition's h2h odds."""
+
+    competition: str
+    fetched_at: float
+    fetched_at_utc: str
+    odds_by_pair: Dict[TeamPair, Dict[str, Any]] = field(default_factory=dict)
+    # Lookup keys that only matched through the containment fallback, memoized
+    # so a fixture named differently from the board still costs one scan.
+    _aliases: Dict[TeamPair, Optional[TeamPair]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_events(
+        cls,
+        competition: str,
+        events: List[Dict[str, Any]],
+        extract: ExtractOdds,
+        fetched_at: Optional[float] = None,
+    ) -> "LeagueOddsBoard":
+        board = cls(
+            competition=competition,
+            fetched_at=time.monotonic() if fetched_at is None else fetched_at,
+            fetched_at_utc=datetime.now(timezone.utc).isoformat(),
+        )
+        for event in events:
+            pair = (team_key(event.get("home_team", "")), team_key(event.get("away_team", "")))
+            if not all(pair) or pair in board.odds_by_pair:
+                continue
+            odds = extract(event)
+            if odds:
+                board.odds_by_pair[pair] = odds
+        return board
+
+    def __len__(self) -> int:
+        return len(self.odds_by_pair)
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (time.monotonic() if now is None else now) - self.fetched_at
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        limit = BOARD_MAX_AGE_SECONDS if self.odds_by_pair else EMPTY_BOARD_MAX_AGE_SECONDS
+        return self.age(now) < limit
+
+    def lookup(self, home_team: str, away_team: str) -> Optional[Dict[str, Any]]:
+        """Odds for a fixture, or None. Returns a copy callers may mutate."""
+        pair = (team_key(home_team), team_key(away_team))
+        odds = self.odds_by_pair.get(pair)
+        if odds is None:
+            if pair not in self._aliases:
+                self._aliases[pair] = self._resolve_by_containment(pair)
+            alias = self._aliases[pair]
+            odds = self.odds_by_pair.get(alias) if alias else None
+        return dict(odds) if odds else None
+
+    def _resolve_by_containment(self, pair: TeamPair) -> Optional[TeamPair]:
+        # Containment both ways, as the per-event scan always did: the fixture
+        # side may carry a longer legal name than the board or vice versa.
+        home, away = pair
+        for board_home, board_away in self.odds_by_pair:
+            if _contains_either_way(home, board_home) and _contains_either_way(away, board_away):
+                return board_home, board_away
+        return None
+
+
+class OddsBoardRegistry:
+    """Process-wide store of league boards with single-flight fetching."""
+
+    def __init__(self) -> None:
+        self._boards: Dict[str, LeagueOddsBoard] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._last_requested: Dict[str, float] = {}
+
+    def peek(self, competition: str) -> Optional[LeagueOddsBoard]:
+        return self._boards.get(competition)
+
+    async def get(
+        self,
+        competition: str,
+        fetch: FetchEvents,
+        extract: ExtractOdds,
+    ) -> LeagueOddsBoard:
+        """Fresh board for ``competition``, fetching only if there is none."""
+        self._last_requested[competition] = time.monotonic()
+        board = self._boards.get(competition)
+        if board is not None and board.is_fresh():
+            return board
+        return await self.refresh(competition, fetch, extract)
+
+    async def refresh(
+        self,
+        competition: str,
+        fetch: FetchEvents,
+        extract: ExtractOdds,
+    ) -> LeagueOddsBoard:
+        """Fetch a new board, joining an in-flight fetch for the same league."""
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(competition)
+        if inflight is None or inflight.done() or inflight.get_loop() is not loop:
+            inflight = loop.create_task(self._build(competition, fetch, extract))
+            self._inflight[competition] = inflight
+            inflight.add_done_callback(
+                lambda task: self._inflight.pop(competition, None)
+                if self._inflight.get(competition) is task
+                else None
+            )
+        # Shielded so one cancelled caller does not cancel the fetch the other
+        # waiters are sharing.
+        return await asyncio.shield(inflight)
+
+    async def _build(
+        self,
+        competition: str,
+        fetch: FetchEvents,
+        extract: ExtractOdds,
+    ) -> LeagueOddsBoard:
+        events = await fetch(competition=competition)
+        board = LeagueOddsBoard.from_events(competition, events or [], extract)
+        self._boards[competition] = board
+        logger.info("Odds board refreshed competition=%s events=%d", competition, len(board))
+        return board
+
+    async def refresh_active(
+        self,
+        fetch: FetchEvents,
+        extract: ExtractOdds,
+    ) -> Dict[str, Any]:
+        """Scheduled pass: re-fetch recently requested leagues, drop idle ones."""
+        now = time.monotonic()
+        refreshed: List[str] = []
+        dropped: List[str] = []
+        failed: List[str] = []
+        for competition, requested_at in list(self._last_requested.items()):
+            if now - requested_at > ACTIVE_WINDOW_SECONDS:
+                self._last_requested.pop(competition, None)
+                self._boards.pop(competition, None)
+                dropped.append(competition)
+                continue
+            try:
+                await self.refresh(competition, fetch, extract)
+                refreshed.append(competition)
+            except Exception:
+                logger.exception("Odds board refresh failed competition=%s", competition)
+                failed.append(competition)
+        return {"refreshed": refreshed, "dropped": dropped, "failed": failed}
+
+    def clear(self) -> None:
+        self._boards.clear()
+        self._inflight.clear()
+        self._last_requested.clear()
+
+
+odds_board_registry = OddsBoardRegistry()
@@ -11,7 +11,9 @@ from ..core.config import settings
 from ..core.league_policy import LeaguePolicyUnavailableError, canonical_league_id
 from ..db.models import Odds
 from ..providers.base import ProviderStatus
+from ..providers.http_cache import get_provider_http_cache
 from ..providers.the_odds_api import TheOddsAPIProvider
+from .odds_board import OddsBoardRegistry, odds_board_registry
 
 logger = logging.getLogger(__name__)
 
@@ -20,12 +22,20 @@ class OddsService:
     """Fetch live odds through the canonical provider gateway."""
     DEFAULT_ODDS = {"source": "unavailable", "reason": "odds_not_verified"}
 
-    def __init__(self, cache_backend: Any = None) -> None:
+    def __init__(
+        self,
+        cache_backend: Any = None,
+        boards: Optional[OddsBoardRegistry] = None,
+    ) -> None:
         self.cache = cache_backend or cache_manager
+        # Shared across instances: services are built per request, the league
+        # boards must outlive them (services/odds_board.py).
+        self.boards = boards or odds_board_registry
         self.provider = TheOddsAPIProvider(
             api_key=settings.the_odds_api_key,
             enabled=settings.enable_the_odds_api_provider,
             live_tests=settings.provider_live_tests,
+            response_cache=get_provider_http_cache(),
         )
 
     async def close(self) -> None:
@@ -88,14 +98,6 @@ class OddsService:
         Returns:
             Dictionary with home_win, draw, away_win odds
         """
-        cache_key = f"match_odds:{league}:{home_team}:{away_team}".lower().replace(" ", "_")
-        cached = self.cache.get(cache_key)
-        if cached:
-            if isinstance(cached, dict):
-                cached.setdefault("source", "cache")
-                cached.setdefault("timestamp", datetime.now(timezone.utc).isoformat())
-            return cached
-
         try:
             competition = canonical_league_id(league)
         except LeaguePolicyUnavailableError:
@@ -107,42 +109,27 @@ class OddsService:
                 "bookmaker": None,
             }
 
-        live_odds = await self.fetch_live_odds(competition=competition)
-
-        # Find matching event
-        home_normalized = home_team.lower().replace(" ", "")
-        away_normalized = away_team.lower().replace(" ", "")
-
-        for event in live_odds:
-            event_home = event.get("home_team", "").lower().replace(" ", "")
-            event_away = event.get("away_team", "").lower().replace(" ", "")
-
-            # Containment must be checked both ways. The fixture side supplies
-            # provider legal names ("Arsenal FC" -> "arsenalfc") while the odds
-            # board uses short names ("Arsenal" -> "arsenal"), so the one-way test
-            # `home_normalized in event_home` was False for exactly the common
-            # case and no match was ever found.
-            if (
-                (home_normalized in event_home or event_home in home_normalized)
-                and (away_normalized in event_away or event_away in away_normalized)
-                and event_home
-                and event_away
-            ):
-                odds = self._extract_h2h_odds(event)
-                if odds:
-                    # Cache for 5 minutes
-                    self.cache.set(cache_key, odds, ttl=300)
-                    return odds
+        # One league fetch answers every fixture on it; see odds_board.py.
+        board = await self.boards.get(
+            competition, fetch=self.fetch_live_odds, extract=self._extract_h2h_odds
+        )
+        odds = board.lookup(home_team, away_team)
+        if odds:
+            return odds
 
         logger.warning("No verified live odds found for %s vs %s", home_team, away_team)
-        unavailable = {
+        return {
             "source": "unavailable",
             "reason": "coherent_1x2_market_snapshot_not_found",
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "bookmaker": None,
         }
-        self.cache.set(cache_key, unavailable, ttl=60)
-        return unavailable
+
+    async def refresh_odds_boards(self) -> Dict[str, Any]:
+        """Scheduled refresh of every recently requested league board."""
+        return await self.boards.refresh_active(
+            fetch=self.fetch_live_odds, extract=self._extract_h2h_odds
+        )
 
     async def store_odds_snapshot(
         self,
@@ -26,6 +26,7 @@ except ImportError:
 from ..data.transformers import FeatureTransformer
 from ..models.edge_detector import EdgeDetector
 from ..models.ensemble import SabiScoreEnsemble
+from ..models.explanation_service import get_explanation_service
 from ..monitoring.metrics import metrics_collector
 from ..schemas.prediction import MatchPredictionRequest, PredictionResponse
 from ..schemas.value_bet import ValueBetResponse
@@ -137,7 +138,7 @@ class PredictionService:
 
         bankroll = float(request.bankroll or self._default_bankroll)
         value_bets = self._detect_value_bets(match_id, probabilities, request.odds, bankroll)
-        explanations = self._generate_explanations(feature_vector, ensemble, feature_frame)
+        explanations = self._generate_explanations(feature_vector, ensemble, feature_frame, league_slug)
         processing_ms = int((time.time() - start_time) * 1000)
         metadata = self._build_metadata(league_slug, ensemble, processing_ms, feature_context)
 
@@ -290,6 +291,8 @@ class PredictionService:
             self._ensemble_cache[league_slug] = model
             self._metadata_cache[league_slug] = model.model_metadata or {}
             self._cache_access_times[league_slug] = datetime.now(timezone.utc).timestamp()
+        # Build the league's TreeExplainer with the artifact, not on first explain.
+        get_explanation_service().register_ensemble(league_slug, model)
         return model
 
     def _build_feature_frame(
@@ -643,10 +646,11 @@ class PredictionService:
         feature_vector: Dict[str, float],
         ensemble: Optional[SabiScoreEnsemble] = None,
         feature_frame: Optional[pd.DataFrame] = None,
+        league_slug: Optional[str] = None,
     ) -> Dict[str, Any]:
         if ensemble is not None and feature_frame is not None:
             try:
-                result = ensemble.explain_predictions(feature_frame)
+                result = ensemble.explain_predictions(feature_frame, league=league_slug)
                 if result:
                     return result
             except Exception as e:
@@ -0,0 +1,239 @@
+"""Materialize predictions for every upcoming fixture ahead of the first request.
+
+The board (/upcoming, value bets, team intelligence, performance) used to
+project features and run inference per fixture on request, cached for
+``fixture_cache_ttl``; the first caller after each expiry paid the full cost.
+``run_prediction_precompute_pass`` (scheduled from api/main.py) does that
+work in the background instead:
+
+1. Enumerate scheduled fixtures in the next ``prediction_precompute_days_ahead``
+   days from the ``matches`` table (fixture sync's write target).
+2. Fingerprint each one: the feature store's input fingerprint (team history,
+   odds, standings, rating artifacts), the feature schema hash and the model
+   artifact directories. Fixtures whose fingerprint matches their
+   materialized row are skipped; only the row's ``verified_at`` moves.
+3. Project features for the rest (through the feature store) and run one
+   batched inference per league (``PredictionEngine.predict_batch``).
+4. Upsert one ``materialized_predictions`` row per fixture.
+
+``get_materialized_prediction`` is the serving read: a primary-key lookup,
+returned with a freshness stamp while its last verification is younger than
+``prediction_materialized_max_age_seconds``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..core.database import Match
+from ..db.models import MaterializedPrediction
+from ..models.prediction import PredictionEngine
+from .upcoming_match_feature_service import UpcomingMatchFeatureProjector
+
+logger = logging.getLogger(__name__)
+
+# Projection keys carried into features_summary (what the board reads besides
+# the prediction itself).
+_SUMMARY_KEYS = ("data_gaps", "data_quality", "staleness_seconds", "feature_store")
+
+_last_result: Dict[str, Any] = {"outcome": "never_run"}
+
+
+def last_prediction_precompute_result() -> Dict[str, Any]:
+    """Sync accessor for /health — a copy, never the live dict."""
+    return dict(_last_result)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)  # Match.match_date is naive UTC
+
+
+def _model_signature() -> List[Optional[int]]:
+    """mtimes of the model artifact directories; a retrain or deploy changes them."""
+    signature = []
+    for directory in (settings.phase7_models_path, settings.models_path):
+        try:
+            signature.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return signature
+
+
+def _summary(features_result: Dict[str, Any]) -> Dict[str, Any]:
+    summary = {key: features_result.get(key) for key in _SUMMARY_KEYS if key in features_result}
+    return json.loads(json.dumps(summary, default=str))
+
+
+class PredictionMaterializer:
+    """One precompute pass over the upcoming window."""
+
+    def __init__(
+        self,
+        projector: Optional[UpcomingMatchFeatureProjector] = None,
+        engine: Optional[PredictionEngine] = None,
+        clock: Callable[[], datetime] = _now,
+    ):
+        self.projector = projector or UpcomingMatchFeatureProjector()
+        self.engine = engine or PredictionEngine()
+        self.clock = clock
+
+    async def fingerprint(self, match: Match, db: AsyncSession) -> str:
+        store = self.projector.feature_store
+        parts = [
+            await store.input_fingerprint(match, db),
+            store.schema_hash,
+            match.league_id,
+            *_model_signature(),
+        ]
+        return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+    async def run(self, db: AsyncSession, days_ahead: Optional[int] = None) -> Dict[str, int]:
+        from .upcoming_match_service import _select_feature_vector
+
+        now = self.clock()
+        window_end = now + timedelta(days=days_ahead or settings.prediction_precompute_days_ahead)
+        fixtures = (
+            await db.execute(
+                select(Match)
+                .where(
+                    Match.match_date >= now,
+                    Match.match_date <= window_end,
+                    Match.status == "scheduled",
+                )
+                .order_by(Match.match_date.asc())
+            )
+        ).scalars().all()
+        existing = {
+            row.match_id: row
+            for row in (
+                await db.execute(
+                    select(MaterializedPrediction).where(
+                        MaterializedPrediction.match_id.in_([str(m.id) for m in fixtures])
+                    )
+                )
+            ).scalars()
+        }
+
+        counts = {"fixtures": len(fixtures), "recomputed": 0, "unchanged": 0, "failed": 0}
+        by_league: Dict[str, List[Tuple[Match, str, Dict[str, Any]]]] = {}
+        for match in fixtures:
+            match_id = str(match.id)
+            league = str(match.league_id or "")
+            try:
+                fingerprint = await self.fingerprint(match, db)
+                current = existing.get(match_id)
+                if current is not None and current.input_fingerprint == fingerprint:
+                    current.verified_at = self.clock()
+                    counts["unchanged"] += 1
+                    continue
+                features_result = await self.projector.build_live_feature_vector(
+                    match_id=match_id, league=league, db=db
+                )
+            except Exception as exc:
+                logger.warning("prediction_precompute: projection failed for %s: %s", match_id, exc)
+                counts["failed"] += 1
+                continue
+            by_league.setdefault(league, []).append((match, fingerprint, features_result))
+
+        for league, items in by_league.items():
+            try:
+                results = await self.engine.predict_batch(
+                    [_select_feature_vector(features_result) for _, _, features_result in items],
+                    league,
+                )
+            except Exception as exc:
+                logger.warning("prediction_precompute: inference failed for %s: %s", league, exc)
+                counts["failed"] += len(items)
+                continue
+            computed_at = self.clock()
+            for (match, fingerprint, features_result), result in zip(items, results):
+                values = {
+                    "league": league,
+                    "match_date": match.match_date,
+                    "model_version": result.model_version,
+                    "feature_schema_hash": self.projector.feature_store.schema_hash,
+                    "input_fingerprint": fingerprint,
+                    "prediction": result.to_dict(),
+                    "features_summary": _summary(features_result),
+                    "computed_at": computed_at,
+                    "verified_at": computed_at,
+                }
+                row = existing.get(str(match.id))
+                if row is None:
+                    db.add(MaterializedPrediction(match_id=str(match.id), **values))
+                else:
+                    for key, value in values.items():
+                        setattr(row, key, value)
+                counts["recomputed"] += 1
+
+        await db.commit()
+        return counts
+
+
+async def get_materialized_prediction(
+    db: AsyncSession,
+    match_id: str,
+    max_age_seconds: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """Primary-key read of a fixture's materialized prediction, or None.
+
+    None when there is no row, it was last computed or verified longer ago
+    than the max age, or the read fails — callers then compute live.
+    """
+    max_age = settings.prediction_materialized_max_age_seconds if max_age_seconds is None else max_age_seconds
+    if max_age <= 0 or not match_id:
+        return None
+    try:
+        row = await db.get(MaterializedPrediction, match_id)
+    except Exception as exc:
+        logger.debug("Materialized prediction read failed for %s: %s", match_id, exc)
+        return None
+    if row is None:
+        return None
+    verified_at = row.verified_at or row.computed_at
+    age = (_now() - verified_at).total_seconds()
+    if age > max_age:
+        return None
+    return {
+        "prediction": dict(row.prediction),
+        "features_summary": dict(row.features_summary or {}),
+        "freshness": {
+            "source": "materialized",
+            "computed_at": row.computed_at.isoformat(),
+            "verified_at": verified_at.isoformat(),
+            "age_seconds": int(age),
+            "model_version": row.model_version,
+        },
+    }
+
+
+async def run_prediction_precompute_pass(days_ahead: Optional[int] = None) -> Dict[str, Any]:
+    """Never raises — every failure lands in the returned/stored dict,
+    matching run_clv_capture_pass()'s swallow-and-log convention."""
+    global _last_result
+
+    from ..db.session import AsyncSessionLocal
+
+    checked_at = datetime.now(timezone.utc).isoformat()
+
+    if AsyncSessionLocal is None:
+        _last_result = {"outcome": "db_not_ready", "checked_at": checked_at}
+        return _last_result
+
+    try:
+        async with AsyncSessionLocal() as session:
+            counts = await PredictionMaterializer().run(session, days_ahead=days_ahead)
+        _last_result = {"outcome": "ok", "checked_at": checked_at, **counts}
+    except Exception as exc:
+        logger.exception("prediction_precompute_pass: unhandled error")
+        _last_result = {"outcome": "error", "checked_at": checked_at, "message": str(exc)}
+
+    return _last_result
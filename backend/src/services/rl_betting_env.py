@@ -0,0 +1,536 @@
+"""Vectorised betting environment core for SAC training (Phase 6-C).
+
+``FootballBettingEnv`` (scripts/train_rl_agent.py) steps one bankroll per
+call and simulates each match from a ``pd.Series`` row, so SAC training spends
+most of its wall time in Python env stepping. ``BettingEnvBatch`` runs N
+independent bankrolls ("lanes") in lock-step over a NumPy label table:
+
+- match simulation (probabilities, odds, uncertainty), curriculum filtering,
+  bet resolution, the 5-component reward and the 16-dim observation are all
+  array operations over the lanes;
+- the last-20 bet history is a fixed (N, 20) ring buffer per lane instead of a
+  list of dicts;
+- lanes that terminate or reach the episode length reset in place, with the
+  final observation kept in ``BatchStep.terminal_obs`` (VecEnv auto-reset
+  semantics).
+
+Per lane, the dynamics and reward are exactly ``FootballBettingEnv.step`` /
+``_compute_reward``; only the random draws are batched. ``BettingEnvPool``
+splits the lanes over worker processes (SubprocVecEnv-style) for multi-core
+rollout collection. Both expose ``reset`` / ``step_async`` / ``step_wait``;
+the stable-baselines3 ``VecEnv`` adapter lives in the training script so this
+module needs neither gymnasium nor stable-baselines3.
+"""
+from __future__ import annotations
+
+import multiprocessing as mp
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# ---------------------------------------------------------------------------
+# Constants from rl_reward_spec (shared with scripts/train_rl_agent.py)
+# ---------------------------------------------------------------------------
+W_PNL = 0.40
+W_IC = 0.25
+W_CAL = 0.15
+W_RISK = 0.15
+W_ABS = 0.05
+
+BASE_HOME = 0.420
+BASE_DRAW = 0.246
+BASE_AWAY = 0.334
+
+IDX_HOME = 0
+IDX_DRAW = 1
+IDX_AWAY = 2
+IDX_ABSTAIN = 3
+
+CURRICULUM_PHASE1_MAX_CONF = 0.60   # episodes 0–100
+CURRICULUM_PHASE2_MAX_CONF = 0.50   # episodes 100–300
+
+INITIAL_BANKROLL = 1.0
+MAX_KELLY_CAP = 0.05
+TERMINAL_PENALTY = -10.0
+
+OBS_DIM = 16
+ACTION_DIM = 5
+HISTORY_WINDOW = 20
+
+# Matches simulated per pending lane and round while a curriculum filter is on.
+_CURRICULUM_LOOKAHEAD = 8
+
+_BASE_PROBS = np.array([BASE_HOME, BASE_DRAW, BASE_AWAY], dtype=np.float64)
+_LOG3 = np.log(3.0)
+
+
+@dataclass
+class BatchStep:
+    """One lock-step transition of every lane; arrays are indexed by lane."""
+
+    obs: np.ndarray
+    reward: np.ndarray
+    terminated: np.ndarray
+    truncated: np.ndarray
+    terminal_obs: np.ndarray  # rows are meaningful only where terminated | truncated
+    bankroll_pct: np.ndarray
+    abstain: np.ndarray
+    pnl: np.ndarray
+    wagered: np.ndarray
+    won: np.ndarray
+    components: Dict[str, np.ndarray]
+
+    @property
+    def done(self) -> np.ndarray:
+        return self.terminated | self.truncated
+
+    def info(self, lane: int) -> Dict[str, Any]:
+        """The per-lane info dict ``FootballBettingEnv.step`` returns."""
+        return {
+            "bankroll_pct": float(self.bankroll_pct[lane]),
+            "abstain": bool(self.abstain[lane]),
+            "pnl": float(self.pnl[lane]),
+            "wagered": float(self.wagered[lane]),
+            "won": bool(self.won[lane]),
+        }
+
+
+def _concat(steps: Sequence[BatchStep]) -> BatchStep:
+    values: Dict[str, Any] = {}
+    for field in fields(BatchStep):
+        parts = [getattr(step, field.name) for step in steps]
+        if field.name == "components":
+            values[field.name] = {key: np.concatenate([p[key] for p in parts]) for key in parts[0]}
+        else:
+            values[field.name] = np.concatenate(parts)
+    return BatchStep(**values)
+
+
+class BettingEnvBatch:
+    """N betting lanes stepped together; see the module docstring."""
+
+    def __init__(
+        self,
+        labels: Sequence[int],
+        n_envs: int,
+        episode_length: int = 50,
+        curriculum_phase: int = 0,
+        seed: Optional[int] = None,
+        epistemic_threshold: float = 0.15,
+        lane_offset: int = 0,
+        total_lanes: Optional[int] = None,
+    ) -> None:
+        self.labels = np.asarray(labels, dtype=np.int64)
+        if self.labels.size == 0:
+            raise ValueError("BettingEnvBatch needs at least one match")
+        self.n_envs = int(n_envs)
+        self.episode_length = episode_length
+        self.curriculum_phase = curriculum_phase
+        self.epistemic_threshold = epistemic_threshold
+        self._rng = np.random.default_rng(seed)
+
+        # Each lane walks the chronological match table from its own offset,
+        # spread evenly across every lane of the pool.
+        total = total_lanes or self.n_envs
+        lanes = lane_offset + np.arange(self.n_envs)
+        self._cursor = (lanes * len(self.labels)) // max(total, 1)
+
+        n = self.n_envs
+        self.bankroll = np.full(n, INITIAL_BANKROLL)
+        self.peak_bankroll = np.full(n, INITIAL_BANKROLL)
+        self.steps = np.zeros(n, dtype=np.int64)
+        self._hist_won = np.zeros((n, HISTORY_WINDOW))
+        self._hist_pnl = np.zeros((n, HISTORY_WINDOW))
+        self._hist_pred = np.zeros((n, HISTORY_WINDOW))
+        self._hist_total = np.zeros(n, dtype=np.int64)
+
+        self._probs = np.tile(_BASE_PROBS.astype(np.float32), (n, 1))
+        self._odds = np.tile(np.array([2.38, 4.07, 3.0], dtype=np.float32), (n, 1))
+        self._result = np.zeros(n, dtype=np.int64)
+        self._epistemic = np.zeros(n)
+        self._aleatoric = np.zeros(n)
+        self._actions: Optional[np.ndarray] = None
+
+    # ------------------------------------------------------------------
+    # Match simulation (batched _simulate_probabilities/_odds/_uncertainty)
+    # ------------------------------------------------------------------
+
+    def _simulate_probabilities(self, labels: np.ndarray) -> np.ndarray:
+        m = len(labels)
+        strength = self._rng.uniform(0.50, 0.85, size=m)
+        probs = np.tile(_BASE_PROBS, (m, 1))
+        probs[np.arange(m), labels] += strength
+        # Dirichlet(probs * 3) per row via normalised gammas.
+        gammas = self._rng.gamma(probs * 3.0)
+        probs = probs + gammas / gammas.sum(axis=1, keepdims=True) * 0.15
+        probs = np.clip(probs, 1e-4, None)
+        probs /= probs.sum(axis=1, keepdims=True)
+        return probs.astype(np.float32)
+
+    def _simulate_odds(self, probs: np.ndarray) -> np.ndarray:
+        margin = self._rng.uniform(1.04, 1.08, size=(len(probs), 1))
+        fair = np.clip(probs * margin, 0.01, 0.99)
+        fair /= fair.sum(axis=1, keepdims=True)
+        return (1.0 / fair).astype(np.float32)
+
+    def _simulate_uncertainty(self, probs: np.ndarray):
+        entropy = -np.sum(probs * np.log(probs + 1e-8), axis=1)
+        epistemic = self._rng.uniform(0.01, 0.30, size=len(probs)) * (1.0 - probs.max(axis=1))
+        return epistemic.astype(np.float64), (entropy / _LOG3).astype(np.float64)
+
+    def _min_confidence(self) -> Optional[float]:
+        if self.curriculum_phase == 0:
+            return CURRICULUM_PHASE1_MAX_CONF
+        if self.curriculum_phase == 1:
+            return CURRICULUM_PHASE2_MAX_CONF
+        return None
+
+    def _draw(self, lanes: np.ndarray) -> None:
+        """Advance ``lanes`` to their next match that passes the curriculum.
+
+        Under a confidence filter each pending lane simulates its next
+        ``_CURRICULUM_LOOKAHEAD`` matches at once and takes the first that
+        passes, instead of one rejection round per match.
+        """
+        n_matches = len(self.labels)
+        threshold = self._min_confidence()
+        width = 1 if threshold is None else _CURRICULUM_LOOKAHEAD
+        pending = lanes
+        tried = 0
+        while len(pending) and tried < n_matches:
+            span = min(width, n_matches - tried)
+            idx = (self._cursor[pending, None] + np.arange(span)) % n_matches
+            probs = self._simulate_probabilities(self.labels[idx].ravel()).reshape(len(pending), span, 3)
+            if threshold is None:
+                ok = np.ones((len(pending), span), dtype=bool)
+            else:
+                ok = probs.max(axis=2) > threshold
+            hit = ok.any(axis=1)
+            first = ok.argmax(axis=1)
+            self._cursor[pending] = (self._cursor[pending] + np.where(hit, first + 1, span)) % n_matches
+            rows = np.flatnonzero(hit)
+            self._accept(pending[rows], idx[rows, first[rows]], probs[rows, first[rows]])
+            pending = pending[~hit]
+            tried += span
+        # Nothing passed within a full sweep: relax the curriculum for these lanes.
+        if len(pending):
+            idx = self._cursor[pending] % n_matches
+            self._cursor[pending] = (idx + 1) % n_matches
+            self._accept(pending, idx, self._simulate_probabilities(self.labels[idx]))
+
+    def _accept(self, lanes: np.ndarray, idx: np.ndarray, probs: np.ndarray) -> None:
+        if len(lanes) == 0:
+            return
+        self._probs[lanes] = probs
+        self._odds[lanes] = self._simulate_odds(probs)
+        self._epistemic[lanes], self._aleatoric[lanes] = self._simulate_uncertainty(probs)
+        self._result[lanes] = self.labels[idx]
+
+    # ------------------------------------------------------------------
+    # History / observation
+    # ------------------------------------------------------------------
+
+    def _history_stats(self):
+        count = np.minimum(self._hist_total, HISTORY_WINDOW)
+        valid = np.arange(HISTORY_WINDOW)[None, :] < count[:, None]
+        denom = np.maximum(count, 1)
+        has = count > 0
+        win_rate = np.where(has, (self._hist_won * valid).sum(axis=1) / denom, 0.5)
+        ece = np.where(has, (np.abs(self._hist_pred - self._hist_won) * valid).sum(axis=1) / denom, 0.0)
+        mu = (self._hist_pnl * valid).sum(axis=1) / denom
+        var = (((self._hist_pnl - mu[:, None]) ** 2) * valid).sum(axis=1) / denom
+        sharpe = np.where(count >= 2, mu / (np.sqrt(var) + 1e-8) * np.sqrt(count), 0.0)
+        return win_rate, ece, sharpe
+
+    def _drawdown(self) -> np.ndarray:
+        bankroll_pct = self.bankroll / INITIAL_BANKROLL
+        peak_pct = np.maximum(self.peak_bankroll / INITIAL_BANKROLL, 1e-8)
+        return np.maximum(0.0, 1.0 - bankroll_pct / peak_pct)
+
+    def _observe(self) -> np.ndarray:
+        odds = self._odds.astype(np.float64)
+        mkt = 1.0 / np.clip(odds, 1.01, 100.0)
+        mkt /= mkt.sum(axis=1, keepdims=True)
+        probs = self._probs.astype(np.float64)
+        win_rate, ece, sharpe = self._history_stats()
+        obs = np.column_stack([
+            probs,
+            self._epistemic, self._aleatoric,
+            probs - mkt,
+            odds,
+            self.bankroll / INITIAL_BANKROLL, self._drawdown(),
+            sharpe, win_rate, ece,
+        ]).astype(np.float32)
+        return np.clip(obs, -5.0, 5.0)
+
+    def _reset_lanes(self, lanes: np.ndarray) -> None:
+        self.bankroll[lanes] = INITIAL_BANKROLL
+        self.peak_bankroll[lanes] = INITIAL_BANKROLL
+        self.steps[lanes] = 0
+        self._hist_total[lanes] = 0
+        self._draw(lanes)
+
+    # ------------------------------------------------------------------
+    # VecEnv-style interface
+    # ------------------------------------------------------------------
+
+    def seed(self, seed: Optional[int]) -> None:
+        self._rng = np.random.default_rng(seed)
+
+    def reset(self) -> np.ndarray:
+        self._reset_lanes(np.arange(self.n_envs))
+        return self._observe()
+
+    def step_async(self, actions: np.ndarray) -> None:
+        self._actions = np.asarray(actions, dtype=np.float64).reshape(self.n_envs, -1)
+
+    def step_wait(self) -> BatchStep:
+        actions, self._actions = self._actions, None
+        if actions is None:
+            raise RuntimeError("step_wait() called without step_async()")
+        return self._step(actions)
+
+    def step(self, actions: np.ndarray) -> BatchStep:
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close(self) -> None:
+        return None
+
+    # ------------------------------------------------------------------
+    # Transition + reward (FootballBettingEnv.step / _compute_reward)
+    # ------------------------------------------------------------------
+
+    def _step(self, actions: np.ndarray) -> BatchStep:
+        n = self.n_envs
+        rows = np.arange(n)
+        self.steps += 1
+
+        outcome_idx = np.argmax(actions[:, :4], axis=1)
+        stake_signal = actions[:, 4] if actions.shape[1] > 4 else np.zeros(n)
+        stake_fraction = np.clip(1.0 / (1.0 + np.exp(-stake_signal)) * MAX_KELLY_CAP, 0.0, MAX_KELLY_CAP)
+        abstain = outcome_idx == IDX_ABSTAIN
+        bet = ~abstain
+
+        pick = np.where(bet, outcome_idx, 0)
+        market_odds = self._odds[rows, pick].astype(np.float64)
+        pred_prob = np.where(bet, self._probs[rows, pick].astype(np.float64), 0.0)
+        won = bet & (self._result == outcome_idx)
+
+        bet_amount = stake_fraction * self.bankroll
+        wagered = np.where(bet, bet_amount, 0.0)
+        pnl = np.where(bet, np.where(won, bet_amount * (market_odds - 1.0), -bet_amount), 0.0)
+        self.bankroll = np.where(bet, np.maximum(0.0, self.bankroll + pnl), self.bankroll)
+        self.peak_bankroll = np.maximum(self.peak_bankroll, self.bankroll)
+
+        slot = self._hist_total % HISTORY_WINDOW
+        self._hist_won[rows, slot] = won
+        self._hist_pnl[rows, slot] = np.where(bet, pnl / np.maximum(self.bankroll, 1e-8), 0.0)
+        self._hist_pred[rows, slot] = pred_prob
+        self._hist_total += 1
+
+        components = self._reward_components(abstain, won, stake_fraction, market_odds, pred_prob)
+        reward = (
+            W_PNL * components["R_pnl"]
+            + W_IC * components["R_ic"]
+            + W_CAL * components["R_cal"]
+            + W_RISK * components["R_risk"]
+            + W_ABS * components["R_abs"]
+        )
+
+        bankroll_pct = self.bankroll / INITIAL_BANKROLL
+        terminated = bankroll_pct < 0.10
+        truncated = self.steps >= self.episode_length
+        reward = np.where(terminated, reward + TERMINAL_PENALTY, reward)
+
+        self._draw(rows)
+        obs = self._observe()
+        terminal_obs = obs.copy()
+        done = np.flatnonzero(terminated | truncated)
+        if len(done):
+            self._reset_lanes(done)
+            obs[done] = self._observe()[done]
+
+        return BatchStep(
+            obs=obs,
+            reward=reward,
+            terminated=terminated,
+            truncated=truncated,
+            terminal_obs=terminal_obs,
+            bankroll_pct=bankroll_pct,
+            abstain=abstain,
+            pnl=pnl,
+            wagered=wagered,
+            won=won,
+            components=components,
+        )
+
+    def _reward_components(
+        self,
+        abstain: np.ndarray,
+        won: np.ndarray,
+        stake_fraction: np.ndarray,
+        market_odds: np.ndarray,
+        pred_prob: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """Unweighted components, keyed like ``RLBettingAgent._reward_components``."""
+        # P&L — stake relative to capped Kelly, with a squared deviation penalty.
+        kelly_f = np.maximum(0.0, (pred_prob * market_odds - 1.0) / np.maximum(market_odds - 1.0, 1e-8))
+        kelly_f = np.minimum(kelly_f, MAX_KELLY_CAP)
+        sized = ~abstain & (kelly_f >= 1e-6)
+        safe_kelly = np.where(sized, kelly_f, 1.0)
+        normalized_stake = stake_fraction / safe_kelly
+        r_pnl = np.where(won, normalized_stake * (market_odds - 1.0), -normalized_stake)
+        r_pnl -= 0.50 * ((stake_fraction - kelly_f) / (kelly_f + 1e-8)) ** 2
+        r_pnl = np.where(sized, r_pnl, 0.0)
+
+        # Information coefficient of the match probabilities vs the base rates.
+        model_probs = self._probs.astype(np.float64)
+        ic_raw = np.sum(model_probs * np.log((model_probs + 1e-8) / (_BASE_PROBS + 1e-8)), axis=1)
+        r_ic = np.clip(ic_raw / _LOG3, -1.0, 1.0)
+
+        _, ece, _ = self._history_stats()
+        r_abs = np.where(abstain, np.where(self._epistemic > self.epistemic_threshold, 0.10, -0.05), 0.0)
+        return {
+            "R_pnl": r_pnl,
+            "R_ic": r_ic,
+            "R_cal": -ece,
+            "R_risk": -self._drawdown(),
+            "R_abs": r_abs,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Multi-process pool
+# ---------------------------------------------------------------------------
+
+def _pool_worker(conn, kwargs: Dict[str, Any]) -> None:
+    batch = BettingEnvBatch(**kwargs)
+    try:
+        while True:
+            command, payload = conn.recv()
+            if command == "step":
+                conn.send(batch.step(payload))
+            elif command == "reset":
+                conn.send(batch.reset())
+            elif command == "set_phase":
+                batch.curriculum_phase = payload
+            elif command == "seed":
+                batch.seed(payload)
+            elif command == "close":
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        conn.close()
+
+
+class BettingEnvPool:
+    """``BettingEnvBatch`` lanes sharded over worker processes.
+
+    ``step_async`` sends each worker its slice of the actions, so the shards
+    simulate in parallel; ``step_wait`` gathers them back in lane order.
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[int],
+        n_envs: int,
+        n_procs: int,
+        episode_length: int = 50,
+        curriculum_phase: int = 0,
+        seed: Optional[int] = None,
+        epistemic_threshold: float = 0.15,
+        start_method: Optional[str] = None,
+    ) -> None:
+        n_procs = max(1, min(int(n_procs), int(n_envs)))
+        sizes = [len(part) for part in np.array_split(np.arange(n_envs), n_procs)]
+        self.n_envs = int(n_envs)
+        self._curriculum_phase = curriculum_phase
+        self._bounds = np.cumsum([0] + sizes)
+        context = mp.get_context(start_method)
+        self._conns = []
+        self._procs = []
+        labels = np.asarray(labels, dtype=np.int64)
+        for shard, size in enumerate(sizes):
+            parent, child = context.Pipe()
+            kwargs = dict(
+                labels=labels,
+                n_envs=size,
+                episode_length=episode_length,
+                curriculum_phase=curriculum_phase,
+                seed=None if seed is None else seed + shard,
+                epistemic_threshold=epistemic_threshold,
+                lane_offset=int(self._bounds[shard]),
+                total_lanes=self.n_envs,
+            )
+            proc = context.Process(target=_pool_worker, args=(child, kwargs), daemon=True)
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+        self.closed = False
+
+    @property
+    def curriculum_phase(self) -> int:
+        return self._curriculum_phase
+
+    @curriculum_phase.setter
+    def curriculum_phase(self, phase: int) -> None:
+        self._curriculum_phase = phase
+        for conn in self._conns:
+            conn.send(("set_phase", phase))
+
+    def seed(self, seed: Optional[int]) -> None:
+        for shard, conn in enumerate(self._conns):
+            conn.send(("seed", None if seed is None else seed + shard))
+
+    def reset(self) -> np.ndarray:
+        for conn in self._conns:
+            conn.send(("reset", None))
+        return np.concatenate([conn.recv() for conn in self._conns])
+
+    def step_async(self, actions: np.ndarray) -> None:
+        actions = np.asarray(actions, dtype=np.float64).reshape(self.n_envs, -1)
+        for shard, conn in enumerate(self._conns):
+            conn.send(("step", actions[self._bounds[shard]:self._bounds[shard + 1]]))
+
+    def step_wait(self) -> BatchStep:
+        return _concat([conn.recv() for conn in self._conns])
+
+    def step(self, actions: np.ndarray) -> BatchStep:
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        for conn in self._conns:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._procs:
+            proc.join(timeout=5)
+        self.closed = True
+
+
+def make_betting_env_batch(
+    labels: Sequence[int],
+    n_envs: int,
+    n_procs: int = 1,
+    **kwargs: Any,
+):
+    """A ``BettingEnvBatch`` in-process, or a ``BettingEnvPool`` when ``n_procs > 1``."""
+    if n_procs > 1 and n_envs > 1:
+        return BettingEnvPool(labels, n_envs, n_procs, **kwargs)
+    return BettingEnvBatch(labels, n_envs, **kwargs)
+
+
+__all__: List[str] = [
+    "BatchStep",
+    "BettingEnvBatch",
+    "BettingEnvPool",
+    "make_betting_env_batch",
+]
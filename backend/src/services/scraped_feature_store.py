@@ -5,10 +5,12 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
+from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 _REPO_ROOT = Path(__file__).resolve().parents[3]
 _DEFAULT_ROOT = _REPO_ROOT / "data" / "processed" / "node-scraper"
@@ -72,36 +74,146 @@ class ScrapedTeamForm:
         }
 
 
+@dataclass(frozen=True)
+class _TeamFormIndex:
+    """Every team-form record under one root, keyed by (competition, team).
+
+    ``dated`` holds records sorted by (latest_match_date, file recency,
+    payload order reversed) so the last entry before a cutoff is the most
+    recent form, from the newest file on ties; ``dates`` is the parallel
+    bisect key. ``undated`` records cannot be checked against a cutoff and
+    are the fallback, newest file first.
+    """
+
+    signature: int
+    dated: dict[tuple[str, str], list[ScrapedTeamForm]]
+    dates: dict[tuple[str, str], list[datetime]]
+    undated: dict[tuple[str, str], list[ScrapedTeamForm]]
+
+
+# Shared by every store on the same root: projectors (and so stores) are
+# built per request, the artifacts are not.
+_INDEXES: dict[Path, _TeamFormIndex] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def _competition_of(path: Path) -> str | None:
+    # team-form-{COMP}-{SEASON}.json
+    stem = path.stem[len("team-form-"):]
+    competition, sep, _season = stem.rpartition("-")
+    return competition.upper() if sep and competition else None
+
+
 class ScrapedTeamFormStore:
+    """Cutoff-aware lookup over the scraper's ``team-form-*.json`` artifacts.
+
+    The files are parsed once into an in-memory index, rebuilt when the
+    root directory's mtime changes (the scraper adds or atomically replaces
+    files); a lookup is then a dict hit plus a bisect.
+    """
+
     def __init__(self, root: str | Path | None = None) -> None:
         configured = root or os.getenv("SCRAPER_PROCESSED_ROOT")
         self.root = Path(configured).expanduser().resolve() if configured else _DEFAULT_ROOT.resolve()
 
     def get_team_form(self, *, competition: str, team: str, information_cutoff: datetime | None = None) -> ScrapedTeamForm | None:
-        if not self.root.exists():
+        index = self._index()
+        if index is None:
             return None
-        files = sorted(self.root.glob(f"team-form-{competition.upper()}-*.json"), key=lambda path: path.stat().st_mtime, reverse=True)
-        target = _norm(team)
-        cutoff = information_cutoff
+        return self._lookup(index, (competition.upper(), _norm(team)), self._aware(information_cutoff))
+
+    def get_many(
+        self, *, competition: str, teams: Iterable[str], information_cutoff: datetime | None = None
+    ) -> dict[str, ScrapedTeamForm | None]:
+        """``get_team_form`` for many teams of one competition, keyed by the
+        team names given, against a single index snapshot."""
+        index = self._index()
+        cutoff = self._aware(information_cutoff)
+        code = competition.upper()
+        return {
+            team: self._lookup(index, (code, _norm(team)), cutoff) if index is not None else None
+            for team in teams
+        }
+
+    def refresh(self) -> None:
+        """Drop the cached index; the next lookup re-reads the files."""
+        with _INDEX_LOCK:
+            _INDEXES.pop(self.root, None)
+
+    @staticmethod
+    def _aware(cutoff: datetime | None) -> datetime | None:
         if cutoff is not None and cutoff.tzinfo is None:
-            cutoff = cutoff.replace(tzinfo=timezone.utc)
-        for path in files:
+            return cutoff.replace(tzinfo=timezone.utc)
+        return cutoff
+
+    @staticmethod
+    def _lookup(index: _TeamFormIndex, key: tuple[str, str], cutoff: datetime | None) -> ScrapedTeamForm | None:
+        dated = index.dated.get(key)
+        if dated:
+            position = len(dated) if cutoff is None else bisect_left(index.dates[key], cutoff)
+            if position:
+                return dated[position - 1]
+        undated = index.undated.get(key)
+        return undated[0] if undated else None
+
+    def _index(self) -> _TeamFormIndex | None:
+        try:
+            signature = self.root.stat().st_mtime_ns
+        except OSError:
+            return None
+        with _INDEX_LOCK:
+            index = _INDEXES.get(self.root)
+            if index is None or index.signature != signature:
+                index = self._build_index(signature)
+                _INDEXES[self.root] = index
+            return index
+
+    def _build_index(self, signature: int) -> _TeamFormIndex:
+        stamped = []
+        for path in self.root.glob("team-form-*.json"):
+            try:
+                stamped.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        # Oldest file first, so "rank" grows with recency.
+        stamped.sort(key=lambda item: item[0])
+
+        dated_entries: dict[tuple[str, str], list[tuple[tuple[datetime, int, int], ScrapedTeamForm]]] = {}
+        undated_entries: dict[tuple[str, str], list[tuple[tuple[int, int], ScrapedTeamForm]]] = {}
+        for rank, (_mtime, path) in enumerate(stamped):
+            competition = _competition_of(path)
+            if competition is None:
+                continue
             try:
                 payload = json.loads(path.read_text(encoding="utf-8"))
             except (OSError, json.JSONDecodeError):
                 continue
             if not isinstance(payload, list):
                 continue
-            for item in payload:
-                if not isinstance(item, dict) or _norm(str(item.get("team") or "")) != target:
+            for position, item in enumerate(payload):
+                if not isinstance(item, dict):
                     continue
                 record = self._parse_record(item, path)
                 if record is None:
                     continue
-                if cutoff and record.latest_match_date and record.latest_match_date >= cutoff:
-                    continue
-                return record
-        return None
+                key = (competition, _norm(record.team))
+                if record.latest_match_date is None:
+                    undated_entries.setdefault(key, []).append(((rank, -position), record))
+                else:
+                    order = (record.latest_match_date, rank, -position)
+                    dated_entries.setdefault(key, []).append((order, record))
+
+        dated: dict[tuple[str, str], list[ScrapedTeamForm]] = {}
+        dates: dict[tuple[str, str], list[datetime]] = {}
+        for key, entries in dated_entries.items():
+            entries.sort(key=lambda entry: entry[0])
+            dated[key] = [record for _order, record in entries]
+            dates[key] = [record.latest_match_date for record in dated[key]]
+        undated = {
+            key: [record for _order, record in sorted(entries, key=lambda entry: entry[0], reverse=True)]
+            for key, entries in undated_entries.items()
+        }
+        return _TeamFormIndex(signature=signature, dated=dated, dates=dates, undated=undated)
 
     @staticmethod
     def _parse_record(item: dict[str, Any], path: Path) -> ScrapedTeamForm | None:
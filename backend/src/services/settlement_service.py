@@ -5,6 +5,14 @@ get_settled_predictions() (repositories/fixtures.py) and walk_forward_validate()
 (models/model_registry.py) were both correct and unit-tested but had zero
 production callers — see docs/DEBT.md item 2. This module is that caller,
 invoked periodically from api/main.py's background task.
+
+The periodic pass is incremental: only predictions settled since the previous
+pass are fetched (get_settled_predictions_since) and scored, into a
+process-lifetime IncrementalWalkForwardEvaluator whose per-record scores are
+persisted next to the walk-forward registry, so restarts resume from the same
+high-water mark instead of rescoring the full history. The same records feed
+the per-league online calibrators, so calibration moves with each pass rather
+than on a periodic refit.
 """
 from __future__ import annotations
 
@@ -13,12 +21,16 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from ..models.evaluation.walk_forward import IncrementalWalkForwardEvaluator
     from ..models.model_registry import ModelRegistry
 
 logger = logging.getLogger(__name__)
 
 _last_result: dict[str, Any] = {"outcome": "never_run", "consecutive_failures": 0}
 _registry_instance: "ModelRegistry | None" = None
+_evaluator_instance: "IncrementalWalkForwardEvaluator | None" = None
+
+WALK_FORWARD_STATE_FILENAME = "walk_forward_state.json"
 
 
 def get_walk_forward_registry() -> "ModelRegistry":
@@ -36,15 +48,40 @@ def get_walk_forward_registry() -> "ModelRegistry":
     return _registry_instance
 
 
+def get_walk_forward_evaluator() -> "IncrementalWalkForwardEvaluator":
+    """Memoized incremental evaluator, state file beside the registry metadata."""
+    global _evaluator_instance
+    if _evaluator_instance is None:
+        from ..models.evaluation.walk_forward import IncrementalWalkForwardEvaluator
+
+        state_path = get_walk_forward_registry().registry_path / WALK_FORWARD_STATE_FILENAME
+        _evaluator_instance = IncrementalWalkForwardEvaluator(state_path=state_path)
+    return _evaluator_instance
+
+
 def last_settlement_result() -> dict[str, Any]:
     """Sync accessor for /health — a copy, never the live dict (health_check()
     is a sync function; this must never be awaited or block on I/O)."""
     return dict(_last_result)
 
 
+def _ingest_online_calibration(records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Same records into the per-league online calibrators
+    (models/online_calibrator.py). A cache outage must not fail settlement."""
+    if not records:
+        return {"leagues_updated": {}}
+    try:
+        from ..models.online_calibrator import ingest_settled_predictions
+
+        return ingest_settled_predictions(records)
+    except Exception as exc:
+        logger.warning("settlement_pass: online calibration update failed: %s", exc)
+        return {"error": str(exc)}
+
+
 async def run_settlement_pass() -> dict[str, Any]:
-    """sync_settled_results() -> get_settled_predictions() -> walk_forward_validate(),
-    against one session. Never raises — every failure lands in the returned/stored
+    """sync_settled_results() -> get_settled_predictions_since() -> incremental
+    walk-forward evaluation, against one session. Never raises — every failure lands in the returned/stored
     dict, matching the swallow-and-log convention run_fixture_sync() already uses.
     """
     global _last_result
@@ -63,21 +100,36 @@ async def run_settlement_pass() -> dict[str, Any]:
 
     try:
         from .fixture_sync_service import sync_settled_results
-        from ..repositories.fixtures import get_settled_predictions
+        from ..repositories.fixtures import (
+            get_settled_predictions_since,
+            parse_settled_high_water_mark,
+        )
 
+        evaluator = get_walk_forward_evaluator()
+        high_water_mark = evaluator.settled_high_water_mark
         async with AsyncSessionLocal() as session:
             sync_counts = await sync_settled_results(session)
-            records = await get_settled_predictions(session)
-
-        # Pure Python, no DB — deliberately outside the session block above.
-        validation = get_walk_forward_registry().walk_forward_validate(records)
+            records = await get_settled_predictions_since(
+                session,
+                settled_after=parse_settled_high_water_mark(high_water_mark),
+                after_prediction_id=evaluator.prediction_high_water_mark,
+            )
+
+        # No DB — deliberately outside the session block above.
+        new_records = evaluator.ingest(records)
+        if new_records:
+            evaluator.save()
+        validation = evaluator.evaluate()
+        online_calibration = _ingest_online_calibration(records)
 
         _last_result = {
             "outcome": "ok",
             "checked_at": checked_at,
             "sync": sync_counts,
-            "settled_predictions_total": len(records),
+            "settled_predictions_total": len(evaluator),
+            "settled_predictions_new": new_records,
             "walk_forward": validation,
+            "online_calibration": online_calibration,
             "consecutive_failures": 0,
         }
     except Exception as exc:
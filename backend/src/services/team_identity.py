@@ -25,7 +25,8 @@ from ..providers.reconciliation import TeamCandidate, reconcile_team
 _CLUB_AFFIXES = re.compile(r"^(afc|cf|1\.)\s+|\s+(fc|afc|cf|sc)$", flags=re.IGNORECASE)
 
 
-def _strip_affixes(name: str) -> str:
+def strip_club_affixes(name: str) -> str:
+    """Drop leading/trailing club affixes ("AFC", "FC", "CF", "SC", "1.")."""
     stripped = _CLUB_AFFIXES.sub("", name.strip()).strip()
     return stripped or name.strip()
 
@@ -51,9 +52,9 @@ async def resolve_team_id(name: str, db: AsyncSession) -> str | None:
         if row_name.lower() == lname:
             return row_id
 
-    normalized = _strip_affixes(name).lower()
+    normalized = strip_club_affixes(name).lower()
     for row_id, row_name in rows:
-        if _strip_affixes(row_name).lower() == normalized:
+        if strip_club_affixes(row_name).lower() == normalized:
             return row_id
 
     candidates = [TeamCandidate(team_id=row_id, name=row_name) for row_id, row_name in rows]
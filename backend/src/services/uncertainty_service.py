@@ -99,14 +99,10 @@ class UncertaintyService:
         numeric columns from feature_frame as-is.
         """
         if self._bnn_feature_cols is not None:
-            rows = []
-            for _, row in feature_frame.iterrows():
-                vec = np.array(
-                    [float(row[c]) if c in row.index else 0.0 for c in self._bnn_feature_cols],
-                    dtype=np.float32,
-                )
-                rows.append(vec)
-            X = np.stack(rows, axis=0)
+            # One column gather for the whole frame; absent columns become 0.
+            X = feature_frame.reindex(
+                columns=self._bnn_feature_cols, fill_value=0.0
+            ).to_numpy(dtype=np.float32)
         else:
             X = feature_frame.select_dtypes(include="number").to_numpy(dtype=np.float32)
         X = np.where(np.isfinite(X), X, 0.0)
@@ -51,8 +51,10 @@ from ..models.feature_registry import (
     derive_last5_form_features,
     derive_league_features,
     derive_temporal_features,
+    feature_schema_hash,
 )
 from ..utils.season import canonical_season
+from .feature_store import FeatureStore
 from .odds_service import OddsService
 from .scraped_feature_store import ScrapedTeamFormStore
 from .team_identity import resolve_team_id
@@ -160,6 +162,15 @@ class UpcomingMatchFeatureProjector:
         )
         self.odds_service = OddsService()
         self.scraped_form_store = ScrapedTeamFormStore()
+        self.feature_store = FeatureStore(
+            schema_hash=feature_schema_hash(self.canonical_features),
+            artifact_paths=(
+                settings.elo_parquet_path,
+                settings.statsbomb_cache_path,
+                settings.pi_ratings_parquet_path,
+                settings.berrar_ratings_parquet_path,
+            ),
+        )
 
     async def project_match_features(
         self,
@@ -393,11 +404,25 @@ class UpcomingMatchFeatureProjector:
         league: str,
         db: AsyncSession,
     ) -> Dict[str, Any]:
-        """Build 68-dim live feature vector with data gap and staleness metadata."""
+        """Build 68-dim live feature vector with data gap and staleness metadata.
+
+        Served from the feature store while none of the vector's inputs have
+        changed (see ``feature_store``); computed and stored otherwise.
+        """
         match = await self._get_match(match_id, db)
         if match is None:
             raise ValueError(f"Unknown match_id: {match_id}")
 
+        return await self.feature_store.get_or_compute(
+            match, league, db, lambda: self._compute_live_feature_vector(match, league, db)
+        )
+
+    async def _compute_live_feature_vector(
+        self,
+        match: Match,
+        league: str,
+        db: AsyncSession,
+    ) -> Dict[str, Any]:
         home_team = await self._get_team_name(match.home_team_id, db)
         away_team = await self._get_team_name(match.away_team_id, db)
         match_date = pd.Timestamp(match.match_date).to_pydatetime()
@@ -18,6 +18,7 @@ from ..core.portfolio_exposure import compute_portfolio_exposure
 from ..data.loaders.football_data_api import FootballDataAPIClient, FootballDataAPIError
 from ..db.models import Match, Team
 from .upcoming_match_feature_service import UpcomingMatchFeatureProjector
+from .prediction_materializer import get_materialized_prediction
 from ..models.prediction import PredictionEngine
 from .odds_service import OddsService
 
@@ -238,18 +239,33 @@ class UpcomingMatchService:
                 # calling the bare projector directly here produced near-identical
                 # feature vectors across fixtures and left staleness_seconds pinned
                 # at 0 (a key absent from the bare projector's return shape).
-                features_result = await feature_projector.build_live_feature_vector(
-                    match_id=match_id, league=match.get("league", ""), db=db
-                )
-                full_features = _select_feature_vector(features_result)
+                #
+                # A fixture the background precompute pass has materialized is a
+                # primary-key read instead (prediction_materializer.py).
+                materialized = await get_materialized_prediction(db, match_id)
+                if materialized is not None:
+                    features_result = materialized["features_summary"]
+                    predictions = materialized["prediction"]
+                    prediction_freshness = materialized["freshness"]
+                else:
+                    features_result = await feature_projector.build_live_feature_vector(
+                        match_id=match_id, league=match.get("league", ""), db=db
+                    )
+                    full_features = _select_feature_vector(features_result)
 
-                # 2. Get predictions via canonical PredictionEngine path
-                pred_result = await prediction_engine.predict(
-                    features=full_features,
-                    league=match.get("league", ""),
-                    match_id=match_id,
-                )
-                predictions = pred_result.to_dict()
+                    # 2. Get predictions via canonical PredictionEngine path
+                    pred_result = await prediction_engine.predict(
+                        features=full_features,
+                        league=match.get("league", ""),
+                        match_id=match_id,
+                    )
+                    predictions = pred_result.to_dict()
+                    prediction_freshness = {
+                        "source": "live",
+                        "computed_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+                        "age_seconds": 0,
+                        "model_version": predictions.get("model_version"),
+                    }
                 data_gaps: list = sorted(
                     set(match.get("data_gaps", []))
                     | set(features_result.get("data_gaps", []))
@@ -294,6 +310,7 @@ class UpcomingMatchService:
                 match["data_quality"] = data_quality
                 match["data_gaps"] = data_gaps
                 match["staleness_seconds"] = features_result.get("staleness_seconds", 0)
+                match["prediction_freshness"] = prediction_freshness
                 match["source"] = str(match.get("source", source))
 
                 if value_bets:
@@ -13,8 +13,9 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, List
 import numpy as np
 
+from ..core.config import settings
+from ..db.odds_storage import drop_expired_partitions, ensure_partitions
 from ..db.session import SessionLocal
-from ..models.orchestrator import ModelOrchestrator
 from ..models.prediction import Prediction
 from ..models.match import Match
 from ..services.odds import OddsService
@@ -82,110 +83,50 @@ celery_app.conf.beat_schedule = {
 @celery_app.task(name='backend.src.tasks.background.calibrate_models', bind=True)
 def calibrate_models(self):
     """
-    Live Platt calibration every 3 minutes
-    Updates Redis with new calibration parameters (platt_a, platt_b)
+    Catch-up for the per-league online calibrators (models/online_calibrator.py)
+    every 3 minutes. The settlement pass already feeds them as results land;
+    this only reads predictions settled past the persisted high-water marks,
+    so a quiet tick is one indexed query and no refit.
     """
+    from ..models.online_calibrator import OnlineCalibrationEngine, online_state_lock
+    from ..repositories.fixtures import (
+        build_settled_predictions_since_query,
+        parse_settled_high_water_mark,
+        settled_prediction_record,
+    )
+
     logger.info("🔄 Starting model calibration task")
     db = SessionLocal()
-    redis_client = redis.from_url(REDIS_URL, decode_responses=True)
-    
+
     try:
-        orchestrator = ModelOrchestrator()
-        
-        # Calibrate each league model
-        for league_key in orchestrator.models.keys():
-            logger.info(f"Calibrating {league_key.upper()} model")
-            
-            # Get predictions from last 24 hours
-            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=24)
-            
-            predictions = db.query(Prediction).join(Match).filter(
-                Prediction.league == league_key,
-                Prediction.created_at >= cutoff_time,
-                Match.home_score.isnot(None),  # Only settled matches
-                Match.away_score.isnot(None)
+        # The settlement pass writes the same state; hold the lock from load to save.
+        with online_state_lock():
+            engine = OnlineCalibrationEngine.load()
+            high_water_mark = engine.settled_high_water_mark
+            rows = db.execute(
+                build_settled_predictions_since_query(
+                    settled_after=parse_settled_high_water_mark(high_water_mark),
+                    after_prediction_id=engine.prediction_high_water_mark,
+                )
             ).all()
-            
-            if len(predictions) < 20:
-                logger.warning(f"Insufficient data for {league_key}: {len(predictions)} predictions")
-                continue
-            
-            # Extract predictions and outcomes
-            y_pred = []
-            y_true = []
-            
-            for pred in predictions:
-                match = pred.match
-                
-                # Get predicted probability for outcome
-                probs = json.loads(pred.probabilities)
-                max_prob = max(probs['home_win'], probs['draw'], probs['away_win'])
-                y_pred.append(max_prob)
-                
-                # Get actual outcome
-                if match.home_score > match.away_score:
-                    actual_outcome = 'home_win'
-                elif match.home_score == match.away_score:
-                    actual_outcome = 'draw'
-                else:
-                    actual_outcome = 'away_win'
-                
-                # Binary: 1 if prediction correct, 0 otherwise
-                predicted_outcome = max(probs, key=probs.get)
-                y_true.append(1 if predicted_outcome == actual_outcome else 0)
-            
-            # Perform Platt scaling
-            from sklearn.linear_model import LogisticRegression
-            from sklearn.preprocessing import StandardScaler
-            
-            # Reshape for sklearn
-            X = np.array(y_pred).reshape(-1, 1)
-            y = np.array(y_true)
-            
-            # Fit logistic regression
-            scaler = StandardScaler()
-            X_scaled = scaler.fit_transform(X)
-            
-            lr = LogisticRegression(random_state=42, max_iter=1000)
-            lr.fit(X_scaled, y)
-            
-            # Extract Platt parameters
-            platt_a = float(lr.coef_[0][0])
-            platt_b = float(lr.intercept_[0])
-            
-            # Calculate Brier score
-            calibrated_probs = lr.predict_proba(X_scaled)[:, 1]
-            brier_score = np.mean((calibrated_probs - y) ** 2)
-            
-            # Store in Redis
-            calibration_data = {
-                'platt_a': platt_a,
-                'platt_b': platt_b,
-                'brier_score': float(brier_score),
-                'samples_used': len(predictions),
-                'calibrated_at': datetime.now(timezone.utc).isoformat(),
-                'accuracy': float(np.mean(y)),
-                'avg_confidence': float(np.mean(y_pred))
-            }
-            
-            redis_client.setex(
-                f"calibration:{league_key}",
-                86400,  # 24 hours TTL
-                json.dumps(calibration_data)
-            )
-            
+            updated = engine.ingest(settled_prediction_record(row) for row in rows)
+            if updated:
+                engine.save(leagues=updated)
+
+        for league_key, count in updated.items():
+            state = engine.leagues[league_key]
             logger.info(
-                f"✅ {league_key.upper()}: Brier={brier_score:.4f}, "
-                f"platt_a={platt_a:.3f}, platt_b={platt_b:.3f}, "
-                f"samples={len(predictions)}"
+                f"✅ {league_key.upper()}: +{count} results, "
+                f"platt_a={state.a:.3f}, platt_b={state.b:.3f}, "
+                f"samples={state.samples_seen}"
             )
-        
-        return {"status": "success", "leagues_calibrated": len(orchestrator.models)}
-    
+
+        return {"status": "success", "leagues_calibrated": len(updated), "results_ingested": sum(updated.values())}
+
     except Exception as e:
         logger.error(f"Calibration failed: {str(e)}", exc_info=True)
         return {"status": "error", "message": str(e)}
-    
+
     finally:
         db.close()
 
@@ -414,8 +355,12 @@ def generate_value_bets(self):
 @celery_app.task(name='backend.src.tasks.background.cleanup_old_data', bind=True)
 def cleanup_old_data(self):
     """
-    Cleanup predictions and cache older than 30 days
+    Cleanup predictions and cache older than 30 days, and expire odds history
     Runs daily at 3 AM
+
+    Odds history is expired by dropping whole monthly partitions (a DELETE
+    only on unpartitioned SQLite databases); upcoming partitions are created
+    on the same run.
     """
     logger.info("🧹 Cleaning up old data")
     db = SessionLocal()
@@ -429,6 +374,10 @@ def cleanup_old_data(self):
             Prediction.created_at < cutoff_date
         ).delete()
         
+        connection = db.connection()
+        odds_expiry = drop_expired_partitions(connection, settings.odds_history_retention_days)
+        ensure_partitions(connection)
+        
         db.commit()
         
         # Clear old Redis keys
@@ -444,12 +393,15 @@ def cleanup_old_data(self):
         
         logger.info(
             f"✅ Cleanup complete: {deleted_predictions} predictions, "
+            f"{len(odds_expiry['partitions_dropped'])} odds partitions dropped, "
             f"{cleared_keys} Redis keys updated"
         )
         
         return {
             "status": "success",
             "predictions_deleted": deleted_predictions,
+            "odds_partitions_dropped": odds_expiry["partitions_dropped"],
+            "odds_rows_deleted": odds_expiry["rows_deleted"],
             "redis_keys_updated": cleared_keys
         }
     
@@ -3,6 +3,7 @@
 Coverage:
   - select_calibration_method: sample-count routing
   - fit_calibrator / apply_calibrator: isotonic, platt, temperature — output shape + normalisation
+  - CompiledCalibrator: parity with the sklearn calibrators, pickling, legacy artifacts
   - compute_ece: perfect calibration, uniform priors
   - _compute_brier_multiclass: known-value assertion
   - run_league_calibration: FittedCalibrator fields + brier tracking
@@ -37,8 +38,11 @@ if str(_BACKEND) not in sys.path:
 from src.models.calibration import (
     BivariatePoissonDrawOverlay,
     EnsembleDiversityDiagnostics,
+    CompiledCalibrator,
     FittedCalibrator,
     _compute_brier_multiclass,
+    compile_calibrator,
+    ensure_compiled,
     compare_calibration_methods,
     compute_ece,
     fit_calibrator,
@@ -183,6 +187,57 @@ class TestFitApplyCalibrator:
         assert cal > 0
 
 
+    def test_temperature_search_finds_nll_minimum(self):
+        y, p = _make_data(400)
+        t = fit_calibrator("temperature", y, p)
+        grid = np.linspace(0.1, 10.0, 2000)
+        nll = [
+            -np.mean(np.log(apply_calibrator("temperature", g, p)[np.arange(len(y)), y]))
+            for g in grid
+        ]
+        assert t == pytest.approx(grid[int(np.argmin(nll))], abs=0.01)
+
+
+# ── CompiledCalibrator ───────────────────────────────────────────────────────
+
+class TestCompiledCalibrator:
+    @pytest.mark.parametrize("method", ["isotonic", "platt", "temperature"])
+    def test_parity_with_sklearn_objects(self, method):
+        y, p = _make_data(500)
+        cal = fit_calibrator(method, y, p)
+        compiled = compile_calibrator(method, cal)
+        assert isinstance(compiled, CompiledCalibrator)
+        # Include out-of-range scores to exercise isotonic clipping.
+        _, probe = _make_data(200, seed=1)
+        probe = np.vstack([probe, [[0.999, 0.0005, 0.0005], [0.0005, 0.0005, 0.999]]])
+        np.testing.assert_allclose(
+            compiled.apply(probe), apply_calibrator(method, cal, probe), rtol=0, atol=1e-12
+        )
+        np.testing.assert_allclose(
+            apply_calibrator(method, compiled, probe), compiled.apply(probe), rtol=0, atol=0
+        )
+
+    def test_fitted_calibrator_carries_compiled_form_through_pickle(self):
+        import pickle
+
+        y, p = _make_data(300)
+        fc = run_league_calibration("epl", y[:200], p[:200], y[200:], p[200:], force_method="platt")
+        assert isinstance(fc.compiled, CompiledCalibrator)
+        restored = pickle.loads(pickle.dumps(fc))
+        np.testing.assert_allclose(restored.compiled.apply(p), fc.compiled.apply(p), atol=0)
+
+    def test_legacy_artifact_is_compiled_on_demand(self):
+        y, p = _make_data(300)
+        fc = run_league_calibration("epl", y, p, y, p, force_method="isotonic")
+        del fc.__dict__["compiled"]  # as unpickled from an older artifact
+        compiled = ensure_compiled(fc)
+        assert compiled is fc.compiled and compiled.method == "isotonic"
+
+    def test_uncompilable_input_returns_none(self):
+        assert compile_calibrator("isotonic", None) is None
+        assert compile_calibrator("platt", [MagicMock(coef_="bad")]) is None
+
+
 # ── run_league_calibration ────────────────────────────────────────────────────
 
 class TestRunLeagueCalibration:
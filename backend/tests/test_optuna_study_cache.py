@@ -0,0 +1,144 @@
+"""StudyDataCache / run_study coverage for scripts/optuna_tune_ensemble.py.
+
+Tests cover:
+  - fold indices and slices are computed once and match TimeSeriesSplit(3)
+  - native xgb.train / lgb.train folds reproduce the sklearn-wrapper models
+  - pickling the cache drops native dataset handles (process-pool safety)
+  - run_study prunes, and fans out over worker processes on journal storage
+"""
+from __future__ import annotations
+
+import importlib.util
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPT = REPO_ROOT / "scripts" / "optuna_tune_ensemble.py"
+
+optuna = pytest.importorskip("optuna")
+pytest.importorskip("lightgbm")
+pytest.importorskip("xgboost")
+
+
+@pytest.fixture(scope="module")
+def tuner():
+    spec = importlib.util.spec_from_file_location("_optuna_tune", SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["_optuna_tune"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(7)
+    X = rng.normal(size=(240, 58)).astype(np.float32)
+    y = rng.integers(0, 3, size=240)
+    return X, y
+
+
+def test_cache_folds_match_time_series_split(tuner, data):
+    from sklearn.model_selection import TimeSeriesSplit
+
+    X, y = data
+    cache = tuner.StudyDataCache(X, y)
+    assert len(cache) == tuner.CV_FOLDS
+    for i, (tr, va) in enumerate(TimeSeriesSplit(n_splits=tuner.CV_FOLDS).split(X)):
+        X_t, y_t, sw, X_v, y_v = cache.fold(i)
+        np.testing.assert_array_equal(X_t, X[tr])
+        np.testing.assert_array_equal(y_v, y[va])
+        assert sw.shape == (len(tr),)
+
+
+def test_native_datasets_built_once_and_dropped_on_pickle(tuner, data):
+    X, y = data
+    cache = tuner.StudyDataCache(X, y)
+    assert cache.lgb_dataset(0) is cache.lgb_dataset(0)
+    assert cache.xgb_dmatrices(1) is cache.xgb_dmatrices(1)
+
+    clone = pickle.loads(pickle.dumps(cache))
+    assert clone._lgb == {} and clone._xgb == {}
+    assert len(clone) == len(cache)
+
+
+def test_xgb_native_fold_matches_classifier(tuner, data):
+    from xgboost import XGBClassifier
+
+    X, y = data
+    cache = tuner.StudyDataCache(X, y, n_threads=1)
+    params = {"n_estimators": 20, "max_depth": 4, "learning_rate": 0.1, "subsample": 0.9}
+    X_t, y_t, sw, X_v, _ = cache.fold(2)
+    ref = XGBClassifier(**params, tree_method="hist", random_state=42, n_jobs=1, verbosity=0)
+    ref.fit(X_t, y_t, sample_weight=sw)
+    np.testing.assert_allclose(
+        tuner._xgb_fold(cache, params, 2), ref.predict_proba(X_v), atol=1e-5
+    )
+
+
+def test_lgbm_native_fold_matches_classifier(tuner, data):
+    from lightgbm import LGBMClassifier
+
+    X, y = data
+    cache = tuner.StudyDataCache(X, y, n_threads=1)
+    params = {"n_estimators": 20, "num_leaves": 15, "learning_rate": 0.1, "min_child_samples": 10}
+    X_t, y_t, sw, X_v, _ = cache.fold(2)
+    ref = LGBMClassifier(
+        **params, class_weight="balanced", random_state=42, n_jobs=1, verbose=-1
+    )
+    ref.fit(X_t, y_t, sample_weight=sw)
+    np.testing.assert_allclose(
+        tuner._lgbm_fold(cache, params, 2), ref.predict_proba(X_v), atol=1e-6
+    )
+
+
+def test_cached_objective_prunes_after_first_fold(tuner, data):
+    X, y = data
+    cache = tuner.StudyDataCache(X, y)
+    study = optuna.create_study(
+        pruner=optuna.pruners.ThresholdPruner(upper=0.0)
+    )
+    calls = []
+
+    def objective(trial):
+        def fit_predict(i):
+            calls.append(i)
+            return np.full((len(cache.fold(i)[4]), 3), 1.0 / 3.0)
+
+        return tuner.cached_cv_objective(trial, cache, fit_predict)
+
+    study.optimize(objective, n_trials=1)
+    assert study.trials[0].state == optuna.trial.TrialState.PRUNED
+    assert calls == [0]
+
+
+def test_run_study_requires_storage_for_parallel(tuner, data):
+    X, y = data
+    with pytest.raises(ValueError):
+        tuner.run_study("rf", X, y, 2, "epl", options=tuner.StudyOptions(n_jobs=2))
+
+
+def test_run_study_parallel_on_journal_storage(tuner, data, tmp_path):
+    X, y = data
+    options = tuner.StudyOptions(
+        pruner="median", storage=f"journal:{tmp_path / 'journal.log'}", n_jobs=2
+    )
+    study = tuner.run_study("lgbm", X, y, 4, "test", options=options)
+    assert len(study.trials) == 4
+    assert np.isfinite(study.best_value)
+
+
+def test_run_study_resumes_only_when_asked(tuner, data, tmp_path):
+    X, y = data
+    storage = f"journal:{tmp_path / 'journal.log'}"
+    tuner.run_study("lgbm", X, y, 2, "test", options=tuner.StudyOptions(storage=storage))
+    with pytest.raises(ValueError, match="--resume"):
+        tuner.run_study("lgbm", X, y, 2, "test", options=tuner.StudyOptions(storage=storage))
+
+    resumed = tuner.run_study(
+        "lgbm", X, y, 2, "test", options=tuner.StudyOptions(storage=storage, resume=True)
+    )
+    assert len(resumed.trials) == 4
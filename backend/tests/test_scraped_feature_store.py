@@ -60,3 +60,43 @@ def test_rejects_post_cutoff_and_invalid_counts(tmp_path):
         competition="EPL", team="Arsenal",
         information_cutoff=datetime(2024, 9, 1, tzinfo=timezone.utc),
     ) is None
+
+
+def _form(team, latest, ppg=1.0):
+    return {
+        "team": team, "matches_sampled": 2, "ppg": ppg, "wins": 1, "draws": 0, "losses": 1,
+        "goals_for_avg": 1.0, "goals_against_avg": 1.0, "goal_difference_avg": 0.0,
+        "latest_match_date": latest,
+    }
+
+
+def test_index_picks_latest_form_before_cutoff_and_refreshes(tmp_path):
+    (tmp_path / "team-form-EPL-2324.json").write_text(json.dumps([
+        _form("Arsenal", "20/05/2024", ppg=1.5), _form("Chelsea", "20/05/2024"),
+    ]), encoding="utf-8")
+    (tmp_path / "team-form-EPL-2425.json").write_text(json.dumps([
+        _form("Arsenal", "30/08/2024", ppg=2.0), _form("Arsenal", "30/09/2024", ppg=2.5),
+    ]), encoding="utf-8")
+    store = ScrapedTeamFormStore(tmp_path)
+
+    def ppg(cutoff):
+        record = store.get_team_form(competition="epl", team="ARSENAL", information_cutoff=cutoff)
+        return record.ppg if record else None
+
+    assert ppg(datetime(2024, 9, 1, tzinfo=timezone.utc)) == 2.0
+    assert ppg(datetime(2024, 8, 30, tzinfo=timezone.utc)) == 1.5  # same-day form is excluded
+    assert ppg(datetime(2024, 1, 1)) is None
+    assert ppg(None) == 2.5
+
+    forms = store.get_many(
+        competition="EPL", teams=["Arsenal", "Chelsea", "Spurs"],
+        information_cutoff=datetime(2024, 9, 1, tzinfo=timezone.utc),
+    )
+    assert forms["Arsenal"].ppg == 2.0 and forms["Chelsea"].ppg == 1.0 and forms["Spurs"] is None
+    assert store.get_team_form(competition="LaLiga", team="Arsenal") is None
+
+    (tmp_path / "team-form-EPL-2526.json").write_text(json.dumps([
+        _form("Spurs", "01/08/2025"),
+    ]), encoding="utf-8")
+    store.refresh()  # a same-tick write may not move the directory mtime
+    assert ScrapedTeamFormStore(tmp_path).get_team_form(competition="EPL", team="spurs") is not None
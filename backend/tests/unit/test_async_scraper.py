@@ -0,0 +1,183 @@
+"""Async scraper core: pooled client, per-host throttles, robots.txt TTL cache."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from src.data.scrapers.async_base_scraper import (
+    AsyncBaseScraper,
+    AsyncScraperSession,
+    HostThrottle,
+    RobotsCache,
+)
+
+
+class _Routes:
+    """MockTransport handler recording every request it answers."""
+
+    def __init__(self, robots: str = "User-agent: *\nDisallow: /private\n", robots_status: int = 200):
+        self.robots = robots
+        self.robots_status = robots_status
+        self.requests: List[httpx.Request] = []
+        self.page_status: Dict[str, List[int]] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path == "/robots.txt":
+            return httpx.Response(self.robots_status, text=self.robots)
+        statuses = self.page_status.get(request.url.path)
+        status = statuses.pop(0) if statuses else 200
+        return httpx.Response(status, text=f"page {request.url.path}")
+
+    def paths(self) -> List[str]:
+        return [r.url.path for r in self.requests]
+
+
+def _session(routes: _Routes) -> AsyncScraperSession:
+    return AsyncScraperSession(
+        client_factory=lambda: httpx.AsyncClient(transport=httpx.MockTransport(routes))
+    )
+
+
+class _LeagueScraper(AsyncBaseScraper):
+    def __init__(self, session: AsyncScraperSession, **kwargs: Any) -> None:
+        super().__init__("https://example.com", rate_limit_delay=0.0, session=session, **kwargs)
+
+    async def _fetch_remote_async(self, league: str) -> Any:
+        return await self.get_page_async(f"{self.base_url}/{league}")
+
+    def _fetch_remote(self, league: str) -> Any:  # sync path unused here
+        return None
+
+    def _parse_data(self, page_content: Any) -> Dict[str, Any]:
+        return {"content": page_content}
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_starts_without_blocking_loop() -> None:
+    throttle = HostThrottle(interval=0.05, max_concurrency=4)
+    starts: List[float] = []
+    ticks = 0
+
+    async def request() -> None:
+        async with throttle:
+            starts.append(time.monotonic())
+
+    async def ticker() -> None:
+        nonlocal ticks
+        for _ in range(5):
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(ticker(), *(request() for _ in range(3)))
+
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(gap >= 0.04 for gap in gaps)
+    assert ticks == 5  # the loop kept running while requests waited
+
+
+@pytest.mark.asyncio
+async def test_semaphore_bounds_in_flight_requests_per_host() -> None:
+    throttle = HostThrottle(interval=0.0, max_concurrency=2)
+    in_flight = peak = 0
+
+    async def request() -> None:
+        nonlocal in_flight, peak
+        async with throttle:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(request() for _ in range(6)))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_leagues_share_one_robots_fetch_and_cache_locally(tmp_path) -> None:
+    routes = _Routes()
+    scraper = _LeagueScraper(_session(routes))
+    scraper.local_processed_path = tmp_path / "league.json"
+
+    results = await asyncio.gather(
+        *(scraper.fetch_data_async(league, force_refresh=True) for league in ("epl", "laliga", "seriea"))
+    )
+
+    assert [r["content"] for r in results] == ["page /epl", "page /laliga", "page /seriea"]
+    assert routes.paths().count("/robots.txt") == 1
+    assert scraper.metrics["requests_success"] == 6  # three fetches, three pages
+    assert scraper.local_processed_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_robots_disallow_and_ttl_expiry() -> None:
+    routes = _Routes()
+    now = [0.0]
+    session = _session(routes)
+    session.robots = RobotsCache(ttl_seconds=10, clock=lambda: now[0])
+    scraper = _LeagueScraper(session)
+
+    assert await scraper.get_page_async("https://example.com/private/x") is None
+    assert scraper.metrics["requests_blocked_robots"] == 1
+    assert await scraper.get_page_async("https://example.com/ok") == "page /ok"
+    assert routes.paths().count("/robots.txt") == 1
+
+    now[0] = 11.0
+    await scraper.get_page_async("https://example.com/ok")
+    assert routes.paths().count("/robots.txt") == 2
+
+
+@pytest.mark.asyncio
+async def test_unreachable_robots_fails_closed_and_forbidden_disallows_all() -> None:
+    for status in (503, 403):
+        routes = _Routes(robots_status=status)
+        scraper = _LeagueScraper(_session(routes))
+        assert await scraper.get_page_async("https://example.com/ok") is None
+        assert "/ok" not in routes.paths()
+
+    routes = _Routes(robots_status=404)
+    scraper = _LeagueScraper(_session(routes))
+    assert await scraper.get_page_async("https://example.com/ok") == "page /ok"
+
+
+@pytest.mark.asyncio
+async def test_retries_then_breaker_opens_and_stale_cache_is_served(tmp_path, monkeypatch) -> None:
+    async def no_sleep(_: float) -> None:
+        return None
+
+    routes = _Routes()
+    routes.page_status["/flaky"] = [503, 200]
+    scraper = _LeagueScraper(_session(routes), max_retries=2)
+    scraper.local_processed_path = tmp_path / "league.json"
+    scraper.local_processed_path.write_text('{"stale": true}')
+    monkeypatch.setattr("src.data.scrapers.async_base_scraper.asyncio.sleep", no_sleep)
+
+    assert await scraper.get_page_async("https://example.com/flaky") == "page /flaky"
+    assert scraper.metrics["retries_total"] == 1
+
+    routes.page_status["/down"] = [500] * 100
+    for _ in range(scraper.circuit_breaker.failure_threshold):
+        assert await scraper.fetch_data_async("down", force_refresh=True) == {"stale": True}
+    assert scraper.circuit_breaker.state == "open"
+
+    sent = len(routes.requests)
+    assert await scraper.fetch_data_async("down", force_refresh=True) == {"stale": True}
+    assert len(routes.requests) == sent  # open breaker: no request
+
+
+@pytest.mark.asyncio
+async def test_sync_only_scraper_runs_on_worker_thread() -> None:
+    class _SyncScraper(AsyncBaseScraper):
+        def _fetch_remote(self, league: str) -> str:
+            return f"sync {league}"
+
+        def _parse_data(self, page_content: str) -> str:
+            return page_content
+
+    scraper = _SyncScraper("https://example.com", rate_limit_delay=0.0, session=_session(_Routes()))
+    assert await scraper.fetch_data_async("epl", use_cache=False) == "sync epl"
@@ -0,0 +1,128 @@
+"""Vectorised backtest: stacked strategies against a per-match reference loop."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from src.core.league_policy import get_league_policy
+from src.models.evaluation.backtest import (
+    StrategyGrid,
+    backtest,
+    evaluate_stakes,
+    max_drawdown,
+    policy_kelly_caps,
+    rolling_sharpe,
+)
+
+
+def _market(n: int = 400, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    probs = rng.dirichlet([3.0, 2.0, 2.0], size=n)
+    odds = 1.0 / (rng.dirichlet([3.0, 2.0, 2.0], size=n) * 1.05)
+    odds[rng.uniform(size=n) < 0.05, 1] = np.nan  # some missing draw prices
+    outcomes = rng.integers(0, 3, size=n)
+    return probs, odds, outcomes
+
+
+def _reference(probs, odds, outcomes, min_edge, kelly_fraction, kelly_cap, flat_stake):
+    """The per-match loop the module replaces."""
+    pnl, staked, bets, unit = 0.0, 0.0, 0, []
+    for i in range(len(outcomes)):
+        pick = int(np.argmax(probs[i]))
+        price = odds[i, pick]
+        if not np.isfinite(price) or price <= 1.0:
+            continue
+        p = probs[i, pick]
+        if p - 1.0 / price <= min_edge:
+            continue
+        if kelly_fraction > 0:
+            stake = min(max(kelly_fraction * (p * price - 1.0) / (price - 1.0), 0.0), kelly_cap)
+        else:
+            stake = flat_stake
+        if stake <= 0:
+            continue
+        result = stake * (price - 1.0) if outcomes[i] == pick else -stake
+        pnl += result
+        staked += stake
+        bets += 1
+        unit.append(result / stake)
+    return pnl, staked, bets, unit
+
+
+def _loop_sharpe(series, window=30):
+    if len(series) < window:
+        if len(series) < 2:
+            return 0.0
+        std = float(np.std(series, ddof=1))
+        return float(np.mean(series) / std * math.sqrt(len(series))) if std > 0 else 0.0
+    values = []
+    for i in range(window - 1, len(series)):
+        chunk = np.asarray(series[i - window + 1 : i + 1])
+        std = float(np.std(chunk, ddof=1))
+        values.append(float(np.mean(chunk) / std * math.sqrt(window)) if std > 0 else 0.0)
+    return float(np.mean(values))
+
+
+def test_stacked_grid_matches_per_strategy_loop() -> None:
+    probs, odds, outcomes = _market()
+    grid = StrategyGrid.product(
+        min_edge=[-np.inf, 0.0, 0.02, 0.05], kelly_fraction=[0.0, 0.25, 1.0], kelly_cap=[0.02, 0.1],
+    )
+    result = backtest(probs, odds, outcomes, grid)
+
+    assert len(grid) == 24 and result.pnl_curve.shape == (24, len(outcomes))
+    for i in range(len(grid)):
+        pnl, staked, bets, unit = _reference(probs, odds, outcomes, **grid.params(i))
+        assert result.pnl[i] == pytest.approx(pnl, abs=1e-9)
+        assert result.staked[i] == pytest.approx(staked, abs=1e-9)
+        assert result.n_bets[i] == bets
+        assert result.rolling_sharpe[i] == pytest.approx(_loop_sharpe(unit), abs=1e-7)
+        assert result.pnl_curve[i, -1] == pytest.approx(pnl, abs=1e-9)
+
+
+@pytest.mark.parametrize("length", [0, 1, 7, 30, 31, 120])
+def test_rolling_sharpe_matches_loop_for_ragged_rows(length: int) -> None:
+    rng = np.random.default_rng(length)
+    series = rng.normal(0.05, 1.0, size=length)
+    padded = np.concatenate([series, rng.normal(size=10)])[None, :]
+    assert rolling_sharpe(padded, np.array([length]))[0] == pytest.approx(_loop_sharpe(list(series)), abs=1e-9)
+    # Constant returns have zero variance, not a huge ratio from rounding.
+    assert rolling_sharpe(np.full((1, 40), 0.9), np.array([40]))[0] == 0.0
+
+
+def test_drawdown_clv_abstention_and_groups() -> None:
+    assert max_drawdown(np.array([[-0.5, 0.0, 1.0, 0.25]]))[0] == pytest.approx(0.5)
+
+    odds = np.array([[2.0, 3.5, 4.0], [2.5, 3.2, 3.0], [1.8, 3.6, 5.0]])
+    result = evaluate_stakes(
+        [1.0, 0.0, 2.0], [0, 0, 2], odds, np.array([0, 1, 1]),
+        closing_odds=odds * np.array([[0.9], [1.0], [1.25]]),
+        groups=["epl", "ded", "ded"],
+    )
+    summary = result.summary()
+    assert summary.pop("group_roi") == {"ded": -1.0, "epl": 1.0}
+    assert summary == pytest.approx({
+        "n_matches": 3, "n_bets": 2, "n_abstained": 1, "staked": 3.0, "pnl": -1.0,
+        "roi": -1.0 / 3.0, "max_drawdown": 1.0, "rolling_sharpe": 0.0,
+        "clv": ((2.0 / 1.8 - 1.0) + (5.0 / 6.25 - 1.0)) / 2, "abstention_rate": 1.0 / 3.0,
+    })
+
+    probs = np.tile([0.6, 0.2, 0.2], (3, 1))
+    abstained = backtest(probs, odds, np.zeros(3, dtype=int), abstain=np.array([True, False, False]))
+    assert abstained.n_bets[0] == 2
+
+
+def test_policy_caps_bound_kelly_stakes_and_block_unknown_leagues() -> None:
+    caps = policy_kelly_caps(["EPL", "premier_league", "no_such_league"])
+    assert caps[0] == caps[1] == get_league_policy("EPL").kelly_cap
+    assert caps[2] == 0.0
+
+    probs = np.tile([0.9, 0.05, 0.05], (3, 1))
+    odds = np.tile([2.0, 10.0, 10.0], (3, 1))
+    result = backtest(
+        probs, odds, np.zeros(3, dtype=int), StrategyGrid.build(kelly_fraction=1.0), match_kelly_cap=caps,
+    )
+    np.testing.assert_allclose(result.stakes[0], caps)
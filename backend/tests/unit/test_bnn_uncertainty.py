@@ -0,0 +1,67 @@
+"""Fast paths in the BNN uncertainty stack (torch-gated).
+
+Pins the closed-form Dirichlet credible interval to the sampling definition it
+replaced, the tiled MC-dropout pass to the UncertaintyOutput contract, and the
+vectorized UncertaintyService._build_input_tensor to the old row-wise gather.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from src.models.bnn_ensemble_impl import (  # noqa: E402
+    BNNEnsembleMember,
+    MCDropoutBNN,
+    dirichlet_credible_interval,
+)
+from src.services.uncertainty_service import UncertaintyService  # noqa: E402
+
+
+def test_analytic_interval_matches_dirichlet_sample_quantiles() -> None:
+    alpha = torch.tensor([[2.0, 1.5, 3.0], [20.0, 8.0, 12.0]])
+
+    lower, upper = dirichlet_credible_interval(alpha)
+
+    torch.manual_seed(0)
+    samples = torch.distributions.Dirichlet(alpha).sample((100_000,))
+    assert torch.allclose(lower, samples.quantile(0.025, dim=0), atol=5e-3)
+    assert torch.allclose(upper, samples.quantile(0.975, dim=0), atol=5e-3)
+
+
+def test_edl_predict_uncertainty_contract() -> None:
+    model = BNNEnsembleMember(in_features=8, hidden=16)
+    outputs = model.predict_uncertainty(torch.randn(4, 8))
+
+    assert len(outputs) == 4
+    for out in outputs:
+        probs = [out.home_prob, out.draw_prob, out.away_prob]
+        assert sum(probs) == pytest.approx(1.0, abs=1e-5)
+        assert out.total == pytest.approx(out.epistemic + out.aleatoric)
+        for lo, p, hi in zip(out.ci_lower, probs, out.ci_upper):
+            assert 0.0 <= lo <= p <= hi <= 1.0
+
+
+def test_mc_dropout_tiled_pass_keeps_contract() -> None:
+    model = MCDropoutBNN(in_features=8, hidden=16)
+    x = torch.randn(3, 8)
+
+    outputs = model.predict_uncertainty_mc(x, T=25)
+
+    assert len(outputs) == 3
+    assert all(out.concentration == 0.0 for out in outputs)
+    assert all(out.epistemic > 0.0 for out in outputs)  # masks differ across T
+    assert model.get_meta_features(x, T=5).shape == (3, 6)
+
+
+def test_build_input_tensor_matches_rowwise_gather() -> None:
+    svc = UncertaintyService.__new__(UncertaintyService)
+    svc._bnn_feature_cols = ["b", "missing", "a"]
+    frame = pd.DataFrame({"a": [1.0, np.inf], "b": [np.nan, 2.0], "extra": [9.0, 9.0]})
+
+    X = svc._build_input_tensor(frame)
+
+    expected = np.array([[0.0, 0.0, 1.0], [2.0, 0.0, 0.0]], dtype=np.float32)
+    np.testing.assert_array_equal(X.numpy(), expected)
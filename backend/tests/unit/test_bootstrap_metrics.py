@@ -0,0 +1,129 @@
+"""Moving-block bootstrap intervals in models/evaluation/bootstrap.py."""
+from __future__ import annotations
+
+import os
+
+os.environ["ALLOW_SQLITE_FALLBACK"] = "true"
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+os.environ["REDIS_ENABLED"] = "false"
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src.models.evaluation import bootstrap
+from src.models.evaluation.bootstrap import (
+    bootstrap_mean_distribution,
+    bootstrap_metric_intervals,
+    moving_block_indices,
+    paired_bootstrap_difference,
+)
+from src.models.model_registry import ModelRegistry
+
+
+def _records(n: int, seed: int = 0, with_odds: bool = False) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    start = date(2024, 8, 1)
+    records = []
+    for i in range(n):
+        probs = rng.dirichlet([3.0, 2.0, 2.0])
+        rec = {
+            "date": (start + timedelta(days=i)).isoformat(),
+            "outcome": int(rng.choice(3, p=probs)),
+            "probs": probs.tolist(),
+        }
+        if with_odds:
+            rec["odds"] = (1.05 / probs).tolist()
+        records.append(rec)
+    return records
+
+
+def test_block_indices_are_contiguous_runs_within_range() -> None:
+    indices = moving_block_indices(50, 200, 5, np.random.default_rng(1))
+
+    assert indices.shape == (200, 50)
+    assert indices.min() >= 0 and indices.max() <= 49
+    # Each block of 5 is a run of consecutive indices.
+    blocks = indices.reshape(200, 10, 5)
+    assert (np.diff(blocks, axis=2) == 1).all()
+
+
+def test_same_seed_is_reproducible_and_chunking_does_not_change_result(monkeypatch) -> None:
+    values = np.random.default_rng(2).normal(size=(2, 300))
+    first = bootstrap_mean_distribution(values, n_resamples=500, seed=7)
+    again = bootstrap_mean_distribution(values, n_resamples=500, seed=7)
+    np.testing.assert_array_equal(first, again)
+
+    # Forcing the pool path must yield exactly the inline result.
+    monkeypatch.setattr(bootstrap, "_MAX_CHUNK_CELLS", 300 * 100)
+    monkeypatch.setattr(bootstrap, "_PARALLEL_MIN_CELLS", 0)
+    inline = bootstrap_mean_distribution(values, n_resamples=500, seed=7, n_jobs=1)
+    pooled = bootstrap_mean_distribution(values, n_resamples=500, seed=7, n_jobs=2)
+    np.testing.assert_array_equal(inline, pooled)
+
+
+def test_iid_interval_matches_normal_theory() -> None:
+    values = np.random.default_rng(3).normal(loc=1.0, scale=2.0, size=2_000)
+
+    result = bootstrap.bootstrap_mean_intervals(
+        {"x": values}, n_resamples=4_000, block_length=1, seed=0
+    )["x"]
+
+    assert result["estimate"] == pytest.approx(values.mean())
+    assert result["std_error"] == pytest.approx(values.std() / np.sqrt(values.size), rel=0.1)
+    assert result["lower"] < values.mean() < result["upper"]
+
+
+def test_blocks_widen_interval_for_autocorrelated_series() -> None:
+    rng = np.random.default_rng(4)
+    series = np.zeros(2_000)
+    for i in range(1, series.size):
+        series[i] = 0.9 * series[i - 1] + rng.normal()
+
+    iid = bootstrap.bootstrap_mean_intervals({"x": series}, block_length=1, seed=0)["x"]
+    blocked = bootstrap.bootstrap_mean_intervals({"x": series}, block_length=40, seed=0)["x"]
+
+    assert blocked["std_error"] > 2 * iid["std_error"]
+
+
+def test_metric_intervals_cover_point_estimates_and_roi_needs_odds() -> None:
+    records = _records(200)
+    result = bootstrap_metric_intervals(records, clv=np.full(30, 0.01), n_resamples=300, seed=0)
+
+    assert result["skipped"] is False
+    assert result["n"] == 200
+    assert set(result["metrics"]) == {"rps", "brier", "accuracy", "mean_clv"}
+    for ci in result["metrics"].values():
+        assert ci["lower"] <= ci["estimate"] <= ci["upper"]
+    assert result["metrics"]["mean_clv"]["n"] == 30
+
+    with_odds = bootstrap_metric_intervals(_records(200, with_odds=True), n_resamples=300, seed=0)
+    assert "roi" in with_odds["metrics"]
+
+    assert bootstrap_metric_intervals(records[:5])["skipped"] is True
+
+
+def test_paired_difference_detects_better_candidate() -> None:
+    records = _records(400, seed=5)
+    incumbent = bootstrap.settled_prediction_metrics(records)["rps"]
+    candidate = incumbent - 0.01
+
+    result = paired_bootstrap_difference(candidate, incumbent, n_resamples=500, seed=0)
+
+    assert result["estimate"] == pytest.approx(-0.01)
+    assert result["upper"] < 0.0
+    assert result["prob_candidate_better"] == 1.0
+    with pytest.raises(ValueError):
+        paired_bootstrap_difference(candidate[:-1], incumbent)
+
+
+def test_compare_models_carries_stored_intervals(tmp_path) -> None:
+    registry = ModelRegistry(registry_path=str(tmp_path))
+    model_id = registry.register_model({}, "ensemble", "1.0.0", {"rps": 0.2}, {})
+
+    registry.record_confidence_intervals(model_id, _records(100), n_resamples=200, seed=0)
+    df = registry.compare_models([model_id])
+
+    assert {"rps_ci_lower", "rps_ci_upper", "accuracy_ci_lower"} <= set(df.columns)
+    assert df.loc[0, "rps_ci_lower"] <= df.loc[0, "rps_ci_upper"]
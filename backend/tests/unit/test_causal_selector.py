@@ -0,0 +1,102 @@
+"""Matrix-form CausalFeatureSelector.analyze and its permutation p-values."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models import causal_selector
+from src.models.causal_selector import CausalFeatureSelector
+
+
+def _frame(n: int = 1500, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    strength = rng.normal(size=n)
+    outcome = np.where(strength + rng.normal(size=n) > 0.3, 0, rng.integers(1, 3, size=n))
+    frame = pd.DataFrame({
+        "elo_difference": strength,
+        "noise_a": rng.normal(size=n),
+        "noise_b": np.round(rng.normal(size=n)),  # heavy ties at the median
+        "mostly_missing": np.where(rng.uniform(size=n) < 0.99, np.nan, 1.0),
+        "constant": np.ones(n),
+        "collider_flag": rng.normal(size=n),
+        "as_text": rng.normal(size=n).astype(str),
+        "match_result": outcome,
+    })
+    frame.loc[:20, "noise_a"] = np.inf
+    return frame
+
+
+def _reference(frame: pd.DataFrame, feature: str):
+    """The per-feature computation analyze() used to run."""
+    x = pd.to_numeric(frame[feature], errors="coerce").replace([np.inf, -np.inf], np.nan)
+    home = (frame["match_result"].astype(str) == "0").astype(float)
+    draw = (frame["match_result"].astype(str) == "1").astype(float)
+    clean = pd.DataFrame({"x": x, "home": home, "draw": draw}).dropna()
+    if len(clean) < 30:
+        return None
+    treated = clean[clean.x >= clean.x.median()]
+    control = clean[clean.x < clean.x.median()]
+    if len(treated) < 10 or len(control) < 10:
+        return None
+    ate = treated.home.mean() - control.home.mean()
+    se = np.sqrt(np.var(treated.home, ddof=1) / len(treated) + np.var(control.home, ddof=1) / len(control))
+    z = 0.0 if se == 0 else abs(ate / se)
+    return ate, treated.draw.mean() - control.draw.mean(), se, min(1.0, np.exp(-0.717 * z - 0.416 * z * z))
+
+
+def test_matrix_table_matches_per_feature_computation() -> None:
+    frame = _frame()
+    original = frame.copy()
+    features = [c for c in frame.columns if c != "match_result"]
+    results = CausalFeatureSelector().analyze(frame, feature_cols=features)
+
+    expected = {f: _reference(frame, f) for f in features}
+    assert [r.name for r in results] == [f for f in features if expected[f] is not None]
+    assert "mostly_missing" not in {r.name for r in results} and "constant" not in {r.name for r in results}
+    for row in results:
+        ate, ate_draw, se, p = expected[row.name]
+        assert row.ate_win == pytest.approx(ate, abs=1e-12)
+        assert row.ate_draw == pytest.approx(ate_draw, abs=1e-12)
+        assert row.ate_ci == pytest.approx((ate - 1.96 * se, ate + 1.96 * se), abs=1e-12)
+        assert row.p_value == pytest.approx(p, abs=1e-12)
+
+    # The caller's frame is never written to; under copy-on-write a float64
+    # block hands back a read-only view, which analyze() must not modify.
+    pd.testing.assert_frame_equal(frame, original)
+    floats = frame[["elo_difference", "noise_a", "match_result"]].astype(float)
+    with pd.option_context("mode.copy_on_write", True):
+        cow = CausalFeatureSelector().analyze(floats, feature_cols=["elo_difference", "noise_a"])
+    assert [r.name for r in cow] == ["elo_difference", "noise_a"]
+    assert np.isinf(floats["noise_a"]).sum() == 21
+
+    by_name = {r.name: r for r in results}
+    assert by_name["elo_difference"].classification == "CAUSAL_DRIVER"
+    assert by_name["collider_flag"].classification == "COLLIDER_WARNING"
+
+
+def test_permutation_p_values_are_seeded_and_pool_invariant(monkeypatch) -> None:
+    frame = _frame()
+    features = ["elo_difference", "noise_a", "noise_b"]
+    selector = CausalFeatureSelector()
+
+    inline = selector.analyze(frame, feature_cols=features, p_value_method="permutation", n_permutations=400, seed=3)
+    monkeypatch.setattr(causal_selector, "_MAX_CHUNK_CELLS", 1500 * 50)
+    monkeypatch.setattr(causal_selector, "_PARALLEL_MIN_CELLS", 0)
+    chunked = selector.analyze(
+        frame, feature_cols=features, p_value_method="permutation", n_permutations=400, seed=3, n_jobs=2,
+    )
+    monkeypatch.undo()
+
+    p = {r.name: r.p_value for r in inline}
+    assert p["elo_difference"] == pytest.approx(1 / 401)
+    assert p["noise_a"] > 0.01 and p["noise_b"] > 0.01
+    # Smaller chunks through the pool draw different shuffles, same verdict.
+    q = {r.name: r.p_value for r in chunked}
+    assert q["elo_difference"] == pytest.approx(1 / 401)
+    rerun = selector.analyze(frame, feature_cols=features, p_value_method="permutation", n_permutations=400, seed=3)
+    assert [r.p_value for r in rerun] == [r.p_value for r in inline]
+
+    with pytest.raises(ValueError):
+        selector.analyze(frame, feature_cols=features, p_value_method="bootstrap")
@@ -0,0 +1,82 @@
+"""Array-based DataAugmentor generators: seeding, noise, flips, interpolation."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.models.data_augmentation import DataAugmentor
+
+
+def _frame(n: int = 400, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame({
+        "home_goals_scored_l5": rng.poisson(7, n).astype(float),
+        "away_goals_conceded_l5": rng.poisson(6, n).astype(float),
+        "home_xg_l5": rng.gamma(2.0, 0.7, n),
+        "pass_accuracy": rng.uniform(0.6, 0.9, n),
+        "derby_match": rng.integers(0, 2, n),
+    })
+    y = pd.Series(rng.choice([0, 1, 2], size=n, p=[0.6, 0.3, 0.1]))
+    return X, y
+
+
+def test_same_seed_same_samples() -> None:
+    X, y = _frame()
+    a = DataAugmentor(random_state=7).augment_training_data(X, y, 0.5, ["perturbation", "monte_carlo", "mixup"])
+    b = DataAugmentor(random_state=7).augment_training_data(X, y, 0.5, ["perturbation", "monte_carlo", "mixup"])
+    pd.testing.assert_frame_equal(a[0], b[0])
+    pd.testing.assert_series_equal(a[1], b[1])
+    assert len(a[0]) == len(X) + 3 * (int(len(X) * 0.5) // 3)
+
+
+def test_perturbation_noise_scale_and_binary_flips() -> None:
+    X, y = _frame()
+    synthetic, labels = DataAugmentor(random_state=1).generate_perturbations(X, y, 20_000)
+
+    assert list(synthetic.columns) == list(X.columns) and len(labels) == 20_000
+    assert set(np.unique(synthetic["derby_match"])) <= {0.0, 1.0}
+    # Noise is 5% of each column's std around a real row: with it removed,
+    # every value is back on one of X's rows.
+    residual = synthetic["home_xg_l5"].to_numpy() - X["home_xg_l5"].to_numpy()[:, None]
+    nearest = np.abs(residual).min(axis=0)
+    assert nearest.max() < 6 * 0.05 * X["home_xg_l5"].std()
+    # Flips happen for ~10% of samples: the derby rate moves towards 0.5.
+    base = X["derby_match"].mean()
+    assert synthetic["derby_match"].mean() == pytest.approx(0.9 * base + 0.1 * (1 - base), abs=0.02)
+
+
+def test_monte_carlo_injury_multipliers() -> None:
+    X, y = _frame(50)
+    X["home_goals_scored_l5"] = 10.0
+    X["away_goals_conceded_l5"] = 10.0
+    synthetic, adjusted = DataAugmentor(random_state=3).monte_carlo_injury_simulation(X, y.astype(float), 3_000)
+
+    assert set(np.round(synthetic["home_goals_scored_l5"], 6)) == {10.0, 8.5}
+    # "goals" makes it an attack feature as well as a defensive one.
+    assert set(np.round(synthetic["away_goals_conceded_l5"], 6)) == {10.0, 8.5, 8.8}
+    # Roughly 1/2 (home) x 1/3 (attack) of samples hit the home attack features.
+    assert (synthetic["home_goals_scored_l5"] < 10).mean() == pytest.approx(1 / 6, abs=0.03)
+    assert set(np.round(adjusted, 6)) <= {0.0, 0.85, 1.0, 1.7}
+
+
+def test_mixup_is_convex_and_smote_stays_within_class() -> None:
+    X, y = _frame(300)
+    augmentor = DataAugmentor(random_state=5)
+
+    mixed, mixed_y = augmentor.mixup_augmentation(X, y, 500)
+    assert ((mixed >= X.min() - 1e-12) & (mixed <= X.max() + 1e-12)).all().all()
+    assert np.all((np.asarray(mixed_y) >= 0) & (np.asarray(mixed_y) <= 2))
+
+    synthetic, labels = augmentor.smote_oversample(X, y, 150)
+    counts = y.value_counts()
+    assert len(synthetic) == 150
+    assert set(labels) <= {1, 2}  # only minority classes are topped up
+    for label in (1, 2):
+        members = X[y == label]
+        rows = synthetic[np.asarray(labels) == label]
+        assert ((rows >= members.min() - 1e-12) & (rows <= members.max() + 1e-12)).all().all()
+    # Budget beyond the total deficit is not spent.
+    everything, _ = augmentor.smote_oversample(X, y, 10_000)
+    assert len(everything) == int((counts.max() - counts).sum())
@@ -9,7 +9,12 @@ import pandas as pd
 import pytest
 
 from src.monitoring import drift as drift_module
-from src.monitoring.drift import DriftMonitor, benjamini_hochberg
+from src.monitoring.drift import (
+    DriftMonitor,
+    ReferenceSketch,
+    RollingFeatureWindow,
+    benjamini_hochberg,
+)
 
 
 def _write_reference(tmp_path: Path) -> tuple[Path, Path, pd.DataFrame]:
@@ -108,3 +113,87 @@ async def test_drift_monitor_applies_fdr_and_uses_async_alert(
     assert result.dataset_drift is True
     assert set(result.drifting_features) == {"feature_a", "feature_b"}
     assert delivered == [result.drifting_features]
+
+
+def test_reference_sketch_matches_scipy_ks_and_round_trips(tmp_path: Path) -> None:
+    import numpy as np
+    from scipy.stats import ks_2samp
+
+    rng = np.random.default_rng(0)
+    reference = pd.DataFrame({"a": rng.normal(size=3000), "b": rng.exponential(size=3000)})
+    reference.loc[:50, "a"] = np.nan
+    current = {"a": rng.normal(0.1, 1, size=400), "b": rng.exponential(size=400)}
+
+    exact = ReferenceSketch.from_frame(reference, sketch_size=None)
+    for item in exact.compare(current):
+        expected = ks_2samp(reference[item.feature].dropna(), current[item.feature], method="asymp")
+        assert item.statistic == pytest.approx(expected.statistic, abs=1e-12)
+        assert item.p_value == pytest.approx(expected.pvalue, abs=1e-12)
+
+    sketched = ReferenceSketch.from_frame(reference, sketch_size=500)
+    assert len(sketched.sketches["b"].sorted_values) == 500
+    assert sketched.sketches["a"].count == 2949
+    for approx, full in zip(sketched.compare(current), exact.compare(current)):
+        assert approx.statistic == pytest.approx(full.statistic, abs=1 / 500)
+
+    path = tmp_path / "reference.sketch.npz"
+    sketched.save(path)
+    loaded = ReferenceSketch.load(path)
+    assert loaded.features == ("a", "b") and loaded.rows == 3000
+    assert loaded.compare(current, method="psi") == sketched.compare(current, method="psi")
+
+
+def test_rolling_window_keeps_latest_rows_in_order() -> None:
+    window = RollingFeatureWindow(["x", "y"], capacity=4)
+    window.append(pd.DataFrame({"x": [1.0, 2.0, 3.0], "y": [1.0, 1.0, 1.0]}))
+    window.append({"x": 4.0})
+    window.append([{"x": 5.0, "y": "bad"}, {"x": 6.0, "y": 2.0}])
+
+    assert len(window) == 4
+    assert window.values()[:, 0].tolist() == [3.0, 4.0, 5.0, 6.0]
+    assert window.columns()["y"].tolist() == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_drift_monitor_caches_sketch_and_scores_window(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    artifact, manifest, reference = _write_reference(tmp_path)
+    monkeypatch.setattr(drift_module.pd, "read_parquet", lambda _: reference.copy())
+    DriftMonitor(artifact, manifest_path=manifest, minimum_current_rows=20, dataset_drift_share=0.5)
+    assert artifact.with_suffix(".sketch.npz").exists()
+
+    def no_parquet(_):
+        raise AssertionError("reference parquet re-read")
+
+    monkeypatch.setattr(drift_module.pd, "read_parquet", no_parquet)
+    monitor = DriftMonitor(
+        artifact,
+        manifest_path=manifest,
+        minimum_current_rows=20,
+        dataset_drift_share=0.5,
+        method="psi",
+        window_size=100,
+        evidently=False,
+    )
+    monkeypatch.setattr(drift_module, "trigger_slack_drift_alert", lambda **_: _resolved(False))
+
+    async with httpx.AsyncClient() as client:
+        monitor.observe(reference.iloc[:10])
+        assert (await monitor.evaluate_window(http_client=client)).status == "INSUFFICIENT_SAMPLE"
+
+        monitor.observe(reference.iloc[10:])
+        steady = await monitor.evaluate_window(http_client=client)
+        assert steady.status == "NO_DATASET_DRIFT" and steady.evidently_report is None
+
+        monitor.observe(reference + 500.0)
+        shifted = await monitor.evaluate_window(http_client=client)
+
+    assert shifted.method == "psi" and shifted.current_rows == 100
+    assert set(shifted.drifting_features) == {"feature_a", "feature_b"}
+    assert all(item.p_value is None for item in shifted.feature_results)
+
+
+async def _resolved(value):
+    return value
@@ -0,0 +1,93 @@
+"""EmbeddingIndex top-k search and MatchVectorEmbeddings analog lookup."""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.models.embedding_index import EmbeddingIndex
+
+
+def _corpus(n: int = 2000, dim: int = 32, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(20, dim))
+    vectors = centres[rng.integers(0, 20, n)] + 0.3 * rng.normal(size=(n, dim))
+    ids = [f"m{i}" for i in range(n)]
+    leagues = ["EPL" if i % 3 else "SerieA" for i in range(n)]
+    seasons = [str(2020 + i % 4) for i in range(n)]
+    return rng, vectors, ids, leagues, seasons
+
+
+def _brute_force(vectors, query, k, keep=None):
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = unit @ (query / np.linalg.norm(query))
+    order = [i for i in np.argsort(-scores, kind="stable") if keep is None or keep[i]]
+    return [f"m{i}" for i in order[:k]]
+
+
+def test_exact_search_matches_brute_force_with_filters() -> None:
+    rng, vectors, ids, leagues, seasons = _corpus()
+    index = EmbeddingIndex(32)
+    for start in range(0, 2000, 700):  # incremental adds across a buffer resize
+        stop = start + 700
+        index.add(ids[start:stop], vectors[start:stop], leagues=leagues[start:stop], seasons=seasons[start:stop])
+    assert len(index) == 2000
+    assert np.allclose(np.linalg.norm(index.vectors, axis=1), 1.0, atol=1e-5)
+
+    query = vectors[17] + 0.05 * rng.normal(size=32)
+    hits = index.search(query, 10)
+    assert [hit.match_id for hit in hits] == _brute_force(vectors, query, 10)
+    assert all(a.similarity >= b.similarity for a, b in zip(hits, hits[1:]))
+
+    keep = np.array([lg == "SerieA" and s == "2021" for lg, s in zip(leagues, seasons)])
+    filtered = index.search(query, 10, league="SerieA", season="2021")
+    assert [hit.match_id for hit in filtered] == _brute_force(vectors, query, 10, keep)
+    assert {(hit.league, hit.season) for hit in filtered} == {("SerieA", "2021")}
+    assert index.search(query, 10, league="Ligue1") == []
+
+
+def test_ivf_mode_recalls_exact_neighbours_and_tracks_adds(tmp_path) -> None:
+    rng, vectors, ids, leagues, seasons = _corpus(n=4000)
+    index = EmbeddingIndex(32, approximate="ivf", n_lists=40, n_probe=6)
+    index.add(ids, vectors, leagues=leagues, seasons=seasons)
+    index.build_ivf()
+
+    queries = vectors[rng.choice(4000, 25, replace=False)] + 0.05 * rng.normal(size=(25, 32))
+    recall = np.mean([
+        len({h.match_id for h in index.search(q, 10)} & set(_brute_force(vectors, q, 10))) / 10
+        for q in queries
+    ])
+    assert recall >= 0.9
+
+    probe = rng.normal(size=32) * 10
+    index.add(["fresh"], probe, [{"home_win_prob": 0.7}], leagues=["EPL"])
+    assert index.search(probe, 1)[0].match_id == "fresh"
+    # hnswlib is optional; without it the hnsw mode answers from the IVF lists.
+    assert index.search(probe, 1, approximate="hnsw")[0].match_id == "fresh"
+
+    index.save(tmp_path)
+    loaded = EmbeddingIndex.load(tmp_path)
+    assert isinstance(loaded._vectors, np.memmap)
+    assert [h.match_id for h in loaded.search(queries[0], 10)] == [h.match_id for h in index.search(queries[0], 10)]
+    assert loaded.search(probe, 1, league="EPL")[0].outcome == {"home_win_prob": 0.7}
+    loaded.add(["later"], -probe)
+    assert loaded.search(-probe, 1)[0].match_id == "later"
+
+
+def test_find_similar_matches_uses_the_index() -> None:
+    from src.models.vector_embeddings import MatchVectorEmbeddings
+
+    _, vectors, ids, leagues, seasons = _corpus(n=300, dim=384)
+    embeddings = MatchVectorEmbeddings()
+    history = [(ids[i], vectors[i], {"home_win_prob": i / 300}) for i in range(300)]
+
+    from_list = asyncio.run(embeddings.find_similar_matches(vectors[5], history, top_k=3))
+    assert [hit["match_id"] for hit in from_list] == _brute_force(vectors, vectors[5], 3)
+    assert from_list[0]["similarity"] == pytest.approx(1.0, abs=1e-5)
+
+    embeddings.add_historical_matches(ids, vectors, [o for _, _, o in history], leagues=leagues, seasons=seasons)
+    from_index = asyncio.run(embeddings.find_similar_matches(vectors[5], top_k=3, league="EPL"))
+    assert all(hit["league"] == "EPL" for hit in from_index)
+    assert from_index[0]["outcome"] == {"home_win_prob": 5 / 300}
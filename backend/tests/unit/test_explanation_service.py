@@ -0,0 +1,71 @@
+"""Per-league TreeSHAP explanation service and its per-match cache."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+pytest.importorskip("shap")
+
+from src.models.ensemble import EnsembleModel
+from src.models.explanation_service import ExplanationService, global_shap_importance
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(300, 6)), columns=[f"f{i}" for i in range(6)])
+    y = np.where(X["f0"] + 0.5 * X["f3"] > 0.3, 0, rng.integers(1, 3, size=300))
+    model = RandomForestClassifier(n_estimators=20, max_depth=4, random_state=0).fit(X, y)
+    return model, X
+
+
+def test_explanations_are_additive_and_cached(fitted) -> None:
+    model, X = fitted
+    service = ExplanationService(cache_size=8)
+    assert service.register("epl", model, list(X.columns), model_version="v1")
+
+    # Columns arrive in a different order; the service aligns them.
+    first = service.explain("epl", X.iloc[[4], ::-1])
+    contributions = np.array(first["shap_values"]["home_win"])
+    assert contributions.sum() + first["waterfall_data"]["base_value"] == pytest.approx(
+        model.predict_proba(X.iloc[[4]])[0, 0], abs=1e-6
+    )
+    assert set(first["shap_values"]) == {"home_win", "draw", "away_win"}
+    top = [abs(item["contribution"]) for item in first["feature_contributions"]]
+    assert top == sorted(top, reverse=True) and len(top) == 5
+
+    assert service.explain("epl", X.iloc[[4]]) is first
+    batch = service.explain_batch("epl", X.iloc[2:7])
+    assert batch[2] is first
+    assert service.cache_info()["hits"] == 2 and service.cache_info()["misses"] == 5
+
+    service.register("epl", model, list(X.columns), model_version="v2")
+    assert service.explain("epl", X.iloc[[4]]) is not first
+    assert service.explain("unknown", X.iloc[[4]]) == {}
+
+
+def test_global_importance_is_stored_in_the_artifact(fitted, tmp_path) -> None:
+    model, X = fitted
+    importance = global_shap_importance(model, X, list(X.columns), max_rows=100)
+    assert list(importance)[0] == "f0"
+    assert list(importance.values()) == sorted(importance.values(), reverse=True)
+
+    ensemble = EnsembleModel()
+    ensemble.models = {"random_forest": model}
+    ensemble.feature_columns = list(X.columns)
+    ensemble.is_trained = True
+    ensemble._compute_shap_importance(X)
+    ensemble.save_model(str(tmp_path), "epl_ensemble")
+
+    loaded = EnsembleModel.load_model(str(tmp_path / "epl_ensemble.pkl"))
+    assert loaded.shap_global_importance == ensemble.shap_global_importance
+    explanation = loaded.explain_predictions(X.iloc[[0]], league="test-epl")
+    assert explanation["feature_importance"] == loaded.shap_global_importance
+
+    linear = EnsembleModel()
+    linear.models = {"logistic": LogisticRegression().fit(X, (X["f0"] > 0).astype(int))}
+    assert linear.explain_predictions(X.iloc[[0]], league="test-linear") == {}
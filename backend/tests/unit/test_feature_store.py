@@ -0,0 +1,172 @@
+"""Persisted live feature vectors keyed by schema hash and input fingerprint."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.database import Base, FeatureVector, LeagueStanding, Match, Odds
+from src.models.feature_registry import CANONICAL_FEATURES_58, feature_schema_hash
+from src.services.feature_store import FeatureStore
+
+KICKOFF = datetime(2026, 10, 25, 15, 0)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 10, 18, 12, 0)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        session.add(Match(id="m1", match_date=KICKOFF, status="scheduled", home_team_id="h", away_team_id="a"))
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+class _Projection:
+    """Stands in for the projector's compute step and counts calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        features = np.linspace(0.0, 1.0, 68, dtype=np.float32)
+        return {
+            "features": features,
+            "features_58": features[:58],
+            "data_gaps": ["shot_quality_diff"],
+            "staleness_seconds": 120,
+            "features_dict": {"elo_difference": np.float32(12.5)},
+            "feature_freshness_seconds": {"odds_drift_home": None, "odds_drift_away": 60.0},
+            "fixture_identity_verified": True,
+        }
+
+
+async def _serve(store: FeatureStore, db: AsyncSession, projection: _Projection):
+    match = (await db.execute(select(Match).where(Match.id == "m1"))).scalar_one()
+    result = await store.get_or_compute(match, "epl", db, projection)
+    await db.commit()
+    return result
+
+
+def test_schema_hash_tracks_feature_order() -> None:
+    names = list(CANONICAL_FEATURES_58)
+    assert feature_schema_hash(names) == feature_schema_hash(list(names))
+    assert feature_schema_hash(names) != feature_schema_hash(names[::-1])
+    assert len(feature_schema_hash(names)) == 16
+
+
+@pytest.mark.asyncio
+async def test_second_read_is_served_from_store_with_metadata(db) -> None:
+    clock = _Clock()
+    store = FeatureStore("schema-a", clock=clock, max_age_seconds=3600)
+    projection = _Projection()
+
+    first = await _serve(store, db, projection)
+    clock.now += timedelta(minutes=5)
+    second = await _serve(store, db, projection)
+
+    assert projection.calls == 1
+    assert first["feature_store"]["hit"] is False and first["feature_store"]["stored"] is True
+    assert second["feature_store"] == {
+        "hit": True, "stored": True, "schema_hash": "schema-a",
+        "as_of": "2026-10-18T12:00:00", "age_seconds": 300,
+    }
+    np.testing.assert_array_equal(second["features"], first["features"])
+    assert second["features_58"].shape == (58,)
+    assert second["data_gaps"] == ["shot_quality_diff"]
+    assert second["features_dict"] == {"elo_difference": 12.5}
+    assert second["fixture_identity_verified"] is True
+    # Staleness is relative to compute time, so a 5-minute-old row is 300s staler.
+    assert first["staleness_seconds"] == 120 and second["staleness_seconds"] == 420
+    assert second["feature_freshness_seconds"] == {"odds_drift_home": None, "odds_drift_away": 360.0}
+
+    # A different schema never sees the other schema's vectors.
+    await _serve(FeatureStore("schema-b", clock=clock, max_age_seconds=3600), db, projection)
+    assert projection.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_changed_inputs_and_age_cap_force_recompute(db) -> None:
+    clock = _Clock()
+    store = FeatureStore("schema-a", clock=clock, max_age_seconds=3600)
+    projection = _Projection()
+    await _serve(store, db, projection)
+
+    db.add(Match(id="old", match_date=KICKOFF - timedelta(days=7), status="finished",
+                 home_team_id="a", away_team_id="x", home_score=1, away_score=0))
+    await db.commit()
+    await _serve(store, db, projection)
+
+    db.add(Odds(match_id="m1", bookmaker="Betfair", home_win=2.0, draw=3.4, away_win=3.9, timestamp=clock.now))
+    await db.commit()
+    await _serve(store, db, projection)
+
+    db.add(LeagueStanding(league="epl", team_id="h", played=8, points=17, updated_at=clock.now))
+    await db.commit()
+    await _serve(store, db, projection)
+    assert projection.calls == 4
+
+    # Unrelated fixtures don't invalidate; age does.
+    db.add(Match(id="other", match_date=KICKOFF - timedelta(days=1), status="finished",
+                 home_team_id="y", away_team_id="z"))
+    await db.commit()
+    await _serve(store, db, projection)
+    assert projection.calls == 4
+    clock.now += timedelta(hours=2)
+    await _serve(store, db, projection)
+    assert projection.calls == 5
+
+    # Each recompute replaces the fixture's row rather than appending one.
+    stored = (await db.execute(select(func.count(FeatureVector.id)))).scalar_one()
+    assert stored == 1
+
+
+@pytest.mark.asyncio
+async def test_put_keeps_one_row_per_match_league_and_schema(db) -> None:
+    clock = _Clock()
+    store = FeatureStore("schema-a", clock=clock, max_age_seconds=3600)
+    result = await _Projection()()
+
+    await store.put("m1", "epl", "fp-1", result, db)
+    clock.now += timedelta(minutes=1)
+    await store.put("m1", "epl", "fp-2", result, db)
+    await FeatureStore("schema-b", clock=clock).put("m1", "epl", "fp-2", result, db)
+    await db.commit()
+
+    rows = (await db.execute(select(FeatureVector).order_by(FeatureVector.features_version))).scalars().all()
+    assert [(row.features_version, row.input_fingerprint) for row in rows] == [
+        ("schema-a", "fp-2"),
+        ("schema-b", "fp-2"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unstorable_vectors_are_served_but_not_persisted(db) -> None:
+    store = FeatureStore("schema-a", clock=_Clock(), max_age_seconds=3600)
+
+    async def with_nan():
+        features = np.full(68, np.nan, dtype=np.float32)
+        return {"features": features, "features_58": features[:58], "data_gaps": []}
+
+    match = (await db.execute(select(Match).where(Match.id == "m1"))).scalar_one()
+    result = await store.get_or_compute(match, "epl", db, with_nan)
+
+    assert result["feature_store"]["stored"] is False
+    assert (await db.execute(select(func.count(FeatureVector.id)))).scalar_one() == 0
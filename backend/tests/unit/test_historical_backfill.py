@@ -235,3 +235,79 @@ async def test_backfill_reports_nothing_when_cache_dir_absent(session: AsyncSess
     report = await backfill_historical_matches(session, cache_dir=tmp_path / "nope")
     assert report.files_read == 0
     assert report.matches_inserted == 0
+
+
+# --------------------------------------------------------------------------- #
+# Streaming (stage-and-merge) mode
+# --------------------------------------------------------------------------- #
+
+async def test_streaming_backfill_matches_orm_path_in_chunks(
+    session: AsyncSession, tmp_path: Path
+):
+    session.add(Team(id="fd-team-epl:fulham_fc", name="Fulham FC", league_id="EPL"))
+    await session.commit()
+    _write_season(tmp_path)
+    (tmp_path / "fd_SP1_2425.csv").write_text(
+        "Div,Date,HomeTeam,AwayTeam,FTHG,FTAG\n"
+        "SP1,18/08/2024,Betis,Girona,1,1\n"
+        "SP1,18/08/2024,Betis,Girona,1,1\n",      # duplicate row within the file
+        encoding="utf-8",
+    )
+    seen_chunks = []
+
+    report = await backfill_historical_matches(
+        session, cache_dir=tmp_path, streaming=True, chunk_size=2,
+        progress=lambda r: seen_chunks.append(r.matches_inserted),
+    )
+
+    assert report.mode == "streaming"
+    assert report.rows_parsed == 4
+    assert report.matches_inserted == 3
+    assert report.matches_existing == 1
+    assert report.leagues == {"EPL": 2, "LA_LIGA": 1}
+    assert report.teams_created == 4   # Man United, Arsenal, Betis, Girona
+    assert seen_chunks == [2, 3]
+    assert report.as_dict()["rows_per_second"] > 0
+
+    rows = (await session.execute(select(Match))).scalars().all()
+    assert {r.status for r in rows} == {"finished"}
+    assert sum(r.away_team_id == "fd-team-epl:fulham_fc" for r in rows) == 2
+    assert {r.id for r in rows} == {
+        historical_match_id("EPL", datetime(2024, 8, 16), "Man United", "Fulham"),
+        historical_match_id("EPL", datetime(2024, 8, 17), "Arsenal", "Fulham"),
+        historical_match_id("LA_LIGA", datetime(2024, 8, 18), "Betis", "Girona"),
+    }
+
+
+async def test_streaming_backfill_is_idempotent_after_orm_run(
+    session: AsyncSession, tmp_path: Path
+):
+    _write_season(tmp_path)
+    await backfill_historical_matches(session, cache_dir=tmp_path)
+
+    again = await backfill_historical_matches(session, cache_dir=tmp_path, streaming=True)
+
+    assert again.matches_inserted == 0
+    assert again.matches_existing == 2
+    assert again.teams_created == 0
+    assert len((await session.execute(select(Match))).scalars().all()) == 2
+
+
+async def test_streaming_backfill_propagates_database_errors(
+    session: AsyncSession, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog
+):
+    """A failed bulk insert aborts the run; it is not a bad CSV file."""
+    from src.services import historical_backfill_service as service
+
+    async def broken_stage(*_args, **_kwargs):
+        raise RuntimeError("connection lost")
+
+    monkeypatch.setattr(service, "_stage_rows", broken_stage)
+    _write_season(tmp_path)
+
+    with pytest.raises(RuntimeError, match="connection lost"):
+        # chunk_size=1 so the failing flush happens mid-file, not after the loop.
+        await backfill_historical_matches(session, cache_dir=tmp_path, streaming=True, chunk_size=1)
+
+    assert "failed to parse" not in caplog.text
+    assert (await session.execute(select(Match))).scalars().all() == []
@@ -0,0 +1,166 @@
+"""IncrementalWalkForwardEvaluator parity with ModelRegistry.walk_forward_validate().
+
+The evaluator is only worth having if a settlement pass that ingests records
+in arbitrary batches reports exactly what a from-scratch walk_forward_validate()
+over the same records would.
+"""
+from __future__ import annotations
+
+import json
+import os
+
+os.environ["ALLOW_SQLITE_FALLBACK"] = "true"
+os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+os.environ["REDIS_ENABLED"] = "false"
+
+import numpy as np
+import pytest
+
+from src.models.evaluation.metrics import expected_calibration_error, reliability_curve
+from src.models.evaluation.walk_forward import (
+    IncrementalWalkForwardEvaluator,
+    score_walk_forward_record,
+    score_walk_forward_records,
+)
+from src.models.model_registry import ModelRegistry
+
+
+def _records(n: int, seed: int = 3) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    records = []
+    for i in range(n):
+        probs = rng.dirichlet([2.0, 1.2, 1.6]).tolist()
+        records.append({
+            "prediction_id": i + 1,
+            "match_id": f"m-{i}",
+            # Distinct dates, inserted out of order below.
+            "date": f"2026-{1 + i // 28:02d}-{1 + i % 28:02d}T15:00:00",
+            "outcome": int(rng.integers(0, 3)),
+            "probs": probs,
+            "settled_at": f"2026-12-01T00:00:{i % 60:02d}",
+        })
+    # One record that fails validation still occupies a fold position.
+    records[7]["probs"] = [0.9, 0.9, 0.9]
+    return records
+
+
+def _assert_same_payload(incremental: dict, reference: dict) -> None:
+    assert incremental["skipped"] is reference["skipped"] is False
+    for key in ("n_splits", "total_records"):
+        assert incremental[key] == reference[key]
+    for key in ("rps_overall", "rps_std", "accuracy_overall", "brier_overall"):
+        assert incremental[key] == pytest.approx(reference[key], abs=1e-12)
+    for inc_fold, ref_fold in zip(incremental["folds"], reference["folds"]):
+        for key in ("fold", "train_end_idx", "test_size", "date_range"):
+            assert inc_fold[key] == ref_fold[key]
+        for key in ("rps_mean", "rps_min", "rps_max", "brier_mean", "accuracy"):
+            assert inc_fold[key] == pytest.approx(ref_fold[key], abs=1e-12)
+    assert incremental["brier_decomposition"] == reference["brier_decomposition"]
+
+
+def test_batched_ingest_matches_full_walk_forward(tmp_path) -> None:
+    records = _records(83)
+    shuffled = [records[i] for i in np.random.default_rng(0).permutation(len(records))]
+
+    evaluator = IncrementalWalkForwardEvaluator()
+    for start in range(0, len(shuffled), 17):
+        evaluator.ingest(shuffled[start:start + 17])
+
+    reference = ModelRegistry(str(tmp_path / "registry")).walk_forward_validate(records)
+    _assert_same_payload(evaluator.evaluate(), reference)
+
+
+def test_reingest_is_noop_and_newer_log_replaces_older() -> None:
+    records = _records(30)
+    evaluator = IncrementalWalkForwardEvaluator()
+    assert evaluator.ingest(records) == 30
+    assert evaluator.ingest(records[:5]) == 0
+
+    newer = dict(records[0], prediction_id=999, probs=[1.0, 0.0, 0.0], outcome=0)
+    assert evaluator.ingest([newer]) == 1
+    assert len(evaluator) == 30
+    assert evaluator.prediction_high_water_mark == 999
+
+
+def test_state_round_trips_through_disk(tmp_path) -> None:
+    state_path = tmp_path / "walk_forward_state.json"
+    records = _records(40)
+
+    first = IncrementalWalkForwardEvaluator(state_path=state_path)
+    first.ingest(records)
+    first.save()
+
+    restored = IncrementalWalkForwardEvaluator(state_path=state_path)
+    assert len(restored) == 40
+    assert restored.settled_high_water_mark == first.settled_high_water_mark
+    expected = first.evaluate()
+    actual = restored.evaluate()
+    expected.pop("validated_at")
+    actual.pop("validated_at")
+    assert actual == expected
+
+
+def test_running_totals_track_every_validated_record() -> None:
+    records = _records(60)
+    evaluator = IncrementalWalkForwardEvaluator()
+    for start in range(0, 60, 13):
+        evaluator.ingest(records[start:start + 13])
+    # Replacing a match's prediction moves its contribution, not just adds one.
+    newer = dict(records[3], prediction_id=999, probs=[0.05, 0.05, 0.9])
+    evaluator.ingest([newer])
+
+    live = [newer if r is records[3] else r for r in records]
+    scored = score_walk_forward_records(live)
+    valid = scored["valid"]
+    outcomes, probs = scored["outcome"][valid], scored["probs"][valid]
+    history = evaluator.history()
+
+    assert history["n_samples"] == int(valid.sum()) == 59
+    assert history["rps_mean"] == pytest.approx(scored["rps"][valid].mean(), abs=1e-12)
+    assert history["brier_mean"] == pytest.approx(scored["brier"][valid].mean(), abs=1e-12)
+    assert history["accuracy"] == pytest.approx(scored["correct"][valid].mean(), abs=1e-12)
+    assert history["per_class"] == reliability_curve(outcomes, probs)["per_class"]
+    assert history["ece_mean"] == expected_calibration_error(outcomes, probs)["mean"]
+    assert evaluator.evaluate()["history"] == history
+
+
+def test_save_appends_only_new_records(tmp_path) -> None:
+    state_path = tmp_path / "walk_forward_state.json"
+    records = _records(40)
+
+    evaluator = IncrementalWalkForwardEvaluator(state_path=state_path)
+    evaluator.ingest(records[:30])
+    evaluator.save()
+    journal = evaluator.journal_path
+    first = journal.read_bytes()
+    assert len(first.splitlines()) == 30
+
+    evaluator.ingest(records[30:])
+    evaluator.ingest([dict(records[0], prediction_id=999)])
+    evaluator.save()
+    second = journal.read_bytes()
+    assert second.startswith(first)
+    # Ten additions, then the replacement: one removal line and one addition.
+    assert len(second.splitlines()) == 42
+    header = json.loads(state_path.read_text())
+    assert header["journal_bytes"] == len(second)
+    assert header["totals"]["valid"] == 39
+
+    # A tail left by an interrupted save is ignored on load and overwritten.
+    with open(journal, "ab") as fh:
+        fh.write(b'[12345,"m-x"')
+    restored = IncrementalWalkForwardEvaluator(state_path=state_path)
+    assert len(restored) == 40 and 12345 not in restored._rows
+    assert restored.history() == evaluator.history()
+    restored.ingest([dict(records[1], prediction_id=1000)])
+    restored.save()
+    again = IncrementalWalkForwardEvaluator(state_path=state_path)
+    assert len(again) == 40 and 1000 in again._rows
+
+
+def test_score_walk_forward_record_rejects_invalid_vectors() -> None:
+    assert score_walk_forward_record(0, [0.5, 0.5, 0.5]) is None
+    assert score_walk_forward_record(3, [0.5, 0.3, 0.2]) is None
+    assert score_walk_forward_record(None, [0.5, 0.3, 0.2]) is None
+    rps, brier, correct = score_walk_forward_record(0, [1.0, 0.0, 0.0])
+    assert (rps, brier, correct) == (0.0, 0.0, True)
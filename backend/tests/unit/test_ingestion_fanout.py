@@ -0,0 +1,130 @@
+"""DataIngestionService live polling: bounded fan-out, bulk writes, adaptive cadence."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.database import Base, Match, Odds, OddsRollup
+from src.services import data_ingestion
+from src.services.data_ingestion import DataIngestionService, poll_interval
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    statements: list = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement.split()[0].upper()),
+    )
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        session.info["statements"] = statements
+        yield session
+    await engine.dispose()
+
+
+async def _seed(session: AsyncSession, n_live: int, n_later: int) -> None:
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    for i in range(n_live):
+        session.add(Match(id=f"live-{i}", match_date=now - timedelta(minutes=30), status="live",
+                          home_team_id=f"h{i}", away_team_id=f"a{i}"))
+    for i in range(n_later):
+        session.add(Match(id=f"later-{i}", match_date=now + timedelta(minutes=90), status="scheduled",
+                          home_team_id=f"h{i}", away_team_id=f"a{i}"))
+    await session.commit()
+
+
+def test_poll_interval_tiers() -> None:
+    now = datetime(2025, 1, 1, 15, 0, tzinfo=timezone.utc)
+
+    assert poll_interval("flashscore", "live", now + timedelta(hours=1), now) == 5.0
+    assert poll_interval("flashscore", "scheduled", now - timedelta(minutes=1), now) == 5.0
+    assert poll_interval("flashscore", "scheduled", now + timedelta(minutes=10), now) == 30.0
+    assert poll_interval("flashscore", "scheduled", now + timedelta(hours=1), now) == 60.0
+    assert poll_interval("betfair_exchange", "scheduled", now + timedelta(hours=5), now) == 120.0
+    assert poll_interval("betfair_exchange", "scheduled", now + timedelta(days=3), now) == 600.0
+
+
+@pytest.mark.asyncio
+async def test_fan_out_is_bounded_ordered_and_isolates_failures(monkeypatch) -> None:
+    monkeypatch.setitem(data_ingestion.SOURCE_CONCURRENCY, "flashscore", 3)
+    service = DataIngestionService()
+    in_flight = peak = 0
+
+    async def fetch(item: int):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if item == 4:
+            raise RuntimeError("boom")
+        return None if item == 5 else {"item": item}
+
+    results = await service._fan_out("flashscore", list(range(10)), fetch)
+
+    assert peak == 3
+    assert [item for item, _ in results] == [0, 1, 2, 3, 6, 7, 8, 9]
+    assert service.get_lag_metrics()["flashscore"]["last_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_live_score_poll_is_one_bulk_update_and_respects_cadence(db) -> None:
+    await _seed(db, n_live=4, n_later=3)
+    service = DataIngestionService()
+    fetched: list = []
+
+    async def fake_fetch(match):
+        fetched.append(match.id)
+        return {"home_score": 1, "away_score": 0, "status": "live"}
+
+    service._fetch_flashscore_live = fake_fetch  # type: ignore[method-assign]
+    db.info["statements"].clear()
+
+    assert await service._poll_live_scores(db) == 7
+    assert db.info["statements"].count("UPDATE") == 1
+    scores = (await db.execute(select(Match.home_score))).scalars().all()
+    assert scores == [1] * 7
+
+    # Nothing is due again straight away; live matches come back first.
+    fetched.clear()
+    assert await service._poll_live_scores(db) == 0
+    schedule = service._next_due["flashscore"]
+    for match_id in schedule:
+        schedule[match_id] -= 6.0
+    await service._poll_live_scores(db)
+    assert sorted(fetched) == [f"live-{i}" for i in range(4)]
+    assert service.get_lag_metrics()["flashscore"]["lag_seconds"] >= 1.0
+
+
+@pytest.mark.asyncio
+async def test_live_odds_poll_inserts_snapshots_in_one_statement(db) -> None:
+    await _seed(db, n_live=2, n_later=2)
+    service = DataIngestionService()
+
+    async def fake_fetch(match):
+        return {"runners": [{"last_price_traded": p} for p in (2.0, 3.3, 3.9)]}
+
+    service._fetch_betfair_exchange_odds = fake_fetch  # type: ignore[method-assign]
+    db.info["statements"].clear()
+
+    assert await service._poll_live_odds(db) == 4
+    # One INSERT for the snapshots, one upsert for their rollups.
+    assert db.info["statements"].count("INSERT") == 2
+    rows = (await db.execute(select(Odds))).scalars().all()
+    assert {(r.bookmaker, r.home_win, r.away_win) for r in rows} == {("Betfair", 2.0, 3.9)}
+    assert len(rows) == 4
+    rollups = (await db.execute(select(OddsRollup))).scalars().all()
+    assert sorted(r.match_id for r in rollups) == ["later-0", "later-1", "live-0", "live-1"]
+    assert {(r.closing_home is None) for r in rollups if r.match_id.startswith("live")} == {True}
+    assert {r.closing_home for r in rollups if r.match_id.startswith("later")} == {2.0}
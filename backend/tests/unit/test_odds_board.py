@@ -0,0 +1,125 @@
+"""League odds boards: one fetch answers every fixture, fetches are single-flight."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from src.services import odds_board
+from src.services.odds_board import LeagueOddsBoard, OddsBoardRegistry, team_key
+from src.services.odds_service import OddsService
+
+
+def _event(home: str, away: str, prices=(2.1, 3.4, 3.6)) -> Dict[str, Any]:
+    return {
+        "home_team": home,
+        "away_team": away,
+        "bookmakers": [
+            {
+                "title": "Book",
+                "markets": [
+                    {
+                        "key": "h2h",
+                        "outcomes": [
+                            {"name": home, "price": prices[0]},
+                            {"name": "Draw", "price": prices[1]},
+                            {"name": away, "price": prices[2]},
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+
+
+class _CountingFetch:
+    def __init__(self, events: List[Dict[str, Any]], delay: float = 0.0) -> None:
+        self.events = events
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, competition: str) -> List[Dict[str, Any]]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.events
+
+
+def _service(fetch: _CountingFetch) -> OddsService:
+    service = OddsService(cache_backend=object(), boards=OddsBoardRegistry())
+    service.fetch_live_odds = fetch  # type: ignore[method-assign]
+    return service
+
+
+def test_team_key_strips_affixes_accents_and_punctuation() -> None:
+    assert team_key("Arsenal FC") == team_key("Arsenal") == "arsenal"
+    assert team_key("AFC Bournemouth") == "bournemouth"
+    assert team_key("Atlético Madrid") == "atleticomadrid"
+    assert team_key("Brighton & Hove Albion") == "brightonhovealbion"
+
+
+@pytest.mark.asyncio
+async def test_whole_board_is_answered_by_one_fetch() -> None:
+    teams = [(f"Home {i} FC", f"Away {i}") for i in range(20)]
+    fetch = _CountingFetch([_event(h, a) for h, a in teams])
+    service = _service(fetch)
+
+    results = [await service.get_match_odds(h, a, "EPL") for h, a in teams]
+
+    assert fetch.calls == 1
+    assert all({"home_win", "draw", "away_win"} <= set(odds) for odds in results)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_lookups_share_one_fetch() -> None:
+    fetch = _CountingFetch([_event("Arsenal", "Chelsea")], delay=0.01)
+    service = _service(fetch)
+
+    results = await asyncio.gather(
+        *(service.get_match_odds("Arsenal FC", "Chelsea FC", "EPL") for _ in range(10))
+    )
+
+    assert fetch.calls == 1
+    assert all(odds["home_win"] == 2.1 for odds in results)
+
+
+def test_containment_fallback_and_miss() -> None:
+    board = LeagueOddsBoard.from_events(
+        "EPL",
+        [_event("Wolverhampton Wanderers", "Nottingham Forest")],
+        _service(_CountingFetch([]))._extract_h2h_odds,
+    )
+
+    assert board.lookup("Wolverhampton", "Nottingham Forest") is not None
+    assert board.lookup("Liverpool", "Everton") is None
+    # Returned dicts are copies; mutating one does not touch the board.
+    board.lookup("Wolverhampton", "Nottingham Forest")["home_win"] = 99.0
+    assert board.lookup("Wolverhampton", "Nottingham Forest")["home_win"] == 2.1
+
+
+@pytest.mark.asyncio
+async def test_scheduled_refresh_refetches_active_and_drops_idle() -> None:
+    fetch = _CountingFetch([_event("Arsenal", "Chelsea")])
+    service = _service(fetch)
+    await service.get_match_odds("Arsenal", "Chelsea", "EPL")
+    await service.get_match_odds("Arsenal", "Chelsea", "LA_LIGA")
+    service.boards._last_requested["LA_LIGA"] -= odds_board.ACTIVE_WINDOW_SECONDS + 1
+
+    summary = await service.refresh_odds_boards()
+
+    assert summary == {"refreshed": ["EPL"], "dropped": ["LA_LIGA"], "failed": []}
+    assert fetch.calls == 3
+    assert service.boards.peek("LA_LIGA") is None
+
+
+@pytest.mark.asyncio
+async def test_empty_board_is_retried_sooner_than_a_full_one() -> None:
+    fetch = _CountingFetch([])
+    service = _service(fetch)
+
+    odds = await service.get_match_odds("Arsenal", "Chelsea", "EPL")
+    assert odds["source"] == "unavailable"
+    board = service.boards.peek("EPL")
+    assert board.is_fresh()
+    assert not board.is_fresh(board.fetched_at + odds_board.EMPTY_BOARD_MAX_AGE_SECONDS)
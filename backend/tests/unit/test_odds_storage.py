@@ -0,0 +1,123 @@
+"""odds_history rollups and month-granular retention."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.database import Base, Match, OddsHistory, OddsRollup
+from src.db.odds_storage import (
+    add_months,
+    drop_expired_partitions,
+    ensure_partitions,
+    month_start,
+    partition_month,
+    partition_name,
+    upsert_odds_rollups,
+)
+from src.features.market import compute_market_drift
+
+KICKOFF = datetime(2026, 10, 18, 15, 0)
+
+
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        session.add(Match(id="m1", match_date=KICKOFF, status="scheduled", home_team_id="h", away_team_id="a"))
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+def _snap(hours_to_kickoff: float, home: float, bookmaker: str = "Betfair") -> dict:
+    return {
+        "match_id": "m1",
+        "bookmaker": bookmaker,
+        "home_win": home,
+        "draw": 3.4,
+        "away_win": 3.9,
+        "timestamp": KICKOFF - timedelta(hours=hours_to_kickoff),
+    }
+
+
+def test_month_helpers_round_trip() -> None:
+    month = month_start(datetime(2026, 12, 31, 23, 59, tzinfo=timezone.utc))
+    assert month == datetime(2026, 12, 1)
+    assert add_months(month, 1) == datetime(2027, 1, 1)
+    assert add_months(month, -12) == datetime(2025, 12, 1)
+    assert partition_name(month) == "odds_history_2026_12"
+    assert partition_month("odds_history_2026_12") == month
+    assert partition_month("odds_history_default") is None
+
+
+@pytest.mark.asyncio
+async def test_rollup_keeps_opening_latest_and_pre_kickoff_closing(db) -> None:
+    kickoffs = {"m1": KICKOFF}
+    await upsert_odds_rollups(db, [_snap(10, 2.10), _snap(5, 2.05)], kickoffs)
+    # A late-arriving earlier snapshot moves the opening, an in-play one only
+    # moves latest, and one batch can carry several snapshots per key.
+    await upsert_odds_rollups(db, [_snap(20, 2.30), _snap(1, 1.95), _snap(-0.5, 1.50)], kickoffs)
+    await db.commit()
+
+    rollup = (await db.execute(select(OddsRollup))).scalar_one()
+    assert rollup.market_type == "match_odds"
+    assert (rollup.opening_home, rollup.opening_at) == (2.30, KICKOFF - timedelta(hours=20))
+    assert (rollup.latest_home, rollup.latest_at) == (1.50, KICKOFF + timedelta(minutes=30))
+    assert (rollup.closing_home, rollup.closing_at) == (1.95, KICKOFF - timedelta(hours=1))
+    assert rollup.snapshot_count == 5
+
+    # Replaying a batch moves neither the prices nor the count.
+    await upsert_odds_rollups(db, [_snap(20, 2.30), _snap(1, 1.95), _snap(-0.5, 1.50)], kickoffs)
+    await db.commit()
+    await db.refresh(rollup)
+    assert rollup.snapshot_count == 5
+    assert (rollup.opening_home, rollup.latest_home, rollup.closing_home) == (2.30, 1.50, 1.95)
+
+    await upsert_odds_rollups(db, [_snap(3, 2.0, bookmaker="Pinnacle"), {**_snap(2, 2.0), "draw": None}])
+    await db.commit()
+    counts = dict((await db.execute(select(OddsRollup.bookmaker, OddsRollup.snapshot_count))).all())
+    assert counts == {"Betfair": 5, "Pinnacle": 1}
+
+
+@pytest.mark.asyncio
+async def test_market_drift_reads_opening_from_rollup(db) -> None:
+    now = datetime.now(timezone.utc)
+    await upsert_odds_rollups(
+        db,
+        [{**_snap(0, 2.50), "timestamp": now - timedelta(hours=2)}, {**_snap(0, 2.00), "timestamp": now}],
+    )
+    await db.commit()
+
+    result = await compute_market_drift({"home_win": 2.0, "draw": 3.4, "away_win": 3.9}, "m1", db)
+
+    assert result.data_gaps == []
+    assert result.features["odds_drift_home"] == pytest.approx(1 / 2.0 - 1 / 2.5, abs=1e-4)
+    assert result.per_feature_freshness_seconds["odds_drift_home"] >= 7200
+
+
+def test_retention_deletes_whole_months_on_unpartitioned_tables() -> None:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    now = datetime(2026, 10, 18)
+    stamps = [datetime(2026, 3, 31, 23), datetime(2026, 4, 1), datetime(2026, 4, 25), datetime(2026, 10, 1)]
+    with engine.begin() as conn:
+        conn.execute(
+            OddsHistory.__table__.insert(),
+            [{"match_id": "m1", "bookmaker": "Betfair", "timestamp": ts} for ts in stamps],
+        )
+        assert ensure_partitions(conn, now=now) == []
+        # 180 days before 18 Oct is 21 Apr: April is kept whole.
+        report = drop_expired_partitions(conn, retention_days=180, now=now)
+        remaining = conn.execute(select(OddsHistory.timestamp).order_by(OddsHistory.timestamp)).scalars().all()
+
+    assert report == {"cutoff": "2026-04-01T00:00:00", "partitions_dropped": [], "rows_deleted": 1}
+    assert remaining == stamps[1:]
+    engine.dispose()
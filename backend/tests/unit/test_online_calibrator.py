@@ -0,0 +1,183 @@
+"""Per-league online calibration: incremental Newton updates and persisted state."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.models.online_calibrator import (
+    ONLINE_STATE_KEY,
+    ONLINE_STATE_LOCK_KEY,
+    OnlineCalibrationEngine,
+    OnlineLeagueCalibration,
+    ingest_settled_predictions,
+    online_state_lock,
+)
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+class _DictCache:
+    def __init__(self) -> None:
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ttl=None):
+        self.store[key] = value
+        return True
+
+
+def _overconfident_sample(n: int, seed: int):
+    """Top-pick confidences whose true hit rate is sigmoid(0.6 * logit(p) - 0.2)."""
+    rng = np.random.default_rng(seed)
+    p = rng.uniform(0.36, 0.9, n)
+    logit = np.log(p / (1 - p))
+    hit = rng.uniform(size=n) < 1 / (1 + np.exp(-(0.6 * logit - 0.2)))
+    return p, hit.astype(float)
+
+
+def _batch_map(p, y, prior=10.0):
+    """Full-batch MAP fit with the same identity prior, for reference."""
+    X = np.column_stack([np.log(p / (1 - p)), np.ones_like(p)])
+    theta = np.array([1.0, 0.0])
+    for _ in range(50):
+        mu = 1 / (1 + np.exp(-X @ theta))
+        grad = prior * (theta - [1.0, 0.0]) - X.T @ (y - mu)
+        hess = prior * np.eye(2) + (X * (mu * (1 - mu))[:, None]).T @ X
+        theta -= np.linalg.solve(hess, grad)
+    return theta
+
+
+def test_incremental_updates_track_the_batch_fit() -> None:
+    p, y = _overconfident_sample(3000, seed=0)
+    state = OnlineLeagueCalibration()
+    for chunk in np.array_split(np.arange(len(p)), 60):
+        state.update(p[chunk], y[chunk])
+
+    np.testing.assert_allclose(state.theta, _batch_map(p, y), atol=0.03)
+    assert state.a == pytest.approx(0.6, abs=0.1)
+    assert state.samples_seen == 3000
+    assert state.effective_samples == pytest.approx(3000)
+    # Overconfident raw probabilities are pulled down.
+    assert float(state.calibrate(0.8)) < 0.8
+    assert state.reliability()["ece"] > 0.02
+
+
+def test_engine_ingests_only_new_settlements_and_round_trips() -> None:
+    cache = _DictCache()
+    engine = OnlineCalibrationEngine(cache=cache, clock=lambda: NOW, halflife_days=14)
+    records = [
+        {"prediction_id": i, "league": "EPL" if i % 2 else "ded", "outcome": i % 3,
+         "probs": [0.5, 0.3, 0.2], "settled_at": f"2026-10-{10 + i % 5:02d}T20:00:00"}
+        for i in range(1, 21)
+    ]
+
+    assert engine.ingest(records) == {"epl": 10, "ded": 10}
+    assert engine.ingest(records) == {}
+    engine.save()
+
+    restored = OnlineCalibrationEngine.load(cache=cache, clock=lambda: NOW + timedelta(days=14))
+    assert restored.to_dict() == engine.to_dict()
+    assert cache.store["calibration:epl"]["samples_used"] == 10
+    assert cache.store["calibration:epl"]["platt_a"] == engine.leagues["epl"].a
+
+    later = {"prediction_id": 21, "league": "epl", "outcome": 0,
+             "probs": [0.6, 0.2, 0.2], "settled_at": "2026-11-01T20:00:00"}
+    assert restored.ingest([later]) == {"epl": 1}
+    # One half-life later the ten earlier results weigh five.
+    assert restored.leagues["epl"].effective_samples == pytest.approx(6.0)
+    assert restored.leagues["epl"].samples_seen == 11
+
+
+def test_ingest_helper_persists_and_skips_unusable_records() -> None:
+    cache = _DictCache()
+    result = ingest_settled_predictions(
+        [
+            {"prediction_id": 1, "league": None, "outcome": 0, "probs": [0.5, 0.3, 0.2], "settled_at": None},
+            {"prediction_id": 2, "league": "epl", "outcome": 0, "probs": [0.5, None, 0.2], "settled_at": None},
+            {"prediction_id": 3, "league": "epl", "outcome": 2, "probs": [0.5, 0.3, 0.2], "settled_at": None},
+        ],
+        cache=cache,
+    )
+
+    assert result["leagues_updated"] == {"epl": 1}
+    assert cache.store[ONLINE_STATE_KEY]["prediction_high_water_mark"] == 3
+    assert cache.store["calibration:epl"]["accuracy"] == 0.0
+
+
+class _SlowCache(_DictCache):
+    """Reads yield the GIL long enough for an unlocked writer to interleave."""
+
+    def get(self, key):
+        value = super().get(key)
+        time.sleep(0.02)
+        return value
+
+
+def test_concurrent_ingests_do_not_lose_updates() -> None:
+    cache = _SlowCache()
+
+    def ingest(league: str, first_id: int) -> None:
+        ingest_settled_predictions(
+            [
+                {"prediction_id": first_id + i, "league": league, "outcome": 0,
+                 "probs": [0.6, 0.2, 0.2], "settled_at": None}
+                for i in range(3)
+            ],
+            cache=cache,
+        )
+
+    threads = [threading.Thread(target=ingest, args=args) for args in (("epl", 1), ("ded", 10))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    state = cache.store[ONLINE_STATE_KEY]
+    assert set(state["leagues"]) == {"epl", "ded"}
+    assert state["prediction_high_water_mark"] == 12
+
+
+class _FakeRedisLock:
+    def __init__(self, client, name, timeout, blocking_timeout):
+        self.client, self.name = client, name
+
+    def acquire(self):
+        self.client.events.append(("acquire", self.name))
+        return self.client.available
+
+    def release(self):
+        self.client.events.append(("release", self.name))
+
+
+class _FakeRedis:
+    def __init__(self, available: bool = True) -> None:
+        self.available = available
+        self.events = []
+
+    def lock(self, name, timeout, blocking_timeout):
+        return _FakeRedisLock(self, name, timeout, blocking_timeout)
+
+
+def test_state_lock_holds_the_redis_lock_around_the_write() -> None:
+    cache = _DictCache()
+    cache.redis_client = _FakeRedis()
+    ingest_settled_predictions(
+        [{"prediction_id": 1, "league": "epl", "outcome": 0, "probs": [0.5, 0.3, 0.2], "settled_at": None}],
+        cache=cache,
+    )
+    assert cache.redis_client.events == [("acquire", ONLINE_STATE_LOCK_KEY), ("release", ONLINE_STATE_LOCK_KEY)]
+
+    cache.redis_client = _FakeRedis(available=False)
+    with pytest.raises(TimeoutError):
+        with online_state_lock(cache):
+            pass
+    # The local lock is released even when the Redis lock was not granted.
+    with online_state_lock(_DictCache()):
+        pass
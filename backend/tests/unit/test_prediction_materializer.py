@@ -0,0 +1,141 @@
+"""Background prediction precompute: batched inference and change-only reruns."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.database import Base, Match, Odds
+from src.db.models import MaterializedPrediction
+from src.models.prediction import PredictionEngine
+from src.services.feature_store import FeatureStore
+from src.services.prediction_materializer import PredictionMaterializer, get_materialized_prediction
+
+NOW = datetime(2026, 10, 18, 12, 0)
+
+
+@pytest.fixture
+def engine():
+    rng = np.random.default_rng(7)
+    X = rng.normal(size=(90, 58))
+    model = LogisticRegression(max_iter=500).fit(X, np.arange(90) % 3)
+    PredictionEngine.clear_cache()
+    PredictionEngine.prime_cache("epl", model)
+    yield PredictionEngine()
+    PredictionEngine.clear_cache()
+
+
+@pytest.fixture
+async def db():
+    sql_engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with sql_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = sessionmaker(sql_engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        for i, days in enumerate((1, 3, 12)):
+            session.add(Match(
+                id=f"m{i}", league_id="epl", match_date=NOW + timedelta(days=days),
+                status="scheduled", home_team_id=f"h{i}", away_team_id=f"a{i}",
+            ))
+        await session.commit()
+        yield session
+    await sql_engine.dispose()
+
+
+class _Projector:
+    """Deterministic per-fixture vectors; counts projections."""
+
+    def __init__(self) -> None:
+        self.feature_store = FeatureStore("schema-a", max_age_seconds=0)
+        self.calls = []
+
+    async def build_live_feature_vector(self, match_id, league, db):
+        self.calls.append(match_id)
+        seed = int(match_id[1:])
+        return {
+            "features": np.random.default_rng(seed).normal(size=58).astype(np.float32),
+            "data_gaps": ["shot_quality_diff"],
+            "staleness_seconds": 60,
+        }
+
+
+@pytest.mark.asyncio
+async def test_predict_batch_matches_per_row_predict(engine) -> None:
+    rows = [np.random.default_rng(i).normal(size=58).astype(np.float32) for i in range(4)]
+    rows.append(np.zeros(40, dtype=np.float32))  # schema mismatch → fallback row
+
+    batch = await engine.predict_batch(rows, "epl")
+    single = [await engine.predict(row, "epl") for row in rows]
+
+    assert [r.to_dict() for r in batch] == [r.to_dict() for r in single]
+    assert batch[-1].model_version == single[-1].model_version
+    assert await engine.predict_batch([], "epl") == []
+
+
+@pytest.mark.asyncio
+async def test_pass_materializes_window_and_reruns_only_changed_fixtures(db, engine) -> None:
+    projector = _Projector()
+    materializer = PredictionMaterializer(projector=projector, engine=engine, clock=lambda: NOW)
+
+    first = await materializer.run(db, days_ahead=7)
+    assert first == {"fixtures": 2, "recomputed": 2, "unchanged": 0, "failed": 0}
+    rows = {r.match_id: r for r in (await db.execute(select(MaterializedPrediction))).scalars()}
+    assert set(rows) == {"m0", "m1"}
+    assert rows["m0"].features_summary == {"data_gaps": ["shot_quality_diff"], "staleness_seconds": 60}
+    assert abs(sum(rows["m0"].prediction[k] for k in ("home_win", "draw", "away_win")) - 1.0) < 1e-6
+
+    assert await materializer.run(db, days_ahead=7) == {
+        "fixtures": 2, "recomputed": 0, "unchanged": 2, "failed": 0,
+    }
+
+    db.add(Odds(match_id="m1", bookmaker="Betfair", home_win=2.0, draw=3.4, away_win=3.9, timestamp=NOW))
+    await db.commit()
+    assert await materializer.run(db, days_ahead=7) == {
+        "fixtures": 2, "recomputed": 1, "unchanged": 1, "failed": 0,
+    }
+    assert projector.calls == ["m0", "m1", "m1"]
+
+
+@pytest.mark.asyncio
+async def test_serving_read_is_stamped_and_age_capped(db, engine) -> None:
+    await PredictionMaterializer(projector=_Projector(), engine=engine, clock=lambda: NOW).run(db, days_ahead=30)
+    row = await db.get(MaterializedPrediction, "m2")
+    row.computed_at = row.verified_at = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=5)
+    await db.commit()
+
+    served = await get_materialized_prediction(db, "m2", max_age_seconds=3600)
+    assert served["freshness"]["source"] == "materialized"
+    assert served["freshness"]["model_version"] == served["prediction"]["model_version"]
+    assert served["features_summary"]["data_gaps"] == ["shot_quality_diff"]
+
+    assert served["freshness"]["age_seconds"] >= 300
+    assert await get_materialized_prediction(db, "missing", max_age_seconds=3600) is None
+    row.verified_at -= timedelta(hours=2)
+    await db.commit()
+    assert await get_materialized_prediction(db, "m2", max_age_seconds=3600) is None
+
+
+@pytest.mark.asyncio
+async def test_unchanged_fixture_stays_servable_past_max_age(db, engine, monkeypatch) -> None:
+    from src.services import prediction_materializer
+
+    projector = _Projector()
+    stale = NOW - timedelta(hours=7)
+    await PredictionMaterializer(projector=projector, engine=engine, clock=lambda: stale).run(db, days_ahead=7)
+    monkeypatch.setattr(prediction_materializer, "_now", lambda: NOW)
+    assert await get_materialized_prediction(db, "m0", max_age_seconds=6 * 3600) is None
+
+    counts = await PredictionMaterializer(projector=projector, engine=engine, clock=lambda: NOW).run(db, days_ahead=7)
+    assert counts["unchanged"] == 2 and projector.calls == ["m0", "m1"]
+
+    served = await get_materialized_prediction(db, "m0", max_age_seconds=6 * 3600)
+    assert served is not None
+    assert served["freshness"]["computed_at"] == stale.isoformat()
+    assert served["freshness"]["verified_at"] == NOW.isoformat()
+    assert served["freshness"]["age_seconds"] == 0
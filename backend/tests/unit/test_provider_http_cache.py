@@ -0,0 +1,142 @@
+"""Conditional-GET provider cache (providers/http_cache.py)."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from src.connectors.base import AsyncJSONClient
+from src.providers.base import BaseProvider
+from src.providers.http_cache import ProviderHTTPCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Upstream:
+    """MockTransport handler: ETag'd JSON body, 304 when the validator matches."""
+
+    def __init__(self, cache_control: str | None = None) -> None:
+        self.requests: list[httpx.Request] = []
+        self.cache_control = cache_control
+        self.remaining = 100
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.remaining -= 1
+        headers = {"ETag": '"v1"', "x-requests-remaining": str(self.remaining)}
+        if self.cache_control:
+            headers["Cache-Control"] = self.cache_control
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, headers=headers, json={"matches": [1, 2, 3]})
+
+
+class _Provider(BaseProvider):
+    provider_id = "fake"
+
+
+def _provider(upstream: _Upstream, cache: ProviderHTTPCache) -> _Provider:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+    return _Provider(enabled=True, http_client=client, response_cache=cache)
+
+
+@pytest.mark.asyncio
+async def test_304_is_a_hit_and_carries_fresh_quota_headers() -> None:
+    upstream = _Upstream()
+    cache = ProviderHTTPCache(clock=_Clock())
+    provider = _provider(upstream, cache)
+
+    first, _ = await provider._get_json("https://api.test/matches", params={"apiKey": "s3cret"})
+    second, headers = await provider._get_json("https://api.test/matches", params={"apiKey": "s3cret"})
+
+    assert first == second == {"matches": [1, 2, 3]}
+    assert upstream.requests[1].headers["If-None-Match"] == '"v1"'
+    assert headers["x-requests-remaining"] == "98"
+    stats = cache.stats("fake")
+    assert stats["misses"] == 1 and stats["not_modified"] == 1
+    assert stats["downloads_saved"] == 1 and stats["requests_saved"] == 0
+
+
+@pytest.mark.asyncio
+async def test_max_age_serves_without_a_request_until_expiry() -> None:
+    upstream = _Upstream(cache_control="max-age=60")
+    clock = _Clock()
+    cache = ProviderHTTPCache(clock=clock)
+    provider = _provider(upstream, cache)
+
+    _, live = await provider._get_json("https://api.test/standings")
+    _, cached = await provider._get_json("https://api.test/standings")
+    assert len(upstream.requests) == 1
+    assert cache.stats("fake")["requests_saved"] == 1
+    # A fresh hit spent no quota, so it must not replay the stored counter.
+    assert live["x-requests-remaining"] == "99"
+    assert "x-requests-remaining" not in cached
+    assert "x-requests-remaining" not in cache.get(cache.key("https://api.test/standings")).headers
+
+    clock.now += 61
+    _, revalidated = await provider._get_json("https://api.test/standings")
+    assert len(upstream.requests) == 2
+    assert cache.stats("fake")["not_modified"] == 1
+    assert revalidated["x-requests-remaining"] == "98"
+
+
+@pytest.mark.asyncio
+async def test_no_store_and_validatorless_responses_are_not_cached() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/no-store":
+            return httpx.Response(200, headers={"Cache-Control": "no-store", "ETag": '"x"'}, json={})
+        return httpx.Response(200, json={})
+
+    cache = ProviderHTTPCache()
+    provider = _Provider(
+        enabled=True,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        response_cache=cache,
+    )
+
+    await provider._get_json("https://api.test/no-store")
+    await provider._get_json("https://api.test/plain")
+
+    assert cache._entries == {}
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_survives_restart_without_persisting_secrets(tmp_path) -> None:
+    path = tmp_path / "http_cache.sqlite3"
+    upstream = _Upstream()
+    first = ProviderHTTPCache(path=path)
+    await _provider(upstream, first)._get_json("https://api.test/odds", params={"apiKey": "s3cret"})
+    first.close()
+
+    restarted = ProviderHTTPCache(path=path)
+    payload, _ = await _provider(upstream, restarted)._get_json(
+        "https://api.test/odds", params={"apiKey": "s3cret"}
+    )
+
+    assert payload == {"matches": [1, 2, 3]}
+    assert upstream.requests[-1].headers["If-None-Match"] == '"v1"'
+    assert restarted.stats("fake")["not_modified"] == 1
+    restarted.close()
+    assert b"s3cret" not in path.read_bytes()
+
+
+@pytest.mark.asyncio
+async def test_async_json_client_revalidates_through_shared_cache() -> None:
+    upstream = _Upstream()
+    cache = ProviderHTTPCache()
+    client = AsyncJSONClient(base_url="https://api.test/v4", response_cache=cache)
+    client._client = httpx.AsyncClient(
+        base_url="https://api.test/v4", transport=httpx.MockTransport(upstream)
+    )
+
+    async with client:
+        assert await client.get_json("/competitions/PL/matches") == {"matches": [1, 2, 3]}
+        assert await client.get_json("/competitions/PL/matches") == {"matches": [1, 2, 3]}
+
+    assert cache.stats("api.test")["not_modified"] == 1
@@ -0,0 +1,110 @@
+"""Vectorised betting env core: per-lane dynamics, auto-reset and sharding."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.services.rl_betting_env import (
+    MAX_KELLY_CAP,
+    TERMINAL_PENALTY,
+    W_ABS,
+    W_CAL,
+    W_IC,
+    W_PNL,
+    W_RISK,
+    BettingEnvBatch,
+    BettingEnvPool,
+)
+
+LABELS = np.random.default_rng(0).integers(0, 3, size=500)
+
+
+def _fix_match(batch: BettingEnvBatch, probs, odds, result: int, epistemic: float) -> None:
+    batch._probs[:] = np.asarray(probs, dtype=np.float32)
+    batch._odds[:] = np.asarray(odds, dtype=np.float32)
+    batch._result[:] = result
+    batch._epistemic[:] = epistemic
+
+
+def test_single_step_reward_matches_spec() -> None:
+    batch = BettingEnvBatch(LABELS, n_envs=3, curriculum_phase=2, seed=1)
+    batch.reset()
+    probs, odds = [0.6, 0.25, 0.15], [2.1, 3.6, 5.5]
+    _fix_match(batch, probs, odds, result=0, epistemic=0.2)
+
+    # Lane 0 backs home at the stake signal 0, lane 1 backs away, lane 2 abstains.
+    actions = np.array([[2, 0, 0, 0, 0.0], [0, 0, 2, 0, 0.0], [0, 0, 0, 2, 1.0]])
+    step = batch.step(actions)
+
+    p = np.asarray(probs, dtype=np.float32).astype(float)
+    o = np.asarray(odds, dtype=np.float32).astype(float)
+    stake = 0.5 * MAX_KELLY_CAP
+    base = np.array([0.420, 0.246, 0.334])
+    r_ic = np.clip(np.sum(p * np.log((p + 1e-8) / (base + 1e-8))) / np.log(3.0), -1, 1)
+
+    def pnl_component(k: int, won: bool) -> float:
+        kelly = min(max(0.0, (p[k] * o[k] - 1) / (o[k] - 1)), MAX_KELLY_CAP)
+        if kelly < 1e-6:
+            return 0.0
+        r = stake / kelly * (o[k] - 1) if won else -stake / kelly
+        return r - 0.5 * ((stake - kelly) / (kelly + 1e-8)) ** 2
+
+    bankroll_lost = 1.0 - stake
+    expected = [
+        W_PNL * pnl_component(0, True) + W_IC * r_ic + W_CAL * -abs(p[0] - 1.0),
+        W_PNL * pnl_component(2, False) + W_IC * r_ic + W_CAL * -p[2] + W_RISK * -(1 - bankroll_lost),
+        W_IC * r_ic + W_ABS * 0.10,
+    ]
+    np.testing.assert_allclose(step.reward, expected, rtol=1e-9)
+    np.testing.assert_allclose(step.pnl, [stake * (o[0] - 1), -stake, 0.0])
+    np.testing.assert_allclose(step.bankroll_pct, [1 + stake * (o[0] - 1), bankroll_lost, 1.0])
+    assert step.abstain.tolist() == [False, False, True]
+    assert step.info(1) == {
+        "bankroll_pct": pytest.approx(bankroll_lost), "abstain": False,
+        "pnl": pytest.approx(-stake), "wagered": pytest.approx(stake), "won": False,
+    }
+
+
+def test_lanes_auto_reset_on_truncation_and_ruin() -> None:
+    batch = BettingEnvBatch(LABELS, n_envs=4, episode_length=5, curriculum_phase=0, seed=2)
+    obs = batch.reset()
+    assert obs.shape == (4, 16) and obs.dtype == np.float32
+    assert (obs[:, :3].max(axis=1) > 0.60).all()  # phase-0 curriculum
+
+    for _ in range(4):
+        assert not batch.step(np.tile([0, 0, 0, 2, 0.0], (4, 1))).done.any()
+    step = batch.step(np.tile([0, 0, 0, 2, 0.0], (4, 1)))
+    assert step.truncated.all()
+    assert (batch.steps == 0).all()
+    np.testing.assert_array_equal(step.obs[:, 11], 1.0)  # bankroll_pct after reset
+
+    batch.bankroll[:] = batch.peak_bankroll[:] = 0.102
+    step = batch.step(np.tile([2, 0, 0, 0, 2.0], (4, 1)))
+    lost = ~step.won
+    assert lost.any()
+    assert step.terminated[lost].all()
+    assert (step.reward[lost] < TERMINAL_PENALTY + 1).all()
+    assert (step.terminal_obs[lost, 11] < 0.1).all() and (step.obs[lost, 11] == 1.0).all()
+
+
+def test_pool_shards_match_in_process_batches() -> None:
+    pool = BettingEnvPool(LABELS, n_envs=5, n_procs=2, curriculum_phase=1, seed=7, start_method="fork")
+    shards = [
+        BettingEnvBatch(LABELS, 3, curriculum_phase=1, seed=7, lane_offset=0, total_lanes=5),
+        BettingEnvBatch(LABELS, 2, curriculum_phase=1, seed=8, lane_offset=3, total_lanes=5),
+    ]
+    try:
+        np.testing.assert_array_equal(pool.reset(), np.concatenate([s.reset() for s in shards]))
+        actions = np.random.default_rng(3).uniform(-2, 2, size=(20, 5, 5))
+        pool.curriculum_phase = 2
+        for shard in shards:
+            shard.curriculum_phase = 2
+        for a in actions:
+            got = pool.step(a)
+            want = [shards[0].step(a[:3]), shards[1].step(a[3:])]
+            np.testing.assert_array_equal(got.obs, np.concatenate([w.obs for w in want]))
+            np.testing.assert_array_equal(got.reward, np.concatenate([w.reward for w in want]))
+            np.testing.assert_array_equal(got.components["R_pnl"], np.concatenate([w.components["R_pnl"] for w in want]))
+    finally:
+        pool.close()
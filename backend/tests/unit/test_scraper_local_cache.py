@@ -0,0 +1,123 @@
+"""Columnar, memoized local cache behind BaseScraper._load_local/_save_local."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from src.data.scrapers import base_scraper  # noqa: E402
+from src.data.scrapers.base_scraper import BaseScraper  # noqa: E402
+from src.data.scrapers.local_cache import LocalDatasetCache  # noqa: E402
+
+
+class _Scraper(BaseScraper):
+    def _fetch_remote(self, *args: Any, **kwargs: Any) -> Any:
+        return None
+
+    def _parse_data(self, page_content: Any) -> Any:
+        return page_content
+
+
+def _matches(*rows) -> pd.DataFrame:
+    return pd.DataFrame(
+        [{"date": d, "home_team": h, "away_team": a, "home_goals": g} for d, h, a, g in rows]
+    )
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_append_dedupes_on_keys_last_write_wins(tmp_path) -> None:
+    cache = LocalDatasetCache(tmp_path)
+
+    assert cache.append("m", _matches(("2024-08-01", "A", "B", 1), ("2024-08-02", "C", "D", 0)),
+                        ["date", "home_team", "away_team"]) == 2
+    # One verbatim repeat (skipped) and one correction to an existing key.
+    assert cache.append("m", _matches(("2024-08-01", "A", "B", 1), ("2024-08-02", "C", "D", 3))) == 1
+
+    frame = LocalDatasetCache(tmp_path).load("m")  # fresh process view
+    assert len(frame) == 2
+    assert frame.set_index("home_team").loc["C", "home_goals"] == 3
+    manifest = cache.manifest("m")
+    assert manifest["rows"] == 2 and len(manifest["parts"]) == 2
+
+
+def test_compaction_rewrites_parts_into_one(tmp_path) -> None:
+    cache = LocalDatasetCache(tmp_path, compact_after=3)
+    for day in range(5):
+        cache.append("m", _matches((f"2024-08-0{day + 1}", "A", "B", day)), ["date"])
+
+    manifest = cache.manifest("m")
+    assert len(manifest["parts"]) == 2
+    assert sorted(p.name for p in (tmp_path / "m").glob("*.parquet")) == [
+        p["file"] for p in manifest["parts"]
+    ]
+    assert len(LocalDatasetCache(tmp_path).load("m")) == 5
+
+
+def test_repeated_loads_do_not_touch_disk_until_stat_interval(tmp_path, monkeypatch) -> None:
+    clock = _Clock()
+    path = tmp_path / "raw.json"
+    path.write_text('{"a": 1}')
+    cache = LocalDatasetCache(tmp_path, stat_interval=30.0, clock=clock)
+    reads = []
+
+    def reader(p):
+        reads.append(p)
+        return {"a": len(reads)}
+
+    assert cache.read_file(path, reader) == {"a": 1}
+    monkeypatch.setattr(type(path), "stat", lambda self: pytest.fail("stat inside interval"))
+    for _ in range(5):
+        cache.read_file(path, reader)["a"] = 99  # callers get copies
+    assert cache.read_file(path, reader) == {"a": 1}
+    monkeypatch.undo()
+
+    path.write_text('{"a": 22}')
+    clock.now = 31.0
+    assert cache.read_file(path, reader) == {"a": 2}
+    assert len(reads) == 2
+
+
+def test_scraper_saves_frames_to_dataset_and_memoizes_merge(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(base_scraper, "get_local_dataset_cache", lambda root: LocalDatasetCache(tmp_path / "ds"))
+    scraper = _Scraper("https://example.com")
+    scraper.local_raw_path = tmp_path / "raw.csv"
+    scraper.local_processed_path = tmp_path / "processed.csv"
+    _matches(("2024-08-01", "A", "B", 1)).to_csv(scraper.local_raw_path, index=False)
+
+    scraper._save_local(_matches(("2024-08-01", "A", "B", 2), ("2024-08-03", "E", "F", 0)))
+
+    assert not scraper.local_processed_path.exists()  # went to Parquet instead
+    merged = scraper._load_local()
+    assert len(merged) == 2
+    assert merged.set_index("home_team").loc["A", "home_goals"] == 2
+
+    calls = []
+    original = scraper._merge_data
+    monkeypatch.setattr(scraper, "_merge_data", lambda *a: calls.append(1) or original(*a))
+    merged.loc[:, "home_goals"] = -1
+    again = scraper._load_local()
+    assert calls == []
+    assert (again["home_goals"] >= 0).all()
+
+
+def test_json_payloads_are_compact_and_reload(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(base_scraper, "get_local_dataset_cache", lambda root: LocalDatasetCache(tmp_path / "ds"))
+    scraper = _Scraper("https://example.com")
+    scraper.local_processed_path = tmp_path / "odds.json"
+
+    assert scraper._load_local() is None
+    scraper._save_local({"EPL": {"home": 2.1}})
+
+    assert scraper.local_processed_path.read_text() == '{"EPL":{"home":2.1}}'
+    assert scraper._load_local() == {"EPL": {"home": 2.1}}
@@ -10,6 +10,7 @@ Contracts verified:
      consecutive_failures; the next successful pass resets it to 0.
   4. AsyncSessionLocal is None -> outcome="db_not_ready", no raise.
   5. get_walk_forward_registry() is memoized (same instance across calls).
+  6. A second pass only fetches/scores predictions settled since the first.
 """
 from __future__ import annotations
 
@@ -25,15 +26,38 @@ from src.data.loaders.football_data_api import FootballDataAPIError
 from src.db.models import MatchPredictionLog
 
 
+class _DictCache:
+    def __init__(self) -> None:
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ttl=None):
+        self.store[key] = value
+        return True
+
+
 @pytest.fixture(autouse=True)
-def _reset_settlement_module_state():
+def _reset_settlement_module_state(monkeypatch):
     """settlement_service holds module-level mutable state — reset it before
     every test so results don't leak across tests in the same process."""
+    from src.core import cache
     from src.services import settlement_service
 
+    # Online calibration state (calibration:online) goes to a per-test cache;
+    # the shared cache_manager persists it across tests when Redis is up.
+    monkeypatch.setattr(cache, "cache_manager", _DictCache())
+
+    from src.models.evaluation.walk_forward import IncrementalWalkForwardEvaluator
+
     settlement_service._last_result = {"outcome": "never_run", "consecutive_failures": 0}
     settlement_service._registry_instance = None
+    # In-memory evaluator: a persisted state file would carry prediction ids
+    # from one test's in-memory database into the next.
+    settlement_service._evaluator_instance = IncrementalWalkForwardEvaluator()
     yield
+    settlement_service._evaluator_instance = None
 
 
 @pytest.fixture
@@ -125,7 +149,7 @@ async def test_run_settlement_pass_genuine_exception_then_recovers(factory) -> N
     with patch("src.db.session.AsyncSessionLocal", new=factory), patch(
         "src.data.loaders.football_data_api.FootballDataAPIClient", return_value=empty_provider
     ), patch(
-        "src.repositories.fixtures.get_settled_predictions",
+        "src.repositories.fixtures.get_settled_predictions_since",
         new=AsyncMock(side_effect=RuntimeError("boom")),
     ):
         failed = await settlement_service.run_settlement_pass()
@@ -142,6 +166,100 @@ async def test_run_settlement_pass_genuine_exception_then_recovers(factory) -> N
     assert recovered["consecutive_failures"] == 0
 
 
+async def test_run_settlement_pass_only_scores_newly_settled_predictions(factory) -> None:
+    from src.services import settlement_service
+
+    await _seed_settled_predictions(factory, n=10)
+    empty_provider = AsyncMock()
+    empty_provider.get_recent_results.return_value = []
+
+    with patch("src.db.session.AsyncSessionLocal", new=factory), patch(
+        "src.data.loaders.football_data_api.FootballDataAPIClient", return_value=empty_provider
+    ):
+        first = await settlement_service.run_settlement_pass()
+
+        # Settle two more fixtures after the first pass.
+        async with factory() as session:
+            late = datetime(2030, 1, 1)
+            for i in range(10, 12):
+                match_id = f"fd-settled-{i}"
+                session.add(
+                    Match(
+                        id=match_id, home_team_id="team-home", away_team_id="team-away",
+                        league_id="DED", match_date=datetime(2026, 8, 1) + timedelta(days=i),
+                        status="finished", home_score=2, away_score=0, updated_at=late,
+                    )
+                )
+                session.add(
+                    MatchPredictionLog(
+                        match_id=match_id, canonical_fixture_id=None, model_version="v5_phase7",
+                        calibration_method=None, home_probability=0.5, draw_probability=0.3,
+                        away_probability=0.2, confidence=0.5, created_at=datetime(2026, 8, 1),
+                    )
+                )
+            await session.commit()
+
+        second = await settlement_service.run_settlement_pass()
+
+    assert first["settled_predictions_new"] == 10
+    assert second["settled_predictions_new"] == 2
+    assert second["settled_predictions_total"] == 12
+    assert second["walk_forward"]["total_records"] == 12
+    # The same two records move the league's online calibrator.
+    assert second["online_calibration"]["leagues_updated"] == {"ded": 2}
+
+
+async def test_run_settlement_pass_normalises_an_offset_high_water_mark(factory, tmp_path) -> None:
+    from src.models.evaluation.walk_forward import IncrementalWalkForwardEvaluator
+    from src.services import settlement_service
+
+    await _seed_settled_predictions(factory, n=10)
+    async with factory() as session:
+        session.add(
+            Match(
+                id="fd-settled-late", home_team_id="team-home", away_team_id="team-away",
+                league_id="DED", match_date=datetime(2026, 9, 1), status="finished",
+                home_score=1, away_score=1, updated_at=datetime(2030, 1, 1, 12, 0),
+            )
+        )
+        session.add(
+            MatchPredictionLog(
+                match_id="fd-settled-late", canonical_fixture_id=None, model_version="v5_phase7",
+                calibration_method=None, home_probability=0.4, draw_probability=0.3,
+                away_probability=0.3, confidence=0.4, created_at=datetime(2026, 9, 1),
+            )
+        )
+        await session.commit()
+
+    # A mark persisted with an offset: 13:00+02:00 is 11:00 UTC, before the
+    # late settlement, so it must still be picked up.
+    saved = IncrementalWalkForwardEvaluator(state_path=tmp_path / "walk_forward.json")
+    saved.settled_high_water_mark = "2030-01-01T13:00:00+02:00"
+    saved.prediction_high_water_mark = 10
+    saved.save()
+    evaluator = IncrementalWalkForwardEvaluator(state_path=tmp_path / "walk_forward.json")
+    assert evaluator.settled_high_water_mark == "2030-01-01T11:00:00"
+    settlement_service._evaluator_instance = evaluator
+    empty_provider = AsyncMock()
+    empty_provider.get_recent_results.return_value = []
+
+    with patch("src.db.session.AsyncSessionLocal", new=factory), patch(
+        "src.data.loaders.football_data_api.FootballDataAPIClient", return_value=empty_provider
+    ):
+        result = await settlement_service.run_settlement_pass()
+
+    assert result["outcome"] == "ok"
+    assert evaluator.settled_high_water_mark == "2030-01-01T12:00:00"
+
+
+def test_parse_settled_high_water_mark_returns_naive_utc() -> None:
+    from src.repositories.fixtures import parse_settled_high_water_mark
+
+    assert parse_settled_high_water_mark(None) is None
+    assert parse_settled_high_water_mark("2030-01-01T13:00:00+02:00") == datetime(2030, 1, 1, 11, 0)
+    assert parse_settled_high_water_mark("2030-01-01T11:00:00") == datetime(2030, 1, 1, 11, 0)
+
+
 async def test_run_settlement_pass_db_not_ready() -> None:
     from src.services.settlement_service import run_settlement_pass
 
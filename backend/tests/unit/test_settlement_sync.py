@@ -109,6 +109,8 @@ async def test_sync_settled_results_updates_matched_match(session: AsyncSession)
     assert match.status == "finished"
     assert match.home_score == 2
     assert match.away_score == 1
+    # Naive UTC, like every other Match.updated_at writer.
+    assert match.updated_at is not None and match.updated_at.tzinfo is None
 
 
 async def test_sync_settled_results_idempotent(session: AsyncSession) -> None:
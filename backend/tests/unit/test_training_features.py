@@ -0,0 +1,141 @@
+"""As-of training features: grouped-window aggregates vs the per-match definition."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.core.database import Base, League, Match, MatchStats
+from src.models.training_features import (
+    build_league_training_frame,
+    compute_asof_features,
+    load_league_history,
+    training_records,
+)
+
+TEAMS = ["ars", "che", "liv", "mci", "tot", "eve"]
+START = datetime(2024, 8, 1)
+
+
+def _history(n: int = 240, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(n):
+        home, away = rng.choice(TEAMS, size=2, replace=False)
+        rows.append({
+            "match_id": f"m{i:04d}",
+            "match_date": pd.Timestamp(START) + pd.Timedelta(days=int(i * 1.5), hours=int(rng.integers(0, 3))),
+            "league_id": "EPL",
+            "home_team_id": home,
+            "away_team_id": away,
+            "home_score": int(rng.poisson(1.5)),
+            "away_score": int(rng.poisson(1.1)),
+            "home_xg": float(rng.gamma(2.0, 0.7)) if rng.uniform() > 0.2 else np.nan,
+            "away_xg": float(rng.gamma(2.0, 0.6)) if rng.uniform() > 0.2 else np.nan,
+        })
+    return pd.DataFrame(rows).sample(frac=1.0, random_state=1)  # row order must not matter
+
+
+def _reference(history: pd.DataFrame, match) -> dict:
+    """The per-match queries train_all_models used to issue, over a frame."""
+    before = history[history.match_date < match.match_date]
+    home = before[(before.home_team_id == match.home_team_id)
+                  & (before.match_date >= match.match_date - timedelta(days=60))]
+    home = home.sort_values("match_date", ascending=False).head(5)
+    away = before[(before.away_team_id == match.away_team_id)
+                  & (before.match_date >= match.match_date - timedelta(days=60))]
+    away = away.sort_values("match_date", ascending=False).head(5)
+    pair = {match.home_team_id, match.away_team_id}
+    h2h = before[before.home_team_id.isin(pair) & before.away_team_id.isin(pair)
+                 & (before.match_date >= match.match_date - timedelta(days=730))]
+    h2h = h2h.sort_values("match_date", ascending=False).head(5)
+
+    def form(rows, us, them):
+        return [1 if a > b else 0.5 if a == b else 0 for a, b in zip(rows[us], rows[them])]
+
+    home_form, away_form = form(home, "home_score", "away_score"), form(away, "away_score", "home_score")
+    return {
+        "home_goals_scored_l5": home.home_score.sum(),
+        "home_goals_conceded_l5": home.away_score.sum(),
+        "home_xg_l5": home.home_xg.fillna(0).sum() / max(len(home), 1),
+        "home_xga_l5": home.away_xg.fillna(0).sum() / max(len(home), 1),
+        "away_goals_scored_l5": away.away_score.sum(),
+        "away_goals_conceded_l5": away.home_score.sum(),
+        "away_xg_l5": away.away_xg.fillna(0).sum() / max(len(away), 1),
+        "away_xga_l5": away.home_xg.fillna(0).sum() / max(len(away), 1),
+        "home_form_last_5": home_form,
+        "away_form_last_5": away_form,
+        "home_points_l5": sum(3 if x == 1 else 1 if x == 0.5 else 0 for x in home_form),
+        "away_points_l5": sum(3 if x == 1 else 1 if x == 0.5 else 0 for x in away_form),
+        "home_clean_sheets_l5": int((home.away_score == 0).sum()),
+        "away_clean_sheets_l5": int((away.home_score == 0).sum()),
+        "h2h_home_wins_l5": int(((h2h.home_team_id == match.home_team_id) & (h2h.home_score > h2h.away_score)).sum()),
+        "h2h_goals_per_game": sum(m.home_score + m.away_score for m in h2h.itertuples() if m.home_score) / max(len(h2h), 1),
+    }
+
+
+def test_grouped_windows_match_per_match_definition() -> None:
+    history = _history()
+    frame = compute_asof_features(history)
+    records = training_records(frame)
+
+    assert len(frame) == len(history)
+    for match, record, label in zip(frame.itertuples(), records, frame["label"]):
+        expected = _reference(history, match)
+        assert record == pytest.approx(expected), match.match_id
+        assert label == (0 if match.home_score > match.away_score else 1 if match.home_score == match.away_score else 2)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(engine)()
+    session.add(League(id="EPL", name="Premier League"))
+    for match in _history(120).itertuples():
+        session.add(Match(
+            id=match.match_id, league_id="EPL", match_date=match.match_date.to_pydatetime(),
+            home_team_id=match.home_team_id, away_team_id=match.away_team_id,
+            home_score=match.home_score, away_score=match.away_score, status="finished",
+        ))
+        if not np.isnan(match.home_xg):
+            session.add(MatchStats(match_id=match.match_id, team_id=match.home_team_id, expected_goals=match.home_xg))
+    session.add(Match(id="other", league_id="LALIGA", match_date=START, home_team_id="rma",
+                      away_team_id="fcb", home_score=1, away_score=1, status="finished"))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def test_league_history_is_one_read_with_xg(db) -> None:
+    history = load_league_history(db, "epl")
+    assert len(history) == 120 and set(history.league_id) == {"EPL"}
+    assert history.home_xg.notna().any() and history.away_xg.isna().all()
+    # League name matches too.
+    assert len(load_league_history(db, "premier")) == 120
+
+
+def test_cached_frame_is_reused_until_data_changes(db, tmp_path) -> None:
+    end = START + timedelta(days=400)
+    cutoff = START + timedelta(days=30)
+    first = build_league_training_frame(db, "epl", cutoff, end, cache_dir=tmp_path)
+    assert first.match_date.min() >= pd.Timestamp(cutoff)
+    # Pre-window matches still feed the first rows' form.
+    assert sum(len(f) for f in first.home_form_last_5.iloc[:3]) > 0
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
+
+    cached = build_league_training_frame(db, "epl", cutoff, end, cache_dir=tmp_path)
+    assert training_records(cached) == training_records(first)
+
+    db.add(Match(id="late", league_id="EPL", match_date=end - timedelta(days=1), home_team_id="ars",
+                 away_team_id="che", home_score=3, away_score=0, status="finished"))
+    db.commit()
+    rebuilt = build_league_training_frame(db, "epl", cutoff, end, cache_dir=tmp_path)
+    assert len(rebuilt) == len(first) + 1
+    assert len(list(tmp_path.glob("*.parquet"))) == 2
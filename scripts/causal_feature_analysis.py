@@ -52,6 +52,15 @@ def main() -> int:
     parser.add_argument("--data-dir", default="data/processed", help="Path to processed data directory")
     parser.add_argument("--alpha", type=float, default=0.05, help="Significance level")
     parser.add_argument("--practical-ate", type=float, default=0.02, help="Practical ATE threshold")
+    parser.add_argument(
+        "--p-value",
+        choices=["normal", "permutation"],
+        default="normal",
+        help="p-value method: normal approximation or permutation test of ATE(win)",
+    )
+    parser.add_argument("--permutations", type=int, default=1000, help="Outcome shuffles for --p-value permutation")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for the permutation test")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the permutation test")
     args = parser.parse_args()
 
     data_dir = Path(args.data_dir)
@@ -70,7 +79,13 @@ def main() -> int:
 
     selector = CausalFeatureSelector(alpha_threshold=args.alpha, practical_ate=args.practical_ate)
     results = selector.analyze(
-        frame, outcome_col="match_result", feature_cols=numeric_feature_cols
+        frame,
+        outcome_col="match_result",
+        feature_cols=numeric_feature_cols,
+        p_value_method=args.p_value,
+        n_permutations=args.permutations,
+        seed=args.seed,
+        n_jobs=args.jobs,
     )
     graph = selector.build_graph(frame, feature_cols=numeric_feature_cols)
 
@@ -89,6 +104,7 @@ def main() -> int:
         "feature_count": len(results),
         "canonical_features": len(CANONICAL_FEATURES_58),
         "method": "analysis-only",
+        "p_value_method": args.p_value,
     }
 
     graph_path = data_dir / "causal_graph.json"
@@ -16,6 +16,19 @@ Constraint C8 (hard): Every trial objective includes the draw_recall_penalty:
 
 Validation gate: predicted_draw_rate / 0.246 ≥ 0.60 for every output artifact.
 
+Study-level data cache (StudyDataCache):
+    Fold indices, fold slices and balanced sample weights are computed once per
+    study; XGBoost/LightGBM trials train on per-fold xgb.DMatrix / lgb.Dataset
+    objects built once and reused by every trial.  Each fold reports the running
+    objective to the pruner (median or hyperband) so hopeless trials stop after
+    the first fold.  --jobs N runs trials in N processes against shared storage:
+
+    python scripts/optuna_tune_ensemble.py --league all --trials 100 --jobs 4 \\
+        --storage journal:backend/models/optuna_journal.log --pruner hyperband
+
+    A study already present in the storage is only continued with --resume;
+    otherwise the run stops rather than mixing in trials scored on older data.
+
 Pre-conditions (enforced at startup):
     - BUG-007 must be fixed (this script always uses method='isotonic')
     - Data CSVs must exist under --data-dir: {league}_training.csv
@@ -24,16 +37,21 @@ Pre-conditions (enforced at startup):
 
 import argparse
 import logging
+import os
 import pickle
 import sys
 import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
+import lightgbm as lgb
 import numpy as np
 import optuna
 import pandas as pd
+import xgboost as xgb
 from lightgbm import LGBMClassifier
 from sklearn.calibration import CalibratedClassifierCV
 from sklearn.ensemble import RandomForestClassifier
@@ -295,58 +313,317 @@ def calibrate_draw_threshold(proba: np.ndarray) -> Optional[float]:
     return float(sorted_desc[n_needed - 1])
 
 
-# ── cross-validated objective ─────────────────────────────────────────────────
+# ── study-level data cache ────────────────────────────────────────────────────
 
-def cv_objective(
-    model_factory,
-    X: np.ndarray,
-    y: np.ndarray,
+class StudyDataCache:
+    """Fold-level data shared by every trial of a study.
+
+    TimeSeriesSplit indices, fold slices and balanced sample weights are built
+    once.  Native boosting datasets (lgb.Dataset / xgb.DMatrix) are built lazily,
+    once per fold and per process, with ``free_raw_data=False`` so LightGBM keeps
+    its binned representation across trials.  Native handles are not picklable,
+    so they are dropped when the cache is shipped to a worker process and rebuilt
+    there on first use.
+    """
+
+    def __init__(self, X: np.ndarray, y: np.ndarray, n_splits: int = CV_FOLDS, n_threads: int = -1):
+        self.X = X
+        self.y = y
+        self.n_threads = n_threads
+        self.folds: List[Tuple[np.ndarray, np.ndarray]] = list(
+            TimeSeriesSplit(n_splits=n_splits).split(X)
+        )
+        self._slices = [
+            (X[tr], y[tr], compute_sample_weight(class_weight="balanced", y=y[tr]), X[va], y[va])
+            for tr, va in self.folds
+        ]
+        self._lgb: Dict[int, lgb.Dataset] = {}
+        self._xgb: Dict[int, Tuple[xgb.DMatrix, xgb.DMatrix]] = {}
+
+    def __len__(self) -> int:
+        return len(self.folds)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_lgb"] = {}
+        state["_xgb"] = {}
+        return state
+
+    def fold(self, i: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(X_train, y_train, sample_weight, X_val, y_val) for fold i."""
+        return self._slices[i]
+
+    def lgb_dataset(self, i: int) -> lgb.Dataset:
+        """Training Dataset for fold i; trials predict on the raw validation slice."""
+        if i not in self._lgb:
+            X_t, y_t, sw, _, _ = self._slices[i]
+            # LGBMClassifier(class_weight="balanced") multiplies the balanced
+            # sample_weight passed to fit() by the class weight again.
+            train = lgb.Dataset(
+                X_t, label=y_t, weight=sw * sw, free_raw_data=False,
+                params={"feature_pre_filter": False, "verbose": -1},
+            )
+            self._lgb[i] = train.construct()
+        return self._lgb[i]
+
+    def xgb_dmatrices(self, i: int) -> Tuple[xgb.DMatrix, xgb.DMatrix]:
+        if i not in self._xgb:
+            X_t, y_t, sw, X_v, y_v = self._slices[i]
+            self._xgb[i] = (
+                xgb.DMatrix(X_t, label=y_t, weight=sw, nthread=self.n_threads),
+                xgb.DMatrix(X_v, label=y_v, nthread=self.n_threads),
+            )
+        return self._xgb[i]
+
+
+@dataclass
+class StudyOptions:
+    """How studies are run: pruner, shared storage and worker processes."""
+
+    pruner: str = "median"
+    storage: Optional[str] = None
+    n_jobs: int = 1
+    # Continue an existing study of the same name in ``storage``.  Off by
+    # default: a study left from older data would silently seed the search.
+    resume: bool = False
+
+    @property
+    def threads_per_trial(self) -> int:
+        if self.n_jobs <= 1:
+            return -1
+        return max(1, (os.cpu_count() or 1) // self.n_jobs)
+
+
+def make_pruner(name: str) -> optuna.pruners.BasePruner:
+    if name == "hyperband":
+        return optuna.pruners.HyperbandPruner(min_resource=1, max_resource=CV_FOLDS)
+    if name == "none":
+        return optuna.pruners.NopPruner()
+    return optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=0)
+
+
+def make_storage(spec: Optional[str]):
+    """None → in-memory; ``journal:<path>`` → journal file; anything else → RDB URL."""
+    if not spec:
+        return None
+    if spec.startswith("journal:"):
+        path = spec[len("journal:"):]
+        try:
+            from optuna.storages.journal import JournalFileBackend
+        except ImportError:  # optuna < 4.0
+            from optuna.storages import JournalFileStorage as JournalFileBackend
+        return optuna.storages.JournalStorage(JournalFileBackend(path))
+    return spec
+
+
+def cached_cv_objective(
+    trial: optuna.Trial,
+    cache: StudyDataCache,
+    fit_predict: Callable[[int], np.ndarray],
     draw_penalty_multiplier: float = 10.0,
 ) -> float:
-    """TimeSeriesSplit(3) mean (log_loss + draw_recall_penalty).
+    """TimeSeriesSplit mean (log_loss + draw_recall_penalty) over cached folds,
+    reporting the running mean after each fold.
 
-    model_factory is a zero-arg callable returning a fresh unfitted estimator.
+    fit_predict(i) trains on fold i and returns validation probabilities.
+    Raises optuna.TrialPruned as soon as the pruner gives up on the trial.
     """
-    tscv = TimeSeriesSplit(n_splits=CV_FOLDS)
     fold_scores = []
-    for train_idx, val_idx in tscv.split(X):
-        X_t, X_v = X[train_idx], X[val_idx]
-        y_t, y_v = y[train_idx], y[val_idx]
-        sw = compute_sample_weight(class_weight="balanced", y=y_t)
-        m = model_factory()
-        m.fit(X_t, y_t, sample_weight=sw)
-        proba = m.predict_proba(X_v)
+    for i in range(len(cache)):
+        proba = fit_predict(i)
+        y_v = cache.fold(i)[4]
         fold_scores.append(
-            log_loss(y_v, proba) + draw_recall_penalty(proba, draw_penalty_multiplier)
+            log_loss(y_v, proba, labels=[0, 1, 2])
+            + draw_recall_penalty(proba, draw_penalty_multiplier)
         )
+        trial.report(float(np.mean(fold_scores)), step=i)
+        if trial.should_prune():
+            raise optuna.TrialPruned()
     return float(np.mean(fold_scores))
 
 
+# ── per-model search spaces & trial fitting ───────────────────────────────────
+
+def _rf_params(trial: optuna.Trial) -> dict:
+    return {
+        "n_estimators": trial.suggest_int("n_estimators", 200, 400),
+        "max_depth": trial.suggest_int("max_depth", 8, 20),
+        "min_samples_split": trial.suggest_int("min_samples_split", 4, 14),
+        "min_samples_leaf": trial.suggest_int("min_samples_leaf", 2, 8),
+        "max_features": trial.suggest_categorical("max_features", ["sqrt", "log2"]),
+    }
+
+
+def _xgb_params(trial: optuna.Trial) -> dict:
+    return {
+        "n_estimators": trial.suggest_int("n_estimators", 150, 350),
+        "max_depth": trial.suggest_int("max_depth", 4, 10),
+        "learning_rate": trial.suggest_float("learning_rate", 0.03, 0.20, log=True),
+        "subsample": trial.suggest_float("subsample", 0.65, 0.95),
+        "colsample_bytree": trial.suggest_float("colsample_bytree", 0.65, 0.95),
+        "gamma": trial.suggest_float("gamma", 0.0, 0.4),
+        "min_child_weight": trial.suggest_int("min_child_weight", 1, 7),
+        "reg_alpha": trial.suggest_float("reg_alpha", 0.0, 0.5),
+        "reg_lambda": trial.suggest_float("reg_lambda", 0.5, 2.5),
+    }
+
+
+def _lgbm_params(trial: optuna.Trial) -> dict:
+    return {
+        "n_estimators": trial.suggest_int("n_estimators", 150, 350),
+        "max_depth": trial.suggest_int("max_depth", 4, 12),
+        "learning_rate": trial.suggest_float("learning_rate", 0.03, 0.20, log=True),
+        "num_leaves": trial.suggest_int("num_leaves", 20, 100),
+        "subsample": trial.suggest_float("subsample", 0.65, 0.95),
+        "colsample_bytree": trial.suggest_float("colsample_bytree", 0.65, 0.95),
+        "min_child_samples": trial.suggest_int("min_child_samples", 10, 30),
+        "reg_alpha": trial.suggest_float("reg_alpha", 0.0, 0.5),
+        "reg_lambda": trial.suggest_float("reg_lambda", 0.5, 2.5),
+    }
+
+
+def _rf_fold(cache: StudyDataCache, params: dict, i: int) -> np.ndarray:
+    X_t, y_t, sw, X_v, _ = cache.fold(i)
+    m = RandomForestClassifier(
+        **params, class_weight="balanced", random_state=42, n_jobs=cache.n_threads
+    )
+    m.fit(X_t, y_t, sample_weight=sw)
+    return m.predict_proba(X_v)
+
+
+def _xgb_fold(cache: StudyDataCache, params: dict, i: int) -> np.ndarray:
+    """Native xgb.train on the cached DMatrix — same model as XGBClassifier(**params)."""
+    dtrain, dval = cache.xgb_dmatrices(i)
+    booster_params = {k: v for k, v in params.items() if k != "n_estimators"}
+    booster_params.update(
+        objective="multi:softprob", num_class=3, tree_method="hist",
+        seed=42, nthread=cache.n_threads, verbosity=0,
+    )
+    booster = xgb.train(booster_params, dtrain, num_boost_round=params["n_estimators"])
+    return booster.predict(dval)
+
+
+def _lgbm_fold(cache: StudyDataCache, params: dict, i: int) -> np.ndarray:
+    """Native lgb.train on the cached Dataset — same model as LGBMClassifier(**params)."""
+    dtrain = cache.lgb_dataset(i)
+    booster_params = {k: v for k, v in params.items() if k != "n_estimators"}
+    booster_params.update(
+        objective="multiclass", num_class=3, seed=42,
+        num_threads=cache.n_threads, verbose=-1,
+    )
+    booster = lgb.train(booster_params, dtrain, num_boost_round=params["n_estimators"])
+    return booster.predict(cache.fold(i)[3])
+
+
+_MODEL_SPACES: Dict[str, Tuple[Callable[[optuna.Trial], dict], Callable]] = {
+    "rf": (_rf_params, _rf_fold),
+    "xgb": (_xgb_params, _xgb_fold),
+    "lgbm": (_lgbm_params, _lgbm_fold),
+}
+
+
+def _make_objective(
+    kind: str, cache: StudyDataCache, draw_penalty_multiplier: float
+) -> Callable[[optuna.Trial], float]:
+    suggest, fold_fit = _MODEL_SPACES[kind]
+
+    def objective(trial: optuna.Trial) -> float:
+        params = suggest(trial)
+        return cached_cv_objective(
+            trial, cache, lambda i: fold_fit(cache, params, i), draw_penalty_multiplier
+        )
+
+    return objective
+
+
+def _optimize_worker(
+    kind: str,
+    study_name: str,
+    options: StudyOptions,
+    cache: StudyDataCache,
+    n_trials: int,
+    draw_penalty_multiplier: float,
+) -> int:
+    """Process-pool entry point: attach to the shared study and run n_trials."""
+    warnings.filterwarnings("ignore")
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = optuna.load_study(
+        study_name=study_name,
+        storage=make_storage(options.storage),
+        pruner=make_pruner(options.pruner),
+    )
+    study.optimize(
+        _make_objective(kind, cache, draw_penalty_multiplier),
+        n_trials=n_trials,
+        show_progress_bar=False,
+    )
+    return n_trials
+
+
+def run_study(
+    kind: str,
+    X: np.ndarray,
+    y: np.ndarray,
+    n_trials: int,
+    league: str,
+    draw_penalty_multiplier: float = 10.0,
+    options: Optional[StudyOptions] = None,
+) -> optuna.Study:
+    """Run the {league}_{kind}_v4 study, in-process or fanned out over options.n_jobs."""
+    options = options or StudyOptions()
+    if options.n_jobs > 1 and not options.storage:
+        raise ValueError("Parallel tuning (n_jobs > 1) needs a shared --storage")
+
+    cache = StudyDataCache(X, y, n_threads=options.threads_per_trial)
+    study_name = f"{league}_{kind}_v4"
+    try:
+        study = optuna.create_study(
+            direction="minimize",
+            study_name=study_name,
+            storage=make_storage(options.storage),
+            pruner=make_pruner(options.pruner),
+            load_if_exists=options.resume,
+        )
+    except optuna.exceptions.DuplicatedStudyError:
+        raise ValueError(
+            f"Study {study_name} already exists in {options.storage}; "
+            "pass --resume to continue it or point --storage elsewhere"
+        ) from None
+
+    if options.n_jobs <= 1:
+        study.optimize(
+            _make_objective(kind, cache, draw_penalty_multiplier),
+            n_trials=n_trials,
+            show_progress_bar=False,
+        )
+    else:
+        base, extra = divmod(n_trials, options.n_jobs)
+        shares = [base + (1 if w < extra else 0) for w in range(options.n_jobs)]
+        with ProcessPoolExecutor(max_workers=options.n_jobs) as pool:
+            futures = [
+                pool.submit(
+                    _optimize_worker, kind, study.study_name, options, cache,
+                    share, draw_penalty_multiplier,
+                )
+                for share in shares
+                if share > 0
+            ]
+            for fut in futures:
+                fut.result()
+
+    pruned = sum(t.state == optuna.trial.TrialState.PRUNED for t in study.trials)
+    log.info(f"    {kind.upper():<4} trials={len(study.trials)}  pruned={pruned}")
+    return study
+
+
 # ── per-model Optuna tuners ───────────────────────────────────────────────────
 
 def tune_rf(
     X: np.ndarray, y: np.ndarray, n_trials: int, league: str,
     draw_penalty_multiplier: float = 10.0,
+    options: Optional[StudyOptions] = None,
 ) -> Tuple[RandomForestClassifier, dict]:
-    def objective(trial: optuna.Trial) -> float:
-        params = {
-            "n_estimators": trial.suggest_int("n_estimators", 200, 400),
-            "max_depth": trial.suggest_int("max_depth", 8, 20),
-            "min_samples_split": trial.suggest_int("min_samples_split", 4, 14),
-            "min_samples_leaf": trial.suggest_int("min_samples_leaf", 2, 8),
-            "max_features": trial.suggest_categorical("max_features", ["sqrt", "log2"]),
-        }
-        return cv_objective(
-            lambda: RandomForestClassifier(
-                **params, class_weight="balanced", random_state=42, n_jobs=-1
-            ),
-            X,
-            y,
-            draw_penalty_multiplier,
-        )
-
-    study = optuna.create_study(direction="minimize", study_name=f"{league}_rf_v4")
-    study.optimize(objective, n_trials=n_trials, show_progress_bar=False)
+    study = run_study("rf", X, y, n_trials, league, draw_penalty_multiplier, options)
 
     sw = compute_sample_weight(class_weight="balanced", y=y)
     best = RandomForestClassifier(
@@ -360,30 +637,9 @@ def tune_rf(
 def tune_xgb(
     X: np.ndarray, y: np.ndarray, n_trials: int, league: str,
     draw_penalty_multiplier: float = 10.0,
+    options: Optional[StudyOptions] = None,
 ) -> Tuple[XGBClassifier, dict]:
-    def objective(trial: optuna.Trial) -> float:
-        params = {
-            "n_estimators": trial.suggest_int("n_estimators", 150, 350),
-            "max_depth": trial.suggest_int("max_depth", 4, 10),
-            "learning_rate": trial.suggest_float("learning_rate", 0.03, 0.20, log=True),
-            "subsample": trial.suggest_float("subsample", 0.65, 0.95),
-            "colsample_bytree": trial.suggest_float("colsample_bytree", 0.65, 0.95),
-            "gamma": trial.suggest_float("gamma", 0.0, 0.4),
-            "min_child_weight": trial.suggest_int("min_child_weight", 1, 7),
-            "reg_alpha": trial.suggest_float("reg_alpha", 0.0, 0.5),
-            "reg_lambda": trial.suggest_float("reg_lambda", 0.5, 2.5),
-        }
-        return cv_objective(
-            lambda: XGBClassifier(
-                **params, tree_method="hist", random_state=42, n_jobs=-1, verbosity=0
-            ),
-            X,
-            y,
-            draw_penalty_multiplier,
-        )
-
-    study = optuna.create_study(direction="minimize", study_name=f"{league}_xgb_v4")
-    study.optimize(objective, n_trials=n_trials, show_progress_bar=False)
+    study = run_study("xgb", X, y, n_trials, league, draw_penalty_multiplier, options)
 
     sw = compute_sample_weight(class_weight="balanced", y=y)
     best = XGBClassifier(
@@ -397,34 +653,9 @@ def tune_xgb(
 def tune_lgbm(
     X: np.ndarray, y: np.ndarray, n_trials: int, league: str,
     draw_penalty_multiplier: float = 10.0,
+    options: Optional[StudyOptions] = None,
 ) -> Tuple[LGBMClassifier, dict]:
-    def objective(trial: optuna.Trial) -> float:
-        params = {
-            "n_estimators": trial.suggest_int("n_estimators", 150, 350),
-            "max_depth": trial.suggest_int("max_depth", 4, 12),
-            "learning_rate": trial.suggest_float("learning_rate", 0.03, 0.20, log=True),
-            "num_leaves": trial.suggest_int("num_leaves", 20, 100),
-            "subsample": trial.suggest_float("subsample", 0.65, 0.95),
-            "colsample_bytree": trial.suggest_float("colsample_bytree", 0.65, 0.95),
-            "min_child_samples": trial.suggest_int("min_child_samples", 10, 30),
-            "reg_alpha": trial.suggest_float("reg_alpha", 0.0, 0.5),
-            "reg_lambda": trial.suggest_float("reg_lambda", 0.5, 2.5),
-        }
-        return cv_objective(
-            lambda: LGBMClassifier(
-                **params,
-                class_weight="balanced",
-                random_state=42,
-                n_jobs=-1,
-                verbose=-1,
-            ),
-            X,
-            y,
-            draw_penalty_multiplier,
-        )
-
-    study = optuna.create_study(direction="minimize", study_name=f"{league}_lgbm_v4")
-    study.optimize(objective, n_trials=n_trials, show_progress_bar=False)
+    study = run_study("lgbm", X, y, n_trials, league, draw_penalty_multiplier, options)
 
     sw = compute_sample_weight(class_weight="balanced", y=y)
     best = LGBMClassifier(
@@ -525,6 +756,7 @@ def train_one_league(
     output_dir: Path,
     n_trials: int,
     draw_penalty_multiplier: float = 10.0,
+    options: Optional[StudyOptions] = None,
 ) -> Dict:
     log.info(f"╔══ {league.upper()} — {n_trials} Optuna trials per model ══╗")
 
@@ -550,13 +782,19 @@ def train_one_league(
 
     # 4. Optuna-tune each base model on X_base
     log.info("  Tuning RF …")
-    rf, rf_params = tune_rf(X_base, y_base, n_trials, league, draw_penalty_multiplier)
+    rf, rf_params = tune_rf(
+        X_base, y_base, n_trials, league, draw_penalty_multiplier, options
+    )
 
     log.info("  Tuning XGB …")
-    xgb_m, xgb_params = tune_xgb(X_base, y_base, n_trials, league, draw_penalty_multiplier)
+    xgb_m, xgb_params = tune_xgb(
+        X_base, y_base, n_trials, league, draw_penalty_multiplier, options
+    )
 
     log.info("  Tuning LGBM …")
-    lgbm_m, lgbm_params = tune_lgbm(X_base, y_base, n_trials, league, draw_penalty_multiplier)
+    lgbm_m, lgbm_params = tune_lgbm(
+        X_base, y_base, n_trials, league, draw_penalty_multiplier, options
+    )
 
     # base model dict — key names must match EnsembleModel._create_meta_features() convention
     base_models = {"rf": rf, "xgb": xgb_m, "lgbm": lgbm_m}
@@ -704,6 +942,37 @@ def parse_args() -> argparse.Namespace:
             "(default: 10.0). Increase to 25-30 when draw calibration gate fails."
         ),
     )
+    p.add_argument(
+        "--pruner",
+        default="median",
+        choices=["median", "hyperband", "none"],
+        help="Per-fold trial pruner (default: median)",
+    )
+    p.add_argument(
+        "--storage",
+        default=None,
+        metavar="URL",
+        help=(
+            "Shared Optuna storage: an RDB URL (sqlite:///optuna.db) or "
+            "journal:<path>. Required for --jobs > 1; defaults to "
+            "journal:<output-dir>/optuna_journal.log in that case."
+        ),
+    )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Worker processes running trials against the shared storage (default: 1)",
+    )
+    p.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Continue existing {league}_{model}_v4 studies in --storage instead "
+            "of refusing to overwrite them. Only resume studies tuned on the same data."
+        ),
+    )
     return p.parse_args()
 
 
@@ -713,11 +982,20 @@ def main() -> None:
     data_dir = Path(args.data_dir)
     leagues = LEAGUES if args.league == "all" else [args.league]
     draw_penalty_multiplier = args.draw_penalty_multiplier
+    storage = args.storage
+    if args.jobs > 1 and not storage:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        storage = f"journal:{output_dir / 'optuna_journal.log'}"
+    options = StudyOptions(
+        pruner=args.pruner, storage=storage, n_jobs=max(1, args.jobs), resume=args.resume
+    )
 
     log.info(
         f"SabiScore Optuna Tuner — leagues={leagues}  trials={args.trials}  "
         f"data={data_dir}  output={output_dir}  "
-        f"draw_penalty_multiplier={draw_penalty_multiplier}"
+        f"draw_penalty_multiplier={draw_penalty_multiplier}  "
+        f"pruner={options.pruner}  jobs={options.n_jobs}  storage={options.storage}  "
+        f"resume={options.resume}"
     )
 
     results = []
@@ -731,6 +1009,7 @@ def main() -> None:
                 output_dir=output_dir,
                 n_trials=args.trials,
                 draw_penalty_multiplier=draw_penalty_multiplier,
+                options=options,
             )
             results.append(result)
         except FileNotFoundError as exc:
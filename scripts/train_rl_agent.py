@@ -1,6 +1,7 @@
 """Phase 6-C: SAC Reinforcement Learning Betting Agent.
 
-Environment : FootballBettingEnv  (Gymnasium)
+Environment : FootballBettingEnv  (Gymnasium); training steps --n-envs lanes of
+              it at once through VectorizedFootballBettingEnv (NumPy, VecEnv)
 Algorithm   : SAC via stable-baselines3 >= 2.3.0
 State       : 16-dim normalized vector
 Action      : 5-dim continuous [-2, 2]
@@ -59,36 +60,33 @@ except ImportError:
 try:
     from stable_baselines3 import SAC
     from stable_baselines3.common.callbacks import BaseCallback
-    from stable_baselines3.common.vec_env import DummyVecEnv
+    from stable_baselines3.common.vec_env import DummyVecEnv, VecEnv
 except ImportError as exc:
     log.error("stable-baselines3 not installed.  Run: pip install stable-baselines3>=2.3.0  (%s)", exc)
     sys.exit(1)
 
 # ---------------------------------------------------------------------------
-# Constants from rl_reward_spec
+# Constants from rl_reward_spec (shared with the vectorised env core)
 # ---------------------------------------------------------------------------
-W_PNL  = 0.40
-W_IC   = 0.25
-W_CAL  = 0.15
-W_RISK = 0.15
-W_ABS  = 0.05
-assert abs(W_PNL + W_IC + W_CAL + W_RISK + W_ABS - 1.0) < 1e-9, "Reward weights must sum to 1.0"
-
-# Base rates (ground truth class mix)
-BASE_HOME = 0.420
-BASE_DRAW = 0.246
-BASE_AWAY = 0.334
-
-# Action outcome indices
-IDX_HOME    = 0
-IDX_DRAW    = 1
-IDX_AWAY    = 2
-IDX_ABSTAIN = 3
+from backend.src.services.rl_betting_env import (  # noqa: E402
+    BASE_AWAY,
+    BASE_DRAW,
+    BASE_HOME,
+    CURRICULUM_PHASE1_MAX_CONF,
+    CURRICULUM_PHASE2_MAX_CONF,
+    IDX_ABSTAIN,
+    INITIAL_BANKROLL,
+    MAX_KELLY_CAP,
+    TERMINAL_PENALTY,
+    W_ABS,
+    W_CAL,
+    W_IC,
+    W_PNL,
+    W_RISK,
+    make_betting_env_batch,
+)
 
-# Curriculum thresholds
-CURRICULUM_PHASE1_MAX_CONF = 0.60   # episodes 0–100
-CURRICULUM_PHASE2_MAX_CONF = 0.50   # episodes 100–300
-# Phase 300+ → all matches
+assert abs(W_PNL + W_IC + W_CAL + W_RISK + W_ABS - 1.0) < 1e-9, "Reward weights must sum to 1.0"
 
 # Gate thresholds
 GATE_ROI_PCT        = 5.0    # mean ROI per bet > 5%
@@ -97,9 +95,6 @@ GATE_SHARPE         = 1.50   # rolling Sharpe (20-bet) ≥ 1.50
 GATE_ABSTAIN_LOW    = 0.10   # abstention rate ≥ 10%
 GATE_ABSTAIN_HIGH   = 0.40   # abstention rate ≤ 40%
 
-INITIAL_BANKROLL    = 1.0    # normalised to 1.0 (bankroll_pct = bankroll / initial)
-MAX_KELLY_CAP       = 0.05   # C14-compatible; matches settings.rl_max_kelly_cap default
-TERMINAL_PENALTY    = -10.0  # applied when bankroll < 10% of initial
 N_STEP              = 5      # n-step returns (temporal rule)
 SEED                = 42
 
@@ -131,6 +126,13 @@ def _load_match_data(data_dir: Path) -> pd.DataFrame:
     return merged
 
 
+def _match_labels(matches: pd.DataFrame) -> np.ndarray:
+    """match_result column as the int label table the vectorised env steps over."""
+    if "match_result" not in matches.columns:
+        return np.zeros(len(matches), dtype=np.int64)
+    return matches["match_result"].fillna(0).astype(int).to_numpy(dtype=np.int64)
+
+
 def _simulate_probabilities(row: pd.Series, rng: np.random.Generator) -> np.ndarray:
     """Derive soft probability vector from match result with calibration noise.
 
@@ -486,32 +488,120 @@ class FootballBettingEnv(gym.Env):
         return float(total)
 
 
+# ---------------------------------------------------------------------------
+# Vectorised environment (stable-baselines3 VecEnv over BettingEnvBatch)
+# ---------------------------------------------------------------------------
+
+class VectorizedFootballBettingEnv(VecEnv):
+    """``n_envs`` FootballBettingEnv lanes stepped as NumPy arrays.
+
+    Same observation/action spaces, per-lane dynamics and reward as
+    FootballBettingEnv; the lanes live in one ``BettingEnvBatch`` (or a
+    ``BettingEnvPool`` of ``n_procs`` worker processes). Finished lanes reset
+    in place and report ``terminal_observation`` like DummyVecEnv.
+    """
+
+    metadata = {"render_modes": []}
+    render_mode = None
+
+    def __init__(
+        self,
+        matches: pd.DataFrame,
+        n_envs: int,
+        episode_length: int = 50,
+        curriculum_phase: int = 0,
+        seed: Optional[int] = None,
+        epistemic_threshold: float = 0.15,
+        n_procs: int = 1,
+    ) -> None:
+        observation_space = spaces.Box(low=-5.0, high=5.0, shape=(16,), dtype=np.float32)
+        action_space = spaces.Box(low=-2.0, high=2.0, shape=(5,), dtype=np.float32)
+        super().__init__(n_envs, observation_space, action_space)
+        self._batch = make_betting_env_batch(
+            _match_labels(matches.reset_index(drop=True)),
+            n_envs,
+            n_procs=n_procs,
+            episode_length=episode_length,
+            curriculum_phase=curriculum_phase,
+            seed=seed,
+            epistemic_threshold=epistemic_threshold,
+        )
+
+    @property
+    def curriculum_phase(self) -> int:
+        return self._batch.curriculum_phase
+
+    @curriculum_phase.setter
+    def curriculum_phase(self, phase: int) -> None:
+        self._batch.curriculum_phase = phase
+
+    def reset(self) -> np.ndarray:
+        seed = self._seeds[0] if any(s is not None for s in self._seeds) else None
+        if seed is not None:
+            self._batch.seed(seed)
+        self._reset_seeds()
+        return self._batch.reset()
+
+    def step_async(self, actions: np.ndarray) -> None:
+        self._batch.step_async(actions)
+
+    def step_wait(self):
+        step = self._batch.step_wait()
+        done = step.done
+        infos: List[Dict[str, Any]] = []
+        for lane in range(self.num_envs):
+            info = step.info(lane)
+            if done[lane]:
+                info["terminal_observation"] = step.terminal_obs[lane]
+                info["TimeLimit.truncated"] = bool(step.truncated[lane] and not step.terminated[lane])
+            infos.append(info)
+        return step.obs, step.reward.astype(np.float32), done, infos
+
+    def close(self) -> None:
+        self._batch.close()
+
+    def get_attr(self, attr_name: str, indices=None) -> List[Any]:
+        return [getattr(self, attr_name)] * len(self._get_indices(indices))
+
+    def set_attr(self, attr_name: str, value: Any, indices=None) -> None:
+        setattr(self, attr_name, value)
+
+    def env_method(self, method_name: str, *method_args, indices=None, **method_kwargs) -> List[Any]:
+        raise NotImplementedError("VectorizedFootballBettingEnv lanes are not separate env objects")
+
+    def env_is_wrapped(self, wrapper_class, indices=None) -> List[bool]:
+        return [False] * len(self._get_indices(indices))
+
+
 # ---------------------------------------------------------------------------
 # Curriculum callback
 # ---------------------------------------------------------------------------
 
 class CurriculumCallback(BaseCallback):
-    """Advances the curriculum phase at the appropriate episode thresholds."""
+    """Advances the curriculum phase at the appropriate episode thresholds.
+
+    Episodes are counted across every lane of a vectorised env.
+    """
 
     _PHASE_THRESHOLDS = {100: 1, 300: 2}  # episode_count → next curriculum phase
 
-    def __init__(self, env: FootballBettingEnv) -> None:
+    def __init__(self, env) -> None:
         super().__init__(verbose=0)
         self._betting_env = env
         self._episode_count = 0
 
     def _on_step(self) -> bool:
-        infos = self.locals.get("infos", [])
-        for info in infos:
-            if info.get("terminal_observation") is not None or self.locals.get("dones", [False])[0]:
-                self._episode_count += 1
-                for threshold, next_phase in sorted(self._PHASE_THRESHOLDS.items()):
-                    if self._episode_count == threshold:
-                        self._betting_env.curriculum_phase = next_phase
-                        log.info(
-                            "Curriculum advanced to phase %d at episode %d",
-                            next_phase, self._episode_count,
-                        )
+        dones = self.locals.get("dones")
+        if dones is None:
+            return True
+        self._episode_count += int(np.sum(dones))
+        for threshold, next_phase in sorted(self._PHASE_THRESHOLDS.items()):
+            if self._episode_count >= threshold and self._betting_env.curriculum_phase < next_phase:
+                self._betting_env.curriculum_phase = next_phase
+                log.info(
+                    "Curriculum advanced to phase %d at episode %d",
+                    next_phase, self._episode_count,
+                )
         return True
 
 
@@ -652,6 +742,12 @@ def main() -> int:
                         help="Total environment steps for SAC training")
     parser.add_argument("--episode-length", type=int, default=50,
                         help="Matches per episode")
+    parser.add_argument("--n-envs", type=int, default=32,
+                        help="Parallel bankrolls in the vectorised training env (1 = single FootballBettingEnv)")
+    parser.add_argument("--n-procs", type=int, default=1,
+                        help="Worker processes the vectorised env is sharded over")
+    parser.add_argument("--gradient-steps", type=int, default=-1,
+                        help="SAC gradient steps per rollout (-1 = one per collected transition)")
     parser.add_argument("--eval-episodes", type=int, default=500,
                         help="Held-out episodes for gate evaluation (C16)")
     parser.add_argument("--learning-rate", type=float, default=3e-4)
@@ -679,13 +775,24 @@ def main() -> int:
         return 1
 
     # --- Build training environment ---
-    env = FootballBettingEnv(
-        matches=matches,
-        episode_length=args.episode_length,
-        curriculum_phase=0,
-        seed=SEED,
-    )
-    vec_env = DummyVecEnv([lambda: env])
+    if args.n_envs > 1:
+        vec_env = VectorizedFootballBettingEnv(
+            matches=matches,
+            n_envs=args.n_envs,
+            episode_length=args.episode_length,
+            curriculum_phase=0,
+            seed=SEED,
+            n_procs=args.n_procs,
+        )
+        env = vec_env
+    else:
+        env = FootballBettingEnv(
+            matches=matches,
+            episode_length=args.episode_length,
+            curriculum_phase=0,
+            seed=SEED,
+        )
+        vec_env = DummyVecEnv([lambda: env])
 
     # --- Build evaluation environment (separate instance, same data) ---
     eval_env = FootballBettingEnv(
@@ -705,6 +812,7 @@ def main() -> int:
         learning_starts=args.learning_starts,
         tau=args.tau,
         gamma=args.gamma,
+        gradient_steps=args.gradient_steps,
         verbose=1,
         device=args.device,
         seed=SEED,
@@ -713,8 +821,8 @@ def main() -> int:
     curriculum_cb = CurriculumCallback(env)
 
     log.info(
-        "Training SAC for %d timesteps (episode_length=%d) …",
-        args.total_timesteps, args.episode_length,
+        "Training SAC for %d timesteps (episode_length=%d, n_envs=%d, n_procs=%d) …",
+        args.total_timesteps, args.episode_length, max(args.n_envs, 1), args.n_procs,
     )
     sac.learn(
         total_timesteps=args.total_timesteps,
@@ -723,6 +831,7 @@ def main() -> int:
         reset_num_timesteps=True,
     )
     log.info("Training complete.")
+    vec_env.close()
 
     # --- Gate evaluation (C16) ---
     log.info("Evaluating on %d held-out episodes …", args.eval_episodes)
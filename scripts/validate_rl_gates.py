@@ -18,7 +18,6 @@ from __future__ import annotations
 import argparse
 import importlib.util
 import json
-import math
 import shutil
 import sys
 from dataclasses import dataclass, field
@@ -210,34 +209,6 @@ def _compute_pnl(recommended_market: str, stake: float, actual_outcome: int, odd
     return -stake
 
 
-def _rolling_sharpe(pnl_series: List[float], window: int = 30) -> float:
-    if len(pnl_series) < window:
-        if len(pnl_series) < 2:
-            return 0.0
-        arr = np.array(pnl_series, dtype=float)
-        std = float(np.std(arr, ddof=1))
-        return float(np.mean(arr) / std * math.sqrt(len(arr))) if std > 0 else 0.0
-
-    sharpes = []
-    for i in range(window - 1, len(pnl_series)):
-        window_data = np.array(pnl_series[i - window + 1 : i + 1], dtype=float)
-        std = float(np.std(window_data, ddof=1))
-        if std > 0:
-            sharpes.append(float(np.mean(window_data) / std * math.sqrt(window)))
-        else:
-            sharpes.append(0.0)
-    return float(np.mean(sharpes)) if sharpes else 0.0
-
-
-def _max_drawdown(cumulative_pnl: List[float]) -> float:
-    if not cumulative_pnl:
-        return 0.0
-    bankroll = np.array(cumulative_pnl, dtype=float) + 1.0  # start at 1.0
-    peak = np.maximum.accumulate(bankroll)
-    drawdown = (peak - bankroll) / np.maximum(peak, 1e-9)
-    return float(np.max(drawdown))
-
-
 def _load_holdout_frames(data_dir: Path, holdout_frac: float, min_total: int) -> pd.DataFrame:
     frames = []
     for league, csv_name in LEAGUE_CSVS.items():
@@ -346,34 +317,34 @@ def run_simulation(
 
 
 def compute_metrics(records: List[BetRecord]) -> ValidationReport:
+    """Gate metrics over the simulated bets in one array pass
+    (backend/src/models/evaluation/backtest.py)."""
+    from backend.src.models.evaluation.backtest import evaluate_stakes
+
     n_matches = len(records)
-    active_bets = [r for r in records if not r.abstained and r.stake_fraction > 0]
-    n_bets = len(active_bets)
+    label_index = {label: idx for idx, label in MARKET_LABEL.items()}
+    picks = np.array([label_index.get(r.recommended_market, 0) for r in records], dtype=int)
+    active = np.array([not r.abstained and r.stake_fraction > 0 for r in records], dtype=bool)
+    stakes = np.where(active, [r.stake_fraction for r in records], 0.0) if n_matches else np.zeros(0)
+    odds = np.full((n_matches, 3), np.nan)
+    odds[np.arange(n_matches), picks] = [r.decimal_odds for r in records]
+
+    result = evaluate_stakes(
+        stakes,
+        picks,
+        odds,
+        np.array([r.actual_outcome for r in records], dtype=int),
+        groups=[r.league for r in records],
+    )
+    n_bets = int(result.n_bets[0])
     n_abstained = n_matches - n_bets
-
     abstention_rate = n_abstained / n_matches if n_matches > 0 else 0.0
-
-    total_staked = sum(r.stake_fraction for r in active_bets)
-    total_pnl = sum(r.pnl for r in active_bets)
-    roi_per_bet = total_pnl / total_staked if total_staked > 0 else 0.0
-
-    cumulative = []
-    running = 0.0
-    bet_pnls = []
-    for r in active_bets:
-        running += r.pnl
-        cumulative.append(running)
-        bet_pnls.append(r.pnl / r.stake_fraction if r.stake_fraction > 0 else 0.0)
-
-    max_dd = _max_drawdown(cumulative) if cumulative else 0.0
-    sharpe = _rolling_sharpe(bet_pnls) if bet_pnls else 0.0
-
-    per_league_roi: Dict[str, float] = {}
-    for league in set(r.league for r in records):
-        league_active = [r for r in active_bets if r.league == league]
-        l_staked = sum(r.stake_fraction for r in league_active)
-        l_pnl = sum(r.pnl for r in league_active)
-        per_league_roi[league] = l_pnl / l_staked if l_staked > 0 else 0.0
+    roi_per_bet = float(result.roi[0])
+    max_dd = float(result.max_drawdown[0])
+    sharpe = float(result.rolling_sharpe[0])
+    per_league_roi: Dict[str, float] = {
+        league: float(result.group_roi[0, g]) for g, league in enumerate(result.group_labels or [])
+    }
 
     gates = [
         GateResult("roi_per_bet_gt_0_05", "> 5.0%", roi_per_bet, roi_per_bet > GATE_1_ROI_PER_BET),